@@ -2,6 +2,11 @@
 ASGI config for Kairo backend.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+
+Serve the API under ASGI (e.g. uvicorn kairo.asgi:application) so the SSE
+job progress streams (kairo.core.job_stream) hold connections without
+tying up a worker thread each. Under WSGI they still stream, one blocked
+thread per open stream.
 """
 
 import os
@@ -7,6 +7,7 @@ PR-7: API Surface + Overrides endpoints.
 URL patterns follow spec Section 10:
 - POST /api/brands/:id/brandbrain/compile
 - GET /api/brands/:id/brandbrain/compile/:compile_run_id/status
+- GET /api/brands/:id/brandbrain/compile/:compile_run_id/events (SSE)
 - GET /api/brands/:id/brandbrain/latest
 - GET /api/brands/:id/brandbrain/history
 - GET/PATCH /api/brands/:id/brandbrain/overrides
@@ -31,6 +32,12 @@ urlpatterns = [
         views.compile_status,
         name="compile-status",
     ),
+    # Read-path: compile progress stream (SSE)
+    path(
+        "compile/<str:compile_run_id>/events",
+        views.compile_events,
+        name="compile-events",
+    ),
     # Read-path: latest snapshot
     path(
         "latest",
@@ -7,6 +7,7 @@ PR-7: API Surface + Contract Tests + Performance Guards.
 Implements:
 - POST /api/brands/:id/brandbrain/compile - kickoff (work-path)
 - GET /api/brands/:id/brandbrain/compile/:compile_run_id/status - status poll (read-path)
+- GET /api/brands/:id/brandbrain/compile/:compile_run_id/events - status stream (SSE)
 - GET /api/brands/:id/brandbrain/latest - latest snapshot (read-path)
 - GET /api/brands/:id/brandbrain/history - snapshot history (read-path)
 - GET /api/brands/:id/brandbrain/overrides - get user overrides (read-path)
@@ -15,12 +16,14 @@ Implements:
 Per spec Section 1.1 Performance Contracts:
 - POST /compile: <200ms (kickoff only, async work)
 - GET /status: <30ms (pure DB read)
-- GET /latest: <50ms (2 queries with select_related)
+- GET /latest: <50ms (2 queries with select_related; 0 when cached)
 - GET /history: <100ms (3 queries paginated)
 - GET /overrides: <30ms (2 queries)
 - PATCH /overrides: <100ms (work-path)
 
 Read-path endpoints are DB reads only. No side effects.
+GET /status and GET /latest are read-through cached between compile state
+transitions (kairo.brandbrain.cache); a hit costs no queries.
 """
 
 from __future__ import annotations
@@ -29,15 +32,26 @@ import json
 import logging
 from uuid import UUID
 
-from django.http import JsonResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 
 from kairo.brandbrain.compile import (
     compile_brandbrain,
-    get_compile_status,
+    get_compile_status_json,
     check_compile_gating,
 )
+from kairo.brandbrain.compile.service import get_compile_state
+from kairo.brandbrain.cache import (
+    get_latest_snapshot_body,
+    get_latest_snapshot_id,
+    set_latest_snapshot_body,
+    set_latest_snapshot_id,
+)
+from kairo.core.etag import etag_matches, make_etag, not_modified
+from kairo.core.job_events import COMPILE_EVENTS
+from kairo.core.job_stream import job_event_response
 
 logger = logging.getLogger(__name__)
 
@@ -79,7 +93,8 @@ def compile_kickoff(request, brand_id: str) -> JsonResponse:
         {
             "compile_run_id": "uuid",
             "status": "PENDING",
-            "poll_url": "/api/brands/:id/brandbrain/compile/:run_id/status"
+            "poll_url": "/api/brands/:id/brandbrain/compile/:run_id/status",
+            "events_url": "/api/brands/:id/brandbrain/compile/:run_id/events"
         }
 
     Response (200 OK - short-circuit):
@@ -173,6 +188,7 @@ def compile_kickoff(request, brand_id: str) -> JsonResponse:
             "compile_run_id": str(result.compile_run_id),
             "status": result.status,
             "poll_url": result.poll_url,
+            "events_url": result.events_url,
         }, status=202)
 
     except Exception as e:
@@ -196,6 +212,7 @@ def compile_status(request, brand_id: str, compile_run_id: str) -> JsonResponse:
     GET /api/brands/:id/brandbrain/compile/:compile_run_id/status
 
     Get the status of a compile run. Pure DB read, no side effects.
+    Served from the read-path cache between status transitions.
 
     SECURITY: Enforces brand ownership - compile run must belong to the
     brand specified in the URL. Returns 404 if run belongs to different brand.
@@ -242,14 +259,48 @@ def compile_status(request, brand_id: str, compile_run_id: str) -> JsonResponse:
     if not parsed_run_id:
         return JsonResponse({"error": "Invalid compile_run_id"}, status=400)
 
-    # Get status (pure DB read)
+    # Get status (cache, else pure DB read)
     # SECURITY: Pass brand_id to enforce ownership check
-    status = get_compile_status(parsed_run_id, parsed_brand_id)
+    body = get_compile_status_json(parsed_run_id, parsed_brand_id)
 
-    if not status:
+    if body is None:
         return JsonResponse({"error": "Compile run not found"}, status=404)
 
-    return JsonResponse(status.to_dict(), status=200)
+    return HttpResponse(body, content_type="application/json", status=200)
+
+
+@require_http_methods(["GET"])
+def compile_events(request, brand_id: str, compile_run_id: str):
+    """
+    GET /api/brands/:id/brandbrain/compile/:compile_run_id/events
+
+    Server-Sent Events stream of a compile run, replacing GET /status
+    polling (see kairo.core.job_stream). Every event carries the same body
+    as GET /status (plus job_id); RUNNING progress reports the worker's
+    current stage (ingesting, bundling, synthesizing). "done" carries the
+    SUCCEEDED/FAILED status, then the stream ends.
+
+    SECURITY: Same brand ownership check as GET /status (404 otherwise).
+    """
+    parsed_brand_id = _parse_uuid(brand_id)
+    parsed_run_id = _parse_uuid(compile_run_id)
+
+    if not parsed_brand_id:
+        return JsonResponse({"error": "Invalid brand_id"}, status=400)
+    if not parsed_run_id:
+        return JsonResponse({"error": "Invalid compile_run_id"}, status=400)
+
+    if get_compile_state(parsed_run_id, parsed_brand_id) is None:
+        return JsonResponse({"error": "Compile run not found"}, status=404)
+
+    return job_event_response(
+        request,
+        COMPILE_EVENTS,
+        parsed_run_id,
+        load_state=lambda: get_compile_state(parsed_run_id, parsed_brand_id),
+        is_terminal=lambda state: state["status"] in ("SUCCEEDED", "FAILED"),
+        partial_events=False,
+    )
 
 
 # =============================================================================
@@ -287,9 +338,16 @@ def latest_snapshot(request, brand_id: str) -> JsonResponse:
     Response (404 - no snapshot):
         {"error": "No snapshot found"}
 
+    Response (304 - If-None-Match matches the latest snapshot's ETag)
+
     Per spec Section 1.1:
     - P95 target: 50ms
     - Read-path only: DB reads, no side effects
+
+    Snapshots are immutable, so the ETag is the snapshot id plus the include
+    set, and response bodies are cached per (snapshot, include variant).
+    Once the brand's latest snapshot id is cached (set by the compile
+    worker or the first read), polls and conditional polls cost no queries.
     """
     from kairo.brandbrain.models import BrandBrainSnapshot
 
@@ -298,6 +356,39 @@ def latest_snapshot(request, brand_id: str) -> JsonResponse:
     if not parsed_brand_id:
         return JsonResponse({"error": "Invalid brand_id"}, status=400)
 
+    # Parse include params (comma-separated or 'full')
+    include_param = request.GET.get("include", "")
+    include_parts = {p.strip().lower() for p in include_param.split(",") if p.strip()}
+    include_full = "full" in include_parts
+    variant = _include_variant(include_parts)
+
+    latest_id = get_latest_snapshot_id(parsed_brand_id)
+
+    # Unchanged poll: compare against the latest snapshot id only
+    if "If-None-Match" in request.headers:
+        if latest_id is None:
+            latest_id = (
+                BrandBrainSnapshot.objects
+                .filter(brand_id=parsed_brand_id)
+                .order_by("-created_at")
+                .values_list("id", flat=True)
+                .first()
+            )
+            if latest_id:
+                set_latest_snapshot_id(parsed_brand_id, latest_id, replace=False)
+        if latest_id:
+            etag = _snapshot_etag(latest_id, variant)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+
+    # Cache hit: stored body for this snapshot + include variant
+    if latest_id:
+        cached = get_latest_snapshot_body(parsed_brand_id, latest_id, variant)
+        if cached is not None:
+            response = HttpResponse(cached, content_type="application/json")
+            response["ETag"] = _snapshot_etag(latest_id, variant)
+            return response
+
     # Check brand exists
     if not _brand_exists(parsed_brand_id):
         return JsonResponse({"error": "Brand not found"}, status=404)
@@ -324,11 +415,6 @@ def latest_snapshot(request, brand_id: str) -> JsonResponse:
         "compile_run_id": str(snapshot.compile_run_id) if snapshot.compile_run_id else None,
     }
 
-    # Parse include params (comma-separated or 'full')
-    include_param = request.GET.get("include", "")
-    include_parts = {p.strip().lower() for p in include_param.split(",") if p.strip()}
-    include_full = "full" in include_parts
-
     # Add evidence_status if requested
     if include_full or "evidence" in include_parts:
         if snapshot.compile_run:
@@ -344,7 +430,25 @@ def latest_snapshot(request, brand_id: str) -> JsonResponse:
         if snapshot.compile_run and snapshot.compile_run.bundle:
             response_data["bundle_summary"] = snapshot.compile_run.bundle.summary_json
 
-    return JsonResponse(response_data, status=200)
+    body = json.dumps(response_data, cls=DjangoJSONEncoder)
+    set_latest_snapshot_id(parsed_brand_id, snapshot.id, replace=False)
+    set_latest_snapshot_body(parsed_brand_id, snapshot.id, variant, body)
+
+    response = HttpResponse(body, content_type="application/json", status=200)
+    response["ETag"] = _snapshot_etag(snapshot.id, variant)
+    return response
+
+
+def _include_variant(include_parts: set[str]) -> str:
+    """Canonical include set: 'full' expanded, unknown parts dropped."""
+    if "full" in include_parts:
+        return "bundle,evidence,qa"
+    return ",".join(sorted(include_parts & {"bundle", "evidence", "qa"}))
+
+
+def _snapshot_etag(snapshot_id, variant: str) -> str:
+    """ETag for a snapshot representation (id + canonical include set)."""
+    return make_etag(snapshot_id, variant)
 
 
 @require_http_methods(["GET"])
@@ -0,0 +1,162 @@
+"""
+BrandBrain Read-Path Cache.
+
+Read-through cache for the two polled BrandBrain endpoints:
+- GET /brandbrain/latest: latest snapshot per brand
+- GET /brandbrain/compile/:id/status: compile run status
+
+Both store the final response JSON, so a hit is served without a DB query
+or re-serializing snapshot_json.
+
+VERSIONING:
+- "brandbrain_latest:v1:{brand_id}" points at the brand's latest snapshot id.
+  Response bodies are keyed by (brand, snapshot id, include variant), so
+  moving the pointer retires every cached variant at once; old bodies
+  simply expire.
+- The compile worker writes through on every state transition (RUNNING,
+  SUCCEEDED + new snapshot, FAILED). Readers filling a miss only add
+  (cache.add), so a slow reader can never overwrite a newer worker write.
+
+Snapshots are immutable, so cached bodies never go stale; the TTL
+(BRANDBRAIN_READ_CACHE_TTL_S) only bounds memory.
+
+Cache errors are logged and treated as misses.
+"""
+
+from __future__ import annotations
+
+import logging
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger("kairo.brandbrain.cache")
+
+
+# =============================================================================
+# CACHE CONFIGURATION
+# =============================================================================
+
+# Brand -> latest snapshot id
+LATEST_KEY_PREFIX = "brandbrain_latest:v1"
+
+# (brand, snapshot id, include variant) -> GET /latest response body
+LATEST_BODY_KEY_PREFIX = "brandbrain_latest_body:v1"
+
+# Compile run -> {"brand_id", "body"} (GET /status response body)
+STATUS_KEY_PREFIX = "brandbrain_compile_status:v1"
+
+DEFAULT_READ_CACHE_TTL_S = 21600
+
+
+def read_cache_ttl() -> int:
+    """TTL (seconds) for cached BrandBrain read-path entries."""
+    return int(getattr(settings, "BRANDBRAIN_READ_CACHE_TTL_S", DEFAULT_READ_CACHE_TTL_S))
+
+
+def get_latest_key(brand_id: UUID) -> str:
+    return f"{LATEST_KEY_PREFIX}:{brand_id}"
+
+
+def get_latest_body_key(brand_id: UUID, snapshot_id: UUID, variant: str) -> str:
+    return f"{LATEST_BODY_KEY_PREFIX}:{brand_id}:{snapshot_id}:{variant}"
+
+
+def get_status_key(compile_run_id: UUID) -> str:
+    return f"{STATUS_KEY_PREFIX}:{compile_run_id}"
+
+
+def _write(key: str, value, replace: bool) -> None:
+    try:
+        if replace:
+            cache.set(key, value, timeout=read_cache_ttl())
+        else:
+            cache.add(key, value, timeout=read_cache_ttl())
+    except Exception as e:
+        logger.warning("Failed to write BrandBrain cache key %s: %s", key, e)
+
+
+def _read(key: str):
+    try:
+        return cache.get(key)
+    except Exception as e:
+        logger.warning("Failed to read BrandBrain cache key %s: %s", key, e)
+        return None
+
+
+# =============================================================================
+# LATEST SNAPSHOT
+# =============================================================================
+
+
+def get_latest_snapshot_id(brand_id: UUID) -> UUID | None:
+    """Cached id of the brand's latest snapshot, or None on miss."""
+    value = _read(get_latest_key(brand_id))
+    return UUID(value) if value else None
+
+
+def set_latest_snapshot_id(brand_id: UUID, snapshot_id: UUID, replace: bool = True) -> None:
+    """
+    Point the brand at its latest snapshot.
+
+    Args:
+        brand_id: UUID of the brand
+        snapshot_id: UUID of the latest snapshot
+        replace: True for the compile worker (new snapshot written);
+            False for readers filling a miss, so a read that raced a
+            compile never moves the pointer back
+    """
+    _write(get_latest_key(brand_id), str(snapshot_id), replace)
+
+
+def get_latest_snapshot_body(brand_id: UUID, snapshot_id: UUID, variant: str) -> str | None:
+    """Cached GET /latest body for one snapshot and include variant."""
+    return _read(get_latest_body_key(brand_id, snapshot_id, variant))
+
+
+def set_latest_snapshot_body(brand_id: UUID, snapshot_id: UUID, variant: str, body: str) -> None:
+    """Cache a GET /latest body (immutable: keyed by snapshot id)."""
+    _write(get_latest_body_key(brand_id, snapshot_id, variant), body, replace=True)
+
+
+# =============================================================================
+# COMPILE STATUS
+# =============================================================================
+
+
+def get_compile_status_body(compile_run_id: UUID, brand_id: UUID) -> str | None:
+    """
+    Cached GET /status body, or None on miss.
+
+    SECURITY: Entries record their brand; a run requested under another
+    brand is a miss (the DB path then returns 404).
+    """
+    entry = _read(get_status_key(compile_run_id))
+    if not entry or entry.get("brand_id") != str(brand_id):
+        return None
+    return entry.get("body")
+
+
+def set_compile_status_body(
+    compile_run_id: UUID,
+    brand_id: UUID,
+    body: str,
+    replace: bool = True,
+) -> None:
+    """
+    Cache a GET /status body.
+
+    Args:
+        compile_run_id: UUID of the compile run
+        brand_id: UUID of the run's brand
+        body: Response JSON
+        replace: True for the compile worker (status changed); False for
+            readers filling a miss, so a stale read never overwrites a
+            newer status
+    """
+    _write(
+        get_status_key(compile_run_id),
+        {"brand_id": str(brand_id), "body": body},
+        replace,
+    )
@@ -6,6 +6,7 @@ PR-5: Compile Orchestration Skeleton.
 This module provides:
 - compile_brandbrain: Async compile kickoff
 - get_compile_status: Status retrieval
+- get_compile_status_json: Cached status response body (read-through)
 - check_compile_gating: Pre-compile validation
 - should_short_circuit: No-op detection
 - compute_compile_input_hash: Deterministic hash for short-circuit
@@ -18,6 +19,7 @@ from kairo.brandbrain.compile.service import (
     check_compile_gating,
     compile_brandbrain,
     get_compile_status,
+    get_compile_status_json,
     should_short_circuit_compile,
 )
 from kairo.brandbrain.compile.hashing import compute_compile_input_hash
@@ -25,6 +27,7 @@ from kairo.brandbrain.compile.hashing import compute_compile_input_hash
 __all__ = [
     "compile_brandbrain",
     "get_compile_status",
+    "get_compile_status_json",
     "check_compile_gating",
     "should_short_circuit_compile",
     "compute_compile_input_hash",
@@ -26,6 +26,7 @@ Sync Mode (for tests):
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 from dataclasses import dataclass, field
@@ -33,10 +34,17 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
 from django.utils import timezone
 
+from kairo.brandbrain.cache import (
+    get_compile_status_body,
+    set_compile_status_body,
+    set_latest_snapshot_id,
+)
 from kairo.brandbrain.compile.hashing import compute_compile_input_hash
+from kairo.core.job_events import COMPILE_EVENTS, publish_job_event
 from kairo.brandbrain.freshness import any_source_stale, check_source_freshness
 
 if TYPE_CHECKING:
@@ -235,6 +243,7 @@ class CompileResult:
     compile_run_id: UUID
     status: str  # PENDING, RUNNING, SUCCEEDED, FAILED, UNCHANGED
     poll_url: str | None = None
+    events_url: str | None = None  # SSE progress stream
     snapshot: "BrandBrainSnapshot | None" = None
     error: str | None = None
 
@@ -339,6 +348,7 @@ def compile_brandbrain(
             compile_run_id=compile_run.id,
             status=compile_run.status,
             poll_url=f"/api/brands/{brand_id}/brandbrain/compile/{compile_run.id}/status",
+            events_url=f"/api/brands/{brand_id}/brandbrain/compile/{compile_run.id}/events",
         )
     else:
         # Production: Enqueue job to durable job queue
@@ -355,6 +365,7 @@ def compile_brandbrain(
             compile_run_id=compile_run.id,
             status="PENDING",
             poll_url=f"/api/brands/{brand_id}/brandbrain/compile/{compile_run.id}/status",
+            events_url=f"/api/brands/{brand_id}/brandbrain/compile/{compile_run.id}/events",
         )
 
 
@@ -452,12 +463,93 @@ def get_compile_status(compile_run_id: UUID, brand_id: UUID) -> CompileStatus |
             .first()
         )
 
+    return _status_from_run(compile_run, snapshot)
+
+
+def _status_from_run(
+    compile_run: "BrandBrainCompileRun",
+    snapshot: "BrandBrainSnapshot | None",
+    progress: dict | None = None,
+) -> CompileStatus:
+    if compile_run.status == "RUNNING" and progress is None:
+        progress = {"stage": "compiling", "sources_completed": 0, "sources_total": 0}
     return CompileStatus(
         compile_run_id=compile_run.id,
         status=compile_run.status,
         error=compile_run.error,
         evidence_status=compile_run.evidence_status_json,
         snapshot=snapshot,
-        progress={"stage": "compiling", "sources_completed": 0, "sources_total": 0}
-        if compile_run.status == "RUNNING" else None,
+        progress=progress if compile_run.status == "RUNNING" else None,
     )
+
+
+def _status_body(status: CompileStatus) -> str:
+    return json.dumps(status.to_dict(), cls=DjangoJSONEncoder)
+
+
+def get_compile_status_json(compile_run_id: UUID, brand_id: UUID) -> str | None:
+    """
+    GET /status read-through: the status response body, cached per run.
+
+    Served from cache between state transitions (the compile worker writes
+    through via publish_compile_status); a miss reads the DB through
+    get_compile_status() and fills the cache.
+
+    SECURITY: Same brand ownership check as get_compile_status().
+
+    Args:
+        compile_run_id: UUID of the compile run
+        brand_id: UUID of the brand (enforced for security)
+
+    Returns:
+        Response JSON, or None if not found OR if brand_id doesn't match.
+    """
+    body = get_compile_status_body(compile_run_id, brand_id)
+    if body is not None:
+        return body
+
+    status = get_compile_status(compile_run_id, brand_id)
+    if not status:
+        return None
+
+    body = _status_body(status)
+    set_compile_status_body(compile_run_id, brand_id, body, replace=False)
+    return body
+
+
+def publish_compile_status(
+    compile_run: "BrandBrainCompileRun",
+    snapshot: "BrandBrainSnapshot | None" = None,
+    progress: dict | None = None,
+) -> None:
+    """
+    Publish a compile run's new state to status polls and SSE streams.
+
+    Called by the compile worker after every status change and stage
+    boundary. Writes the status body through to the read-path cache and
+    emits it as a progress event (kairo.core.job_events). With the new
+    snapshot (SUCCEEDED), also points GET /latest at it.
+
+    Args:
+        compile_run: Compile run, already saved with its new status
+        snapshot: Snapshot written by this run, if any
+        progress: RUNNING progress (stage, sources_completed, sources_total)
+    """
+    status = _status_from_run(compile_run, snapshot, progress)
+    set_compile_status_body(compile_run.id, compile_run.brand_id, _status_body(status))
+    if snapshot is not None:
+        set_latest_snapshot_id(compile_run.brand_id, snapshot.id)
+    publish_job_event(COMPILE_EVENTS, compile_run.id, **status.to_dict())
+
+
+def get_compile_state(compile_run_id: UUID, brand_id: UUID) -> dict | None:
+    """
+    Current compile status in the shape of its progress events (SSE).
+
+    Read through the status cache, which also holds the worker's latest
+    RUNNING progress. Same ownership check as get_compile_status().
+    """
+    body = get_compile_status_json(compile_run_id, brand_id)
+    if body is None:
+        return None
+    return {"job_id": str(compile_run_id), **json.loads(body)}
@@ -21,6 +21,10 @@ The compile pipeline:
 7. Create BrandBrainSnapshot
 8. Mark SUCCEEDED or FAILED
 
+Every status change and stage boundary (ingesting, bundling, synthesizing)
+is published via publish_compile_status: written through to the read-path
+cache and pushed to SSE progress streams.
+
 Evidence status tracking:
 - reused: Sources with fresh cached runs
 - refreshed: Sources that triggered new actor runs
@@ -43,6 +47,7 @@ from django.utils import timezone
 
 from kairo.brandbrain.actors.registry import is_capability_enabled
 from kairo.brandbrain.bundling import create_evidence_bundle, create_feature_report
+from kairo.brandbrain.compile.service import publish_compile_status
 from kairo.brandbrain.freshness import check_source_freshness
 from kairo.brandbrain.ingestion import ingest_source
 from kairo.brandbrain.ingestion.service import reuse_cached_run
@@ -132,6 +137,7 @@ def execute_compile_job(
         # Step 1: Update status to RUNNING
         compile_run.status = "RUNNING"
         compile_run.save(update_fields=["status"])
+        publish_compile_status(compile_run)
 
         # Log LLM config at compile start (critical for debugging stub issues)
         _llm_config = _log_llm_config(f"compile_run={compile_run_id}")
@@ -171,12 +177,13 @@ def execute_compile_job(
         _t_ingestion_start = time.perf_counter()
         _source_timings = {}
 
-        sources = SourceConnection.objects.filter(
+        sources = list(SourceConnection.objects.filter(
             brand_id=brand_id,
             is_enabled=True,
-        )
+        ))
 
-        for source in sources:
+        for index, source in enumerate(sources):
+            _publish_progress(compile_run, "ingesting", index, len(sources))
             _t_source_start = time.perf_counter()
             source_key = f"{source.platform}.{source.capability}"
 
@@ -313,6 +320,7 @@ def execute_compile_job(
             )
 
         # Step 4: Create EvidenceBundle
+        _publish_progress(compile_run, "bundling", len(sources), len(sources))
         _t_bundling_start = time.perf_counter()
         try:
             bundle = create_evidence_bundle(brand_id)
@@ -353,6 +361,7 @@ def execute_compile_job(
         _timings["feature_report_ms"] = int((time.perf_counter() - _t_feature_start) * 1000)
 
         # Steps 6-7: LLM synthesis
+        _publish_progress(compile_run, "synthesizing", len(sources), len(sources))
         _t_llm_start = time.perf_counter()
         llm_meta = {"provider": None, "model": None, "used": False, "tokens_in": 0, "tokens_out": 0, "error": None}
         _llm_prompts = {}  # Store prompts for DEBUG diagnostics
@@ -437,6 +446,7 @@ def execute_compile_job(
         # Mark as SUCCEEDED
         compile_run.status = "SUCCEEDED"
         compile_run.save(update_fields=["status", "draft_json", "qa_report_json"])
+        publish_compile_status(compile_run, snapshot)
 
         logger.info(
             "Compile run %s succeeded with snapshot %s",
@@ -449,9 +459,27 @@ def execute_compile_job(
         compile_run.status = "FAILED"
         compile_run.error = str(e)
         compile_run.save(update_fields=["status", "error"])
+        publish_compile_status(compile_run)
         raise
 
 
+def _publish_progress(
+    compile_run: "BrandBrainCompileRun",
+    stage: str,
+    sources_completed: int,
+    sources_total: int,
+) -> None:
+    """Publish RUNNING progress to status polls and SSE streams."""
+    publish_compile_status(
+        compile_run,
+        progress={
+            "stage": stage,
+            "sources_completed": sources_completed,
+            "sources_total": sources_total,
+        },
+    )
+
+
 def _create_stub_draft(
     answers: dict,
     bundle: Any | None,
@@ -7,13 +7,13 @@ This module provides:
 - ingest_source(): End-to-end ingestion for a SourceConnection
   1. Trigger Apify actor run
   2. Poll until terminal status
-  3. Fetch raw items with cap enforcement
-  4. Store RawApifyItem rows
+  3. Fetch raw items with cap enforcement, page by page
+  4. Store RawApifyItem rows (one bulk insert per page)
   5. Call normalization service
 
 Cost controls:
 - Actor input caps via build_input()
-- Dataset fetch caps via fetch_dataset_items(limit=cap)
+- Dataset fetch caps via iter_dataset_pages(limit=cap)
 - Poll timeout to prevent runaway runs
 
 Dependencies:
@@ -41,6 +41,7 @@ from kairo.integrations.apify.client import (
     ApifyClient,
     ApifyError,
     ApifyTimeoutError,
+    iter_dataset_pages,
 )
 from kairo.integrations.apify.models import ApifyRun, ApifyRunStatus, RawApifyItem
 
@@ -57,8 +58,9 @@ logger = logging.getLogger(__name__)
 # Default poll timeout (seconds)
 DEFAULT_POLL_TIMEOUT_S = 300  # 5 minutes
 
-# Poll interval (seconds)
-DEFAULT_POLL_INTERVAL_S = 5
+# Poll interval (seconds); None = adaptive polling
+# (see kairo.integrations.apify.polling)
+DEFAULT_POLL_INTERVAL_S = None
 
 
 # =============================================================================
@@ -101,7 +103,7 @@ def ingest_source(
     source_connection: "SourceConnection",
     *,
     poll_timeout_s: int = DEFAULT_POLL_TIMEOUT_S,
-    poll_interval_s: int = DEFAULT_POLL_INTERVAL_S,
+    poll_interval_s: int | None = DEFAULT_POLL_INTERVAL_S,
     apify_client: ApifyClient | None = None,
     user_id: UUID | None = None,
 ) -> IngestionResult:
@@ -113,14 +115,14 @@ def ingest_source(
     2. Build actor input with cap
     3. Start Apify actor run
     4. Poll until terminal status
-    5. Fetch raw items with cap
-    6. Store RawApifyItem rows
+    5. Stream raw items with cap (APIFY_DATASET_PAGE_SIZE per page)
+    6. Store RawApifyItem rows page by page
     7. Call normalization service
 
     Args:
         source_connection: SourceConnection to ingest
         poll_timeout_s: Max seconds to wait for run completion
-        poll_interval_s: Polling interval
+        poll_interval_s: Fixed polling interval (None = adaptive)
         apify_client: Optional ApifyClient instance (for testing)
 
     Returns:
@@ -230,6 +232,7 @@ def ingest_source(
             run_info.run_id,
             timeout_s=poll_timeout_s,
             interval_s=poll_interval_s,
+            actor_id=spec.actor_id,
         )
     except ApifyTimeoutError as e:
         # Update ApifyRun with timeout status
@@ -291,14 +294,30 @@ def ingest_source(
         )
         return result
 
+    # Step 8: Stream pages into RawApifyItem rows (bounded memory: one page
+    # of items in flight, however high the cap). Pages are fetched outside
+    # any transaction and each is written in its own short one, so no DB
+    # transaction stays open across Apify requests.
+    # Clear existing items for this run (idempotent replace)
+    RawApifyItem.objects.filter(apify_run=apify_run).delete()
+
+    raw_count = 0
     try:
         # CRITICAL: Pass cap as limit to enforce dataset-fetch cap
-        raw_items = apify_client.fetch_dataset_items(
-            dataset_id,
-            limit=cap,
-            offset=0,
-        )
+        for page in iter_dataset_pages(apify_client, dataset_id, limit=cap):
+            with transaction.atomic():
+                RawApifyItem.objects.bulk_create([
+                    RawApifyItem(
+                        apify_run=apify_run,
+                        item_index=raw_count + idx,
+                        raw_json=item,
+                    )
+                    for idx, item in enumerate(page)
+                ])
+            raw_count += len(page)
     except ApifyError as e:
+        # Drop the partial dataset; raw_item_count was never updated
+        RawApifyItem.objects.filter(apify_run=apify_run).delete()
         result.error = f"Failed to fetch dataset items: {e}"
         logger.exception(
             "Ingestion failed for %s: %s",
@@ -307,39 +326,17 @@ def ingest_source(
         )
         return result
 
-    logger.info(
-        "Fetched %d items from dataset %s (cap=%d)",
-        len(raw_items),
-        dataset_id,
-        cap,
-    )
-
-    # Step 8: Store RawApifyItem rows
-    with transaction.atomic():
-        # Clear existing items for this run (idempotent replace)
-        RawApifyItem.objects.filter(apify_run=apify_run).delete()
-
-        # Bulk create new items
-        raw_item_objects = [
-            RawApifyItem(
-                apify_run=apify_run,
-                item_index=idx,
-                raw_json=item,
-            )
-            for idx, item in enumerate(raw_items)
-        ]
-        RawApifyItem.objects.bulk_create(raw_item_objects)
-
-        # Update ApifyRun.raw_item_count
-        apify_run.raw_item_count = len(raw_items)
-        apify_run.save(update_fields=["raw_item_count"])
-
-    result.raw_items_count = len(raw_items)
+    # Update ApifyRun.raw_item_count
+    apify_run.raw_item_count = raw_count
+    apify_run.save(update_fields=["raw_item_count"])
+    result.raw_items_count = raw_count
 
     logger.info(
-        "Stored %d raw items for ApifyRun %s",
-        len(raw_items),
+        "Stored %d raw items for ApifyRun %s from dataset %s (cap=%d)",
+        raw_count,
         apify_run.id,
+        dataset_id,
+        cap,
     )
 
     # Step 9: Call normalization service
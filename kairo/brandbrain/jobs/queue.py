@@ -13,10 +13,17 @@ This module provides:
 
 Job leasing ensures no double-execution:
 - Worker claims job by atomic update: status=PENDING -> RUNNING
+  (kairo.core.job_scheduling: priority lanes, weighted round-robin across
+  tenants, FOR UPDATE SKIP LOCKED on PostgreSQL)
 - Sets locked_at and locked_by for stale lock detection
 - Stale locks (>10 min) are released and jobs become available
+- Enqueue publishes a wakeup (kairo.core.job_notify) so idle workers
+  start immediately instead of waiting out their poll interval
 - Workers extend locks periodically via heartbeat to prevent stale release
 
+Metrics (kairo.core.job_metrics): enqueue, claim, complete, fail and
+stale-release emit counters and latency histograms (queue="brandbrain").
+
 Retry policy:
 - Default max_attempts = 3
 - Exponential backoff: 2^attempt * 30 seconds
@@ -33,10 +40,20 @@ from datetime import timedelta
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from django.db import transaction
-from django.db.models import F, Q
 from django.utils import timezone
 
+from kairo.core.enums import JobPriority
+from kairo.core.job_metrics import (
+    BRANDBRAIN_QUEUE,
+    record_claim,
+    record_enqueue,
+    record_finish,
+    record_retry_backoff,
+    record_stale_release,
+)
+from kairo.core.job_notify import BRANDBRAIN_JOBS_CHANNEL, notify_job_available
+from kairo.core.job_scheduling import claim_jobs
+
 if TYPE_CHECKING:
     from kairo.brandbrain.models import BrandBrainJob
 
@@ -89,6 +106,7 @@ def enqueue_compile_job(
     force_refresh: bool = False,
     prompt_version: str = "v1",
     model: str = "gpt-4",
+    priority: int = JobPriority.INTERACTIVE,
 ) -> EnqueueResult:
     """
     Enqueue a compile job for background execution.
@@ -101,6 +119,7 @@ def enqueue_compile_job(
         force_refresh: Whether to force refresh all sources
         prompt_version: Compile prompt version
         model: LLM model identifier
+        priority: JobPriority lane (compiles are user-triggered by default)
 
     Returns:
         EnqueueResult with job_id and compile_run_id
@@ -112,6 +131,7 @@ def enqueue_compile_job(
         compile_run_id=compile_run_id,
         job_type="compile",
         status=BrandBrainJobStatus.PENDING,
+        priority=priority,
         params_json={
             "force_refresh": force_refresh,
             "prompt_version": prompt_version,
@@ -126,6 +146,11 @@ def enqueue_compile_job(
         compile_run_id,
     )
 
+    record_enqueue(BRANDBRAIN_QUEUE, priority)
+
+    # Wake an idle worker (delivered after commit)
+    notify_job_available(BRANDBRAIN_JOBS_CHANNEL)
+
     return EnqueueResult(
         job_id=job.id,
         compile_run_id=compile_run_id,
@@ -139,14 +164,16 @@ def claim_next_job(
     """
     Claim the next available job with atomic locking.
 
-    Uses optimistic locking pattern:
-    1. Find jobs WHERE status=PENDING AND available_at <= now
-    2. Update first one to status=RUNNING, set locked_at/locked_by
-    3. Return the job if successful
+    Scheduling and locking live in kairo.core.job_scheduling.claim_jobs():
+    1. Serve the highest priority lane with a PENDING job whose
+       available_at <= now
+    2. Within the lane, pick the tenant owed the next slot (weighted
+       round-robin), then its oldest job
+    3. Update it to status=RUNNING, set locked_at/locked_by
 
     SQLite compatibility:
-    - Uses atomic transaction instead of SELECT FOR UPDATE
-    - Single UPDATE with filter ensures no double-claiming
+    - Uses a conditional UPDATE (status=PENDING) instead of
+      SELECT FOR UPDATE SKIP LOCKED
 
     Args:
         worker_id: Identifier for this worker (defaults to hostname+uuid)
@@ -155,71 +182,44 @@ def claim_next_job(
     Returns:
         ClaimResult with claimed job or None.
     """
-    from kairo.brandbrain.models import BrandBrainJob, BrandBrainJobStatus
+    from kairo.brandbrain.models import BrandBrainJob
 
     if worker_id is None:
         worker_id = f"{socket.gethostname()}-{uuid_module.uuid4().hex[:8]}"
 
     now = timezone.now()
+    jobs = claim_jobs(
+        BrandBrainJob,
+        worker_id,
+        1,
+        now,
+        filters={"job_type": job_type},
+    )
 
-    with transaction.atomic():
-        # Find next available job
-        # Ordered by available_at (for backoff) then created_at (FIFO)
-        job = (
-            BrandBrainJob.objects
-            .filter(
-                job_type=job_type,
-                status=BrandBrainJobStatus.PENDING,
-                available_at__lte=now,
-            )
-            .order_by("available_at", "created_at")
-            .first()
-        )
-
-        if not job:
-            return ClaimResult(
-                job=None,
-                claimed=False,
-                reason="No available jobs",
-            )
-
-        # Atomic claim: only succeeds if still PENDING
-        # This prevents race conditions even without SELECT FOR UPDATE
-        rows_updated = BrandBrainJob.objects.filter(
-            id=job.id,
-            status=BrandBrainJobStatus.PENDING,
-        ).update(
-            status=BrandBrainJobStatus.RUNNING,
-            locked_at=now,
-            locked_by=worker_id,
-            attempts=F("attempts") + 1,
+    if not jobs:
+        return ClaimResult(
+            job=None,
+            claimed=False,
+            reason="No available jobs",
         )
 
-        if rows_updated == 0:
-            # Another worker claimed it first
-            return ClaimResult(
-                job=None,
-                claimed=False,
-                reason="Job claimed by another worker",
-            )
-
-        # Refresh the job to get updated values
-        job.refresh_from_db()
-
-        logger.info(
-            "Claimed job %s for brand %s (attempt %d/%d, worker=%s)",
-            job.id,
-            job.brand_id,
-            job.attempts,
-            job.max_attempts,
-            worker_id,
-        )
+    job = jobs[0]
+    record_claim(BRANDBRAIN_QUEUE, job, now)
+    logger.info(
+        "Claimed job %s for brand %s (attempt %d/%d, priority=%d, worker=%s)",
+        job.id,
+        job.brand_id,
+        job.attempts,
+        job.max_attempts,
+        job.priority,
+        worker_id,
+    )
 
-        return ClaimResult(
-            job=job,
-            claimed=True,
-            reason="",
-        )
+    return ClaimResult(
+        job=job,
+        claimed=True,
+        reason="",
+    )
 
 
 def complete_job(job_id: UUID) -> bool:
@@ -247,6 +247,13 @@ def complete_job(job_id: UUID) -> bool:
     )
 
     if rows_updated > 0:
+        claimed_at = (
+            BrandBrainJob.objects
+            .filter(id=job_id)
+            .values_list("claimed_at", flat=True)
+            .first()
+        )
+        record_finish(BRANDBRAIN_QUEUE, job_id, claimed_at, "succeeded", now)
         logger.info("Completed job %s", job_id)
         return True
 
@@ -294,6 +301,7 @@ def fail_job(job_id: UUID, error: str) -> bool:
         job.save(update_fields=[
             "status", "finished_at", "last_error", "locked_at", "locked_by"
         ])
+        record_finish(BRANDBRAIN_QUEUE, job_id, job.claimed_at, "failed", now)
         logger.warning(
             "Job %s permanently failed after %d attempts: %s",
             job_id,
@@ -314,6 +322,8 @@ def fail_job(job_id: UUID, error: str) -> bool:
     job.save(update_fields=[
         "status", "available_at", "last_error", "locked_at", "locked_by"
     ])
+    record_finish(BRANDBRAIN_QUEUE, job_id, job.claimed_at, "retry", now)
+    record_retry_backoff(BRANDBRAIN_QUEUE, backoff_seconds)
 
     logger.info(
         "Job %s scheduled for retry (attempt %d/%d, available at %s): %s",
@@ -355,6 +365,7 @@ def release_stale_jobs(
     )
 
     released_count = 0
+    retryable_count = 0
     for job in stale_jobs:
         # Capture lock info before clearing for logging
         prev_locked_at = job.locked_at
@@ -370,6 +381,7 @@ def release_stale_jobs(
             job.save(update_fields=[
                 "status", "finished_at", "last_error", "locked_at", "locked_by"
             ])
+            record_stale_release(BRANDBRAIN_QUEUE, "failed")
             logger.warning(
                 "Job %s failed due to stale lock after max attempts "
                 "(was locked since %s by %s)",
@@ -379,6 +391,7 @@ def release_stale_jobs(
             )
         else:
             # Release for retry
+            retryable_count += 1
             job.status = BrandBrainJobStatus.PENDING
             job.available_at = now
             job.last_error = f"Released from stale lock (was locked by {prev_locked_by})"
@@ -387,6 +400,7 @@ def release_stale_jobs(
             job.save(update_fields=[
                 "status", "available_at", "last_error", "locked_at", "locked_by"
             ])
+            record_stale_release(BRANDBRAIN_QUEUE, "retry")
             logger.info(
                 "Released stale job %s for retry (was locked since %s by %s)",
                 job.id,
@@ -395,6 +409,9 @@ def release_stale_jobs(
             )
         released_count += 1
 
+    if retryable_count > 0:
+        notify_job_available(BRANDBRAIN_JOBS_CHANNEL)
+
     return released_count
 
 
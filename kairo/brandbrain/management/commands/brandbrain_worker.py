@@ -7,7 +7,8 @@ Usage:
     python manage.py brandbrain_worker
 
 Options:
-    --poll-interval: Seconds between job queue polls (default: 5)
+    --poll-interval: Initial idle poll interval in seconds (default: 5)
+    --max-poll-interval: Cap for idle poll backoff in seconds (default: 60)
     --stale-check-interval: Seconds between stale lock checks (default: 60)
     --max-jobs: Max jobs to process before exiting (0 = unlimited, default: 0)
     --once: Process one job and exit (for testing)
@@ -42,6 +43,12 @@ from typing import TYPE_CHECKING
 
 from django.core.management.base import BaseCommand
 
+from kairo.core.job_metrics import BRANDBRAIN_QUEUE, record_start
+from kairo.core.job_notify import (
+    BRANDBRAIN_JOBS_CHANNEL,
+    AdaptivePollBackoff,
+    wait_for_job,
+)
 from kairo.brandbrain.jobs.queue import (
     claim_next_job,
     complete_job,
@@ -59,6 +66,9 @@ logger = logging.getLogger(__name__)
 # Should be less than DEFAULT_STALE_LOCK_MINUTES (10 min = 600s)
 HEARTBEAT_INTERVAL_S = 30
 
+# Max time a single idle wait blocks before re-checking for shutdown (seconds)
+SHUTDOWN_CHECK_INTERVAL_S = 1.0
+
 
 class Command(BaseCommand):
     """Run BrandBrain compile worker."""
@@ -75,7 +85,13 @@ class Command(BaseCommand):
             "--poll-interval",
             type=int,
             default=5,
-            help="Seconds between job queue polls (default: 5)",
+            help="Initial idle poll interval in seconds (default: 5)",
+        )
+        parser.add_argument(
+            "--max-poll-interval",
+            type=int,
+            default=60,
+            help="Cap for idle poll backoff in seconds (default: 60)",
         )
         parser.add_argument(
             "--stale-check-interval",
@@ -102,6 +118,7 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         poll_interval = options["poll_interval"]
+        max_poll_interval = options["max_poll_interval"]
         stale_check_interval = options["stale_check_interval"]
         max_jobs = options["max_jobs"]
         once = options["once"]
@@ -112,7 +129,7 @@ class Command(BaseCommand):
         signal.signal(signal.SIGTERM, self._signal_handler)
 
         self.stdout.write(f"Starting BrandBrain worker: {self._worker_id}")
-        self.stdout.write(f"  Poll interval: {poll_interval}s")
+        self.stdout.write(f"  Poll interval: {poll_interval}s (backoff to {max_poll_interval}s, wakes on enqueue)")
         self.stdout.write(f"  Stale check interval: {stale_check_interval}s")
         if max_jobs > 0:
             self.stdout.write(f"  Max jobs: {max_jobs}")
@@ -134,6 +151,7 @@ class Command(BaseCommand):
 
         jobs_processed = 0
         last_stale_check = time.monotonic()
+        backoff = AdaptivePollBackoff(poll_interval, max_poll_interval)
 
         while not self._shutdown_requested:
             # Check for stale locks periodically
@@ -148,6 +166,7 @@ class Command(BaseCommand):
             result = claim_next_job(worker_id=self._worker_id)
 
             if result.claimed and result.job:
+                backoff.reset()
                 job = result.job
                 self.stdout.write(
                     f"Claimed job {job.id} (brand={job.brand_id}, "
@@ -173,14 +192,32 @@ class Command(BaseCommand):
                     break
 
             else:
-                # No job available - sleep and retry
-                time.sleep(poll_interval)
+                # No job available - wait for an enqueue wakeup, with
+                # polling (adaptive backoff) as the safety net
+                if self._wait_for_work(backoff.next_timeout()):
+                    backoff.reset()
 
         if self._shutdown_requested:
             self.stdout.write("\nGraceful shutdown complete")
 
         self.stdout.write(f"Worker exiting. Jobs processed: {jobs_processed}")
 
+    def _wait_for_work(self, timeout: float) -> bool:
+        """
+        Block until a job is enqueued, timeout elapses, or shutdown is requested.
+
+        Returns:
+            True if woken by an enqueue notification.
+        """
+        deadline = time.monotonic() + timeout
+        while not self._shutdown_requested:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if wait_for_job(BRANDBRAIN_JOBS_CHANNEL, min(remaining, SHUTDOWN_CHECK_INTERVAL_S)):
+                return True
+        return False
+
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
         sig_name = signal.Signals(signum).name
@@ -238,6 +275,7 @@ class Command(BaseCommand):
             params = job.params_json or {}
             force_refresh = params.get("force_refresh", False)
 
+            record_start(BRANDBRAIN_QUEUE, job)
             self.stdout.write(f"  Executing compile for brand {job.brand_id}...")
 
             # Run the compile
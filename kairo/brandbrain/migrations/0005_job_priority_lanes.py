@@ -0,0 +1,64 @@
+"""
+Priority lanes and per-tenant fair scheduling for BrandBrainJob.
+
+Adds priority (JobPriority), a denormalized tenant, and claimed_at, plus
+the indexes used by kairo.core.job_scheduling. Existing rows keep the
+interactive default and get tenant backfilled from brand.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_tenant(apps, schema_editor):
+    BrandBrainJob = apps.get_model("brandbrain", "BrandBrainJob")
+    Brand = apps.get_model("core", "Brand")
+
+    BrandBrainJob.objects.update(
+        tenant_id=Subquery(
+            Brand.objects.filter(id=OuterRef("brand_id")).values("tenant_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brandbrain', '0004_pr6_brandbrain_job'),
+        ('core', '0003_create_user_models'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='brandbrainjob',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='brandbrainjob',
+            name='priority',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Interactive'), (10, 'First run'), (20, 'Scheduled')], default=0),
+        ),
+        migrations.AddField(
+            model_name='brandbrainjob',
+            name='tenant',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.tenant'),
+        ),
+        migrations.RunPython(
+            backfill_tenant,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddIndex(
+            model_name='brandbrainjob',
+            index=models.Index(fields=['status', 'priority', 'available_at', 'created_at'], name='idx_job_claim_order'),
+        ),
+        migrations.AddIndex(
+            model_name='brandbrainjob',
+            index=models.Index(fields=['status', 'priority', 'tenant', 'available_at'], name='idx_job_lane_tenant'),
+        ),
+        migrations.AddIndex(
+            model_name='brandbrainjob',
+            index=models.Index(fields=['priority', 'claimed_at'], name='idx_job_lane_claimed'),
+        ),
+    ]
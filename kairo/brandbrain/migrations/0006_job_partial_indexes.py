@@ -0,0 +1,41 @@
+"""
+Partial indexes for live jobs.
+
+The claim-order and per-tenant lane indexes now cover PENDING rows only, and
+a new (brand, -created_at) index covers PENDING/RUNNING rows, so claims and
+running-job lookups stay small as terminal history accumulates (terminal
+rows are moved out by kairo.core.job_retention).
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brandbrain', '0005_job_priority_lanes'),
+        ('core', '0004_job_archive'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='brandbrainjob',
+            name='idx_job_claim_order',
+        ),
+        migrations.RemoveIndex(
+            model_name='brandbrainjob',
+            name='idx_job_lane_tenant',
+        ),
+        migrations.AddIndex(
+            model_name='brandbrainjob',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['priority', 'available_at', 'created_at'], name='idx_job_pending_order'),
+        ),
+        migrations.AddIndex(
+            model_name='brandbrainjob',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['priority', 'tenant', 'available_at'], name='idx_job_pending_tenant'),
+        ),
+        migrations.AddIndex(
+            model_name='brandbrainjob',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'running'])), fields=['brand', '-created_at'], name='idx_job_brand_live'),
+        ),
+    ]
@@ -24,7 +24,8 @@ import uuid
 
 from django.db import models
 
-from kairo.core.models import Brand
+from kairo.core.enums import JobPriority
+from kairo.core.models import Brand, Tenant
 
 
 # =============================================================================
@@ -492,6 +493,10 @@ class BrandBrainJob(models.Model):
     - max_attempts default 3
     - available_at for exponential backoff
     - last_error for debugging
+
+    Retention:
+    - Terminal rows older than JOB_RETENTION_DAYS move to ArchivedJob
+      (kairo.core.job_retention, archive_jobs command)
     """
 
     JOB_TYPE_CHOICES = [
@@ -511,6 +516,14 @@ class BrandBrainJob(models.Model):
         on_delete=models.CASCADE,
         related_name="brandbrain_jobs",
     )
+    # Denormalized from brand.tenant (set on save) for fair scheduling
+    tenant = models.ForeignKey(
+        Tenant,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
     compile_run = models.ForeignKey(
         BrandBrainCompileRun,
         on_delete=models.CASCADE,
@@ -537,6 +550,11 @@ class BrandBrainJob(models.Model):
 
     # Scheduling
     available_at = models.DateTimeField(auto_now_add=True)  # for backoff scheduling
+    priority = models.PositiveSmallIntegerField(
+        choices=JobPriority.choices,
+        default=JobPriority.INTERACTIVE,
+    )
+    claimed_at = models.DateTimeField(null=True, blank=True)  # latest claim (fair share window)
 
     # Job parameters
     params_json = models.JSONField(default=dict)  # force_refresh, prompt_version, model
@@ -555,6 +573,33 @@ class BrandBrainJob(models.Model):
                 fields=["status", "available_at"],
                 name="idx_job_status_available",
             ),
+            # Claim order: priority lane, then backoff/FIFO.
+            # Partial (PENDING only) so terminal history never bloats it.
+            models.Index(
+                fields=["priority", "available_at", "created_at"],
+                name="idx_job_pending_order",
+                condition=models.Q(status=BrandBrainJobStatus.PENDING),
+            ),
+            # Fair scheduling: per-tenant lane heads and claims
+            models.Index(
+                fields=["priority", "tenant", "available_at"],
+                name="idx_job_pending_tenant",
+                condition=models.Q(status=BrandBrainJobStatus.PENDING),
+            ),
+            # Live job per brand (running-job lookups, enqueue dedupe)
+            models.Index(
+                fields=["brand", "-created_at"],
+                name="idx_job_brand_live",
+                condition=models.Q(status__in=[
+                    BrandBrainJobStatus.PENDING,
+                    BrandBrainJobStatus.RUNNING,
+                ]),
+            ),
+            # Fair scheduling: recent claims per lane
+            models.Index(
+                fields=["priority", "claimed_at"],
+                name="idx_job_lane_claimed",
+            ),
             # Brand job history
             models.Index(
                 fields=["brand", "-created_at"],
@@ -564,3 +609,14 @@ class BrandBrainJob(models.Model):
 
     def __str__(self) -> str:
         return f"Job {self.id} ({self.job_type}) for {self.brand_id} [{self.status}]"
+
+    def save(self, *args, **kwargs):
+        """Denormalize tenant from brand before the first save."""
+        if self.tenant_id is None and self.brand_id is not None:
+            self.tenant_id = (
+                Brand.objects
+                .filter(id=self.brand_id)
+                .values_list("tenant_id", flat=True)
+                .first()
+            )
+        super().save(*args, **kwargs)
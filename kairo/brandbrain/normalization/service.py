@@ -21,7 +21,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 from uuid import UUID
 
 from django.db import transaction
@@ -36,6 +36,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Raw items read per DB round trip while normalizing
+RAW_ITEM_CHUNK_SIZE = 200
+
 
 @dataclass
 class NormalizationResult:
@@ -117,8 +120,7 @@ def normalize_apify_run(
     # Fetch raw items (from database, not Apify API)
     raw_items = _fetch_raw_items(apify_run, limit=fetch_limit)
     logger.info(
-        "Normalizing %d raw items for ApifyRun %s (actor=%s, cap=%d)",
-        len(raw_items),
+        "Normalizing raw items for ApifyRun %s (actor=%s, cap=%d)",
         apify_run_id,
         apify_run.actor_id,
         fetch_limit,
@@ -189,16 +191,28 @@ def _get_source_connection(source_connection_id: UUID) -> "SourceConnection | No
         return None
 
 
-def _fetch_raw_items(apify_run: ApifyRun, limit: int) -> list[RawApifyItem]:
+def _fetch_raw_items(apify_run: ApifyRun, limit: int) -> Iterator[RawApifyItem]:
     """
-    Fetch raw items for an ApifyRun with cap enforcement.
+    Stream raw items for an ApifyRun with cap enforcement.
 
     PR-3 requirement: dataset-fetch cap must be enforced.
+    Rows are read RAW_ITEM_CHUNK_SIZE at a time by item_index range
+    (keyset paging in plain queries, not a server-side cursor, which
+    PgBouncer transaction pooling cannot keep across autocommit FETCHes),
+    so memory stays flat as caps grow.
     """
-    return list(
-        RawApifyItem.objects.filter(apify_run=apify_run)
-        .order_by("item_index")[:limit]
-    )
+    remaining = limit
+    last_index = -1
+    while remaining > 0:
+        chunk = list(
+            RawApifyItem.objects.filter(apify_run=apify_run, item_index__gt=last_index)
+            .order_by("item_index")[:min(RAW_ITEM_CHUNK_SIZE, remaining)]
+        )
+        if not chunk:
+            return
+        yield from chunk
+        remaining -= len(chunk)
+        last_index = chunk[-1].item_index
 
 
 def _upsert_normalized_item(
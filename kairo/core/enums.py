@@ -138,3 +138,16 @@ class TodayBoardState(models.TextChoices):
     READY = "ready", "Ready"
     INSUFFICIENT_EVIDENCE = "insufficient_evidence", "Insufficient Evidence"
     ERROR = "error", "Error"
+
+
+class JobPriority(models.IntegerChoices):
+    """
+    Priority lanes for the durable job queues (OpportunitiesJob, BrandBrainJob).
+
+    Stored as a small integer so claims can ORDER BY it; lower values are
+    claimed first. Within a lane, tenants are served weighted round-robin
+    (see kairo.core.job_scheduling).
+    """
+    INTERACTIVE = 0, "Interactive"  # POST /regenerate, user-triggered compile
+    FIRST_RUN = 10, "First run"  # first-run fixture auto-enqueue
+    SCHEDULED = 20, "Scheduled"  # background refresh
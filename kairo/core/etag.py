@@ -0,0 +1,60 @@
+"""
+Conditional GET helpers (ETag / If-None-Match).
+
+Used by the polling endpoints (GET /today, GET /brandbrain/latest) to answer
+an unchanged poll with 304 Not Modified before building the payload.
+
+ETags are strong and opaque; callers derive them from immutable identity
+(board version + content digest, snapshot id + representation). Matching
+follows RFC 9110 §13.1.2: If-None-Match uses weak comparison, and "*"
+matches any current representation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from django.http import HttpRequest, HttpResponse
+from django.utils.http import parse_etags, quote_etag
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Build a quoted strong ETag from identity parts.
+
+    Args:
+        parts: Values identifying the representation (ids, versions, variants)
+
+    Returns:
+        Quoted ETag, e.g. '"3f2a9c0d41b7e8a5"'
+    """
+    digest = hashlib.sha1(":".join(str(p) for p in parts).encode()).hexdigest()[:16]
+    return quote_etag(digest)
+
+
+def etag_matches(request: HttpRequest, etag: str | None) -> bool:
+    """
+    True if the request's If-None-Match covers this ETag.
+
+    Args:
+        request: Incoming request
+        etag: Quoted ETag of the current representation (None = unknown)
+    """
+    if not etag:
+        return False
+    header = request.headers.get("If-None-Match", "")
+    if not header:
+        return False
+
+    candidates = parse_etags(header)
+    if "*" in candidates:
+        return True
+    target = etag.removeprefix("W/")
+    return any(candidate.removeprefix("W/") == target for candidate in candidates)
+
+
+def not_modified(etag: str) -> HttpResponse:
+    """304 response carrying the current ETag (no body)."""
+    response = HttpResponse(status=304)
+    response["ETag"] = etag
+    return response
@@ -0,0 +1,291 @@
+"""
+Job Progress Events.
+
+Pub/sub for background job progress, consumed by the SSE endpoints
+(kairo.core.job_stream). Job queue modules publish state changes on a
+per-job channel; each open stream subscribes to its job's channel.
+
+Unlike kairo.core.job_notify (wakeup tokens, one consumer), every
+subscriber receives every event.
+
+Event payloads are flat JSON dicts describing the job's new state, e.g.
+{"job_id": ..., "status": "running", "stage": "synthesizing", "detail": ...}.
+Streams merge them into the state they last sent.
+
+Backends (selected by settings.JOB_EVENTS_BACKEND):
+- "redis": PUBLISH/SUBSCRIBE. Used when REDIS_URL is configured.
+- "inprocess": per-subscriber queues. Stand-in for tests and
+  single-process dev.
+- "none": publish is a no-op; streams fall back to re-reading job state.
+- "auto" (default): redis if REDIS_URL, else inprocess.
+
+Events are a latency optimization only. Streams re-read job state from the
+DB on connect and every JOB_EVENTS_POLL_S, so a lost event (or a worker in
+another process without Redis) delays an update by at most one poll.
+
+Publishing never raises: a job transition must not fail because the event
+channel is unavailable.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+import time
+from typing import Any, Protocol
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+logger = logging.getLogger("kairo.core.job_events")
+
+
+# =============================================================================
+# CHANNELS
+# =============================================================================
+
+OPPORTUNITIES_EVENTS = "opportunities"
+COMPILE_EVENTS = "compile"
+
+# Events buffered per subscriber (inprocess backend); a stream that falls
+# further behind drops events and catches up on its next DB poll.
+MAX_BUFFERED_EVENTS = 100
+
+
+def job_channel(kind: str, job_id) -> str:
+    """Channel name for one job's events."""
+    return f"kairo_job_events:{kind}:{job_id}"
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+
+class JobEventSubscription(Protocol):
+    """An open subscription to one channel."""
+
+    def get(self, timeout: float) -> dict | None:
+        """Block up to timeout seconds for the next event. None on timeout."""
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class JobEventBus(Protocol):
+    """Event backend interface."""
+
+    def publish(self, channel: str, event: dict) -> None:
+        ...
+
+    def subscribe(self, channel: str) -> JobEventSubscription:
+        ...
+
+
+class _NullSubscription:
+    def get(self, timeout: float) -> dict | None:
+        time.sleep(timeout)
+        return None
+
+    def close(self) -> None:
+        pass
+
+
+class NullJobEventBus:
+    """No-op backend: nothing is delivered, subscribers just time out."""
+
+    def publish(self, channel: str, event: dict) -> None:
+        pass
+
+    def subscribe(self, channel: str) -> JobEventSubscription:
+        return _NullSubscription()
+
+
+class _InProcessSubscription:
+    def __init__(self, bus: "InProcessJobEventBus", channel: str) -> None:
+        self._bus = bus
+        self._channel = channel
+        self.queue: queue.Queue = queue.Queue(maxsize=MAX_BUFFERED_EVENTS)
+
+    def get(self, timeout: float) -> dict | None:
+        try:
+            return self.queue.get(timeout=max(timeout, 0))
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        self._bus._unsubscribe(self._channel, self)
+
+
+class InProcessJobEventBus:
+    """
+    In-process backend for tests and single-process dev.
+
+    Each subscriber gets its own bounded queue. Safe across threads in one
+    process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, set[_InProcessSubscription]] = {}
+
+    def publish(self, channel: str, event: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription.queue.put_nowait(event)
+            except queue.Full:
+                pass
+
+    def subscribe(self, channel: str) -> JobEventSubscription:
+        subscription = _InProcessSubscription(self, channel)
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, channel: str, subscription: _InProcessSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[channel]
+
+    def subscriber_count(self, channel: str) -> int:
+        """Number of open subscriptions on channel (for tests)."""
+        with self._lock:
+            return len(self._subscribers.get(channel, ()))
+
+
+class _RedisSubscription:
+    def __init__(self, pubsub) -> None:
+        self._pubsub = pubsub
+
+    def get(self, timeout: float) -> dict | None:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            message = self._pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=remaining
+            )
+            if message and message.get("type") == "message":
+                return json.loads(message["data"])
+
+    def close(self) -> None:
+        self._pubsub.close()
+
+
+class RedisJobEventBus:
+    """
+    Redis backend using PUBLISH/SUBSCRIBE.
+
+    One pubsub connection per open stream, released on close.
+    """
+
+    def __init__(self, url: str) -> None:
+        import redis
+
+        self._client = redis.Redis.from_url(url, socket_connect_timeout=5)
+
+    def publish(self, channel: str, event: dict) -> None:
+        self._client.publish(channel, json.dumps(event, cls=DjangoJSONEncoder))
+
+    def subscribe(self, channel: str) -> JobEventSubscription:
+        pubsub = self._client.pubsub()
+        pubsub.subscribe(channel)
+        return _RedisSubscription(pubsub)
+
+
+# =============================================================================
+# BACKEND SELECTION
+# =============================================================================
+
+_bus: JobEventBus | None = None
+_bus_lock = threading.Lock()
+
+
+def _build_bus() -> JobEventBus:
+    backend = getattr(settings, "JOB_EVENTS_BACKEND", "auto")
+    redis_url = getattr(settings, "REDIS_URL", "")
+
+    if backend == "auto":
+        backend = "redis" if redis_url else "inprocess"
+
+    if backend == "redis":
+        return RedisJobEventBus(redis_url)
+    if backend == "inprocess":
+        return InProcessJobEventBus()
+    if backend == "none":
+        return NullJobEventBus()
+
+    logger.warning("Unknown JOB_EVENTS_BACKEND=%r, streams will poll", backend)
+    return NullJobEventBus()
+
+
+def get_event_bus() -> JobEventBus:
+    """Get the process-wide event bus (created on first use)."""
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = _build_bus()
+    return _bus
+
+
+def set_event_bus(bus: JobEventBus | None) -> None:
+    """Override the process-wide event bus (tests). None resets to settings."""
+    global _bus
+    with _bus_lock:
+        _bus = bus
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+
+def publish_job_event(kind: str, job_id, **state: Any) -> None:
+    """
+    Publish a job's new state once the current transaction commits.
+
+    Deferred via transaction.on_commit so a stream that re-reads the job
+    sees the committed row. Runs immediately when not inside an atomic
+    block. Never raises.
+
+    Args:
+        kind: OPPORTUNITIES_EVENTS or COMPILE_EVENTS
+        job_id: Job (or compile run) id
+        state: Changed fields, e.g. status="running", stage="synthesizing"
+    """
+    channel = job_channel(kind, job_id)
+    event = {"job_id": str(job_id), **state}
+
+    def _publish() -> None:
+        try:
+            get_event_bus().publish(channel, event)
+        except Exception as e:
+            logger.warning("Job event publish failed on %s: %s", channel, str(e))
+
+    transaction.on_commit(_publish)
+
+
+def subscribe_job_events(kind: str, job_id) -> JobEventSubscription:
+    """
+    Subscribe to one job's events.
+
+    Backend errors are logged and yield a subscription that never delivers,
+    so the stream degrades to polling.
+    """
+    channel = job_channel(kind, job_id)
+    try:
+        return get_event_bus().subscribe(channel)
+    except Exception as e:
+        logger.warning("Job event subscribe failed on %s: %s", channel, str(e))
+        return _NullSubscription()
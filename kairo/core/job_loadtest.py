@@ -0,0 +1,359 @@
+"""
+Job Queue Load Test Harness.
+
+Spins up K simulated worker threads against one durable job queue
+(kairo.hero.jobs.queue or kairo.brandbrain.jobs.queue), enqueues M jobs
+and drains them, measuring:
+- claims/sec over the drain
+- p50/p99 claim latency (one claim call, including empty polls)
+- double claims: the same (job, attempt) handed to two workers
+- stale-lock recoveries: simulated worker crashes recovered by
+  release_stale_jobs()
+
+Used by the job_queue_loadtest management command and
+tests/test_job_queue_loadtest.py. Works on SQLite (writers serialize;
+"database is locked" errors are counted, not fatal) and PostgreSQL
+(FOR UPDATE SKIP LOCKED claim path).
+
+All rows live under a throwaway tenant that is deleted afterwards.
+Workers claim whatever is PENDING in the queue, so run against a scratch
+database: the harness refuses to start if the queue already has live jobs.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from typing import Callable
+
+from django.db import OperationalError, close_old_connections, connection
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+QUEUES = ("opportunities", "brandbrain")
+
+# Idle sleep between empty polls (seconds)
+IDLE_POLL_S = 0.005
+
+# Main-thread completion check interval (seconds)
+DONE_POLL_S = 0.05
+
+
+# =============================================================================
+# RESULT TYPES
+# =============================================================================
+
+
+@dataclass
+class LoadTestConfig:
+    """Parameters for one load test run."""
+    queue: str = "opportunities"
+    workers: int = 4
+    jobs: int = 200
+    batch_size: int = 1  # claim_next_jobs limit (opportunities only)
+    crash_rate: float = 0.0  # fraction of first attempts abandoned mid-run
+    timeout_s: float = 120.0
+    seed: int = 0
+
+
+@dataclass
+class LoadTestReport:
+    """Measured results of one load test run."""
+    queue: str
+    vendor: str
+    workers: int
+    jobs: int
+    batch_size: int
+    claims: int = 0
+    completed: int = 0
+    elapsed_s: float = 0.0
+    claims_per_sec: float = 0.0
+    claim_p50_ms: float = 0.0
+    claim_p99_ms: float = 0.0
+    double_claims: int = 0
+    crashes: int = 0
+    stale_recoveries: int = 0
+    db_lock_errors: int = 0
+    timed_out: bool = False
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True if every job completed exactly once with no double claims."""
+        return (
+            not self.timed_out
+            and self.double_claims == 0
+            and self.completed == self.jobs
+            and not self.errors
+        )
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "ok": self.ok}
+
+
+class LoadTestError(Exception):
+    """Raised when the harness cannot run safely."""
+
+
+# =============================================================================
+# QUEUE ADAPTERS
+# =============================================================================
+
+
+@dataclass
+class _QueueOps:
+    model: type
+    claim: Callable[[str, int], list]
+    complete: Callable[[object], bool]
+    release_stale: Callable[[int], int]
+    stale_minutes: int
+
+
+def _queue_ops(queue: str) -> _QueueOps:
+    if queue == "opportunities":
+        from kairo.hero.jobs import queue as q
+        from kairo.hero.models import OpportunitiesJob
+
+        return _QueueOps(
+            model=OpportunitiesJob,
+            claim=lambda worker_id, limit: q.claim_next_jobs(worker_id=worker_id, limit=limit),
+            complete=q.complete_job,
+            release_stale=lambda minutes: q.release_stale_jobs(stale_threshold_minutes=minutes),
+            stale_minutes=q.DEFAULT_STALE_LOCK_MINUTES,
+        )
+
+    if queue == "brandbrain":
+        from kairo.brandbrain.jobs import queue as q
+        from kairo.brandbrain.models import BrandBrainJob
+
+        def claim(worker_id: str, limit: int) -> list:
+            result = q.claim_next_job(worker_id=worker_id)
+            return [result.job] if result.claimed else []
+
+        return _QueueOps(
+            model=BrandBrainJob,
+            claim=claim,
+            complete=q.complete_job,
+            release_stale=lambda minutes: q.release_stale_jobs(stale_threshold_minutes=minutes),
+            stale_minutes=q.DEFAULT_STALE_LOCK_MINUTES,
+        )
+
+    raise LoadTestError(f"Unknown queue {queue!r} (expected one of {QUEUES})")
+
+
+def _seed_jobs(queue: str, tenant, count: int) -> None:
+    """Create one brand per job (one PENDING job per brand) and enqueue."""
+    from kairo.core.models import Brand
+
+    brands = Brand.objects.bulk_create([
+        Brand(tenant=tenant, name=f"Load test brand {i}", slug=f"{tenant.slug}-{i}")
+        for i in range(count)
+    ])
+
+    if queue == "opportunities":
+        from kairo.hero.jobs.queue import enqueue_opportunities_job
+
+        for brand in brands:
+            enqueue_opportunities_job(brand.id)
+    else:
+        from kairo.brandbrain.jobs.queue import enqueue_compile_job
+        from kairo.brandbrain.models import BrandBrainCompileRun
+
+        runs = BrandBrainCompileRun.objects.bulk_create([
+            BrandBrainCompileRun(brand=brand) for brand in brands
+        ])
+        for brand, run in zip(brands, runs):
+            enqueue_compile_job(brand.id, run.id)
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+# =============================================================================
+# HARNESS
+# =============================================================================
+
+
+def run_queue_load_test(config: LoadTestConfig) -> LoadTestReport:
+    """
+    Run one load test and return its report.
+
+    Flow:
+    1. Create a throwaway tenant with M brands and enqueue M jobs
+    2. Start K worker threads: claim (batch_size), then complete each job,
+       except that crash_rate of first attempts are abandoned (lock held)
+    3. Main thread acts as the stale reaper: abandoned locks are aged past
+       the stale threshold and release_stale_jobs() requeues them
+    4. Stop when all M jobs completed or timeout_s elapsed
+    5. Delete the tenant and its brands (cascades to jobs)
+
+    Raises:
+        LoadTestError: Unknown queue, or the queue already has live jobs
+    """
+    from kairo.core.models import Brand, Tenant
+
+    ops = _queue_ops(config.queue)
+
+    live = ops.model.objects.filter(status__in=["pending", "running"]).count()
+    if live:
+        raise LoadTestError(
+            f"{config.queue} queue has {live} live jobs; workers would claim them. "
+            "Run the load test against a scratch database."
+        )
+
+    report = LoadTestReport(
+        queue=config.queue,
+        vendor=connection.vendor,
+        workers=config.workers,
+        jobs=config.jobs,
+        batch_size=config.batch_size if config.queue == "opportunities" else 1,
+    )
+
+    slug = f"loadtest-{uuid.uuid4().hex[:8]}"
+    tenant = Tenant.objects.create(name="Queue load test", slug=slug)
+    try:
+        _seed_jobs(config.queue, tenant, config.jobs)
+        _drain(ops, config, report, tenant)
+    finally:
+        # Brand.tenant is PROTECT: brands (and their jobs) go first
+        Brand.objects.filter(tenant=tenant).delete()
+        tenant.delete()
+
+    return report
+
+
+def _drain(ops: _QueueOps, config: LoadTestConfig, report: LoadTestReport, tenant) -> None:
+    lock = threading.Lock()
+    latencies: list[float] = []
+    seen: dict[tuple, str] = {}  # (job_id, attempt) -> worker_id
+    abandoned: set = set()
+    state = {"claims": 0, "lock_errors": 0, "double": 0, "crashes": 0}
+    stop = threading.Event()
+    rng = random.Random(config.seed)
+
+    def worker(worker_id: str) -> None:
+        try:
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    jobs = ops.claim(worker_id, report.batch_size)
+                except OperationalError:
+                    with lock:
+                        state["lock_errors"] += 1
+                    continue
+                elapsed = time.perf_counter() - started
+
+                with lock:
+                    latencies.append(elapsed)
+                    state["claims"] += len(jobs)
+                    for job in jobs:
+                        key = (job.id, job.attempts)
+                        if key in seen:
+                            state["double"] += 1
+                            report.errors.append(
+                                f"job {job.id} attempt {job.attempts} claimed by "
+                                f"{seen[key]} and {worker_id}"
+                            )
+                        seen[key] = worker_id
+
+                if not jobs:
+                    time.sleep(IDLE_POLL_S)
+                    continue
+
+                for job in jobs:
+                    with lock:
+                        crash = job.attempts == 1 and rng.random() < config.crash_rate
+                        if crash:
+                            state["crashes"] += 1
+                            abandoned.add(job.id)
+                    if crash:
+                        continue
+                    _complete(job.id)
+        except Exception as e:
+            with lock:
+                report.errors.append(f"{worker_id}: {e!r}")
+        finally:
+            close_old_connections()
+            connection.close()
+
+    def _complete(job_id) -> None:
+        # SQLite raises "database table is locked" instead of waiting. The
+        # error can land after the status UPDATE committed, so completions
+        # are counted from the DB (_count_succeeded), not from return values.
+        while not stop.is_set():
+            try:
+                ops.complete(job_id)
+                return
+            except OperationalError:
+                with lock:
+                    state["lock_errors"] += 1
+                time.sleep(IDLE_POLL_S)
+
+    threads = [
+        threading.Thread(target=worker, args=(f"loadtest-w{i}",), daemon=True)
+        for i in range(config.workers)
+    ]
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+
+    deadline = started + config.timeout_s
+    while time.perf_counter() < deadline:
+        with lock:
+            to_release = list(abandoned)
+            abandoned.clear()
+        if to_release:
+            report.stale_recoveries += _recover_stale(ops, to_release)
+        if _count_succeeded(ops, tenant) >= config.jobs:
+            break
+        time.sleep(DONE_POLL_S)
+    else:
+        report.timed_out = True
+
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    report.elapsed_s = time.perf_counter() - started
+    report.claims = state["claims"]
+    report.completed = _count_succeeded(ops, tenant)
+    report.double_claims = state["double"]
+    report.crashes = state["crashes"]
+    report.db_lock_errors = state["lock_errors"]
+    report.claims_per_sec = report.claims / report.elapsed_s if report.elapsed_s else 0.0
+    report.claim_p50_ms = _percentile(latencies, 50) * 1000
+    report.claim_p99_ms = _percentile(latencies, 99) * 1000
+
+
+def _count_succeeded(ops: _QueueOps, tenant) -> int:
+    """Jobs of this run that reached SUCCEEDED (-1 if the DB is busy)."""
+    for _ in range(20):
+        try:
+            return ops.model.objects.filter(tenant=tenant, status="succeeded").count()
+        except OperationalError:
+            time.sleep(IDLE_POLL_S)
+    return -1
+
+
+def _recover_stale(ops: _QueueOps, job_ids: list) -> int:
+    """Age abandoned locks past the threshold, then run the stale reaper."""
+    aged = timezone.now() - timedelta(minutes=ops.stale_minutes + 1)
+    for _ in range(20):
+        try:
+            ops.model.objects.filter(id__in=job_ids, status="running").update(locked_at=aged)
+            return ops.release_stale(ops.stale_minutes)
+        except OperationalError:
+            time.sleep(IDLE_POLL_S)
+    return 0
@@ -0,0 +1,483 @@
+"""
+Job Queue Metrics.
+
+Counters and histograms for the durable job queues (OpportunitiesJob,
+BrandBrainJob), emitted by the queue modules on enqueue, claim, complete,
+fail and stale-release, plus DB-derived gauges read at scrape time.
+Exposed via GET /hero/internal/queues/metrics/ (JSON or Prometheus text).
+
+Emitted series (all labelled with queue="opportunities"|"brandbrain"):
+- kairo_job_enqueued_total{priority, coalesced}
+- kairo_job_claimed_total{priority}
+- kairo_job_finished_total{outcome}: succeeded, insufficient_evidence,
+  failed (permanent), superseded
+- kairo_job_retried_total: failure scheduled for retry
+- kairo_job_stale_released_total{outcome}: retry, failed, superseded
+- kairo_job_queue_wait_seconds{priority}: created_at -> claim
+  (time in queue, including retry backoff)
+- kairo_job_ready_wait_seconds{priority}: available_at -> claim
+  (time claimable but unclaimed; grows when workers are short)
+- kairo_job_retry_backoff_seconds: backoff delay assigned on retry
+  (compare with ready_wait to see whether backoff dominates latency)
+- kairo_job_claim_to_start_seconds: claim -> worker starts executing
+- kairo_job_run_seconds{outcome}: claim -> terminal/retry
+- kairo_job_stage_seconds{stage}: time spent per progress stage
+
+Gauges (read from the DB on each scrape, authoritative across processes):
+- kairo_job_depth{status, priority}: PENDING/RUNNING rows
+- kairo_job_pending_backoff: PENDING rows whose available_at is in the future
+- kairo_job_oldest_ready_age_seconds{priority}: age of the oldest claimable job
+
+Backends (selected by settings.JOB_METRICS_BACKEND):
+- "redis": HINCRBYFLOAT into one hash, so counters from web and worker
+  processes aggregate. Used when REDIS_URL is configured.
+- "inprocess": per-process dict (tests, single-process dev).
+- "none": recording is a no-op.
+- "auto" (default): redis if REDIS_URL, else inprocess.
+
+Recording never raises: a metrics outage must not fail a queue operation.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from datetime import datetime
+from typing import Any, Protocol
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger("kairo.core.job_metrics")
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+OPPORTUNITIES_QUEUE = "opportunities"
+BRANDBRAIN_QUEUE = "brandbrain"
+
+METRIC_PREFIX = "kairo_job_"
+
+# Histogram buckets (seconds): sub-second claims up to half-hour backoffs
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+
+HISTOGRAMS = {
+    "queue_wait_seconds",
+    "ready_wait_seconds",
+    "retry_backoff_seconds",
+    "claim_to_start_seconds",
+    "run_seconds",
+    "stage_seconds",
+}
+
+HELP = {
+    "enqueued_total": "Jobs enqueued (coalesced=true: merged into an existing job)",
+    "claimed_total": "Jobs claimed by a worker",
+    "finished_total": "Jobs reaching a terminal state",
+    "retried_total": "Failures scheduled for retry",
+    "stale_released_total": "Jobs released from a stale lock",
+    "queue_wait_seconds": "Time from enqueue to claim",
+    "ready_wait_seconds": "Time from available_at to claim",
+    "retry_backoff_seconds": "Backoff delay assigned on retry",
+    "claim_to_start_seconds": "Time from claim to execution start",
+    "run_seconds": "Time from claim to finish or retry",
+    "stage_seconds": "Time spent per progress stage",
+    "depth": "PENDING/RUNNING jobs",
+    "pending_backoff": "PENDING jobs waiting out retry backoff",
+    "oldest_ready_age_seconds": "Age of the oldest claimable job",
+}
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+
+class JobMetricsBackend(Protocol):
+    """Metrics storage interface: flat series key -> float."""
+
+    def incr(self, values: dict[str, float]) -> None:
+        """Add each amount to its series."""
+        ...
+
+    def snapshot(self) -> dict[str, float]:
+        """Return all series."""
+        ...
+
+
+class NullJobMetricsBackend:
+    """No-op backend."""
+
+    def incr(self, values: dict[str, float]) -> None:
+        pass
+
+    def snapshot(self) -> dict[str, float]:
+        return {}
+
+
+class InProcessJobMetricsBackend:
+    """Per-process backend for tests and single-process dev."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._series: dict[str, float] = {}
+
+    def incr(self, values: dict[str, float]) -> None:
+        with self._lock:
+            for key, amount in values.items():
+                self._series[key] = self._series.get(key, 0.0) + amount
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._series)
+
+
+class RedisJobMetricsBackend:
+    """Redis backend: one hash, HINCRBYFLOAT per series in a pipeline."""
+
+    KEY = "kairo:job_metrics"
+
+    def __init__(self, url: str) -> None:
+        import redis
+
+        self._client = redis.Redis.from_url(url, socket_connect_timeout=5)
+
+    def incr(self, values: dict[str, float]) -> None:
+        pipe = self._client.pipeline(transaction=False)
+        for key, amount in values.items():
+            pipe.hincrbyfloat(self.KEY, key, amount)
+        pipe.execute()
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            key.decode(): float(value)
+            for key, value in self._client.hgetall(self.KEY).items()
+        }
+
+
+_backend: JobMetricsBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def _build_backend() -> JobMetricsBackend:
+    backend = getattr(settings, "JOB_METRICS_BACKEND", "auto")
+    redis_url = getattr(settings, "REDIS_URL", "")
+
+    if backend == "auto":
+        backend = "redis" if redis_url else "inprocess"
+
+    if backend == "redis":
+        return RedisJobMetricsBackend(redis_url)
+    if backend == "inprocess":
+        return InProcessJobMetricsBackend()
+    if backend == "none":
+        return NullJobMetricsBackend()
+
+    logger.warning("Unknown JOB_METRICS_BACKEND=%r, metrics disabled", backend)
+    return NullJobMetricsBackend()
+
+
+def get_metrics_backend() -> JobMetricsBackend:
+    """Get the process-wide metrics backend (created on first use)."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _build_backend()
+    return _backend
+
+
+def set_metrics_backend(backend: JobMetricsBackend | None) -> None:
+    """Override the process-wide backend (tests). None resets to settings."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+# =============================================================================
+# SERIES ENCODING
+# =============================================================================
+
+
+def _series_key(name: str, labels: dict[str, Any]) -> str:
+    """Encode a series as Prometheus text: name{k="v",...}."""
+    if not labels:
+        return name
+    body = ",".join(f'{k}="{labels[k]}"' for k in sorted(labels))
+    return f"{name}{{{body}}}"
+
+
+def _parse_series_key(key: str) -> tuple[str, dict[str, str]]:
+    name, _, rest = key.partition("{")
+    labels = {}
+    if rest:
+        for pair in rest.rstrip("}").split(","):
+            k, _, v = pair.partition("=")
+            labels[k] = v.strip('"')
+    return name, labels
+
+
+def _inc(metric: str, amount: float = 1.0, **labels: Any) -> None:
+    _record({_series_key(METRIC_PREFIX + metric, labels): amount})
+
+
+def _observe(metric: str, value: float, **labels: Any) -> None:
+    """Record one histogram observation (cumulative buckets, sum, count)."""
+    value = max(0.0, value)
+    name = METRIC_PREFIX + metric
+    # Every bucket is written (0 below the value) so each series exists
+    values = {
+        _series_key(f"{name}_bucket", {**labels, "le": bound}): 1.0 if value <= bound else 0.0
+        for bound in DEFAULT_BUCKETS
+    }
+    values[_series_key(f"{name}_bucket", {**labels, "le": "+Inf"})] = 1.0
+    values[_series_key(f"{name}_sum", labels)] = value
+    values[_series_key(f"{name}_count", labels)] = 1.0
+    _record(values)
+
+
+def _record(values: dict[str, float]) -> None:
+    try:
+        get_metrics_backend().incr(values)
+    except Exception as e:
+        logger.warning("Job metrics recording failed: %s", e)
+
+
+def _priority_label(priority: int | None) -> str:
+    from kairo.core.enums import JobPriority
+
+    try:
+        return JobPriority(priority).name.lower()
+    except ValueError:
+        return str(priority)
+
+
+def _seconds_since(then: datetime | None, now: datetime) -> float | None:
+    if then is None:
+        return None
+    return (now - then).total_seconds()
+
+
+# =============================================================================
+# RECORDING API (called by the queue modules and workers)
+# =============================================================================
+
+
+def record_enqueue(queue: str, priority: int, *, coalesced: bool = False) -> None:
+    """Record an enqueue (or a request coalesced into an existing job)."""
+    _inc(
+        "enqueued_total",
+        queue=queue,
+        priority=_priority_label(priority),
+        coalesced="true" if coalesced else "false",
+    )
+
+
+def record_claim(queue: str, job, now: datetime) -> None:
+    """Record a claim with its time-in-queue and ready-wait."""
+    priority = _priority_label(job.priority)
+    _inc("claimed_total", queue=queue, priority=priority)
+
+    queue_wait = _seconds_since(job.created_at, now)
+    if queue_wait is not None:
+        _observe("queue_wait_seconds", queue_wait, queue=queue, priority=priority)
+    ready_wait = _seconds_since(job.available_at, now)
+    if ready_wait is not None:
+        _observe("ready_wait_seconds", ready_wait, queue=queue, priority=priority)
+
+
+def record_start(queue: str, job) -> None:
+    """Record claim-to-start latency when a worker begins executing a job."""
+    latency = _seconds_since(getattr(job, "claimed_at", None), timezone.now())
+    if latency is not None:
+        _observe("claim_to_start_seconds", latency, queue=queue)
+
+
+def record_finish(
+    queue: str,
+    job_id,
+    claimed_at: datetime | None,
+    outcome: str,
+    now: datetime,
+) -> None:
+    """Record a terminal outcome (or a retry) with the attempt's run time."""
+    if outcome == "retry":
+        _inc("retried_total", queue=queue)
+    else:
+        _inc("finished_total", queue=queue, outcome=outcome)
+
+    run_time = _seconds_since(claimed_at, now)
+    if run_time is not None:
+        _observe("run_seconds", run_time, queue=queue, outcome=outcome)
+
+    _close_stage(queue, job_id)
+
+
+def record_retry_backoff(queue: str, backoff_seconds: float) -> None:
+    """Record the backoff delay assigned to a retry."""
+    _observe("retry_backoff_seconds", backoff_seconds, queue=queue)
+
+
+def record_stale_release(queue: str, outcome: str) -> None:
+    """Record a stale-lock release (retry, failed or superseded)."""
+    _inc("stale_released_total", queue=queue, outcome=outcome)
+
+
+# Progress stage clocks live in the executing worker process:
+# job_id -> (stage, monotonic start)
+_stage_clocks: dict[Any, tuple[str, float]] = {}
+_stage_lock = threading.Lock()
+
+
+def record_stage(queue: str, job_id, stage: str) -> None:
+    """Close the job's previous progress stage (if any) and start `stage`."""
+    _close_stage(queue, job_id)
+    with _stage_lock:
+        _stage_clocks[job_id] = (stage, time.monotonic())
+
+
+def _close_stage(queue: str, job_id) -> None:
+    with _stage_lock:
+        clock = _stage_clocks.pop(job_id, None)
+    if clock is not None:
+        stage, started = clock
+        _observe("stage_seconds", time.monotonic() - started, queue=queue, stage=stage)
+
+
+# =============================================================================
+# GAUGES (DB)
+# =============================================================================
+
+
+def collect_queue_gauges() -> dict[str, float]:
+    """
+    Read queue depth and lag gauges from the DB for both queues.
+
+    Returns:
+        Flat series key -> value, same encoding as the backend snapshot.
+    """
+    from django.db.models import Count, Min
+
+    from kairo.brandbrain.models import BrandBrainJob
+    from kairo.hero.models import OpportunitiesJob
+
+    now = timezone.now()
+    gauges: dict[str, float] = {}
+
+    for queue, model in (
+        (OPPORTUNITIES_QUEUE, OpportunitiesJob),
+        (BRANDBRAIN_QUEUE, BrandBrainJob),
+    ):
+        rows = (
+            model.objects
+            .filter(status__in=["pending", "running"])
+            .order_by()
+            .values("status", "priority")
+            .annotate(n=Count("id"))
+        )
+        for row in rows:
+            key = _series_key(
+                f"{METRIC_PREFIX}depth",
+                {
+                    "queue": queue,
+                    "status": row["status"],
+                    "priority": _priority_label(row["priority"]),
+                },
+            )
+            gauges[key] = float(row["n"])
+
+        gauges[_series_key(f"{METRIC_PREFIX}pending_backoff", {"queue": queue})] = float(
+            model.objects.filter(status="pending", available_at__gt=now).count()
+        )
+
+        heads = (
+            model.objects
+            .filter(status="pending", available_at__lte=now)
+            .order_by()
+            .values("priority")
+            .annotate(oldest=Min("available_at"))
+        )
+        for row in heads:
+            key = _series_key(
+                f"{METRIC_PREFIX}oldest_ready_age_seconds",
+                {"queue": queue, "priority": _priority_label(row["priority"])},
+            )
+            gauges[key] = max(0.0, (now - row["oldest"]).total_seconds())
+
+    return gauges
+
+
+# =============================================================================
+# EXPOSITION
+# =============================================================================
+
+
+def _metric_family(series_name: str) -> str:
+    """Strip the prefix and histogram suffixes: kairo_job_run_seconds_bucket -> run_seconds."""
+    name = series_name[len(METRIC_PREFIX):]
+    for suffix in ("_bucket", "_sum", "_count"):
+        base = name[: -len(suffix)]
+        if name.endswith(suffix) and base in HISTOGRAMS:
+            return base
+    return name
+
+
+def _all_series(include_gauges: bool) -> dict[str, float]:
+    series = get_metrics_backend().snapshot()
+    if include_gauges:
+        series.update(collect_queue_gauges())
+    return series
+
+
+def render_prometheus(include_gauges: bool = True) -> str:
+    """Render all series in Prometheus text exposition format."""
+    families: dict[str, list[tuple[str, float]]] = {}
+    for key, value in _all_series(include_gauges).items():
+        name, _ = _parse_series_key(key)
+        families.setdefault(_metric_family(name), []).append((key, value))
+
+    lines = []
+    for family in sorted(families):
+        if family in HISTOGRAMS:
+            kind = "histogram"
+        elif family.endswith("_total"):
+            kind = "counter"
+        else:
+            kind = "gauge"
+        full_name = METRIC_PREFIX + family
+        lines.append(f"# HELP {full_name} {HELP.get(family, family)}")
+        lines.append(f"# TYPE {full_name} {kind}")
+        for key, value in sorted(families[family], key=lambda kv: _bucket_sort_key(kv[0])):
+            lines.append(f"{key} {_format_value(value)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def metrics_json(include_gauges: bool = True) -> dict[str, list[dict]]:
+    """
+    All series grouped by metric name, for the JSON endpoint.
+
+    Returns:
+        {"kairo_job_claimed_total": [{"labels": {...}, "value": 3.0}, ...], ...}
+    """
+    result: dict[str, list[dict]] = {}
+    for key, value in sorted(_all_series(include_gauges).items()):
+        name, labels = _parse_series_key(key)
+        result.setdefault(name, []).append({"labels": labels, "value": value})
+    return result
+
+
+def _bucket_sort_key(key: str) -> tuple:
+    """Sort buckets numerically by le (with +Inf last) within a family."""
+    name, labels = _parse_series_key(key)
+    le = labels.pop("le", None)
+    le_value = math.inf if le == "+Inf" else float(le) if le is not None else -1.0
+    return (name, sorted(labels.items()), le_value)
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
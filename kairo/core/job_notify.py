@@ -0,0 +1,361 @@
+"""
+Job Queue Wakeup Notifications.
+
+Push-based wakeup for the durable job workers (opportunities_worker,
+brandbrain_worker). Enqueue publishes on a named channel; idle workers
+block on the same channel instead of sleeping a fixed poll interval.
+
+Backends (selected by settings.JOB_NOTIFY_BACKEND):
+- "redis": RPUSH/BLPOP on a short list per channel. One enqueue wakes
+  one worker. Used when REDIS_URL is configured.
+- "postgres": LISTEN/NOTIFY. Listener uses a dedicated autocommit
+  connection (JOB_NOTIFY_DATABASE_URL, or the default DB settings).
+  NOTIFY through a transaction-mode pooler is not delivered, so point
+  JOB_NOTIFY_DATABASE_URL at a direct/session-mode port.
+- "inprocess": threading.Condition stand-in for tests and single-process dev.
+- "none": publish is a no-op, wait just sleeps (pure polling).
+- "auto" (default): redis if REDIS_URL, else postgres if the default DB is
+  PostgreSQL, else inprocess.
+
+Notifications are a latency optimization only. Workers still poll on a
+timeout as a safety net (e.g. for jobs whose backoff available_at passes
+without a new enqueue), so a lost notification costs at most one poll
+interval.
+
+Publishing never raises: enqueue must not fail because the wakeup
+channel is unavailable.
+"""
+
+from __future__ import annotations
+
+import logging
+import select
+import threading
+import time
+from typing import Protocol
+
+from django.conf import settings
+from django.db import transaction
+
+logger = logging.getLogger("kairo.core.job_notify")
+
+
+# =============================================================================
+# CHANNELS
+# =============================================================================
+
+OPPORTUNITIES_JOBS_CHANNEL = "kairo_opportunities_jobs"
+BRANDBRAIN_JOBS_CHANNEL = "kairo_brandbrain_jobs"
+
+# Cap on queued wakeup tokens per channel (redis backend).
+# Tokens beyond this are redundant: one token is enough to wake a worker
+# that will then drain the queue by claiming.
+MAX_PENDING_TOKENS = 100
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+
+class JobNotifier(Protocol):
+    """Notification backend interface."""
+
+    def publish(self, channel: str) -> None:
+        """Signal that a job is available on channel."""
+        ...
+
+    def wait(self, channel: str, timeout: float) -> bool:
+        """
+        Block up to timeout seconds for a notification on channel.
+
+        Returns:
+            True if woken by a notification, False on timeout.
+        """
+        ...
+
+
+class NullJobNotifier:
+    """No-op backend: publish does nothing, wait sleeps the full timeout."""
+
+    def publish(self, channel: str) -> None:
+        pass
+
+    def wait(self, channel: str, timeout: float) -> bool:
+        time.sleep(timeout)
+        return False
+
+
+class InProcessJobNotifier:
+    """
+    In-process backend for tests and single-process dev.
+
+    Each publish adds one pending token to the channel; each successful
+    wait consumes one. Safe across threads in one process.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._pending: dict[str, int] = {}
+
+    def publish(self, channel: str) -> None:
+        with self._cond:
+            self._pending[channel] = min(
+                self._pending.get(channel, 0) + 1,
+                MAX_PENDING_TOKENS,
+            )
+            self._cond.notify_all()
+
+    def wait(self, channel: str, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending.get(channel, 0) == 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            self._pending[channel] -= 1
+            return True
+
+    def pending(self, channel: str) -> int:
+        """Number of unconsumed notifications on channel (for tests)."""
+        with self._cond:
+            return self._pending.get(channel, 0)
+
+
+class RedisJobNotifier:
+    """
+    Redis backend using a capped list per channel.
+
+    publish: RPUSH + LTRIM (bounded) + EXPIRE
+    wait: BLPOP with timeout (one token wakes one worker)
+    """
+
+    KEY_PREFIX = "kairo:job_notify"
+    KEY_TTL_SECONDS = 3600
+
+    def __init__(self, url: str) -> None:
+        import redis
+
+        self._client = redis.Redis.from_url(url, socket_connect_timeout=5)
+
+    def _key(self, channel: str) -> str:
+        return f"{self.KEY_PREFIX}:{channel}"
+
+    def publish(self, channel: str) -> None:
+        key = self._key(channel)
+        pipe = self._client.pipeline()
+        pipe.rpush(key, "1")
+        pipe.ltrim(key, -MAX_PENDING_TOKENS, -1)
+        pipe.expire(key, self.KEY_TTL_SECONDS)
+        pipe.execute()
+
+    def wait(self, channel: str, timeout: float) -> bool:
+        # BLPOP timeout is whole seconds; 0 would block forever
+        result = self._client.blpop([self._key(channel)], timeout=max(1, int(timeout)))
+        return result is not None
+
+
+class PostgresJobNotifier:
+    """
+    PostgreSQL backend using LISTEN/NOTIFY.
+
+    publish goes through Django's connection (pg_notify), so a NOTIFY
+    issued inside a transaction is delivered on commit. wait uses a
+    dedicated autocommit psycopg2 connection per process, created lazily
+    on first wait and re-created after errors.
+    """
+
+    def __init__(self, dsn: str | None = None) -> None:
+        self._dsn = dsn
+        self._conn = None
+        self._listening: set[str] = set()
+        self._lock = threading.Lock()
+
+    def publish(self, channel: str) -> None:
+        from django.db import connection
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, '')", [channel])
+
+    def _connect(self):
+        import psycopg2
+        import psycopg2.extensions
+
+        if self._dsn:
+            conn = psycopg2.connect(self._dsn)
+        else:
+            db = settings.DATABASES["default"]
+            conn = psycopg2.connect(
+                dbname=db.get("NAME"),
+                user=db.get("USER"),
+                password=db.get("PASSWORD"),
+                host=db.get("HOST") or None,
+                port=db.get("PORT") or None,
+            )
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        return conn
+
+    def _reset(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+        self._listening.clear()
+
+    def wait(self, channel: str, timeout: float) -> bool:
+        with self._lock:
+            try:
+                if self._conn is None:
+                    self._conn = self._connect()
+                if channel not in self._listening:
+                    with self._conn.cursor() as cursor:
+                        # Channel names are module constants, not user input
+                        cursor.execute(f'LISTEN "{channel}"')
+                    self._listening.add(channel)
+
+                # Drain anything that arrived between waits
+                self._conn.poll()
+                if self._drain(channel):
+                    return True
+
+                ready, _, _ = select.select([self._conn], [], [], timeout)
+                if not ready:
+                    return False
+                self._conn.poll()
+                return self._drain(channel)
+            except Exception:
+                self._reset()
+                raise
+
+    def _drain(self, channel: str) -> bool:
+        found = False
+        while self._conn.notifies:
+            notify = self._conn.notifies.pop(0)
+            if notify.channel == channel:
+                found = True
+        return found
+
+
+# =============================================================================
+# BACKEND SELECTION
+# =============================================================================
+
+_notifier: JobNotifier | None = None
+_notifier_lock = threading.Lock()
+
+
+def _build_notifier() -> JobNotifier:
+    from django.db import connection
+
+    backend = getattr(settings, "JOB_NOTIFY_BACKEND", "auto")
+    redis_url = getattr(settings, "REDIS_URL", "")
+
+    if backend == "auto":
+        if redis_url:
+            backend = "redis"
+        elif connection.vendor == "postgresql":
+            backend = "postgres"
+        else:
+            backend = "inprocess"
+
+    if backend == "redis":
+        return RedisJobNotifier(redis_url)
+    if backend == "postgres":
+        return PostgresJobNotifier(getattr(settings, "JOB_NOTIFY_DATABASE_URL", "") or None)
+    if backend == "inprocess":
+        return InProcessJobNotifier()
+    if backend == "none":
+        return NullJobNotifier()
+
+    logger.warning("Unknown JOB_NOTIFY_BACKEND=%r, falling back to polling", backend)
+    return NullJobNotifier()
+
+
+def get_notifier() -> JobNotifier:
+    """Get the process-wide notifier (created on first use)."""
+    global _notifier
+    if _notifier is None:
+        with _notifier_lock:
+            if _notifier is None:
+                _notifier = _build_notifier()
+    return _notifier
+
+
+def set_notifier(notifier: JobNotifier | None) -> None:
+    """Override the process-wide notifier (tests). None resets to settings."""
+    global _notifier
+    with _notifier_lock:
+        _notifier = notifier
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+
+def notify_job_available(channel: str) -> None:
+    """
+    Publish a wakeup on channel once the current transaction commits.
+
+    Deferred via transaction.on_commit so a woken worker can actually see
+    the new row. Runs immediately when not inside an atomic block.
+    Never raises.
+    """
+
+    def _publish() -> None:
+        try:
+            get_notifier().publish(channel)
+        except Exception as e:
+            logger.warning("Job notify publish failed on %s: %s", channel, str(e))
+
+    transaction.on_commit(_publish)
+
+
+def wait_for_job(channel: str, timeout: float) -> bool:
+    """
+    Block up to timeout seconds for a wakeup on channel.
+
+    Backend errors are logged and treated as a timeout (after sleeping the
+    remaining time) so a broken channel degrades to plain polling.
+
+    Returns:
+        True if woken by a notification, False on timeout or error.
+    """
+    if timeout <= 0:
+        return False
+
+    started = time.monotonic()
+    try:
+        return get_notifier().wait(channel, timeout)
+    except Exception as e:
+        logger.warning("Job notify wait failed on %s: %s", channel, str(e))
+        remaining = timeout - (time.monotonic() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+        return False
+
+
+class AdaptivePollBackoff:
+    """
+    Idle-wait interval for worker poll loops.
+
+    Starts at min_interval, doubles after each idle wait that timed out,
+    capped at max_interval. Resets when a job is claimed or a
+    notification arrives.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.current = min_interval
+
+    def reset(self) -> None:
+        self.current = self.min_interval
+
+    def next_timeout(self) -> float:
+        timeout = self.current
+        self.current = min(self.current * 2, self.max_interval)
+        return timeout
@@ -0,0 +1,227 @@
+"""
+Job Retention: archive terminal job rows.
+
+OpportunitiesJob and BrandBrainJob rows are never deleted by the queues, so
+terminal history (SUCCEEDED / FAILED / INSUFFICIENT_EVIDENCE) piles up next
+to the handful of live rows the workers and polling endpoints care about.
+archive_terminal_jobs() moves terminal rows older than N days out of the
+live table in bounded batches, either into the job_archive table
+(ArchivedJob) or into a gzip-compressed JSONL export.
+
+Each batch is one transaction: select up to batch_size terminal rows
+(FOR UPDATE SKIP LOCKED on PostgreSQL), copy them out, delete them. A batch
+that fails rolls back and leaves its rows in place for the next run.
+Exports are at-least-once: a batch written to the file whose delete then
+fails is exported again on the next run (consumers dedupe on "id").
+
+Live rows are never touched: only terminal statuses are selected, and the
+delete re-checks the status. Deleting an opportunities job detaches its
+ActivationRun (job FK is SET_NULL), so the EvidenceItem ledger that live
+opportunities cite for evidence previews survives archival.
+
+Run via `python manage.py archive_jobs` (e.g. nightly cron).
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from kairo.core.job_metrics import BRANDBRAIN_QUEUE, OPPORTUNITIES_QUEUE
+
+logger = logging.getLogger("kairo.core.job_retention")
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+QUEUES = (OPPORTUNITIES_QUEUE, BRANDBRAIN_QUEUE)
+
+TERMINAL_STATUSES = {
+    OPPORTUNITIES_QUEUE: ("succeeded", "failed", "insufficient_evidence"),
+    BRANDBRAIN_QUEUE: ("succeeded", "failed"),
+}
+
+
+def retention_days() -> int:
+    """Default age (days) after which terminal jobs are archived."""
+    return int(getattr(settings, "JOB_RETENTION_DAYS", 30))
+
+
+def archive_batch_size() -> int:
+    """Default number of rows moved per transaction."""
+    return int(getattr(settings, "JOB_ARCHIVE_BATCH_SIZE", 500))
+
+
+def _job_model(queue: str):
+    if queue == OPPORTUNITIES_QUEUE:
+        from kairo.hero.models import OpportunitiesJob
+
+        return OpportunitiesJob
+    if queue == BRANDBRAIN_QUEUE:
+        from kairo.brandbrain.models import BrandBrainJob
+
+        return BrandBrainJob
+    raise ValueError(f"Unknown queue {queue!r} (expected one of {QUEUES})")
+
+
+# =============================================================================
+# RESULT TYPES
+# =============================================================================
+
+
+@dataclass
+class ArchiveResult:
+    """Result of archive_terminal_jobs() for one queue."""
+    queue: str
+    cutoff: datetime
+    archived: int = 0
+    batches: int = 0
+    dry_run: bool = False
+    export_path: str | None = None
+    remaining: bool = False  # stopped at max_batches with rows left
+
+
+# =============================================================================
+# ARCHIVAL
+# =============================================================================
+
+
+def archive_terminal_jobs(
+    queue: str,
+    older_than_days: int | None = None,
+    batch_size: int | None = None,
+    max_batches: int | None = None,
+    export_path: str | None = None,
+    dry_run: bool = False,
+    now: datetime | None = None,
+) -> ArchiveResult:
+    """
+    Move terminal jobs older than the cutoff out of a live queue table.
+
+    Age is measured from finished_at (updated_at for legacy rows without it).
+
+    Args:
+        queue: "opportunities" or "brandbrain"
+        older_than_days: Age threshold (default: settings.JOB_RETENTION_DAYS)
+        batch_size: Rows per transaction (default: settings.JOB_ARCHIVE_BATCH_SIZE)
+        max_batches: Stop after this many batches (None = until done)
+        export_path: Append rows to this gzip JSONL file instead of the
+            job_archive table
+        dry_run: Only count the rows that would be archived
+        now: Reference time (tests)
+
+    Returns:
+        ArchiveResult with the number of rows moved (or matched, if dry_run)
+
+    Raises:
+        ValueError: Unknown queue or non-positive batch size
+    """
+    model = _job_model(queue)
+    days = retention_days() if older_than_days is None else older_than_days
+    size = archive_batch_size() if batch_size is None else batch_size
+    if size < 1:
+        raise ValueError("batch_size must be positive")
+
+    cutoff = (now or timezone.now()) - timedelta(days=days)
+    result = ArchiveResult(queue=queue, cutoff=cutoff, dry_run=dry_run, export_path=export_path)
+
+    terminal = TERMINAL_STATUSES[queue]
+    expired = Q(status__in=terminal) & (
+        Q(finished_at__lt=cutoff) | Q(finished_at__isnull=True, updated_at__lt=cutoff)
+    )
+
+    if dry_run:
+        result.archived = model.objects.filter(expired).count()
+        return result
+
+    while max_batches is None or result.batches < max_batches:
+        moved = _archive_batch(queue, model, expired, size, export_path)
+        if not moved:
+            break
+        result.archived += moved
+        result.batches += 1
+        if moved < size:
+            break
+    else:
+        result.remaining = model.objects.filter(expired).exists()
+
+    if result.archived:
+        logger.info(
+            "Archived %d %s jobs older than %s in %d batches%s",
+            result.archived,
+            queue,
+            cutoff.isoformat(),
+            result.batches,
+            f" to {export_path}" if export_path else "",
+        )
+
+    return result
+
+
+def _archive_batch(queue, model, expired: Q, size: int, export_path: str | None) -> int:
+    """Copy out and delete one batch. Returns rows moved."""
+    with transaction.atomic():
+        qs = model.objects.filter(expired)
+        if connection.vendor == "postgresql":
+            # Concurrent archivers take disjoint batches
+            qs = qs.select_for_update(skip_locked=True)
+        rows = list(qs.values()[:size])
+        if not rows:
+            return 0
+
+        ids = [row["id"] for row in rows]
+        if export_path:
+            _export_rows(export_path, queue, rows)
+        else:
+            _insert_archive_rows(queue, rows)
+
+        # Count the job rows only (detached ActivationRuns are not deleted)
+        _, deleted = model.objects.filter(expired, id__in=ids).delete()
+        return deleted.get(model._meta.label, 0)
+
+
+def _to_json(row: dict) -> dict[str, Any]:
+    return json.loads(json.dumps(row, cls=DjangoJSONEncoder))
+
+
+def _insert_archive_rows(queue: str, rows: list[dict]) -> None:
+    from kairo.core.models import ArchivedJob
+
+    ArchivedJob.objects.bulk_create(
+        [
+            ArchivedJob(
+                id=row["id"],
+                queue=queue,
+                brand_id=row["brand_id"],
+                tenant_id=row.get("tenant_id"),
+                status=row["status"],
+                attempts=row.get("attempts") or 0,
+                created_at=row["created_at"],
+                finished_at=row.get("finished_at"),
+                payload_json=_to_json(row),
+            )
+            for row in rows
+        ],
+        # Re-running after a partial failure must not trip on the PK
+        ignore_conflicts=True,
+    )
+
+
+def _export_rows(path: str, queue: str, rows: list[dict]) -> None:
+    # Appending gzip members yields a valid multi-member gzip file
+    with gzip.open(path, "at", encoding="utf-8") as fh:
+        for row in rows:
+            fh.write(json.dumps({"queue": queue, **row}, cls=DjangoJSONEncoder))
+            fh.write("\n")
@@ -0,0 +1,288 @@
+"""
+Job Queue Claim Scheduling.
+
+Shared claim path for the durable job queues (OpportunitiesJob,
+BrandBrainJob). Both models carry the same scheduling columns:
+status, priority, tenant, available_at, claimed_at, created_at.
+
+Scheduling policy:
+- Priority lanes (kairo.core.enums.JobPriority): the lowest-numbered lane
+  with an available job is always served first, so an interactive
+  regenerate never waits behind a first-run or scheduled backlog.
+- Within a lane, tenants are served weighted round-robin: each tenant's
+  recent claims in the lane (JOB_FAIR_SHARE_WINDOW_MINUTES) divided by its
+  weight (JOB_TENANT_WEIGHTS) decides who is owed the next job. Ties go to
+  the tenant whose oldest job has waited longest. One tenant onboarding
+  200 brands therefore gets one slot in turn, not the whole queue.
+- Within a tenant, jobs are FIFO by (available_at, created_at).
+
+Claim mechanics:
+- PostgreSQL: UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED)
+  RETURNING, so concurrent workers take disjoint jobs.
+- SQLite (tests/dev): SELECT candidates, then conditional UPDATE.
+
+Fairness is best-effort: concurrent workers may both pick the same tenant
+and one falls through to the plain lane-ordered fill. Correctness (no
+double-claim) never depends on it.
+
+Supporting indexes (per model):
+- (status, priority, available_at, created_at): lane head and fill claims
+- (status, priority, tenant, available_at): per-tenant heads and claims
+- (priority, claimed_at): recent claims per tenant in the window
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Hashable
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F, Min
+
+logger = logging.getLogger(__name__)
+
+# Status values shared by OpportunitiesJobStatus and BrandBrainJobStatus
+PENDING = "pending"
+RUNNING = "running"
+
+# Ordering applied to every claim
+CLAIM_ORDER = ("priority", "available_at", "created_at")
+
+
+# =============================================================================
+# FAIR SHARE
+# =============================================================================
+
+
+def tenant_weight(tenant_id: Any) -> float:
+    """Weight for a tenant from settings.JOB_TENANT_WEIGHTS (default 1.0)."""
+    weights = getattr(settings, "JOB_TENANT_WEIGHTS", {}) or {}
+    weight = weights.get(str(tenant_id), 1.0)
+    return weight if weight > 0 else 1.0
+
+
+def allocate_fair_slots(
+    heads: dict[Hashable, tuple[datetime, int]],
+    served: dict[Hashable, int],
+    limit: int,
+    weights: dict[Hashable, float] | None = None,
+) -> list[tuple[Hashable, int]]:
+    """
+    Split `limit` claim slots across tenants by weighted round-robin.
+
+    Each slot goes to the tenant with the lowest served/weight; ties go to
+    the tenant with the oldest head job. A tenant never gets more slots
+    than it has available jobs.
+
+    Args:
+        heads: tenant -> (oldest available_at, available job count)
+        served: tenant -> recent claims in this lane
+        limit: Slots to allocate
+        weights: tenant -> weight (default 1.0 each)
+
+    Returns:
+        [(tenant, slots)] in the order tenants were first served.
+    """
+    weights = weights or {}
+    counts = {tenant: served.get(tenant, 0) for tenant in heads}
+    remaining = {tenant: depth for tenant, (_, depth) in heads.items()}
+    allocation: dict[Hashable, int] = {}
+
+    for _ in range(limit):
+        eligible = [tenant for tenant in heads if remaining[tenant] > 0]
+        if not eligible:
+            break
+        tenant = min(
+            eligible,
+            key=lambda t: (counts[t] / weights.get(t, 1.0), heads[t][0]),
+        )
+        counts[tenant] += 1
+        remaining[tenant] -= 1
+        allocation[tenant] = allocation.get(tenant, 0) + 1
+
+    return list(allocation.items())
+
+
+# =============================================================================
+# CLAIMING
+# =============================================================================
+
+
+def claim_jobs(
+    model,
+    worker_id: str,
+    limit: int,
+    now: datetime,
+    filters: dict[str, Any] | None = None,
+) -> list:
+    """
+    Claim up to `limit` PENDING jobs of `model`, lane-ordered, fairly.
+
+    Args:
+        model: OpportunitiesJob or BrandBrainJob
+        worker_id: Lock owner written to locked_by
+        limit: Maximum number of jobs to claim
+        now: Claim timestamp (locked_at/claimed_at, available_at cutoff)
+        filters: Extra equality filters on the job (e.g. job_type)
+
+    Returns:
+        Claimed jobs (status=RUNNING) in (priority, available_at, created_at)
+        order, possibly empty.
+    """
+    filters = dict(filters or {})
+    if limit < 1:
+        return []
+
+    available = model.objects.filter(
+        status=PENDING,
+        available_at__lte=now,
+        **filters,
+    )
+
+    top = available.aggregate(top=Min("priority"))["top"]
+    if top is None:
+        return []
+
+    heads = {
+        row["tenant_id"]: (row["head"], row["depth"])
+        for row in (
+            available
+            .filter(priority=top)
+            .order_by()
+            .values("tenant_id")
+            .annotate(head=Min("available_at"), depth=Count("id"))
+        )
+    }
+
+    claimed = []
+    if len(heads) > 1:
+        window = timedelta(minutes=getattr(settings, "JOB_FAIR_SHARE_WINDOW_MINUTES", 15))
+        served = dict(
+            model.objects
+            .filter(
+                priority=top,
+                claimed_at__gte=now - window,
+                tenant_id__in=[t for t in heads if t is not None],
+                **filters,
+            )
+            .order_by()
+            .values("tenant_id")
+            .annotate(n=Count("id"))
+            .values_list("tenant_id", "n")
+        )
+        weights = {tenant: tenant_weight(tenant) for tenant in heads}
+
+        for tenant_id, slots in allocate_fair_slots(heads, served, limit, weights):
+            claimed.extend(_claim(
+                model,
+                worker_id,
+                slots,
+                now,
+                {**filters, "priority": top, "tenant_id": tenant_id},
+            ))
+
+    # Single tenant in the lane, lost races, or lane exhausted: plain
+    # lane-ordered claim for whatever is left
+    if len(claimed) < limit:
+        claimed.extend(_claim(model, worker_id, limit - len(claimed), now, filters))
+
+    claimed.sort(key=lambda j: (j.priority, j.available_at, j.created_at))
+    return claimed
+
+
+def _claim(
+    model,
+    worker_id: str,
+    limit: int,
+    now: datetime,
+    filters: dict[str, Any],
+) -> list:
+    """Claim up to `limit` jobs matching filters, in CLAIM_ORDER."""
+    if connection.vendor == "postgresql":
+        return _claim_skip_locked(model, worker_id, limit, now, filters)
+    return _claim_conditional_update(model, worker_id, limit, now, filters)
+
+
+def _claim_skip_locked(
+    model,
+    worker_id: str,
+    limit: int,
+    now: datetime,
+    filters: dict[str, Any],
+) -> list:
+    """PostgreSQL claim path: single UPDATE ... RETURNING with SKIP LOCKED."""
+    table = model._meta.db_table
+    conditions = ["status = %s", "available_at <= %s"]
+    where_params: list[Any] = [PENDING, now]
+    for name, value in filters.items():
+        column = model._meta.get_field(name).column
+        if value is None:
+            conditions.append(f"{column} IS NULL")
+        else:
+            conditions.append(f"{column} = %s")
+            where_params.append(value)
+
+    sql = f"""
+        UPDATE {table}
+        SET status = %s,
+            locked_at = %s,
+            locked_by = %s,
+            claimed_at = %s,
+            attempts = attempts + 1,
+            updated_at = %s
+        WHERE id IN (
+            SELECT id FROM {table}
+            WHERE {" AND ".join(conditions)}
+            ORDER BY {", ".join(CLAIM_ORDER)}
+            LIMIT %s
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING *
+    """
+    params = [RUNNING, now, worker_id, now, now, *where_params, limit]
+
+    with transaction.atomic():
+        return list(model.objects.raw(sql, params))
+
+
+def _claim_conditional_update(
+    model,
+    worker_id: str,
+    limit: int,
+    now: datetime,
+    filters: dict[str, Any],
+) -> list:
+    """Portable claim path: SELECT candidates, then conditional UPDATE."""
+    with transaction.atomic():
+        candidate_ids = list(
+            model.objects
+            .filter(status=PENDING, available_at__lte=now, **filters)
+            .order_by(*CLAIM_ORDER)
+            .values_list("id", flat=True)[:limit]
+        )
+
+        if not candidate_ids:
+            return []
+
+        # Atomic claim: only rows still PENDING are taken
+        model.objects.filter(
+            id__in=candidate_ids,
+            status=PENDING,
+        ).update(
+            status=RUNNING,
+            locked_at=now,
+            locked_by=worker_id,
+            claimed_at=now,
+            attempts=F("attempts") + 1,
+        )
+
+        return list(
+            model.objects.filter(
+                id__in=candidate_ids,
+                status=RUNNING,
+                locked_by=worker_id,
+                locked_at=now,
+            )
+        )
@@ -0,0 +1,188 @@
+"""
+Server-Sent Events for job progress.
+
+One long-lived text/event-stream response per job instead of polling
+GET /today or GET /compile/:id/status every second or two. Fed by
+kairo.core.job_events. job_event_response() picks the stream for the server
+the request came through:
+- ASGI (kairo.asgi): an async iterator; waiting costs no worker thread
+- WSGI (runserver, gunicorn): a sync generator that blocks its request
+  thread but flushes every message as it happens. Django would otherwise
+  buffer an async iterator under WSGI until the stream ends.
+
+Protocol:
+- "progress": job state (sent on connect and on every change)
+- "done": final state; the stream then ends
+- "error": job not found; the stream then ends
+- ": keepalive" comments while nothing changes
+- "retry:" tells EventSource how soon to reconnect after a drop
+
+Each stream subscribes before reading the job's current state, so no
+transition between the two is missed. When no event arrives within
+JOB_EVENTS_POLL_S the state is re-read from the DB (covers lost events and
+publishers without a shared event bus). Streams close after
+JOB_EVENTS_STREAM_MAX_S; EventSource reconnects and resumes from the
+current state.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import AsyncIterator, Callable, Iterator
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest, StreamingHttpResponse
+
+from kairo.core.job_events import subscribe_job_events
+
+# EventSource reconnect delay (ms) sent in the "retry:" field
+RECONNECT_MS = 2000
+
+
+def poll_interval_s() -> float:
+    """Seconds without an event before a stream re-reads job state."""
+    return float(getattr(settings, "JOB_EVENTS_POLL_S", 5.0))
+
+
+def max_stream_s() -> float:
+    """Maximum lifetime (seconds) of one stream."""
+    return float(getattr(settings, "JOB_EVENTS_STREAM_MAX_S", 600.0))
+
+
+def format_sse(event: str, data: dict) -> str:
+    """Encode one SSE message."""
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+
+async def job_event_stream(
+    kind: str,
+    job_id,
+    load_state: Callable[[], dict | None],
+    is_terminal: Callable[[dict], bool],
+    partial_events: bool = True,
+) -> AsyncIterator[str]:
+    """
+    Yield SSE messages for one job until it reaches a terminal state.
+
+    Args:
+        kind: Event kind (kairo.core.job_events.OPPORTUNITIES_EVENTS / COMPILE_EVENTS)
+        job_id: Job (or compile run) id
+        load_state: Reads the job's current state from the DB (sync);
+            None if the job does not exist
+        is_terminal: True for states after which the job never changes
+        partial_events: Events carry only changed fields (merged into the
+            last state); False if each event is the full state
+    """
+    subscription = await sync_to_async(subscribe_job_events, thread_sensitive=False)(
+        kind, job_id
+    )
+    try:
+        yield f"retry: {RECONNECT_MS}\n\n"
+
+        state = await sync_to_async(load_state)()
+        if state is None:
+            yield format_sse("error", {"job_id": str(job_id), "error": "Job not found"})
+            return
+
+        deadline = time.monotonic() + max_stream_s()
+        while True:
+            terminal = is_terminal(state)
+            yield format_sse("done" if terminal else "progress", state)
+            if terminal:
+                return
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+
+                event = await sync_to_async(subscription.get, thread_sensitive=False)(
+                    min(poll_interval_s(), remaining)
+                )
+                if event is not None:
+                    updated = {**state, **event} if partial_events else event
+                else:
+                    updated = await sync_to_async(load_state)()
+                    if updated is None:
+                        return
+
+                if updated != state:
+                    state = updated
+                    break
+                yield ": keepalive\n\n"
+    finally:
+        await sync_to_async(subscription.close, thread_sensitive=False)()
+
+
+def iter_job_events(
+    kind: str,
+    job_id,
+    load_state: Callable[[], dict | None],
+    is_terminal: Callable[[dict], bool],
+    partial_events: bool = True,
+) -> Iterator[str]:
+    """
+    Blocking counterpart of job_event_stream() for WSGI servers.
+
+    Same protocol and arguments; runs on the request thread.
+    """
+    subscription = subscribe_job_events(kind, job_id)
+    try:
+        yield f"retry: {RECONNECT_MS}\n\n"
+
+        state = load_state()
+        if state is None:
+            yield format_sse("error", {"job_id": str(job_id), "error": "Job not found"})
+            return
+
+        deadline = time.monotonic() + max_stream_s()
+        while True:
+            terminal = is_terminal(state)
+            yield format_sse("done" if terminal else "progress", state)
+            if terminal:
+                return
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+
+                event = subscription.get(min(poll_interval_s(), remaining))
+                if event is not None:
+                    updated = {**state, **event} if partial_events else event
+                else:
+                    updated = load_state()
+                    if updated is None:
+                        return
+
+                if updated != state:
+                    state = updated
+                    break
+                yield ": keepalive\n\n"
+    finally:
+        subscription.close()
+
+
+def job_event_response(
+    request: HttpRequest,
+    kind: str,
+    job_id,
+    load_state: Callable[[], dict | None],
+    is_terminal: Callable[[dict], bool],
+    partial_events: bool = True,
+) -> StreamingHttpResponse:
+    """SSE response for one job, streamed natively by the serving handler."""
+    stream = job_event_stream if isinstance(request, ASGIRequest) else iter_job_events
+    return sse_response(stream(kind, job_id, load_state, is_terminal, partial_events))
+
+
+def sse_response(stream: AsyncIterator[str] | Iterator[str]) -> StreamingHttpResponse:
+    """Wrap an SSE message stream in a non-cached, unbuffered response."""
+    response = StreamingHttpResponse(stream, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx: do not buffer the stream
+    return response
@@ -0,0 +1,35 @@
+"""
+ArchivedJob: terminal job rows moved out of the live queue tables
+(kairo.core.job_retention).
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_create_user_models'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedJob',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('queue', models.CharField(max_length=50)),
+                ('brand_id', models.UUIDField()),
+                ('tenant_id', models.UUIDField(blank=True, null=True)),
+                ('status', models.CharField(max_length=30)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField()),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('payload_json', models.JSONField(default=dict)),
+            ],
+            options={
+                'db_table': 'job_archive',
+                'indexes': [models.Index(fields=['queue', 'brand_id', '-created_at'], name='idx_jobarchive_brand_created'), models.Index(fields=['archived_at'], name='idx_jobarchive_archived')],
+            },
+        ),
+    ]
@@ -658,6 +658,49 @@ class LearningEvent(TimestampedModel):
         return f"{self.signal_type} for {self.brand.name}"
 
 
+# =============================================================================
+# JOB ARCHIVE
+# =============================================================================
+
+
+class ArchivedJob(models.Model):
+    """
+    Terminal job row moved out of a live queue table.
+
+    Written by kairo.core.job_retention so OpportunitiesJob / BrandBrainJob
+    only hold recent history. id is the original job id; the full row is kept
+    in payload_json. brand_id / tenant_id are plain UUIDs (no FK) so archived
+    history survives brand deletion.
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    queue = models.CharField(max_length=50)  # "opportunities" | "brandbrain"
+    brand_id = models.UUIDField()
+    tenant_id = models.UUIDField(null=True, blank=True)
+    status = models.CharField(max_length=30)
+    attempts = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField()
+    finished_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    payload_json = models.JSONField(default=dict)
+
+    class Meta:
+        db_table = "job_archive"
+        indexes = [
+            models.Index(
+                fields=["queue", "brand_id", "-created_at"],
+                name="idx_jobarchive_brand_created",
+            ),
+            models.Index(
+                fields=["archived_at"],
+                name="idx_jobarchive_archived",
+            ),
+        ]
+
+    def __str__(self):
+        return f"ArchivedJob {self.id} ({self.queue}) [{self.status}]"
+
+
 # =============================================================================
 # NOTE: LearningSummary is NOT a persisted model
 # =============================================================================
@@ -13,10 +13,13 @@ import json
 from typing import Any
 from uuid import UUID
 
-from django.http import HttpRequest, JsonResponse
+from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_GET, require_http_methods
 
+from kairo.core.etag import etag_matches, not_modified
+from kairo.core.job_events import OPPORTUNITIES_EVENTS
+from kairo.core.job_stream import job_event_response
 from kairo.core.models import Brand
 
 from .dto import (
@@ -32,6 +35,7 @@ from .services import (
     today_service,
     variants_service,
 )
+from .jobs.queue import TERMINAL_STATUSES, get_job_state
 from .services.decisions_service import ObjectNotFoundError
 
 
@@ -85,7 +89,7 @@ def error_response(
 
 
 @require_GET
-def get_today_board(request: HttpRequest, brand_id: str) -> JsonResponse:
+def get_today_board(request: HttpRequest, brand_id: str) -> HttpResponse:
     """
     GET /api/brands/{brand_id}/today
 
@@ -101,7 +105,15 @@ def get_today_board(request: HttpRequest, brand_id: str) -> JsonResponse:
     CRITICAL: This endpoint MUST NOT call LLMs or block on generation.
     The ONLY side effect allowed is first-run auto-enqueue (non-blocking).
 
-    Calls: today_service.get_today_board (read-only)
+    Stale-while-revalidate (opt-in): with ?swr=1 or the X-Kairo-SWR: 1
+    header, a running job returns the previous READY board with
+    meta.stale=true and meta.job_id instead of state "generating".
+
+    Conditional GET: cached READY boards carry a strong ETag; a matching
+    If-None-Match gets 304 straight from cache metadata (no DB access).
+
+    Calls: today_service.get_cached_today_board_json (cache hit), else
+    today_service.get_today_board (read-only)
     """
     try:
         brand_uuid = UUID(brand_id)
@@ -112,8 +124,24 @@ def get_today_board(request: HttpRequest, brand_id: str) -> JsonResponse:
             details={"field": "brand_id", "value": brand_id},
         )
 
+    allow_stale = _wants_stale_while_revalidate(request)
+
+    # Unchanged poll: 304 from the cached board's ETag, before any DB access
+    if "If-None-Match" in request.headers:
+        etag = today_service.get_today_board_etag(brand_uuid)
+        if etag_matches(request, etag):
+            return _no_browser_cache(not_modified(etag))
+
     try:
-        dto = today_service.get_today_board(brand_uuid)
+        # Cache hit: stored response body goes straight out (no DTO round-trip)
+        cached, etag = today_service.get_cached_today_board_json(brand_uuid, allow_stale=allow_stale)
+        if cached is not None:
+            response = HttpResponse(cached, content_type="application/json")
+            if etag:
+                response["ETag"] = etag
+        else:
+            dto = today_service.get_today_board(brand_uuid, allow_stale=allow_stale)
+            response = JsonResponse(dto.model_dump(mode="json"))
     except Brand.DoesNotExist:
         return error_response(
             code="not_found",
@@ -122,16 +150,30 @@ def get_today_board(request: HttpRequest, brand_id: str) -> JsonResponse:
             details={"brand_id": brand_id},
         )
 
-    # CRITICAL: Disable browser caching for polling endpoint.
-    # Without this header, browsers may serve stale responses during polling,
-    # causing UI to stay stuck in "generating" state even after job completes.
-    response = JsonResponse(dto.model_dump(mode="json"))
-    response["Cache-Control"] = "no-cache, no-store, must-revalidate"
+    return _no_browser_cache(response)
+
+
+def _no_browser_cache(response: HttpResponse) -> HttpResponse:
+    """
+    CRITICAL: Disable browser caching for polling endpoint.
+
+    Without this header, browsers may serve stale responses during polling,
+    causing UI to stay stuck in "generating" state even after job completes.
+    no-cache (not no-store) so the browser keeps the body and revalidates it
+    with If-None-Match on every poll.
+    """
+    response["Cache-Control"] = "no-cache, must-revalidate"
     response["Pragma"] = "no-cache"  # HTTP/1.0 compatibility
     response["Expires"] = "0"
     return response
 
 
+def _wants_stale_while_revalidate(request: HttpRequest) -> bool:
+    """True if the client opted into stale-while-revalidate for GET /today."""
+    flag = request.GET.get("swr") or request.headers.get("X-Kairo-SWR", "")
+    return flag.lower() in ("true", "1", "yes")
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def regenerate_today_board(request: HttpRequest, brand_id: str) -> JsonResponse:
@@ -214,6 +256,47 @@ def regenerate_today_board(request: HttpRequest, brand_id: str) -> JsonResponse:
         )
 
 
+@require_GET
+def stream_job_events(request: HttpRequest, brand_id: str, job_id: str) -> HttpResponse:
+    """
+    GET /api/brands/{brand_id}/jobs/{job_id}/events/
+
+    Server-Sent Events stream of an opportunities job's progress, replacing
+    GET /today polling while the job runs (see kairo.core.job_stream).
+    "progress" events carry {job_id, status, stage, detail, board_id, error};
+    "done" carries the terminal state, after which the client fetches
+    GET /today once.
+
+    The job_id comes from POST /regenerate (events_url) or GET /today meta.
+    Under WSGI the stream holds a worker thread open; prefer ASGI.
+    """
+    try:
+        brand_uuid = UUID(brand_id)
+        job_uuid = UUID(job_id)
+    except ValueError:
+        return error_response(
+            code="invalid_uuid",
+            message="Invalid brand_id or job_id format",
+            details={"brand_id": brand_id, "job_id": job_id},
+        )
+
+    if get_job_state(job_uuid, brand_uuid) is None:
+        return error_response(
+            code="not_found",
+            message="Job not found",
+            status=404,
+            details={"job_id": job_id},
+        )
+
+    return job_event_response(
+        request,
+        OPPORTUNITIES_EVENTS,
+        job_uuid,
+        load_state=lambda: get_job_state(job_uuid, brand_uuid),
+        is_terminal=lambda state: state["status"] in TERMINAL_STATUSES,
+    )
+
+
 # =============================================================================
 # PACKAGE ENDPOINTS
 # =============================================================================
@@ -13,23 +13,52 @@ CRITICAL INVARIANTS (per PRD §D.4):
 - Cache key format: "today_board:v2:{brand_id}"
 - TTL: 6 hours (21600 seconds)
 - Invalidation: On job completion OR POST /regenerate
+- Write-through: job completion writes its READY board straight into the
+  cache, so the first poll after generation is a hit
 
 CACHING POLICY:
 - ONLY cache state=READY boards
 - NEVER cache state=GENERATING (stale immediately)
 - NEVER cache state=NOT_GENERATED_YET (may need first-run auto-enqueue)
 - Cache includes full DTO with evidence_preview (PR-5 requirement)
+
+STORAGE FORMAT:
+- Entries are the final GET /today JSON body (cache-hit meta included),
+  so hits are served without Pydantic validation or re-serialization
+- TODAY_BOARD_CACHE_VALIDATE (default: DEBUG) re-validates hits
+- Each body has a strong ETag (generated_at version + body digest) under a
+  separate key, so If-None-Match is answered without reading the body
+
+VERSIONING:
+- Writes are ordered by board generated_at; an older board never replaces
+  a newer one (job write-through vs slow GET rebuilds, see write_cached_board)
+
+STALE-WHILE-REVALIDATE:
+- The last READY body is kept under a separate key (TODAY_BOARD_STALE_TTL_S)
+  and served marked stale, with the running job id, to opted-in polls
+
+SINGLE-FLIGHT:
+- Cache misses rebuild under a per-brand lock (board_rebuild_lock); other
+  requests wait up to TODAY_BOARD_REBUILD_WAIT_S for the leader's write
 """
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import TYPE_CHECKING
-from uuid import UUID
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from enum import Enum
+from typing import TYPE_CHECKING, Iterator
+from uuid import UUID, uuid4
 
 from django.conf import settings
 from django.core.cache import cache
 
+from kairo.core.etag import make_etag
+
 if TYPE_CHECKING:
     from kairo.hero.dto import TodayBoardDTO
 
@@ -43,6 +72,9 @@ logger = logging.getLogger("kairo.hero.cache")
 # Exact key format per PRD: "today_board:v2:{brand_id}"
 CACHE_KEY_PREFIX = "today_board:v2"
 
+# Strong ETag of the cached body (conditional GET, see kairo.core.etag)
+ETAG_KEY_PREFIX = "today_board_etag:v2"
+
 # Default TTL: 6 hours (21600 seconds) per PRD §D.4
 DEFAULT_CACHE_TTL_SECONDS = 21600
 
@@ -77,32 +109,92 @@ def get_cache_key(brand_id: UUID) -> str:
 # =============================================================================
 
 
-def get_cached_board(brand_id: UUID) -> "TodayBoardDTO | None":
+def should_validate_hits() -> bool:
     """
-    Get cached TodayBoard for a brand.
+    Whether cache hits are re-validated against TodayBoardDTO.
+
+    Off by default outside DEBUG: hits are served as stored.
+    """
+    return getattr(settings, "TODAY_BOARD_CACHE_VALIDATE", settings.DEBUG)
+
+
+# Present in every entry written by set_cached_board(). Cannot occur inside
+# a JSON string value (the quote would be escaped).
+HIT_MARKER = '"cache_hit":true'
+
+
+def _hit_payload(board: "TodayBoardDTO", cache_key: str, ttl: int) -> str:
+    """
+    Serialize a board exactly as GET /today returns it on a cache hit.
+
+    The hit-time meta fields (cache_hit, ready_reason, cache_key,
+    cache_ttl_seconds) are fixed for a given entry, so they are written once
+    here instead of being patched into a parsed DTO on every read.
+    """
+    meta = board.meta.model_copy(update={
+        "cache_hit": True,
+        "ready_reason": "cache_hit",
+        "cache_key": cache_key,
+        "cache_ttl_seconds": ttl,
+    })
+    return board.model_copy(update={"meta": meta}).model_dump_json()
+
+
+def get_etag_key(brand_id: UUID) -> str:
+    """Generate ETag key for a brand's cached TodayBoard."""
+    return f"{ETAG_KEY_PREFIX}:{brand_id}"
+
+
+def get_cached_board_etag(brand_id: UUID) -> str | None:
+    """
+    ETag of the cached TodayBoard body, without fetching the body.
+
+    Lets GET /today answer If-None-Match with 304 before any DB access.
 
     Args:
         brand_id: UUID of the brand
 
     Returns:
-        TodayBoardDTO if cached and valid, None otherwise
+        Quoted ETag if a board is cached, None otherwise
+    """
+    try:
+        return cache.get(get_etag_key(brand_id))
+    except Exception:
+        return None
+
+
+def get_cached_board_entry(brand_id: UUID) -> tuple[str | None, str | None]:
+    """
+    Get the cached TodayBoard body and its ETag (one cache round trip).
+
+    Hot path for GET /today: no Pydantic parse or re-serialization unless
+    TODAY_BOARD_CACHE_VALIDATE is set.
+
+    Args:
+        brand_id: UUID of the brand
+
+    Returns:
+        (JSON body with cache hit meta, ETag) - (None, None) on miss; the
+        ETag is None for entries written before ETags were stored
     """
     from kairo.hero.dto import TodayBoardDTO
 
     cache_key = get_cache_key(brand_id)
+    etag_key = get_etag_key(brand_id)
 
     try:
-        cached = cache.get(cache_key)
+        entry = cache.get_many([cache_key, etag_key])
+        cached = entry.get(cache_key)
         if cached is None:
-            return None
+            return None, None
 
-        # Validate and deserialize
-        board = TodayBoardDTO.model_validate_json(cached)
+        if HIT_MARKER not in cached:
+            # Entry written before boards were stored pre-serialized
+            board = TodayBoardDTO.model_validate_json(cached)
+            return _hit_payload(board, cache_key, get_cache_ttl()), None
 
-        # Mark as cache hit
-        board.meta.cache_hit = True
-        board.meta.cache_key = cache_key
-        board.meta.cache_ttl_seconds = get_cache_ttl()
+        if should_validate_hits():
+            TodayBoardDTO.model_validate_json(cached)
 
         logger.debug(
             "Cache hit for brand %s (key=%s)",
@@ -110,7 +202,7 @@ def get_cached_board(brand_id: UUID) -> "TodayBoardDTO | None":
             cache_key,
         )
 
-        return board
+        return cached, entry.get(etag_key)
 
     except Exception as e:
         # Cache corruption or deserialization failure - log and return None
@@ -121,26 +213,160 @@ def get_cached_board(brand_id: UUID) -> "TodayBoardDTO | None":
         )
         # Optionally delete corrupted cache entry
         try:
-            cache.delete(cache_key)
+            cache.delete_many([cache_key, etag_key])
         except Exception:
             pass
+        return None, None
+
+
+def get_cached_board_json(brand_id: UUID) -> str | None:
+    """
+    Get the cached TodayBoard for a brand as the final response body.
+
+    Args:
+        brand_id: UUID of the brand
+
+    Returns:
+        JSON string (cache hit meta included) if cached, None otherwise
+    """
+    return get_cached_board_entry(brand_id)[0]
+
+
+def get_cached_board(brand_id: UUID) -> "TodayBoardDTO | None":
+    """
+    Get cached TodayBoard for a brand.
+
+    Parses the stored body; GET /today serves get_cached_board_json()
+    directly instead.
+
+    Args:
+        brand_id: UUID of the brand
+
+    Returns:
+        TodayBoardDTO if cached and valid, None otherwise
+    """
+    from kairo.hero.dto import TodayBoardDTO
+
+    payload = get_cached_board_json(brand_id)
+    if payload is None:
         return None
 
+    try:
+        return TodayBoardDTO.model_validate_json(payload)
+    except Exception as e:
+        logger.warning(
+            "Cache read failed for brand %s: %s",
+            brand_id,
+            str(e),
+        )
+        invalidate_cache(brand_id)
+        return None
+
+
+# =============================================================================
+# VERSIONED WRITES
+# =============================================================================
+# Board cache writes come from job completion (write-through) and from GET
+# /today rebuilds, and either can be slow. Each entry is versioned by the
+# board's generated_at (OpportunitiesBoard.created_at, the order GET uses to
+# pick the latest board). A per-brand version key records the newest version
+# written, and writes are serialized by a short cache.add lock, so an older
+# board never replaces a newer one. The version key outlives invalidation so
+# a stale writer cannot repopulate a board that has been superseded.
+
+VERSION_KEY_PREFIX = "today_board_version:v2"
+WRITE_LOCK_PREFIX = "today_board_write:v2"
+WRITE_LOCK_TTL_SECONDS = 5
+WRITE_LOCK_WAIT_SECONDS = 0.5
+WRITE_LOCK_POLL_SECONDS = 0.01
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def get_version_key(brand_id: UUID) -> str:
+    """Generate board version key for a brand."""
+    return f"{VERSION_KEY_PREFIX}:{brand_id}"
+
+
+def board_version(generated_at: datetime) -> int:
+    """Cache version of a board: generated_at in microseconds since epoch."""
+    if generated_at.tzinfo is None:
+        generated_at = generated_at.replace(tzinfo=dt_timezone.utc)
+    return (generated_at - _EPOCH) // timedelta(microseconds=1)
+
+
+@contextmanager
+def _board_write_lock(brand_id: UUID) -> Iterator[bool]:
+    """Serialize versioned writes for a brand. Yields False if not acquired."""
+    lock_key = f"{WRITE_LOCK_PREFIX}:{brand_id}"
+    token = uuid4().hex
+    deadline = time.monotonic() + WRITE_LOCK_WAIT_SECONDS
+
+    acquired = False
+    while True:
+        try:
+            acquired = cache.add(lock_key, token, timeout=WRITE_LOCK_TTL_SECONDS)
+        except Exception:
+            break
+        if acquired or time.monotonic() >= deadline:
+            break
+        time.sleep(WRITE_LOCK_POLL_SECONDS)
+
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            try:
+                if cache.get(lock_key) == token:
+                    cache.delete(lock_key)
+            except Exception:
+                pass
+
+
+def _superseded(brand_id: UUID, version: int) -> bool:
+    """True if a newer board version has already been written."""
+    current = cache.get(get_version_key(brand_id))
+    return current is not None and current > version
+
+
+class BoardWrite(Enum):
+    """Outcome of write_cached_board()."""
+    CACHED = "cached"
+    NOT_READY = "not_ready"
+    SUPERSEDED = "superseded"  # a newer board is already cached
+    LOCK_BUSY = "lock_busy"  # another writer held the brand's write lock
+    FAILED = "failed"  # cache backend error
+
 
 def set_cached_board(brand_id: UUID, board: "TodayBoardDTO") -> bool:
+    """
+    Cache a TodayBoard response (see write_cached_board).
+
+    Returns:
+        True if cached successfully, False otherwise (including when a
+        newer board is already cached or the write lock is contended)
+    """
+    return write_cached_board(brand_id, board) is BoardWrite.CACHED
+
+
+def write_cached_board(brand_id: UUID, board: "TodayBoardDTO") -> BoardWrite:
     """
     Cache a TodayBoard response.
 
     CACHING POLICY (per PRD §D.4):
     - ONLY cache state=READY boards
     - Skip caching for other states (generating, insufficient_evidence, etc.)
+    - Never replace a newer board (versioned by meta.generated_at)
+
+    The entry is the serialized cache-hit response (see _hit_payload);
+    the passed board's meta describes this fresh (non-hit) response.
 
     Args:
         brand_id: UUID of the brand
         board: TodayBoardDTO to cache
 
     Returns:
-        True if cached successfully, False otherwise
+        BoardWrite.CACHED if written, otherwise why the board was not
     """
     from kairo.core.enums import TodayBoardState
 
@@ -151,10 +377,11 @@ def set_cached_board(brand_id: UUID, board: "TodayBoardDTO") -> bool:
             brand_id,
             board.meta.state,
         )
-        return False
+        return BoardWrite.NOT_READY
 
     cache_key = get_cache_key(brand_id)
     ttl = get_cache_ttl()
+    version = board_version(board.meta.generated_at)
 
     try:
         # Ensure cache metadata is set
@@ -162,8 +389,27 @@ def set_cached_board(brand_id: UUID, board: "TodayBoardDTO") -> bool:
         board.meta.cache_key = cache_key
         board.meta.cache_ttl_seconds = ttl
 
-        # Serialize and store
-        cache.set(cache_key, board.model_dump_json(), timeout=ttl)
+        # Serialize once (outside the lock) and store the response body
+        payload = _hit_payload(board, cache_key, ttl)
+
+        with _board_write_lock(brand_id) as locked:
+            if not locked:
+                logger.debug("Board write lock busy for brand %s, skipping cache", brand_id)
+                return BoardWrite.LOCK_BUSY
+            if _superseded(brand_id, version):
+                logger.debug(
+                    "Skipping cache for brand %s (board %s superseded)",
+                    brand_id,
+                    board.meta.generated_at,
+                )
+                return BoardWrite.SUPERSEDED
+            cache.set_many({
+                cache_key: payload,
+                get_etag_key(brand_id): make_etag(version, payload),
+                get_version_key(brand_id): version,
+            }, timeout=ttl)
+            # Last READY board for stale-while-revalidate (survives invalidation)
+            cache.set(get_stale_key(brand_id), payload, timeout=get_stale_ttl())
 
         logger.debug(
             "Cached board for brand %s (key=%s, ttl=%ds)",
@@ -171,7 +417,7 @@ def set_cached_board(brand_id: UUID, board: "TodayBoardDTO") -> bool:
             cache_key,
             ttl,
         )
-        return True
+        return BoardWrite.CACHED
 
     except Exception as e:
         logger.warning(
@@ -179,19 +425,22 @@ def set_cached_board(brand_id: UUID, board: "TodayBoardDTO") -> bool:
             brand_id,
             str(e),
         )
-        return False
+        return BoardWrite.FAILED
 
 
-def invalidate_cache(brand_id: UUID) -> bool:
+def invalidate_cache(brand_id: UUID, superseded_at: datetime | None = None) -> bool:
     """
     Invalidate cache for a brand's TodayBoard.
 
     Called on:
     - POST /regenerate (immediately)
-    - Job completion (before/after persisting new board)
+    - Job completion with a non-READY board (superseded_at = that board's
+      created_at, so slower writers of older READY boards are rejected)
 
     Args:
         brand_id: UUID of the brand
+        superseded_at: generated_at of a board that replaces the cached one
+            but is not itself cached; no-op if a newer board is cached
 
     Returns:
         True if deleted successfully, False otherwise
@@ -199,7 +448,18 @@ def invalidate_cache(brand_id: UUID) -> bool:
     cache_key = get_cache_key(brand_id)
 
     try:
-        cache.delete(cache_key)
+        if superseded_at is not None:
+            version = board_version(superseded_at)
+            with _board_write_lock(brand_id):
+                if _superseded(brand_id, version):
+                    # An even newer board is already cached; keep it
+                    return True
+                cache.delete_many([cache_key, get_etag_key(brand_id)])
+                # The latest board is not READY: nothing left to serve stale
+                cache.delete(get_stale_key(brand_id))
+                cache.set(get_version_key(brand_id), version, timeout=get_cache_ttl())
+        else:
+            cache.delete_many([cache_key, get_etag_key(brand_id)])
         logger.debug(
             "Cache invalidated for brand %s (key=%s)",
             brand_id,
@@ -216,6 +476,169 @@ def invalidate_cache(brand_id: UUID) -> bool:
         return False
 
 
+# =============================================================================
+# STALE-WHILE-REVALIDATE
+# =============================================================================
+# Every cached READY body is also kept under a long-lived stale key that
+# invalidation (POST /regenerate, job completion) leaves in place. While a
+# job runs, opted-in GET /today requests get that body with meta spliced to
+# stale=true and the running job id, instead of an empty GENERATING board.
+
+STALE_KEY_PREFIX = "today_board_stale:v2"
+DEFAULT_STALE_TTL_SECONDS = 604800  # 7 days
+
+
+def get_stale_key(brand_id: UUID) -> str:
+    """Generate last-READY-board key for a brand."""
+    return f"{STALE_KEY_PREFIX}:{brand_id}"
+
+
+def get_stale_ttl() -> int:
+    """How long the last READY board is kept for stale serving (seconds)."""
+    return getattr(settings, "TODAY_BOARD_STALE_TTL_S", DEFAULT_STALE_TTL_SECONDS)
+
+
+def get_stale_board_json(
+    brand_id: UUID,
+    job_id: str,
+    progress_stage: str | None = None,
+    progress_detail: str | None = None,
+) -> str | None:
+    """
+    Get the last READY board, marked stale, for serving during regeneration.
+
+    Only meta is touched (stdlib json, no Pydantic or to_dto). state stays
+    "ready" so clients keep rendering opportunities.
+
+    Args:
+        brand_id: UUID of the brand
+        job_id: ID of the running regenerate job
+        progress_stage: Current job stage (Phase 3 progress)
+        progress_detail: Current job stage detail
+
+    Returns:
+        JSON response body, or None if no READY board is kept
+    """
+    try:
+        payload = cache.get(get_stale_key(brand_id))
+        if payload is None:
+            return None
+
+        body = json.loads(payload)
+        body["meta"].update({
+            "stale": True,
+            "job_id": job_id,
+            "progress_stage": progress_stage,
+            "progress_detail": progress_detail,
+            "cache_hit": True,
+            "ready_reason": "stale_while_revalidate",
+        })
+        return json.dumps(body, ensure_ascii=False, separators=(",", ":"))
+
+    except Exception as e:
+        logger.warning(
+            "Stale board read failed for brand %s: %s",
+            brand_id,
+            str(e),
+        )
+        return None
+
+
+# =============================================================================
+# SINGLE-FLIGHT REBUILD
+# =============================================================================
+# After invalidation every concurrent GET /today for a brand misses at once.
+# One request (the leader) takes a short per-brand lock via cache.add (atomic
+# on Redis and LocMem) and rebuilds the board from the DB; the others wait
+# for the leader's cache write instead of running the same board and
+# evidence-preview queries.
+
+REBUILD_LOCK_PREFIX = "today_board_rebuild:v2"
+REBUILD_LOCK_TTL_SECONDS = 10  # expires if the leader dies mid-rebuild
+REBUILD_POLL_SECONDS = 0.05
+DEFAULT_REBUILD_WAIT_SECONDS = 2.0
+
+
+def get_rebuild_lock_key(brand_id: UUID) -> str:
+    """Generate single-flight lock key for a brand's board rebuild."""
+    return f"{REBUILD_LOCK_PREFIX}:{brand_id}"
+
+
+def get_rebuild_wait_seconds() -> float:
+    """How long a follower waits for the leader's rebuild (seconds)."""
+    return float(getattr(settings, "TODAY_BOARD_REBUILD_WAIT_S", DEFAULT_REBUILD_WAIT_SECONDS))
+
+
+@contextmanager
+def board_rebuild_lock(brand_id: UUID) -> Iterator[bool]:
+    """
+    Single-flight lock around a TodayBoard rebuild.
+
+    Yields True for the leader (lock acquired, or cache unavailable - never
+    block a request on a cache outage) and False for followers. The lock is
+    released on exit only if still owned by this request.
+
+    Args:
+        brand_id: UUID of the brand
+    """
+    lock_key = get_rebuild_lock_key(brand_id)
+    token = uuid4().hex
+
+    try:
+        leader = cache.add(lock_key, token, timeout=REBUILD_LOCK_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(
+            "Rebuild lock unavailable for brand %s: %s",
+            brand_id,
+            str(e),
+        )
+        yield True
+        return
+
+    try:
+        yield leader
+    finally:
+        if leader:
+            try:
+                if cache.get(lock_key) == token:
+                    cache.delete(lock_key)
+            except Exception:
+                pass
+
+
+def wait_for_rebuilt_board(brand_id: UUID, timeout: float | None = None) -> "TodayBoardDTO | None":
+    """
+    Follower side of the single-flight: wait for the leader's cache write.
+
+    Returns as soon as the board is cached, or None once the leader releases
+    the lock without caching (non-READY board) or the wait times out; the
+    caller then rebuilds itself.
+
+    Args:
+        brand_id: UUID of the brand
+        timeout: Max seconds to wait (default: TODAY_BOARD_REBUILD_WAIT_S)
+
+    Returns:
+        Cached TodayBoardDTO (cache hit meta) or None
+    """
+    lock_key = get_rebuild_lock_key(brand_id)
+    deadline = time.monotonic() + (get_rebuild_wait_seconds() if timeout is None else timeout)
+
+    while True:
+        board = get_cached_board(brand_id)
+        if board is not None:
+            return board
+        try:
+            if cache.get(lock_key) is None:
+                return None
+        except Exception:
+            return None
+        if time.monotonic() >= deadline:
+            logger.debug("Rebuild wait timed out for brand %s", brand_id)
+            return None
+        time.sleep(REBUILD_POLL_SECONDS)
+
+
 # =============================================================================
 # JOB TRACKING CACHE
 # =============================================================================
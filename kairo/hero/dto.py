@@ -560,6 +560,8 @@ class TodayBoardMetaDTO(BaseModel):
     - degraded: True if state in {"insufficient_evidence", "error"} (legacy, preserved for backwards compat)
     - reason: Degradation reason code
     - remediation: User-facing action to fix degraded state
+    - stale: True when serving the previous READY board during regeneration
+      (stale-while-revalidate; job_id is the running job)
     """
     generated_at: datetime
     source: str = "hero_f1_v2"  # Flow identifier (updated for v2)
@@ -582,6 +584,10 @@ class TodayBoardMetaDTO(BaseModel):
     cache_key: str | None = None  # e.g., "today_board:v2:{brand_id}"
     cache_ttl_seconds: int | None = None
 
+    # Stale-while-revalidate (opt-in per request): previous READY board served
+    # while job_id regenerates; state stays "ready"
+    stale: bool = False
+
     # Generation status (legacy, preserved for backwards compat)
     degraded: bool = False  # True if state in {"insufficient_evidence", "error"}
     reason: str | None = None  # Degradation reason code
@@ -662,11 +668,12 @@ class RegenerateResponseDTO(BaseModel):
     POST /regenerate/ is the ONLY endpoint that triggers generation.
     Returns 202 Accepted with job_id for async polling.
 
-    Client polls GET /today/ for completion.
+    Client polls GET /today/ for completion, or follows events_url (SSE).
     """
     status: Literal["accepted"] = "accepted"
     job_id: str
     poll_url: str  # "/api/brands/{brand_id}/today/"
+    events_url: str | None = None  # "/api/brands/{brand_id}/jobs/{job_id}/events/"
 
 
 class RegenerateResponseLegacyDTO(BaseModel):
@@ -9,6 +9,8 @@ Features:
 - Run browser: List and inspect hero loop runs (HTML + JSON)
 - Eval report browser: View eval markdown reports
 - Brand detail: View brand snapshot, opportunities, packages, variants
+- Queue metrics: Job queue depth/lag counters and histograms (JSON or
+  Prometheus text) for autoscaling workers
 
 Access control:
 - Token via X-Kairo-Internal-Token header
@@ -32,6 +34,7 @@ from uuid import UUID
 import markdown
 from django.http import HttpRequest, HttpResponse, JsonResponse
 
+from kairo.core.job_metrics import metrics_json, render_prometheus
 from kairo.core.models import Brand, ContentPackage, Opportunity, Variant
 from kairo.hero.observability_store import get_run_detail, list_runs
 
@@ -568,3 +571,32 @@ def get_brand_detail(request: HttpRequest, brand_id: str) -> HttpResponse:
     """
 
     return _html_page(f"Brand: {brand.name}", content)
+
+
+# =============================================================================
+# QUEUE METRICS
+# =============================================================================
+
+
+@require_internal_token
+def queue_metrics(request: HttpRequest) -> HttpResponse:
+    """
+    Job queue metrics for OpportunitiesJob and BrandBrainJob.
+
+    GET /hero/internal/queues/metrics/
+    GET /hero/internal/queues/metrics/?format=prometheus
+
+    Returns JSON by default, Prometheus text exposition with
+    format=prometheus. Counters/histograms come from kairo.core.job_metrics;
+    depth and lag gauges are read from the DB on each request.
+    """
+    if request.GET.get("format") == "prometheus":
+        return HttpResponse(
+            render_prometheus(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+    return JsonResponse({
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "metrics": metrics_json(),
+    })
@@ -8,8 +8,10 @@ from .queue import (
     ClaimResult,
     EnqueueResult,
     claim_next_job,
+    claim_next_jobs,
     complete_job,
     extend_job_lock,
+    extend_job_locks,
     fail_job,
     fail_job_insufficient_evidence,
     enqueue_opportunities_job,
@@ -20,8 +22,10 @@ __all__ = [
     "ClaimResult",
     "EnqueueResult",
     "claim_next_job",
+    "claim_next_jobs",
     "complete_job",
     "extend_job_lock",
+    "extend_job_locks",
     "fail_job",
     "fail_job_insufficient_evidence",
     "enqueue_opportunities_job",
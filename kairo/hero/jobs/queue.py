@@ -5,20 +5,46 @@ PR1: Durable job queue for opportunities generation.
 Per opportunities_v1_prd.md §0.2 - TodayBoard State Machine.
 
 This module provides:
-- enqueue_opportunities_job(): Create a new generation job
+- enqueue_opportunities_job(): Create (or coalesce into) a generation job
 - claim_next_job(): Claim the next available job with atomic locking
+- claim_next_jobs(): Claim up to N available jobs in a single round trip
 - complete_job(): Mark a job as succeeded
 - fail_job(): Mark a job as failed with retry/backoff logic
 - fail_job_insufficient_evidence(): Mark job as insufficient_evidence (no retry)
 - release_stale_jobs(): Release jobs with stale locks
 - extend_job_lock(): Extend lock on a running job (heartbeat)
+- extend_job_locks(): Extend locks on several running jobs in one UPDATE
+- get_job_state(): Current status/progress, as streamed over SSE
 
 Job leasing ensures no double-execution:
 - Worker claims job by atomic update: status=PENDING -> RUNNING
+- On PostgreSQL, claims use FOR UPDATE SKIP LOCKED so concurrent workers
+  take disjoint jobs instead of racing for the queue head
 - Sets locked_at and locked_by for stale lock detection
 - Stale locks (>10 min) are released and jobs become available
+- Enqueue publishes a wakeup (kairo.core.job_notify) so idle workers
+  start immediately instead of waiting out their poll interval
 - Workers extend locks periodically via heartbeat
 
+Progress events (kairo.core.job_events): claim, progress updates and every
+terminal/retry transition publish the job's new state for SSE streams.
+
+Metrics (kairo.core.job_metrics): enqueue, claim, complete, fail and
+stale-release emit counters and latency histograms (queue="opportunities").
+
+Per-brand coalescing:
+- At most one PENDING job per brand (partial unique index
+  uniq_oppjob_brand_pending), so regenerate storms collapse into one job
+- Enqueue returns the existing PENDING job, or the RUNNING job if its mode
+  already covers the request; a force/live request promotes a PENDING
+  fixture job's mode in place instead of adding a second job
+- A retry that would collide with a newer PENDING job is superseded
+
+Scheduling (kairo.core.job_scheduling):
+- Priority lanes: interactive regenerate > first_run fixture > scheduled
+- Weighted round-robin across tenants within a lane, so one tenant's
+  bulk onboarding cannot starve other tenants
+
 Terminal states:
 - SUCCEEDED: Board generated successfully
 - FAILED: Error during generation (after max retries)
@@ -35,10 +61,23 @@ from datetime import timedelta
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from django.db import transaction
-from django.db.models import F
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 
+from kairo.core.enums import JobPriority
+from kairo.core.job_metrics import (
+    OPPORTUNITIES_QUEUE,
+    record_claim,
+    record_enqueue,
+    record_finish,
+    record_retry_backoff,
+    record_stage,
+    record_stale_release,
+)
+from kairo.core.job_events import OPPORTUNITIES_EVENTS, publish_job_event
+from kairo.core.job_notify import OPPORTUNITIES_JOBS_CHANNEL, notify_job_available
+from kairo.core.job_scheduling import claim_jobs
+
 if TYPE_CHECKING:
     from kairo.hero.models import OpportunitiesBoard, OpportunitiesJob
 
@@ -58,6 +97,17 @@ BACKOFF_BASE_SECONDS = 30
 # Backoff multiplier (exponential)
 BACKOFF_MULTIPLIER = 2
 
+# Mode strength for coalescing: a job in a stronger mode satisfies a request
+# for a weaker one (a live run also covers a fixture request).
+MODE_RANK = {
+    "fixture_only": 0,
+    "live_cap_limited": 1,
+}
+
+# Retries when a concurrent enqueue/claim changes the brand's live job
+# between our read and write
+COALESCE_MAX_ATTEMPTS = 3
+
 
 # =============================================================================
 # RESULT TYPES
@@ -69,6 +119,7 @@ class EnqueueResult:
     """Result of enqueueing a job."""
     job_id: UUID
     brand_id: UUID
+    coalesced: bool = False  # True if an existing PENDING/RUNNING job was returned
 
 
 @dataclass
@@ -91,17 +142,33 @@ def enqueue_opportunities_job(
     first_run: bool = False,
     mode: str | None = None,
     user_id: UUID | None = None,
+    priority: int | None = None,
 ) -> EnqueueResult:
     """
     Enqueue an opportunities generation job for background execution.
 
-    Creates an OpportunitiesJob in PENDING status.
+    Creates an OpportunitiesJob in PENDING status, unless the brand already
+    has a compatible live job (see coalescing rules below).
 
     PR-6: Mode selection rule:
     - force=True (POST /regenerate): live_cap_limited (if APIFY_ENABLED)
     - first_run=True (auto-enqueue): fixture_only (always)
     - Default: fixture_only
 
+    Priority lane (JobPriority) unless given explicitly:
+    - force=True: INTERACTIVE
+    - first_run=True: FIRST_RUN
+    - Default: SCHEDULED
+
+    Coalescing rules (per brand):
+    - PENDING job exists: return it. If the request's mode outranks the
+      job's (MODE_RANK), promote the job's params in place; if its
+      priority is higher, move the job to the higher lane.
+    - RUNNING job exists whose mode ranks >= the request's: return it.
+    - Otherwise create a PENDING job. The partial unique index on
+      (brand) WHERE status='pending' makes this safe under concurrency:
+      the loser of a create race coalesces into the winner.
+
     Phase 2 BYOK: If user_id is provided, stores it in job params for
     BYOK token lookup during execution.
 
@@ -111,9 +178,11 @@ def enqueue_opportunities_job(
         first_run: Whether this is a first-run auto-enqueue (from GET with evidence)
         mode: Explicit mode override (if None, determined from force/first_run)
         user_id: Optional user UUID for BYOK token lookup
+        priority: Explicit JobPriority override (if None, determined from
+            force/first_run)
 
     Returns:
-        EnqueueResult with job_id and brand_id
+        EnqueueResult with job_id, brand_id and whether it was coalesced
     """
     from kairo.core.guardrails import is_apify_enabled
     from kairo.hero.models import OpportunitiesJob, OpportunitiesJobStatus
@@ -127,42 +196,194 @@ def enqueue_opportunities_job(
             # First-run auto-enqueue or Apify disabled → fixture mode
             mode = "fixture_only"
 
-    job = OpportunitiesJob.objects.create(
-        brand_id=brand_id,
-        status=OpportunitiesJobStatus.PENDING,
-        params_json={
-            "force": force,
-            "first_run": first_run,
-            "mode": mode,  # PR-6: Store mode in job params
-            "user_id": str(user_id) if user_id else None,  # Phase 2 BYOK
-        },
+    if priority is None:
+        if force:
+            priority = JobPriority.INTERACTIVE
+        elif first_run:
+            priority = JobPriority.FIRST_RUN
+        else:
+            priority = JobPriority.SCHEDULED
+
+    params = {
+        "force": force,
+        "first_run": first_run,
+        "mode": mode,  # PR-6: Store mode in job params
+        "user_id": str(user_id) if user_id else None,  # Phase 2 BYOK
+    }
+
+    for _ in range(COALESCE_MAX_ATTEMPTS):
+        pending = (
+            OpportunitiesJob.objects
+            .filter(brand_id=brand_id, status=OpportunitiesJobStatus.PENDING)
+            .first()
+        )
+        if pending:
+            if not _promote_pending_job(pending, params, priority):
+                # Claimed between our read and write - re-evaluate
+                continue
+            record_enqueue(OPPORTUNITIES_QUEUE, priority, coalesced=True)
+            return EnqueueResult(job_id=pending.id, brand_id=brand_id, coalesced=True)
+
+        running = (
+            OpportunitiesJob.objects
+            .filter(brand_id=brand_id, status=OpportunitiesJobStatus.RUNNING)
+            .order_by("-created_at")
+            .first()
+        )
+        if running and _mode_rank(running.params_json) >= _mode_rank(params):
+            logger.info(
+                "Coalesced opportunities enqueue for brand %s into running job %s (mode=%s)",
+                brand_id,
+                running.id,
+                mode,
+            )
+            record_enqueue(OPPORTUNITIES_QUEUE, priority, coalesced=True)
+            return EnqueueResult(job_id=running.id, brand_id=brand_id, coalesced=True)
+
+        try:
+            with transaction.atomic():
+                job = OpportunitiesJob.objects.create(
+                    brand_id=brand_id,
+                    status=OpportunitiesJobStatus.PENDING,
+                    priority=priority,
+                    params_json=params,
+                )
+        except IntegrityError:
+            # Concurrent enqueue created the brand's PENDING job first
+            continue
+
+        logger.info(
+            "Enqueued opportunities job %s for brand %s "
+            "(force=%s, first_run=%s, mode=%s, priority=%s)",
+            job.id,
+            brand_id,
+            force,
+            first_run,
+            mode,
+            priority,
+        )
+
+        record_enqueue(OPPORTUNITIES_QUEUE, priority)
+
+        # Wake an idle worker (delivered after commit)
+        notify_job_available(OPPORTUNITIES_JOBS_CHANNEL)
+
+        return EnqueueResult(
+            job_id=job.id,
+            brand_id=brand_id,
+        )
+
+    raise RuntimeError(
+        f"Could not enqueue opportunities job for brand {brand_id} "
+        f"after {COALESCE_MAX_ATTEMPTS} attempts"
     )
 
+
+def _mode_rank(params: dict | None) -> int:
+    """Rank a job's mode for coalescing (unknown modes rank lowest)."""
+    return MODE_RANK.get((params or {}).get("mode", "fixture_only"), 0)
+
+
+def _promote_pending_job(
+    job: "OpportunitiesJob",
+    requested: dict,
+    priority: int,
+) -> bool:
+    """
+    Coalesce a request into an existing PENDING job.
+
+    If the request's mode outranks the job's, the job's params are promoted
+    (mode, force, and the requesting user's BYOK id). If the request's
+    priority lane is higher, the job moves to it. Both use a conditional
+    UPDATE so a concurrent claim is never overwritten.
+
+    Returns:
+        True if the job is still PENDING and now satisfies the request,
+        False if it was claimed concurrently.
+    """
+    from kairo.hero.models import OpportunitiesJob, OpportunitiesJobStatus
+
+    current = job.params_json or {}
+    promote_mode = _mode_rank(requested) > _mode_rank(current)
+    promote_priority = priority < job.priority
+
+    if not promote_mode and not promote_priority:
+        logger.info(
+            "Coalesced opportunities enqueue for brand %s into pending job %s (mode=%s)",
+            job.brand_id,
+            job.id,
+            current.get("mode"),
+        )
+        return True
+
+    promoted = current
+    if promote_mode:
+        promoted = {
+            **current,
+            "mode": requested["mode"],
+            "force": current.get("force", False) or requested["force"],
+            "user_id": requested["user_id"] or current.get("user_id"),
+        }
+    new_priority = min(priority, job.priority)
+
+    rows_updated = OpportunitiesJob.objects.filter(
+        id=job.id,
+        status=OpportunitiesJobStatus.PENDING,
+    ).update(params_json=promoted, priority=new_priority)
+
+    if rows_updated == 0:
+        return False
+
     logger.info(
-        "Enqueued opportunities job %s for brand %s (force=%s, first_run=%s, mode=%s)",
+        "Promoted pending opportunities job %s for brand %s: "
+        "mode %s -> %s, priority %s -> %s",
         job.id,
-        brand_id,
-        force,
-        first_run,
-        mode,
+        job.brand_id,
+        current.get("mode"),
+        promoted.get("mode"),
+        job.priority,
+        new_priority,
     )
+    job.params_json = promoted
+    job.priority = new_priority
+    return True
+
 
-    return EnqueueResult(
-        job_id=job.id,
-        brand_id=brand_id,
+def _pending_sibling_id(job: "OpportunitiesJob") -> UUID | None:
+    """Return the id of another PENDING job for the same brand, if any."""
+    from kairo.hero.models import OpportunitiesJob, OpportunitiesJobStatus
+
+    return (
+        OpportunitiesJob.objects
+        .filter(brand_id=job.brand_id, status=OpportunitiesJobStatus.PENDING)
+        .exclude(id=job.id)
+        .values_list("id", flat=True)
+        .first()
     )
 
 
+def _save_pending(job: "OpportunitiesJob", update_fields: list[str]) -> bool:
+    """
+    Save a job moved back to PENDING.
+
+    Returns False (nothing saved) if a concurrent enqueue created the brand's
+    PENDING job first and the one-pending-per-brand constraint rejected it.
+    """
+    try:
+        with transaction.atomic():
+            job.save(update_fields=update_fields)
+    except IntegrityError:
+        return False
+    return True
+
+
 def claim_next_job(
     worker_id: str | None = None,
 ) -> ClaimResult:
     """
     Claim the next available job with atomic locking.
 
-    Uses optimistic locking pattern:
-    1. Find jobs WHERE status=PENDING AND available_at <= now
-    2. Update first one to status=RUNNING, set locked_at/locked_by
-    3. Return the job if successful
+    Thin wrapper over claim_next_jobs() with limit=1.
 
     Args:
         worker_id: Identifier for this worker (defaults to hostname+uuid)
@@ -170,69 +391,70 @@ def claim_next_job(
     Returns:
         ClaimResult with claimed job or None.
     """
-    from kairo.hero.models import OpportunitiesJob, OpportunitiesJobStatus
+    jobs = claim_next_jobs(worker_id=worker_id, limit=1)
 
-    if worker_id is None:
-        worker_id = f"{socket.gethostname()}-{uuid_module.uuid4().hex[:8]}"
+    if not jobs:
+        return ClaimResult(
+            job=None,
+            claimed=False,
+            reason="No available jobs",
+        )
 
-    now = timezone.now()
+    return ClaimResult(
+        job=jobs[0],
+        claimed=True,
+        reason="",
+    )
 
-    with transaction.atomic():
-        # Find next available job
-        # Ordered by available_at (for backoff) then created_at (FIFO)
-        job = (
-            OpportunitiesJob.objects
-            .filter(
-                status=OpportunitiesJobStatus.PENDING,
-                available_at__lte=now,
-            )
-            .order_by("available_at", "created_at")
-            .first()
-        )
 
-        if not job:
-            return ClaimResult(
-                job=None,
-                claimed=False,
-                reason="No available jobs",
-            )
+def claim_next_jobs(
+    worker_id: str | None = None,
+    limit: int = 1,
+) -> list["OpportunitiesJob"]:
+    """
+    Claim up to `limit` available jobs.
 
-        # Atomic claim: only succeeds if still PENDING
-        rows_updated = OpportunitiesJob.objects.filter(
-            id=job.id,
-            status=OpportunitiesJobStatus.PENDING,
-        ).update(
-            status=OpportunitiesJobStatus.RUNNING,
-            locked_at=now,
-            locked_by=worker_id,
-            attempts=F("attempts") + 1,
-        )
+    Scheduling and locking live in kairo.core.job_scheduling.claim_jobs():
+    - The highest priority lane with an available job is served first
+    - Within the lane, slots go weighted round-robin across tenants
+    - PostgreSQL claims use UPDATE ... FOR UPDATE SKIP LOCKED RETURNING,
+      so N workers take N disjoint jobs instead of racing for the head;
+      SQLite (tests/dev) uses a conditional UPDATE
 
-        if rows_updated == 0:
-            # Another worker claimed it first
-            return ClaimResult(
-                job=None,
-                claimed=False,
-                reason="Job claimed by another worker",
-            )
+    Args:
+        worker_id: Identifier for this worker (defaults to hostname+uuid)
+        limit: Maximum number of jobs to claim
+
+    Returns:
+        List of claimed jobs (status=RUNNING, locked_by=worker_id) in
+        (priority, available_at, created_at) order, possibly empty.
+    """
+    from kairo.hero.models import OpportunitiesJob
 
-        # Refresh the job to get updated values
-        job.refresh_from_db()
+    if worker_id is None:
+        worker_id = f"{socket.gethostname()}-{uuid_module.uuid4().hex[:8]}"
+
+    if limit < 1:
+        return []
 
+    now = timezone.now()
+    jobs = claim_jobs(OpportunitiesJob, worker_id, limit, now)
+
+    for job in jobs:
+        record_claim(OPPORTUNITIES_QUEUE, job, now)
+        _publish_job_state(job.id, job.status)
         logger.info(
-            "Claimed opportunities job %s for brand %s (attempt %d/%d, worker=%s)",
+            "Claimed opportunities job %s for brand %s "
+            "(attempt %d/%d, priority=%d, worker=%s)",
             job.id,
             job.brand_id,
             job.attempts,
             job.max_attempts,
+            job.priority,
             worker_id,
         )
 
-        return ClaimResult(
-            job=job,
-            claimed=True,
-            reason="",
-        )
+    return jobs
 
 
 def complete_job(
@@ -278,6 +500,8 @@ def complete_job(
             if board_id:
                 job.board_id = board_id
             job.save()
+            record_finish(OPPORTUNITIES_QUEUE, job_id, job.claimed_at, "succeeded", now)
+            _publish_job_state(job_id, job.status, board_id=job.board_id)
             logger.info("Completed opportunities job %s", job_id)
             return True
         except OpportunitiesJob.DoesNotExist:
@@ -290,6 +514,14 @@ def complete_job(
     ).update(**update_fields)
 
     if rows_updated > 0:
+        claimed_at = (
+            OpportunitiesJob.objects
+            .filter(id=job_id)
+            .values_list("claimed_at", flat=True)
+            .first()
+        )
+        record_finish(OPPORTUNITIES_QUEUE, job_id, claimed_at, "succeeded", now)
+        _publish_job_state(job_id, OpportunitiesJobStatus.SUCCEEDED, board_id=board_id)
         logger.info("Completed opportunities job %s", job_id)
         return True
 
@@ -337,6 +569,8 @@ def fail_job(job_id: UUID, error: str) -> bool:
         job.save(update_fields=[
             "status", "finished_at", "last_error", "locked_at", "locked_by"
         ])
+        record_finish(OPPORTUNITIES_QUEUE, job_id, job.claimed_at, "failed", now)
+        _publish_job_state(job_id, job.status, error=job.last_error)
         logger.warning(
             "Job %s permanently failed after %d attempts: %s",
             job_id,
@@ -345,25 +579,53 @@ def fail_job(job_id: UUID, error: str) -> bool:
         )
         return True
 
-    # Retry with exponential backoff
-    backoff_seconds = BACKOFF_BASE_SECONDS * (BACKOFF_MULTIPLIER ** job.attempts)
-    available_at = now + timedelta(seconds=backoff_seconds)
+    # A newer PENDING job for the brand supersedes the retry (and the
+    # one-pending-per-brand constraint would reject it)
+    sibling_id = _pending_sibling_id(job)
+    if sibling_id is None:
+        # Retry with exponential backoff
+        backoff_seconds = BACKOFF_BASE_SECONDS * (BACKOFF_MULTIPLIER ** job.attempts)
+        available_at = now + timedelta(seconds=backoff_seconds)
 
-    job.status = OpportunitiesJobStatus.PENDING
-    job.available_at = available_at
-    job.last_error = error
+        job.status = OpportunitiesJobStatus.PENDING
+        job.available_at = available_at
+        job.last_error = error
+        job.locked_at = None
+        job.locked_by = None
+        if _save_pending(job, [
+            "status", "available_at", "last_error", "locked_at", "locked_by"
+        ]):
+            record_finish(OPPORTUNITIES_QUEUE, job_id, job.claimed_at, "retry", now)
+            record_retry_backoff(OPPORTUNITIES_QUEUE, backoff_seconds)
+            _publish_job_state(job_id, job.status, error=job.last_error)
+
+            logger.info(
+                "Job %s scheduled for retry (attempt %d/%d, available at %s): %s",
+                job_id,
+                job.attempts,
+                job.max_attempts,
+                available_at.isoformat(),
+                error[:200],
+            )
+            return True
+
+        # A concurrent enqueue created the PENDING job since the check
+        sibling_id = _pending_sibling_id(job)
+
+    job.status = OpportunitiesJobStatus.FAILED
+    job.finished_at = now
+    job.last_error = f"{error} (retry superseded by pending job {sibling_id})"
     job.locked_at = None
     job.locked_by = None
     job.save(update_fields=[
-        "status", "available_at", "last_error", "locked_at", "locked_by"
+        "status", "finished_at", "last_error", "locked_at", "locked_by"
     ])
-
+    record_finish(OPPORTUNITIES_QUEUE, job_id, job.claimed_at, "superseded", now)
+    _publish_job_state(job_id, job.status, error=job.last_error)
     logger.info(
-        "Job %s scheduled for retry (attempt %d/%d, available at %s): %s",
+        "Job %s failed; retry superseded by pending job %s: %s",
         job_id,
-        job.attempts,
-        job.max_attempts,
-        available_at.isoformat(),
+        sibling_id,
         error[:200],
     )
     return True
@@ -408,6 +670,8 @@ def fail_job_insufficient_evidence(
     if result_json:
         job.result_json = result_json
     job.save()
+    record_finish(OPPORTUNITIES_QUEUE, job_id, job.claimed_at, "insufficient_evidence", now)
+    _publish_job_state(job_id, job.status, board_id=job.board_id)
 
     logger.info(
         "Job %s completed with insufficient_evidence",
@@ -503,6 +767,7 @@ def release_stale_jobs(
     )
 
     released_count = 0
+    retryable_count = 0
     for job in stale_jobs:
         prev_locked_at = job.locked_at
         prev_locked_by = job.locked_by
@@ -522,6 +787,8 @@ def release_stale_jobs(
             job.save(update_fields=[
                 "status", "finished_at", "last_error", "locked_at", "locked_by", "board_id"
             ])
+            record_stale_release(OPPORTUNITIES_QUEUE, "failed")
+            _publish_job_state(job.id, job.status, error=job.last_error, board_id=job.board_id)
             logger.warning(
                 "Job %s failed due to stale lock after max attempts "
                 "(was locked since %s by %s, board=%s)",
@@ -531,23 +798,57 @@ def release_stale_jobs(
                 error_board.id if error_board else None,
             )
         else:
-            # Release for retry
-            job.status = OpportunitiesJobStatus.PENDING
-            job.available_at = now
-            job.last_error = f"Released from stale lock (was locked by {prev_locked_by})"
+            # A newer PENDING job for the brand supersedes the retry
+            sibling_id = _pending_sibling_id(job)
+            if sibling_id is None:
+                # Release for retry
+                job.status = OpportunitiesJobStatus.PENDING
+                job.available_at = now
+                job.last_error = f"Released from stale lock (was locked by {prev_locked_by})"
+                job.locked_at = None
+                job.locked_by = None
+                if _save_pending(job, [
+                    "status", "available_at", "last_error", "locked_at", "locked_by"
+                ]):
+                    retryable_count += 1
+                    released_count += 1
+                    record_stale_release(OPPORTUNITIES_QUEUE, "retry")
+                    _publish_job_state(job.id, job.status, error=job.last_error)
+                    logger.info(
+                        "Released stale job %s for retry (was locked since %s by %s)",
+                        job.id,
+                        prev_locked_at,
+                        prev_locked_by,
+                    )
+                    continue
+
+                # A concurrent enqueue created the PENDING job since the check
+                sibling_id = _pending_sibling_id(job)
+
+            job.status = OpportunitiesJobStatus.FAILED
+            job.finished_at = now
+            job.last_error = (
+                f"Released from stale lock (was locked by {prev_locked_by}); "
+                f"retry superseded by pending job {sibling_id}"
+            )
             job.locked_at = None
             job.locked_by = None
             job.save(update_fields=[
-                "status", "available_at", "last_error", "locked_at", "locked_by"
+                "status", "finished_at", "last_error", "locked_at", "locked_by"
             ])
+            record_stale_release(OPPORTUNITIES_QUEUE, "superseded")
+            _publish_job_state(job.id, job.status, error=job.last_error)
             logger.info(
-                "Released stale job %s for retry (was locked since %s by %s)",
+                "Stale job %s superseded by pending job %s (was locked by %s)",
                 job.id,
-                prev_locked_at,
+                sibling_id,
                 prev_locked_by,
             )
         released_count += 1
 
+    if retryable_count > 0:
+        notify_job_available(OPPORTUNITIES_JOBS_CHANNEL)
+
     return released_count
 
 
@@ -592,6 +893,48 @@ def extend_job_lock(
     return False
 
 
+def extend_job_locks(
+    job_ids: list[UUID],
+    worker_id: str,
+) -> int:
+    """
+    Extend the locks on several running jobs in one UPDATE (batched heartbeat).
+
+    Used by multi-slot workers so one heartbeat covers every held job.
+    Same ownership rules as extend_job_lock(): only RUNNING jobs locked by
+    worker_id are touched.
+
+    Args:
+        job_ids: UUIDs of the jobs held by this worker
+        worker_id: Worker identifier (must match locked_by)
+
+    Returns:
+        Number of locks extended (less than len(job_ids) means some jobs
+        were released or completed elsewhere).
+    """
+    from kairo.hero.models import OpportunitiesJob, OpportunitiesJobStatus
+
+    if not job_ids:
+        return 0
+
+    now = timezone.now()
+
+    rows_updated = OpportunitiesJob.objects.filter(
+        id__in=job_ids,
+        status=OpportunitiesJobStatus.RUNNING,
+        locked_by=worker_id,
+    ).update(locked_at=now)
+
+    logger.debug(
+        "Extended %d/%d job locks (worker=%s, locked_at=%s)",
+        rows_updated,
+        len(job_ids),
+        worker_id,
+        now.isoformat(),
+    )
+    return rows_updated
+
+
 def get_running_job_for_brand(brand_id: UUID) -> "OpportunitiesJob | None":
     """
     Get the currently running job for a brand.
@@ -648,6 +991,8 @@ def update_job_progress(
     )
 
     if rows_updated > 0:
+        record_stage(OPPORTUNITIES_QUEUE, job_id, stage)
+        _publish_job_state(job_id, OpportunitiesJobStatus.RUNNING, stage=stage, detail=detail)
         logger.debug(
             "Updated progress for job %s: stage=%s, detail=%s",
             job_id,
@@ -679,3 +1024,52 @@ def get_job_progress(job_id: UUID) -> dict | None:
         }
     except OpportunitiesJob.DoesNotExist:
         return None
+
+
+# =============================================================================
+# PROGRESS EVENTS (SSE)
+# =============================================================================
+
+
+TERMINAL_STATUSES = ("succeeded", "failed", "insufficient_evidence")
+
+
+def _publish_job_state(job_id: UUID, status: str, **state) -> None:
+    """Push a job state change to progress streams (kairo.core.job_events)."""
+    if state.get("board_id"):
+        state["board_id"] = str(state["board_id"])
+    else:
+        state.pop("board_id", None)  # unchanged
+    publish_job_event(OPPORTUNITIES_EVENTS, job_id, status=status, **state)
+
+
+def get_job_state(job_id: UUID, brand_id: UUID) -> dict | None:
+    """
+    Current job state in the shape of its progress events.
+
+    Args:
+        job_id: UUID of the job
+        brand_id: UUID of the brand (job must belong to it)
+
+    Returns:
+        Dict with job_id, status, stage, detail, board_id, error;
+        None if not found or owned by another brand.
+    """
+    from kairo.hero.models import OpportunitiesJob
+
+    job = (
+        OpportunitiesJob.objects
+        .filter(id=job_id, brand_id=brand_id)
+        .values("status", "progress_stage", "progress_detail", "board_id", "last_error")
+        .first()
+    )
+    if job is None:
+        return None
+    return {
+        "job_id": str(job_id),
+        "status": job["status"],
+        "stage": job["progress_stage"],
+        "detail": job["progress_detail"],
+        "board_id": str(job["board_id"]) if job["board_id"] else None,
+        "error": job["last_error"],
+    }
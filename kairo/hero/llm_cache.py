@@ -0,0 +1,341 @@
+"""
+LLM Response Cache.
+
+Content-addressed cache for LLMClient.call. Eval reruns, query planning
+against an unchanged snapshot and retries after a downstream failure send
+byte-identical requests; with the cache enabled they are answered without a
+provider round trip.
+
+Key: SHA-256 over the request (model, system prompt, prompt, temperature,
+top_p, max tokens, tools, flow). Value: the provider's text plus token usage.
+
+Backends (selected by LLMConfig.cache_backend / KAIRO_LLM_CACHE):
+- "none" (default): caching off
+- "disk": one JSON file per entry under KAIRO_LLM_CACHE_DIR. Shared by
+  processes on one host (eval runs, local dev).
+- "redis": shared across hosts via REDIS_URL
+
+Both backends expire entries after KAIRO_LLM_CACHE_TTL_S and evict least
+recently used entries beyond KAIRO_LLM_CACHE_MAX_ENTRIES.
+
+Cache errors are logged and treated as misses: a broken cache must never
+fail an LLM call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Mapping, Protocol, Sequence
+
+if TYPE_CHECKING:
+    from kairo.hero.llm_client import LLMConfig
+
+logger = logging.getLogger("kairo.llm")
+
+# Bump to invalidate every cached response (e.g. when the entry shape changes)
+CACHE_VERSION = "v1"
+
+# Eviction trims the disk cache to this fraction of max_entries, so a full
+# cache is not rescanned on every write
+_EVICTION_HEADROOM = 0.9
+
+
+# =============================================================================
+# KEYS & ENTRIES
+# =============================================================================
+
+
+def cache_key(
+    *,
+    model: str,
+    system_prompt: str | None,
+    prompt: str,
+    temperature: float,
+    top_p: float,
+    max_tokens: int,
+    flow: str,
+    tools: Sequence[Mapping[str, Any]] | None = None,
+) -> str:
+    """
+    Content address of one LLM request.
+
+    Every input that can change the provider's output is part of the key;
+    run_id, brand_id and trigger_source are not.
+    """
+    request = {
+        "version": CACHE_VERSION,
+        "model": model,
+        "system_prompt": system_prompt or "",
+        "prompt": prompt,
+        "temperature": temperature,
+        "top_p": top_p,
+        "max_tokens": max_tokens,
+        "flow": flow,
+        "tools": list(tools) if tools else [],
+    }
+    encoded = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def make_entry(content: str, tokens_in: int, tokens_out: int) -> dict[str, Any]:
+    """Build a cache entry for a provider response."""
+    return {
+        "content": content,
+        "tokens_in": tokens_in,
+        "tokens_out": tokens_out,
+        "created_at": time.time(),
+    }
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+
+class LLMResponseCache(Protocol):
+    """Cache backend interface."""
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the entry for key (and mark it recently used), or None."""
+        ...
+
+    def set(self, key: str, entry: dict[str, Any]) -> None:
+        ...
+
+
+class NullLLMResponseCache:
+    """Caching disabled."""
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        return None
+
+    def set(self, key: str, entry: dict[str, Any]) -> None:
+        pass
+
+
+class DiskLLMResponseCache:
+    """
+    Local-disk backend: <directory>/<key[:2]>/<key>.json.
+
+    File mtime is the LRU clock (touched on every hit). Writes go through a
+    temp file + rename, so concurrent readers never see a partial entry.
+    """
+
+    def __init__(self, directory: str, ttl_s: int, max_entries: int) -> None:
+        self.directory = directory
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entry_count: int | None = None  # Lazily counted; approximate across processes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("LLM cache read failed for %s: %s", path, str(e))
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_s:
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def set(self, key: str, entry: dict[str, Any]) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            existed = os.path.exists(path)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("LLM cache write failed for %s: %s", path, str(e))
+            self._remove(tmp_path)
+            return
+
+        if not existed:
+            with self._lock:
+                if self._entry_count is None:
+                    self._entry_count = len(self._entry_paths())
+                else:
+                    self._entry_count += 1
+                if self._entry_count > self.max_entries:
+                    self._evict()
+
+    def _entry_paths(self) -> list[str]:
+        paths = []
+        try:
+            for shard in os.scandir(self.directory):
+                if not shard.is_dir():
+                    continue
+                for item in os.scandir(shard.path):
+                    if item.name.endswith(".json"):
+                        paths.append(item.path)
+        except FileNotFoundError:
+            pass
+        return paths
+
+    def _evict(self) -> None:
+        """Remove expired entries, then least recently used down to the headroom."""
+        now = time.time()
+        by_mtime = []
+        for path in self._entry_paths():
+            try:
+                by_mtime.append((os.stat(path).st_mtime, path))
+            except FileNotFoundError:
+                continue
+        by_mtime.sort()
+
+        target = int(self.max_entries * _EVICTION_HEADROOM)
+        remaining = len(by_mtime)
+        for mtime, path in by_mtime:
+            # Expiry is checked against created_at on read; mtime >= created_at,
+            # so anything untouched for a full TTL is certainly expired
+            if remaining <= target and now - mtime <= self.ttl_s:
+                break
+            self._remove(path)
+            remaining -= 1
+
+        self._entry_count = remaining
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class RedisLLMResponseCache:
+    """
+    Redis backend.
+
+    Entries are plain keys with EX=ttl. A sorted set (member: key, score:
+    last access time) tracks recency for LRU eviction beyond max_entries.
+    """
+
+    KEY_PREFIX = f"kairo_llm_cache:{CACHE_VERSION}"
+    LRU_KEY = f"kairo_llm_cache:{CACHE_VERSION}:lru"
+
+    def __init__(self, url: str, ttl_s: int, max_entries: int) -> None:
+        import redis
+
+        self._client = redis.Redis.from_url(url, socket_connect_timeout=5, socket_timeout=5)
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+
+    def _key(self, key: str) -> str:
+        return f"{self.KEY_PREFIX}:{key}"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            raw = self._client.get(self._key(key))
+            if raw is None:
+                return None
+            self._client.zadd(self.LRU_KEY, {key: time.time()})
+            return json.loads(raw)
+        except Exception as e:
+            logger.warning("LLM cache read failed: %s", str(e))
+            return None
+
+    def set(self, key: str, entry: dict[str, Any]) -> None:
+        try:
+            now = time.time()
+            pipe = self._client.pipeline()
+            pipe.set(self._key(key), json.dumps(entry), ex=self.ttl_s)
+            pipe.zadd(self.LRU_KEY, {key: now})
+            # Drop index members whose entries have already expired
+            pipe.zremrangebyscore(self.LRU_KEY, "-inf", now - self.ttl_s)
+            pipe.zcard(self.LRU_KEY)
+            size = pipe.execute()[-1]
+
+            excess = size - self.max_entries
+            if excess > 0:
+                evicted = self._client.zrange(self.LRU_KEY, 0, excess - 1)
+                if evicted:
+                    pipe = self._client.pipeline()
+                    pipe.delete(*(self._key(k.decode()) for k in evicted))
+                    pipe.zrem(self.LRU_KEY, *evicted)
+                    pipe.execute()
+        except Exception as e:
+            logger.warning("LLM cache write failed: %s", str(e))
+
+
+# =============================================================================
+# BACKEND SELECTION
+# =============================================================================
+
+_caches: dict[tuple, LLMResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def _build_cache(config: "LLMConfig") -> LLMResponseCache:
+    backend = config.cache_backend
+    if backend == "none":
+        return NullLLMResponseCache()
+    if backend == "disk":
+        return DiskLLMResponseCache(
+            config.cache_dir, config.cache_ttl_s, config.cache_max_entries
+        )
+    if backend == "redis":
+        if not config.cache_redis_url:
+            logger.warning("KAIRO_LLM_CACHE=redis but REDIS_URL is not set; caching disabled")
+            return NullLLMResponseCache()
+        return RedisLLMResponseCache(
+            config.cache_redis_url, config.cache_ttl_s, config.cache_max_entries
+        )
+
+    logger.warning("Unknown KAIRO_LLM_CACHE=%r; caching disabled", backend)
+    return NullLLMResponseCache()
+
+
+def get_llm_cache(config: "LLMConfig") -> LLMResponseCache:
+    """
+    Get the cache backend for a client config.
+
+    Clients with the same cache settings share one backend instance (and,
+    for redis, one connection pool).
+    """
+    key = (
+        config.cache_backend,
+        config.cache_dir,
+        config.cache_redis_url,
+        config.cache_ttl_s,
+        config.cache_max_entries,
+    )
+    cache = _caches.get(key)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(key)
+            if cache is None:
+                try:
+                    cache = _build_cache(config)
+                except Exception as e:
+                    logger.warning("LLM cache unavailable: %s", str(e))
+                    cache = NullLLMResponseCache()
+                _caches[key] = cache
+    return cache
+
+
+def reset_llm_caches() -> None:
+    """Forget all backend instances (for tests)."""
+    with _caches_lock:
+        _caches.clear()
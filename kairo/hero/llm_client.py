@@ -25,6 +25,12 @@ API Routing (PR-7.1):
 - Older models (gpt-4o, gpt-3.5-turbo, etc.) use Chat Completions API
 - This routing is automatic based on model name prefix detection
 
+Response cache (opt-in, see kairo/hero/llm_cache.py):
+- KAIRO_LLM_CACHE=disk|redis answers byte-identical requests from cache
+- Only temperature=0.0 calls are cached unless KAIRO_LLM_CACHE_NONZERO_TEMP
+  is set or the caller passes cache=True
+- Hits are logged with status "cache_hit"
+
 This module does NOT contain any graphs or agents - it's pure infrastructure.
 """
 
@@ -34,12 +40,15 @@ import json
 import logging
 import os
 import re
+import tempfile
 import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal, Mapping, Sequence, TypeVar
 
 from pydantic import BaseModel, ValidationError
 
+from kairo.hero.llm_cache import cache_key, get_llm_cache, make_entry
+
 if TYPE_CHECKING:
     from uuid import UUID
 
@@ -179,7 +188,7 @@ def _get_stub_json_for_flow(flow: str) -> str:
         return json.dumps({"_stub": True, "_flow": flow})
 
 
-Status = Literal["success", "failure", "disabled"]
+Status = Literal["success", "failure", "disabled", "cache_hit"]
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -260,6 +269,12 @@ class LLMConfig:
     - KAIRO_LLM_TOP_P_HEAVY: Top-p for heavy role (default: 1.0)
     - KAIRO_LLM_COST_FAST_USD_PER_1K: Cost per 1K tokens for fast (default: 0.01)
     - KAIRO_LLM_COST_HEAVY_USD_PER_1K: Cost per 1K tokens for heavy (default: 0.03)
+    - KAIRO_LLM_CACHE: Response cache backend: none, disk, redis (default: none)
+    - KAIRO_LLM_CACHE_TTL_S: Cached response lifetime in seconds (default: 86400)
+    - KAIRO_LLM_CACHE_MAX_ENTRIES: LRU bound on cached responses (default: 10000)
+    - KAIRO_LLM_CACHE_DIR: Directory for the disk backend (default: <tmp>/kairo_llm_cache)
+    - KAIRO_LLM_CACHE_NONZERO_TEMP: Also cache temperature > 0 calls (default: false)
+    - REDIS_URL: Redis for the redis backend
     """
 
     # Model names (aligned with load_config_from_env defaults)
@@ -291,6 +306,16 @@ class LLMConfig:
     cost_fast_usd_per_1k: float = 0.01
     cost_heavy_usd_per_1k: float = 0.03
 
+    # Response cache (see kairo/hero/llm_cache.py)
+    cache_backend: str = "none"
+    cache_ttl_s: int = 86400
+    cache_max_entries: int = 10000
+    cache_dir: str = field(
+        default_factory=lambda: os.path.join(tempfile.gettempdir(), "kairo_llm_cache")
+    )
+    cache_nonzero_temperature: bool = False
+    cache_redis_url: str = ""
+
 
 def load_config_from_env() -> LLMConfig:
     """
@@ -365,6 +390,25 @@ def load_config_from_env() -> LLMConfig:
     except ValueError:
         cost_heavy = 0.03
 
+    # Parse response cache parameters
+    cache_backend = os.getenv("KAIRO_LLM_CACHE", "none").lower().strip() or "none"
+
+    try:
+        cache_ttl_s = int(os.getenv("KAIRO_LLM_CACHE_TTL_S", "86400"))
+    except ValueError:
+        cache_ttl_s = 86400
+
+    try:
+        cache_max_entries = int(os.getenv("KAIRO_LLM_CACHE_MAX_ENTRIES", "10000"))
+    except ValueError:
+        cache_max_entries = 10000
+
+    cache_dir = os.getenv("KAIRO_LLM_CACHE_DIR") or os.path.join(
+        tempfile.gettempdir(), "kairo_llm_cache"
+    )
+    cache_nonzero_str = os.getenv("KAIRO_LLM_CACHE_NONZERO_TEMP", "").lower().strip()
+    cache_nonzero_temperature = cache_nonzero_str in ("true", "1", "yes", "on")
+
     return LLMConfig(
         fast_model_name=fast_model,
         heavy_model_name=heavy_model,
@@ -380,6 +424,12 @@ def load_config_from_env() -> LLMConfig:
         top_p_heavy=top_p_heavy,
         cost_fast_usd_per_1k=cost_fast,
         cost_heavy_usd_per_1k=cost_heavy,
+        cache_backend=cache_backend,
+        cache_ttl_s=cache_ttl_s,
+        cache_max_entries=cache_max_entries,
+        cache_dir=cache_dir,
+        cache_nonzero_temperature=cache_nonzero_temperature,
+        cache_redis_url=os.getenv("REDIS_URL", ""),
     )
 
 
@@ -496,6 +546,9 @@ class LLMClient:
         """
         self.config = config or load_config_from_env()
         self._api_key_override = api_key_override
+        self._cache = get_llm_cache(self.config)
+        # Provider SDK clients by timeout, reused so HTTP connections stay warm
+        self._provider_clients: dict[float, Any] = {}
 
     def call(
         self,
@@ -510,6 +563,7 @@ class LLMClient:
         temperature: float | None = None,
         run_id: "UUID | None" = None,
         trigger_source: str = "api",
+        cache: bool | None = None,
     ) -> LLMResponse:
         """
         Make an LLM call.
@@ -527,9 +581,14 @@ class LLMClient:
             temperature: Override temperature (uses config default for role if None)
             run_id: Optional run ID for correlation (auto-generated if None)
             trigger_source: Trigger source for observability (api, cron, eval, manual)
+            cache: Response cache policy for this call (when a cache backend is
+                configured). None: cache only temperature=0.0 calls (or all, with
+                KAIRO_LLM_CACHE_NONZERO_TEMP). True: cache regardless of
+                temperature. False: bypass the cache entirely.
 
         Returns:
-            LLMResponse with raw_text and metadata
+            LLMResponse with raw_text and metadata (status "cache_hit" and
+            estimated_cost_usd=0.0 when served from cache)
 
         Raises:
             LLMCallError: If the LLM call fails (wraps all provider exceptions)
@@ -598,6 +657,49 @@ class LLMClient:
 
             return response
 
+        # Serve byte-identical requests from the response cache
+        key = None
+        if self._use_cache(cache, actual_temperature):
+            key = cache_key(
+                model=model,
+                system_prompt=system_prompt,
+                prompt=prompt,
+                temperature=actual_temperature,
+                top_p=top_p,
+                max_tokens=actual_max_tokens,
+                flow=flow,
+                tools=tools,
+            )
+            entry = self._cache.get(key)
+            if entry is not None:
+                latency_ms = int((time.perf_counter() - start_time) * 1000)
+                response = LLMResponse(
+                    raw_text=entry["content"],
+                    model=model,
+                    usage_tokens_in=entry["tokens_in"],
+                    usage_tokens_out=entry["tokens_out"],
+                    latency_ms=latency_ms,
+                    role=role,
+                    status="cache_hit",
+                    estimated_cost_usd=0.0,
+                )
+
+                self._log_call(
+                    run_id=run_id,
+                    brand_id=brand_id,
+                    flow=flow,
+                    trigger_source=trigger_source,
+                    model=model,
+                    role=role,
+                    latency_ms=latency_ms,
+                    tokens_in=response.usage_tokens_in,
+                    tokens_out=response.usage_tokens_out,
+                    status="cache_hit",
+                    estimated_cost_usd=0.0,
+                )
+
+                return response
+
         # Make actual provider call
         try:
             result = self._call_provider(
@@ -628,6 +730,9 @@ class LLMClient:
                 estimated_cost_usd=estimated_cost,
             )
 
+            if key is not None and response.raw_text:
+                self._cache.set(key, make_entry(response.raw_text, tokens_in, tokens_out))
+
             self._log_call(
                 run_id=run_id,
                 brand_id=brand_id,
@@ -668,6 +773,19 @@ class LLMClient:
                 original_error=exc,
             ) from exc
 
+    def _use_cache(self, cache: bool | None, temperature: float) -> bool:
+        """
+        Whether a call may be served from / stored in the response cache.
+
+        Sampled (temperature > 0) output is only cached on explicit opt-in:
+        callers at non-zero temperature usually want a fresh sample.
+        """
+        if cache is False or self.config.cache_backend == "none":
+            return False
+        if cache is True:
+            return True
+        return temperature == 0.0 or self.config.cache_nonzero_temperature
+
     def _call_provider(
         self,
         *,
@@ -719,11 +837,12 @@ class LLMClient:
                 "OPENAI_API_KEY not set. Set the environment variable or use LLM_DISABLED=true for testing."
             )
 
-        # Create client (BYOK: may use user's key)
-        client = openai.OpenAI(
-            api_key=api_key,
-            timeout=timeout,
-        )
+        # Reuse the SDK client (and its connection pool) across calls
+        client = self._provider_clients.get(timeout)
+        if client is None:
+            client = self._provider_clients.setdefault(
+                timeout, openai.OpenAI(api_key=api_key, timeout=timeout)
+            )
 
         # Route based on model - GPT-5.x uses Responses API
         if _is_responses_api_model(model):
@@ -976,7 +1095,11 @@ def get_client_for_user(user_id: "UUID | None") -> LLMClient:
     Get an LLM client configured for a specific user (BYOK support).
 
     Phase 2 BYOK: If user has configured their own OpenAI API key,
-    creates a client using that key. Otherwise returns the default client.
+    returns a client using that key. Otherwise returns the default client.
+
+    Per-user clients come from kairo.users.clients, so the key is looked up
+    and decrypted once per BYOK_CLIENT_CACHE_TTL_S (or key update), not on
+    every graph invocation.
 
     Args:
         user_id: User UUID, or None for default client
@@ -987,13 +1110,21 @@ def get_client_for_user(user_id: "UUID | None") -> LLMClient:
     if user_id is None:
         return get_default_client()
 
-    # Try to get user's OpenAI key
-    try:
+    def build_user_client() -> LLMClient | None:
         from kairo.users.encryption import get_user_openai_key
+
         user_key = get_user_openai_key(user_id)
-        if user_key:
-            logger.info("Using user's BYOK OpenAI key for user_id=%s", user_id)
-            return LLMClient(api_key_override=user_key)
+        if not user_key:
+            return None
+        logger.info("Using user's BYOK OpenAI key for user_id=%s", user_id)
+        return LLMClient(api_key_override=user_key)
+
+    try:
+        from kairo.users.clients import OPENAI_CLIENT, get_user_client
+
+        client = get_user_client(OPENAI_CLIENT, user_id, build_user_client)
+        if client is not None:
+            return client
     except Exception as e:
         logger.warning("Failed to get user OpenAI key: %s", e)
 
@@ -0,0 +1,110 @@
+"""
+Management command to archive terminal job rows.
+
+Usage:
+    python manage.py archive_jobs
+    python manage.py archive_jobs --queue opportunities --days 14
+    python manage.py archive_jobs --export /backups/jobs-2026-10.jsonl.gz
+    python manage.py archive_jobs --max-batches 20 --batch-size 1000
+    python manage.py archive_jobs --dry-run
+
+Moves SUCCEEDED / FAILED / INSUFFICIENT_EVIDENCE jobs older than
+JOB_RETENTION_DAYS out of hero_opportunities_job and brandbrain_job, into the
+job_archive table or (with --export) a gzip JSONL file.
+See kairo.core.job_retention.
+
+Safe to run while workers are active: live (PENDING/RUNNING) rows are never
+selected, and each batch is its own short transaction.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from kairo.core.job_retention import (
+    QUEUES,
+    archive_batch_size,
+    archive_terminal_jobs,
+    retention_days,
+)
+
+
+class Command(BaseCommand):
+    """Archive terminal jobs older than the retention window."""
+
+    help = "Move old terminal jobs out of the live job queue tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--queue",
+            choices=QUEUES,
+            default=None,
+            help="Queue to archive (default: all)",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=None,
+            help="Archive terminal jobs older than this many days "
+                 "(default: JOB_RETENTION_DAYS)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Rows moved per transaction (default: JOB_ARCHIVE_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop after this many batches per queue (default: until done)",
+        )
+        parser.add_argument(
+            "--export",
+            type=str,
+            default=None,
+            help="Append rows to this gzip JSONL file instead of the job_archive table",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            default=False,
+            help="Only count the rows that would be archived",
+        )
+
+    def handle(self, *args, **options):
+        days = options["days"] if options["days"] is not None else retention_days()
+        batch_size = options["batch_size"] or archive_batch_size()
+        if days < 0:
+            raise CommandError("--days must be >= 0")
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive")
+
+        queues = [options["queue"]] if options["queue"] else list(QUEUES)
+        for queue in queues:
+            result = archive_terminal_jobs(
+                queue,
+                older_than_days=days,
+                batch_size=batch_size,
+                max_batches=options["max_batches"],
+                export_path=options["export"],
+                dry_run=options["dry_run"],
+            )
+
+            if result.dry_run:
+                self.stdout.write(
+                    f"{queue}: {result.archived} terminal jobs older than {days} days "
+                    "would be archived"
+                )
+                continue
+
+            target = result.export_path or "job_archive"
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{queue}: archived {result.archived} jobs to {target} "
+                    f"in {result.batches} batches"
+                )
+            )
+            if result.remaining:
+                self.stdout.write(
+                    self.style.WARNING(f"{queue}: more rows remain (hit --max-batches)")
+                )
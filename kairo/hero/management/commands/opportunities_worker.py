@@ -8,11 +8,13 @@ Usage:
     python manage.py opportunities_worker
 
 Options:
-    --poll-interval: Seconds between job queue polls (default: 5)
+    --poll-interval: Initial idle poll interval in seconds (default: 5)
+    --max-poll-interval: Cap for idle poll backoff in seconds (default: 60)
     --stale-check-interval: Seconds between stale lock checks (default: 60)
     --max-jobs: Max jobs to process before exiting (0 = unlimited, default: 0)
     --once: Process one job and exit (for testing)
     --dry-run: Claim and log jobs without processing
+    --concurrency: Number of jobs to run at once in this process (default: 1)
 
 The worker:
 1. Polls for available jobs
@@ -21,6 +23,13 @@ The worker:
 4. Marks job succeeded/failed/insufficient_evidence
 5. Periodically checks for stale locks
 
+Concurrency (--concurrency N > 1):
+- Jobs are mostly blocked on Apify/LLM I/O, so N jobs run in a thread pool
+- Free slots are filled with one claim_next_jobs() call
+- One shared heartbeat thread extends every held lock in a single
+  batched UPDATE (extend_job_locks)
+- SIGINT/SIGTERM stops claiming and drains in-flight slots before exit
+
 CRITICAL (PR1):
 - NO LLM calls
 - NO prompt execution
@@ -36,14 +45,25 @@ import socket
 import threading
 import time
 import uuid as uuid_module
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING
+from uuid import UUID
 
 from django.core.management.base import BaseCommand
+from django.db import close_old_connections
 
+from kairo.core.job_metrics import OPPORTUNITIES_QUEUE, record_start
+from kairo.core.job_notify import (
+    OPPORTUNITIES_JOBS_CHANNEL,
+    AdaptivePollBackoff,
+    wait_for_job,
+)
 from kairo.hero.jobs.queue import (
     claim_next_job,
+    claim_next_jobs,
     complete_job,
     extend_job_lock,
+    extend_job_locks,
     fail_job,
     fail_job_insufficient_evidence,
     release_stale_jobs,
@@ -57,6 +77,9 @@ logger = logging.getLogger(__name__)
 # Heartbeat interval for extending job locks (seconds)
 HEARTBEAT_INTERVAL_S = 30
 
+# Max time a single idle wait blocks before re-checking for shutdown (seconds)
+SHUTDOWN_CHECK_INTERVAL_S = 1.0
+
 
 class Command(BaseCommand):
     """Run Opportunities generation worker."""
@@ -73,7 +96,13 @@ class Command(BaseCommand):
             "--poll-interval",
             type=int,
             default=5,
-            help="Seconds between job queue polls (default: 5)",
+            help="Initial idle poll interval in seconds (default: 5)",
+        )
+        parser.add_argument(
+            "--max-poll-interval",
+            type=int,
+            default=60,
+            help="Cap for idle poll backoff in seconds (default: 60)",
         )
         parser.add_argument(
             "--stale-check-interval",
@@ -97,23 +126,33 @@ class Command(BaseCommand):
             action="store_true",
             help="Claim and log jobs without processing",
         )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of jobs to run at once in this process (default: 1)",
+        )
 
     def handle(self, *args, **options):
         poll_interval = options["poll_interval"]
+        max_poll_interval = options["max_poll_interval"]
         stale_check_interval = options["stale_check_interval"]
         max_jobs = options["max_jobs"]
         once = options["once"]
         dry_run = options["dry_run"]
+        concurrency = max(1, options["concurrency"])
 
         # Register signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
 
         self.stdout.write(f"Starting Opportunities worker: {self._worker_id}")
-        self.stdout.write(f"  Poll interval: {poll_interval}s")
+        self.stdout.write(f"  Poll interval: {poll_interval}s (backoff to {max_poll_interval}s, wakes on enqueue)")
         self.stdout.write(f"  Stale check interval: {stale_check_interval}s")
         if max_jobs > 0:
             self.stdout.write(f"  Max jobs: {max_jobs}")
+        if concurrency > 1 and not once:
+            self.stdout.write(f"  Concurrency: {concurrency} slots")
         if dry_run:
             self.stdout.write("  DRY RUN MODE - jobs will be claimed but not processed")
 
@@ -122,6 +161,40 @@ class Command(BaseCommand):
         self.stdout.write(self.style.WARNING("  PR1 MODE: Evidence gates only, NO LLM synthesis"))
         self.stdout.write("")
 
+        backoff = AdaptivePollBackoff(poll_interval, max_poll_interval)
+
+        if concurrency > 1 and not once:
+            jobs_processed = self._run_concurrent(
+                concurrency=concurrency,
+                backoff=backoff,
+                stale_check_interval=stale_check_interval,
+                max_jobs=max_jobs,
+                dry_run=dry_run,
+            )
+        else:
+            jobs_processed = self._run_serial(
+                backoff=backoff,
+                stale_check_interval=stale_check_interval,
+                max_jobs=max_jobs,
+                once=once,
+                dry_run=dry_run,
+            )
+
+        if self._shutdown_requested:
+            self.stdout.write("\nGraceful shutdown complete")
+
+        self.stdout.write(f"Worker exiting. Jobs processed: {jobs_processed}")
+
+    def _run_serial(
+        self,
+        *,
+        backoff: AdaptivePollBackoff,
+        stale_check_interval: int,
+        max_jobs: int,
+        once: bool,
+        dry_run: bool,
+    ) -> int:
+        """Claim and execute one job at a time. Returns jobs processed."""
         jobs_processed = 0
         last_stale_check = time.monotonic()
 
@@ -138,6 +211,7 @@ class Command(BaseCommand):
             result = claim_next_job(worker_id=self._worker_id)
 
             if result.claimed and result.job:
+                backoff.reset()
                 job = result.job
                 self.stdout.write(
                     f"Claimed job {job.id} (brand={job.brand_id}, "
@@ -163,13 +237,180 @@ class Command(BaseCommand):
                     break
 
             else:
-                # No job available - sleep and retry
-                time.sleep(poll_interval)
+                # No job available - wait for an enqueue wakeup, with
+                # polling (adaptive backoff) as the safety net
+                if self._wait_for_work(backoff.next_timeout()):
+                    backoff.reset()
+
+        return jobs_processed
+
+    def _run_concurrent(
+        self,
+        *,
+        concurrency: int,
+        backoff: AdaptivePollBackoff,
+        stale_check_interval: int,
+        max_jobs: int,
+        dry_run: bool,
+    ) -> int:
+        """
+        Run up to `concurrency` jobs at once in a thread pool.
 
-        if self._shutdown_requested:
-            self.stdout.write("\nGraceful shutdown complete")
+        The main thread claims jobs for free slots and submits them; a single
+        heartbeat thread extends all held locks. On shutdown (or once
+        --max-jobs have been claimed) no new jobs are claimed and in-flight
+        slots are drained before returning.
 
-        self.stdout.write(f"Worker exiting. Jobs processed: {jobs_processed}")
+        Returns:
+            Number of jobs processed (slots that finished without raising).
+        """
+        active: dict[UUID, Future] = {}
+        active_lock = threading.Lock()
+        jobs_claimed = 0
+        jobs_processed = 0
+        last_stale_check = time.monotonic()
+
+        stop_heartbeat = threading.Event()
+        heartbeat_thread = threading.Thread(
+            target=self._shared_heartbeat_loop,
+            args=(active, active_lock, stop_heartbeat),
+            name="heartbeat-shared",
+            daemon=True,
+        )
+        heartbeat_thread.start()
+
+        pool = ThreadPoolExecutor(
+            max_workers=concurrency,
+            thread_name_prefix="oppjob-slot",
+        )
+
+        def on_done(job_id: UUID):
+            def _remove(future: Future) -> None:
+                nonlocal jobs_processed
+                error = future.exception()
+                if error is not None:
+                    logger.error("Job %s slot raised: %s", job_id, error, exc_info=error)
+                with active_lock:
+                    active.pop(job_id, None)
+                    if error is None:
+                        jobs_processed += 1
+            return _remove
+
+        try:
+            while not self._shutdown_requested:
+                if max_jobs > 0 and jobs_claimed >= max_jobs:
+                    self.stdout.write(f"Claimed {max_jobs} job(s) (--max-jobs), draining")
+                    break
+
+                # Check for stale locks periodically
+                now = time.monotonic()
+                if now - last_stale_check >= stale_check_interval:
+                    released = release_stale_jobs()
+                    if released > 0:
+                        self.stdout.write(f"Released {released} stale job(s)")
+                    last_stale_check = now
+
+                with active_lock:
+                    in_flight = list(active.values())
+                free_slots = concurrency - len(in_flight)
+
+                if free_slots <= 0:
+                    # All slots busy - wait for one to finish
+                    wait(in_flight, timeout=SHUTDOWN_CHECK_INTERVAL_S, return_when=FIRST_COMPLETED)
+                    continue
+
+                limit = free_slots
+                if max_jobs > 0:
+                    limit = min(limit, max_jobs - jobs_claimed)
+
+                jobs = claim_next_jobs(worker_id=self._worker_id, limit=limit)
+
+                if not jobs:
+                    # No job available - wait for an enqueue wakeup, with
+                    # polling (adaptive backoff) as the safety net
+                    if self._wait_for_work(backoff.next_timeout()):
+                        backoff.reset()
+                    continue
+
+                backoff.reset()
+                for job in jobs:
+                    jobs_claimed += 1
+                    self.stdout.write(
+                        f"Claimed job {job.id} (brand={job.brand_id}, "
+                        f"attempt {job.attempts}/{job.max_attempts})"
+                    )
+                    if dry_run:
+                        self.stdout.write("  [DRY RUN] Skipping execution")
+                        complete_job(job.id)
+                        with active_lock:
+                            jobs_processed += 1
+                        continue
+
+                    with active_lock:
+                        future = pool.submit(self._run_slot, job)
+                        active[job.id] = future
+                    future.add_done_callback(on_done(job.id))
+
+        finally:
+            with active_lock:
+                draining = len(active)
+            if draining:
+                self.stdout.write(f"Draining {draining} in-flight job(s)...")
+            pool.shutdown(wait=True)
+            stop_heartbeat.set()
+            heartbeat_thread.join(timeout=1.0)
+
+        return jobs_processed
+
+    def _run_slot(self, job: "OpportunitiesJob") -> None:
+        """Execute one job in a pool thread (lock kept alive by shared heartbeat)."""
+        close_old_connections()
+        try:
+            self._run_job(job)
+        finally:
+            close_old_connections()
+
+    def _shared_heartbeat_loop(
+        self,
+        active: dict,
+        active_lock: threading.Lock,
+        stop: threading.Event,
+    ) -> None:
+        """Extend every held job lock in one batched UPDATE per interval."""
+        while not stop.wait(timeout=HEARTBEAT_INTERVAL_S):
+            with active_lock:
+                job_ids = list(active.keys())
+            if not job_ids:
+                continue
+            try:
+                extended = extend_job_locks(job_ids, self._worker_id)
+                if extended < len(job_ids):
+                    logger.warning(
+                        "Heartbeat: extended %d of %d job locks (worker=%s)",
+                        extended,
+                        len(job_ids),
+                        self._worker_id,
+                    )
+            except Exception as e:
+                logger.warning("Shared heartbeat error: %s", str(e))
+            finally:
+                close_old_connections()
+
+    def _wait_for_work(self, timeout: float) -> bool:
+        """
+        Block until a job is enqueued, timeout elapses, or shutdown is requested.
+
+        Returns:
+            True if woken by an enqueue notification.
+        """
+        deadline = time.monotonic() + timeout
+        while not self._shutdown_requested:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if wait_for_job(OPPORTUNITIES_JOBS_CHANNEL, min(remaining, SHUTDOWN_CHECK_INTERVAL_S)):
+                return True
+        return False
 
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
@@ -177,7 +418,7 @@ class Command(BaseCommand):
         self.stdout.write(f"\nReceived {sig_name}, shutting down gracefully...")
         self._shutdown_requested = True
 
-    def _execute_job(self, job: "OpportunitiesJob") -> None:
+    def _run_job(self, job: "OpportunitiesJob") -> None:
         """
         Execute an opportunities generation job.
 
@@ -197,6 +438,8 @@ class Command(BaseCommand):
         job_params = job.params_json or {}
         mode = job_params.get("mode", "fixture_only")
 
+        record_start(OPPORTUNITIES_QUEUE, job)
+
         # TASK-2: JOB_START logging for observability
         # This is the first checkpoint - if you don't see this, the worker isn't processing jobs
         logger.info(
@@ -209,6 +452,38 @@ class Command(BaseCommand):
             job_params.get("first_run", False),
         )
 
+        try:
+            self.stdout.write(f"  Executing evidence gates for brand {job.brand_id} (mode={mode})...")
+
+            # Run the generation task (PR1: gates only)
+            # TASK-2: Pass mode explicitly from job params
+            result = execute_opportunities_job(
+                job_id=job.id,
+                brand_id=job.brand_id,
+                mode=mode,  # CRITICAL: Must pass mode from job params, not let it default
+            )
+
+            if result.success:
+                self.stdout.write(self.style.SUCCESS(f"  Job {job.id} succeeded"))
+            elif result.insufficient_evidence:
+                self.stdout.write(
+                    self.style.WARNING(f"  Job {job.id} completed: insufficient_evidence")
+                )
+            else:
+                self.stdout.write(self.style.ERROR(f"  Job {job.id} failed: {result.error}"))
+
+        except Exception as e:
+            error_msg = str(e)
+            logger.exception("Job %s failed: %s", job.id, error_msg)
+
+            # Mark job failed (may retry)
+            fail_job(job.id, error_msg)
+            self.stdout.write(self.style.ERROR(f"  Job {job.id} failed: {error_msg[:100]}"))
+
+    def _execute_job(self, job: "OpportunitiesJob") -> None:
+        """
+        Execute a single job with its own heartbeat thread (serial mode).
+        """
         # Event to signal heartbeat thread to stop
         stop_heartbeat = threading.Event()
 
@@ -243,33 +518,7 @@ class Command(BaseCommand):
         heartbeat_thread.start()
 
         try:
-            self.stdout.write(f"  Executing evidence gates for brand {job.brand_id} (mode={mode})...")
-
-            # Run the generation task (PR1: gates only)
-            # TASK-2: Pass mode explicitly from job params
-            result = execute_opportunities_job(
-                job_id=job.id,
-                brand_id=job.brand_id,
-                mode=mode,  # CRITICAL: Must pass mode from job params, not let it default
-            )
-
-            if result.success:
-                self.stdout.write(self.style.SUCCESS(f"  Job {job.id} succeeded"))
-            elif result.insufficient_evidence:
-                self.stdout.write(
-                    self.style.WARNING(f"  Job {job.id} completed: insufficient_evidence")
-                )
-            else:
-                self.stdout.write(self.style.ERROR(f"  Job {job.id} failed: {result.error}"))
-
-        except Exception as e:
-            error_msg = str(e)
-            logger.exception("Job %s failed: %s", job.id, error_msg)
-
-            # Mark job failed (may retry)
-            fail_job(job.id, error_msg)
-            self.stdout.write(self.style.ERROR(f"  Job {job.id} failed: {error_msg[:100]}"))
-
+            self._run_job(job)
         finally:
             # Stop heartbeat thread
             stop_heartbeat.set()
@@ -0,0 +1,57 @@
+"""
+Enqueue coalescing: at most one PENDING OpportunitiesJob per brand.
+
+Before adding the partial unique constraint, duplicate PENDING jobs left
+by earlier regenerate storms are collapsed: the newest PENDING job per
+brand is kept and older ones are marked FAILED as superseded.
+"""
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def supersede_duplicate_pending_jobs(apps, schema_editor):
+    OpportunitiesJob = apps.get_model("hero", "OpportunitiesJob")
+
+    seen_brands = set()
+    duplicates = []
+    pending = (
+        OpportunitiesJob.objects
+        .filter(status="pending")
+        .order_by("brand_id", "-created_at")
+        .values_list("id", "brand_id")
+    )
+    for job_id, brand_id in pending:
+        if brand_id in seen_brands:
+            duplicates.append(job_id)
+        else:
+            seen_brands.add(brand_id)
+
+    if duplicates:
+        OpportunitiesJob.objects.filter(id__in=duplicates).update(
+            status="failed",
+            finished_at=timezone.now(),
+            last_error="Superseded by newer pending job (enqueue coalescing migration)",
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hero", "0002_phase3_progress_tracking"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            supersede_duplicate_pending_jobs,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name="opportunitiesjob",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("status", "pending")),
+                fields=("brand",),
+                name="uniq_oppjob_brand_pending",
+            ),
+        ),
+    ]
@@ -0,0 +1,67 @@
+"""
+Priority lanes and per-tenant fair scheduling for OpportunitiesJob.
+
+Adds priority (JobPriority), a denormalized tenant, and claimed_at, plus
+the indexes used by kairo.core.job_scheduling. Existing rows are
+backfilled: tenant from brand, priority from params (force -> interactive,
+first_run -> first_run, else scheduled).
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_tenant_and_priority(apps, schema_editor):
+    OpportunitiesJob = apps.get_model("hero", "OpportunitiesJob")
+    Brand = apps.get_model("core", "Brand")
+
+    OpportunitiesJob.objects.update(
+        tenant_id=Subquery(
+            Brand.objects.filter(id=OuterRef("brand_id")).values("tenant_id")[:1]
+        )
+    )
+    OpportunitiesJob.objects.filter(params_json__first_run=True).update(priority=10)
+    OpportunitiesJob.objects.filter(params_json__force=True).update(priority=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_create_user_models'),
+        ('hero', '0003_oppjob_brand_pending_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='opportunitiesjob',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='opportunitiesjob',
+            name='priority',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Interactive'), (10, 'First run'), (20, 'Scheduled')], default=20),
+        ),
+        migrations.AddField(
+            model_name='opportunitiesjob',
+            name='tenant',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.tenant'),
+        ),
+        migrations.RunPython(
+            backfill_tenant_and_priority,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddIndex(
+            model_name='opportunitiesjob',
+            index=models.Index(fields=['status', 'priority', 'available_at', 'created_at'], name='idx_oppjob_claim_order'),
+        ),
+        migrations.AddIndex(
+            model_name='opportunitiesjob',
+            index=models.Index(fields=['status', 'priority', 'tenant', 'available_at'], name='idx_oppjob_lane_tenant'),
+        ),
+        migrations.AddIndex(
+            model_name='opportunitiesjob',
+            index=models.Index(fields=['priority', 'claimed_at'], name='idx_oppjob_lane_claimed'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+"""
+Record early cancellation on ActivationRun.
+
+early_exit_reason says why live activation stopped before every recipe
+finished (e.g. "evidence_gates_met"); cancelled_runs lists the Apify runs
+that were aborted as a result.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hero', '0005_job_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activationrun',
+            name='early_exit_reason',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='activationrun',
+            name='cancelled_runs',
+            field=models.JSONField(default=list),
+        ),
+    ]
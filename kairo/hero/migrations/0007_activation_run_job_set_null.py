@@ -0,0 +1,30 @@
+"""
+Detach ActivationRun from archived jobs instead of cascading.
+
+Archiving a terminal OpportunitiesJob (archive_jobs) used to delete its
+ActivationRun and, through it, the EvidenceItem ledger that live
+opportunities still reference. The FK is now nullable with SET_NULL.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hero', '0006_activation_run_cancellations'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activationrun',
+            name='job',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='activation_runs',
+                to='hero.opportunitiesjob',
+            ),
+        ),
+    ]
@@ -9,6 +9,7 @@ This model tracks:
 - Input snapshot and seed pack
 - Recipes selected and executed
 - Timing and outcome metrics
+- Apify runs cancelled once the evidence quota was met
 - Budget tracking via estimated_cost_usd
 
 IMPORTANT: This is schema-only for PR-3. No Apify execution logic.
@@ -46,9 +47,13 @@ class ActivationRun(models.Model):
     # Link to job that triggered this activation
     # PR-4b: Per PRD §D.3.2 - Required FK for ledger traceability
     # SourceActivation must ONLY be invoked from job execution context
+    # (enforced by _persist_evidence). Nullable only so archiving an old job
+    # (kairo.core.job_retention) detaches the run instead of deleting the
+    # evidence ledger that live opportunities still cite.
     job = models.ForeignKey(
         "hero.OpportunitiesJob",
-        on_delete=models.CASCADE,
+        on_delete=models.SET_NULL,
+        null=True,
         related_name="activation_runs",
     )
 
@@ -65,6 +70,11 @@ class ActivationRun(models.Model):
     recipes_selected = models.JSONField(default=list)  # ["IG-1", "IG-2", ...]
     recipes_executed = models.JSONField(default=list)  # ["IG-1", ...]
 
+    # Early cancellation (live activation stopped once the evidence quota was met)
+    early_exit_reason = models.CharField(max_length=50, blank=True, default="")
+    # Aborted Apify runs: [{"recipe_id", "actor_id", "run_id", "stage"}, ...]
+    cancelled_runs = models.JSONField(default=list)
+
     # Timing
     started_at = models.DateTimeField(auto_now_add=True)
     ended_at = models.DateTimeField(null=True, blank=True)
@@ -21,7 +21,8 @@ import uuid
 
 from django.db import models
 
-from kairo.core.models import Brand
+from kairo.core.enums import JobPriority
+from kairo.core.models import Brand, Tenant
 
 
 class OpportunitiesJobStatus:
@@ -71,11 +72,20 @@ class OpportunitiesJob(models.Model):
 
     PR1: DB-backed job queue for production durability.
 
+    Coalescing:
+    - At most one PENDING job per brand (uniq_oppjob_brand_pending)
+    - Enqueue returns/promotes the existing job instead of adding another
+
     Job leasing:
     - Worker claims job by setting status=RUNNING, locked_at, locked_by
     - Atomic update ensures no double-claiming
     - Stale lock detection via locked_at threshold
 
+    Scheduling (kairo.core.job_scheduling):
+    - priority lane first (JobPriority: interactive > first_run > scheduled)
+    - weighted round-robin across tenants within a lane
+    - tenant is denormalized from brand so claims need no join
+
     Retry policy:
     - max_attempts default 3
     - available_at for exponential backoff
@@ -85,6 +95,11 @@ class OpportunitiesJob(models.Model):
     - SUCCEEDED: Generation completed, board is ready
     - FAILED: Generation failed (error, timeout, etc.)
     - INSUFFICIENT_EVIDENCE: Evidence gates blocked generation
+
+    Retention:
+    - Terminal rows older than JOB_RETENTION_DAYS move to ArchivedJob
+      (kairo.core.job_retention, archive_jobs command)
+    - Hot indexes are partial on PENDING/RUNNING rows
     """
 
     STATUS_CHOICES = [
@@ -101,6 +116,14 @@ class OpportunitiesJob(models.Model):
         on_delete=models.CASCADE,
         related_name="opportunities_jobs",
     )
+    # Denormalized from brand.tenant (set on save) for fair scheduling
+    tenant = models.ForeignKey(
+        Tenant,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
     status = models.CharField(
         max_length=30,
         choices=STATUS_CHOICES,
@@ -128,6 +151,11 @@ class OpportunitiesJob(models.Model):
 
     # Scheduling
     available_at = models.DateTimeField(auto_now_add=True)  # for backoff scheduling
+    priority = models.PositiveSmallIntegerField(
+        choices=JobPriority.choices,
+        default=JobPriority.SCHEDULED,
+    )
+    claimed_at = models.DateTimeField(null=True, blank=True)  # latest claim (fair share window)
 
     # Job parameters
     params_json = models.JSONField(default=dict)  # force, first_run, etc.
@@ -163,12 +191,58 @@ class OpportunitiesJob(models.Model):
                 fields=["status", "available_at"],
                 name="idx_oppjob_status_available",
             ),
+            # Claim order: priority lane, then backoff/FIFO.
+            # Partial (PENDING only) so terminal history never bloats it.
+            models.Index(
+                fields=["priority", "available_at", "created_at"],
+                name="idx_oppjob_pending_order",
+                condition=models.Q(status=OpportunitiesJobStatus.PENDING),
+            ),
+            # Fair scheduling: per-tenant lane heads and claims
+            models.Index(
+                fields=["priority", "tenant", "available_at"],
+                name="idx_oppjob_pending_tenant",
+                condition=models.Q(status=OpportunitiesJobStatus.PENDING),
+            ),
+            # Live job per brand (running-job lookups, enqueue dedupe)
+            models.Index(
+                fields=["brand", "-created_at"],
+                name="idx_oppjob_brand_live",
+                condition=models.Q(status__in=[
+                    OpportunitiesJobStatus.PENDING,
+                    OpportunitiesJobStatus.RUNNING,
+                ]),
+            ),
+            # Fair scheduling: recent claims per lane
+            models.Index(
+                fields=["priority", "claimed_at"],
+                name="idx_oppjob_lane_claimed",
+            ),
             # Brand job history
             models.Index(
                 fields=["brand", "-created_at"],
                 name="idx_oppjob_brand_created",
             ),
         ]
+        constraints = [
+            # Enqueue coalescing: at most one PENDING job per brand
+            models.UniqueConstraint(
+                fields=["brand"],
+                condition=models.Q(status=OpportunitiesJobStatus.PENDING),
+                name="uniq_oppjob_brand_pending",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"OpportunitiesJob {self.id} for {self.brand_id} [{self.status}]"
+
+    def save(self, *args, **kwargs):
+        """Denormalize tenant from brand before the first save."""
+        if self.tenant_id is None and self.brand_id is not None:
+            self.tenant_id = (
+                Brand.objects
+                .filter(id=self.brand_id)
+                .values_list("tenant_id", flat=True)
+                .first()
+            )
+        super().save(*args, **kwargs)
@@ -36,15 +36,22 @@ from kairo.core.enums import TodayBoardState
 from kairo.core.models import Brand
 from kairo.hero.cache import (
     JOB_TTL_SECONDS,
+    BoardWrite,
+    board_rebuild_lock,
     clear_cached_job_id,
     get_cache_key,
     get_cache_ttl,
     get_cached_board,
+    get_cached_board_entry,
+    get_cached_board_etag,
     get_cached_job_id,
     get_job_cache_key,
+    get_stale_board_json,
     invalidate_cache,
     set_cached_board,
     set_cached_job_id,
+    wait_for_rebuilt_board,
+    write_cached_board,
 )
 from kairo.hero.dto import (
     BrandSnapshotDTO,
@@ -62,7 +69,53 @@ logger = logging.getLogger("kairo.hero.services.today")
 # =============================================================================
 
 
-def get_today_board(brand_id: UUID) -> TodayBoardDTO:
+def get_today_board_etag(brand_id: UUID) -> str | None:
+    """
+    ETag of the cached READY board, from cache metadata only (no DB access).
+
+    GET /today compares it with If-None-Match before anything else.
+
+    Args:
+        brand_id: UUID of the brand
+
+    Returns:
+        Quoted ETag if a board is cached, None otherwise
+    """
+    return get_cached_board_etag(brand_id)
+
+
+def get_cached_today_board_json(
+    brand_id: UUID,
+    allow_stale: bool = False,
+) -> tuple[str | None, str | None]:
+    """
+    GET /today/ fast path: the cached READY board as the response body.
+
+    Same result as PATH 1 of get_today_board() (and, with allow_stale, its
+    stale-while-revalidate branch), without building a DTO.
+    Callers fall back to get_today_board() on a None body.
+
+    Args:
+        brand_id: UUID of the brand
+        allow_stale: Serve the last READY board while a job regenerates
+
+    Returns:
+        (JSON response body, ETag) on cache hit, (None, None) on miss.
+        Stale bodies carry no ETag (they change with job progress).
+
+    Raises:
+        Brand.DoesNotExist: If brand not found
+    """
+    if not Brand.objects.filter(id=brand_id).exists():
+        raise Brand.DoesNotExist(f"Brand {brand_id} does not exist")
+
+    payload, etag = get_cached_board_entry(brand_id)
+    if payload is None and allow_stale:
+        return _get_stale_board_json(brand_id), None
+    return payload, etag
+
+
+def get_today_board(brand_id: UUID, allow_stale: bool = False) -> TodayBoardDTO:
     """
     GET /today/ implementation.
 
@@ -70,8 +123,10 @@ def get_today_board(brand_id: UUID) -> TodayBoardDTO:
 
     PR-7: Optimized path ordering for polling-storm defense:
     1. Cache hit → Return immediately (cheapest path)
-    2. Generating state → Return minimal response (no evidence join)
+    2. Generating state → Return minimal response (no evidence join), or
+       with allow_stale the previous READY board marked stale
     3. Persisted board → Return with evidence join, populate cache
+       (single-flight per brand: concurrent misses wait for one rebuild)
     4. First-run auto-enqueue → Return generating state
     5. No snapshot → Return not_generated_yet
 
@@ -83,6 +138,10 @@ def get_today_board(brand_id: UUID) -> TodayBoardDTO:
 
     Args:
         brand_id: UUID of the brand
+        allow_stale: Stale-while-revalidate - while a job runs, return the
+            last READY board (meta.stale=True, meta.job_id) instead of an
+            empty GENERATING board. Opt-in per request; default keeps the
+            PRD §0.2 contract.
 
     Returns:
         TodayBoardDTO with appropriate state
@@ -124,6 +183,18 @@ def get_today_board(brand_id: UUID) -> TodayBoardDTO:
         # Phase 3: Get progress info for UI indicators
         progress_stage, progress_detail = _get_job_progress(running_job_id)
 
+        if allow_stale:
+            stale_json = get_stale_board_json(
+                brand_id, running_job_id, progress_stage, progress_detail
+            )
+            if stale_json:
+                logger.debug(
+                    "GET /today serving stale board for brand %s (job=%s)",
+                    brand_id,
+                    running_job_id,
+                )
+                return TodayBoardDTO.model_validate_json(stale_json)
+
         logger.debug(
             "GET /today returning generating state for brand %s (job=%s, stage=%s)",
             brand_id,
@@ -147,21 +218,33 @@ def get_today_board(brand_id: UUID) -> TodayBoardDTO:
 
     # ==========================================================================
     # PATH 3: Load persisted board from DB (includes evidence preview join)
+    # Single-flight: one request per brand rebuilds, concurrent misses wait
+    # for its cache write instead of repeating the evidence preview join.
     # ==========================================================================
-    persisted_board = _get_persisted_board(brand_id, snapshot)
-    if persisted_board:
-        # Return board regardless of state (ready, insufficient_evidence, error)
-        persisted_board.meta.cache_hit = False
-        persisted_board.meta.cache_key = cache_key
-        persisted_board.meta.cache_ttl_seconds = cache_ttl
-
-        # PR-7: Set ready_reason for ready boards (fresh_generation since not cached)
-        if persisted_board.meta.state == TodayBoardState.READY:
-            persisted_board.meta.ready_reason = "fresh_generation"
-            # Populate cache for next request
-            set_cached_board(brand_id, persisted_board)
-
-        return persisted_board
+    with board_rebuild_lock(brand_id) as leader:
+        if not leader:
+            rebuilt_board = wait_for_rebuilt_board(brand_id)
+            if rebuilt_board:
+                logger.debug(
+                    "GET /today served rebuilt board for brand %s (single-flight)",
+                    brand_id,
+                )
+                return rebuilt_board
+
+        persisted_board = _get_persisted_board(brand_id, snapshot)
+        if persisted_board:
+            # Return board regardless of state (ready, insufficient_evidence, error)
+            persisted_board.meta.cache_hit = False
+            persisted_board.meta.cache_key = cache_key
+            persisted_board.meta.cache_ttl_seconds = cache_ttl
+
+            # PR-7: Set ready_reason for ready boards (fresh_generation since not cached)
+            if persisted_board.meta.state == TodayBoardState.READY:
+                persisted_board.meta.ready_reason = "fresh_generation"
+                # Populate cache for next request (and waiting followers)
+                set_cached_board(brand_id, persisted_board)
+
+            return persisted_board
 
     # ==========================================================================
     # PATH 4: First-run auto-enqueue (snapshot exists but no board)
@@ -255,6 +338,7 @@ def regenerate_today_board(brand_id: UUID, user_id: UUID | None = None) -> Regen
         status="accepted",
         job_id=job_id,
         poll_url=f"/api/brands/{brand_id}/today/",
+        events_url=f"/api/brands/{brand_id}/jobs/{job_id}/events/",
     )
 
 
@@ -317,6 +401,21 @@ def _get_persisted_board(brand_id: UUID, snapshot: BrandSnapshotDTO) -> TodayBoa
         return None
 
 
+def _get_stale_board_json(brand_id: UUID) -> str | None:
+    """
+    Stale-while-revalidate body for GET /today, if a job is running.
+
+    Returns None when no job runs (caller takes the normal miss path) or no
+    READY board is kept.
+    """
+    running_job_id = _get_running_job_id(brand_id)
+    if not running_job_id:
+        return None
+
+    progress_stage, progress_detail = _get_job_progress(running_job_id)
+    return get_stale_board_json(brand_id, running_job_id, progress_stage, progress_detail)
+
+
 def _get_running_job_id(brand_id: UUID) -> str | None:
     """
     Check if a generation job is currently running for this brand.
@@ -434,7 +533,8 @@ def _enqueue_generation_job(
 
     Args:
         brand_id: Brand to generate for
-        force: If True, override any existing job
+        force: If True, skip the cached running-job check (the queue still
+            coalesces into a compatible PENDING/RUNNING job)
         first_run: If True, this is a first-run auto-enqueue
         user_id: Optional user UUID for BYOK token lookup
 
@@ -475,13 +575,15 @@ def _enqueue_generation_job(
                 "job_id": job_id,
                 "force": force,
                 "first_run": first_run,
+                "coalesced": result.coalesced,
             },
         )
 
         # DEBUG mode: Execute job synchronously (no worker required)
         # This allows development without running a separate worker process.
         # Production uses async workers that claim and execute jobs.
-        if settings.DEBUG:
+        # Coalesced requests reuse a job that is already queued or running.
+        if settings.DEBUG and not result.coalesced:
             logger.info(
                 "DEBUG mode: Executing job synchronously (job=%s, brand=%s)",
                 job_id,
@@ -559,14 +661,19 @@ def _execute_job_sync(job_id: UUID, brand_id: UUID, user_id: UUID | None = None)
 # =============================================================================
 
 
-def invalidate_today_board_cache(brand_id: UUID) -> None:
+def invalidate_today_board_cache(brand_id: UUID, superseded_at: datetime | None = None) -> None:
     """
     Invalidate cache for a brand's TodayBoard.
 
     PR7: Called on job completion before/after board persistence.
     Also clears job tracking cache.
+
+    Args:
+        brand_id: UUID of the brand
+        superseded_at: created_at of the job's (non-READY) board; older
+            READY boards can no longer be written back by slow readers
     """
-    invalidate_cache(brand_id)
+    invalidate_cache(brand_id, superseded_at=superseded_at)
     clear_cached_job_id(brand_id)
 
 
@@ -580,6 +687,69 @@ def populate_today_board_cache(brand_id: UUID, board: TodayBoardDTO) -> None:
     set_cached_board(brand_id, board)
 
 
+def render_today_board(brand_id: UUID, board) -> TodayBoardDTO | None:
+    """
+    Render a persisted OpportunitiesBoard exactly as GET /today returns it.
+
+    Same DTO as PATH 3 of get_today_board() (minimal snapshot, fresh meta),
+    so a write-through entry is indistinguishable from a GET rebuild.
+
+    Args:
+        brand_id: UUID of the brand
+        board: OpportunitiesBoard instance
+
+    Returns:
+        TodayBoardDTO, or None if rendering failed
+    """
+    try:
+        brand = Brand.objects.get(id=brand_id)
+        dto = board.to_dto()
+        dto.snapshot = _build_minimal_snapshot(brand)
+        dto.meta.cache_hit = False
+        dto.meta.cache_key = get_cache_key(brand_id)
+        dto.meta.cache_ttl_seconds = get_cache_ttl()
+        if dto.meta.state == TodayBoardState.READY:
+            dto.meta.ready_reason = "fresh_generation"
+        return dto
+    except Exception as e:
+        logger.warning(
+            "Failed to render board for cache",
+            extra={"brand_id": str(brand_id), "error": str(e)},
+        )
+        return None
+
+
+def write_through_today_board_cache(brand_id: UUID, board: TodayBoardDTO | None) -> bool:
+    """
+    Write a completed job's board into the cache (write-through).
+
+    Replaces the previous entry in place (no invalidation gap). Versioned
+    by generated_at, so a slower job finishing an older board cannot
+    overwrite a newer one. Falls back to invalidation if the board is
+    missing, not READY, superseded, or the write failed. A busy write lock
+    leaves the cache alone: the entry another writer holds is a good
+    READY board, and evicting it would only force rebuilds. Clears job
+    tracking.
+
+    Args:
+        brand_id: UUID of the brand
+        board: Rendered board (render_today_board), or None
+
+    Returns:
+        True if the board is now cached
+    """
+    outcome = write_cached_board(brand_id, board) if board is not None else None
+    if outcome is BoardWrite.LOCK_BUSY:
+        logger.debug("Board write lock busy for brand %s, keeping cached board", brand_id)
+    elif outcome is not BoardWrite.CACHED:
+        invalidate_cache(
+            brand_id,
+            superseded_at=board.meta.generated_at if board is not None else None,
+        )
+    clear_cached_job_id(brand_id)
+    return outcome is BoardWrite.CACHED
+
+
 # =============================================================================
 # LEGACY COMPATIBILITY
 # =============================================================================
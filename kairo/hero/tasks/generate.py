@@ -38,8 +38,13 @@ import logging
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import TYPE_CHECKING
 from uuid import UUID
 
+if TYPE_CHECKING:
+    from kairo.hero.dto import TodayBoardDTO
+    from kairo.hero.models import OpportunitiesBoard
+
 logger = logging.getLogger("kairo.hero.tasks.generate")
 
 
@@ -268,7 +273,7 @@ def execute_opportunities_job(
             )
 
             # Invalidate cache to ensure next GET reads from DB
-            _invalidate_cache(brand_id)
+            _invalidate_cache(brand_id, superseded_at=board.created_at)
 
             total_time_ms = int((time.monotonic() - start_time) * 1000)
             diagnostics["total_time_ms"] = total_time_ms
@@ -353,6 +358,10 @@ def execute_opportunities_job(
                 f"Generated {len(opportunity_ids)} opportunities!",
             )
 
+            # Render the response before completing so the cache write
+            # lands right after the status flip
+            rendered_board = _render_board(brand_id, board)
+
             # Mark job as succeeded
             complete_job(
                 job_id,
@@ -360,10 +369,10 @@ def execute_opportunities_job(
                 result_json=diagnostics,
             )
 
-            # PR-7: Invalidate caches (clears job tracking + old board cache)
-            # then populate with new board
-            _invalidate_cache(brand_id)
-            _populate_cache(brand_id, board)
+            # Write-through: replace the cached board in place (versioned, so
+            # an older job finishing later cannot overwrite it) and clear job
+            # tracking; the next poll is a cache hit
+            _write_through_cache(brand_id, rendered_board)
 
             total_time_ms = int((time.monotonic() - start_time) * 1000)
             diagnostics["total_time_ms"] = total_time_ms
@@ -407,7 +416,7 @@ def execute_opportunities_job(
             fail_job(job_id, str(synthesis_error))
 
             # Invalidate cache
-            _invalidate_cache(brand_id)
+            _invalidate_cache(brand_id, superseded_at=board.created_at)
 
             total_time_ms = int((time.monotonic() - start_time) * 1000)
             diagnostics["total_time_ms"] = total_time_ms
@@ -445,33 +454,38 @@ def execute_opportunities_job(
         )
 
 
-def _invalidate_cache(brand_id: UUID) -> None:
+def _invalidate_cache(brand_id: UUID, superseded_at: datetime | None = None) -> None:
     """
     Invalidate cache for a brand's TodayBoard.
 
     PR-7: Uses centralized cache module from kairo.hero.cache.
-    Also clears job tracking cache.
+    Also clears job tracking cache. superseded_at is the created_at of this
+    job's non-READY board (keeps older READY boards from being re-cached).
     """
     from kairo.hero.services.today_service import invalidate_today_board_cache
-    invalidate_today_board_cache(brand_id)
+    invalidate_today_board_cache(brand_id, superseded_at=superseded_at)
 
 
-def _populate_cache(brand_id: UUID, board: "OpportunitiesBoard") -> None:
+def _render_board(brand_id: UUID, board: "OpportunitiesBoard") -> "TodayBoardDTO | None":
+    """Render a persisted board as GET /today returns it (None on failure)."""
+    from kairo.hero.services.today_service import render_today_board
+    return render_today_board(brand_id, board)
+
+
+def _write_through_cache(brand_id: UUID, rendered_board: "TodayBoardDTO | None") -> None:
     """
-    Populate cache with a board.
+    Write a completed job's board into the cache.
 
-    PR-7: Uses centralized cache module from kairo.hero.cache.
-    Only caches state=READY boards.
+    Falls back to invalidation if rendering failed or the board is not READY.
     """
-    from kairo.hero.services.today_service import populate_today_board_cache
+    from kairo.hero.services.today_service import write_through_today_board_cache
 
     try:
-        dto = board.to_dto()
-        populate_today_board_cache(brand_id, dto)
-        logger.debug("Populated cache for brand %s", brand_id)
+        if write_through_today_board_cache(brand_id, rendered_board):
+            logger.debug("Wrote board through to cache for brand %s", brand_id)
     except Exception as e:
         logger.warning(
-            "Failed to populate cache for brand %s: %s",
+            "Failed to write board through to cache for brand %s: %s",
             brand_id,
             str(e),
         )
@@ -33,6 +33,11 @@ urlpatterns = [
         api_views.regenerate_today_board,
         name="regenerate_today",
     ),
+    path(
+        "api/brands/<str:brand_id>/jobs/<str:job_id>/events/",
+        api_views.stream_job_events,
+        name="job_events",
+    ),
 
     # PR-2: Package endpoints
     path(
@@ -122,4 +127,11 @@ urlpatterns = [
         internal_views.get_brand_detail,
         name="internal_brand_detail",
     ),
+
+    # Job queue metrics (JSON, or ?format=prometheus)
+    path(
+        "hero/internal/queues/metrics/",
+        internal_views.queue_metrics,
+        name="internal_queue_metrics",
+    ),
 ]
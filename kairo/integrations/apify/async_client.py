@@ -0,0 +1,367 @@
+"""
+Asyncio Apify API v2 client.
+
+Same 4 primitives as kairo.integrations.apify.client.ApifyClient, as
+coroutines:
+1. start_actor_run(actor_id, input_json) -> RunInfo
+2. poll_run(run_id, timeout_s, interval_s, actor_id) -> RunInfo
+3. fetch_dataset_items(dataset_id, limit, offset) -> list[dict]
+4. abort_run(run_id) -> RunInfo
+
+A run waiting in poll_run costs one suspended coroutine instead of a
+sleeping thread, so one worker can keep dozens of actor runs in flight
+(see kairo.sourceactivation.live.execute_recipe_async). All calls through
+one client share a single httpx connection pool (APIFY_MAX_CONNECTIONS).
+
+The pool belongs to the event loop it was created on: create one client per
+activation and close it, e.g. `async with AsyncApifyClient(token) as client:`.
+
+PR-0 GUARDRAILS:
+Every call is guarded by require_apify_enabled(), exactly like the sync
+client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator
+from urllib.parse import quote
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from kairo.core.guardrails import require_apify_enabled
+from kairo.integrations.apify.client import (
+    ApifyError,
+    ApifyTimeoutError,
+    RunInfo,
+    dataset_page_size,
+    start_run_params,
+    parse_run_info,
+)
+from kairo.integrations.apify.polling import PollPolicy
+from kairo.integrations.apify.webhooks import (
+    WEBHOOK_CHECK_INTERVAL_S,
+    get_finished_run,
+    webhooks_enabled,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 20
+
+
+class AsyncApifyClient:
+    """
+    Asyncio HTTP client for Apify API v2.
+
+    Authentication via Bearer token (recommended by Apify docs).
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = "https://api.apify.com",
+        max_connections: int | None = None,
+    ):
+        """
+        Initialize async Apify client.
+
+        Args:
+            token: Apify API token
+            base_url: Base URL for Apify API (default: https://api.apify.com)
+            max_connections: Connection pool size (default: APIFY_MAX_CONNECTIONS)
+        """
+        if not token:
+            raise ValueError("Apify token is required")
+        if max_connections is None:
+            max_connections = int(
+                getattr(settings, "APIFY_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)
+            )
+
+        self.token = token
+        self.base_url = base_url.rstrip("/")
+        self._client = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            },
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    async def __aenter__(self) -> "AsyncApifyClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        await self._client.aclose()
+
+    async def start_actor_run(self, actor_id: str, input_json: dict[str, Any]) -> RunInfo:
+        """
+        Start an actor run.
+
+        Raises:
+            ApifyDisabledError: If APIFY_ENABLED=false (PR-0 guardrail)
+            ApifyError: If API returns an error
+        """
+        require_apify_enabled()
+
+        encoded_actor_id = quote(actor_id, safe="")
+        url = f"{self.base_url}/v2/acts/{encoded_actor_id}/runs"
+
+        call_start_ms = time.monotonic() * 1000
+        logger.info(
+            "APIFY_CALL_START actor_id=%s url=%s",
+            actor_id,
+            url,
+        )
+
+        try:
+            response = await self._client.post(
+                url,
+                json=input_json,
+                params=start_run_params(),
+                timeout=30,
+            )
+            duration_ms = int(time.monotonic() * 1000 - call_start_ms)
+        except httpx.HTTPError as e:
+            duration_ms = int(time.monotonic() * 1000 - call_start_ms)
+            logger.error(
+                "APIFY_CALL_END actor_id=%s status=ERROR duration_ms=%d error=%s",
+                actor_id,
+                duration_ms,
+                str(e),
+            )
+            raise ApifyError(f"Request failed: {e}") from e
+
+        if response.is_error:
+            logger.error(
+                "APIFY_CALL_END actor_id=%s status=HTTP_ERROR duration_ms=%d http_status=%d error=%s",
+                actor_id,
+                duration_ms,
+                response.status_code,
+                response.text[:200],
+            )
+            raise ApifyError(
+                f"Failed to start actor run: {response.status_code}",
+                status_code=response.status_code,
+                body=response.text,
+            )
+
+        data = response.json().get("data", {})
+        run_info = parse_run_info(data, actor_id)
+
+        logger.info(
+            "APIFY_CALL_END actor_id=%s run_id=%s status=STARTED duration_ms=%d apify_status=%s",
+            actor_id,
+            run_info.run_id,
+            duration_ms,
+            run_info.status,
+        )
+        return run_info
+
+    async def poll_run(
+        self,
+        run_id: str,
+        timeout_s: float = 180,
+        interval_s: float | None = None,
+        actor_id: str | None = None,
+    ) -> RunInfo:
+        """
+        Poll run status until terminal state or timeout.
+
+        Adaptive unless interval_s is given; see ApifyClient.poll_run.
+
+        Raises:
+            ApifyDisabledError: If APIFY_ENABLED=false (PR-0 guardrail)
+            ApifyTimeoutError: If polling times out
+            ApifyError: If API returns an error
+        """
+        require_apify_enabled()
+
+        if interval_s is not None:
+            policy = PollPolicy.fixed(interval_s)
+        else:
+            # The duration hint reads ApifyRun history: keep the ORM off the loop
+            policy = await sync_to_async(PollPolicy.adaptive)(actor_id)
+        delays = policy.delays()
+
+        url = f"{self.base_url}/v2/actor-runs/{run_id}"
+        start_time = time.monotonic()
+        logger.info("Polling run: run_id=%s, timeout_s=%d", run_id, timeout_s)
+
+        while True:
+            elapsed = time.monotonic() - start_time
+            if elapsed > timeout_s:
+                raise ApifyTimeoutError(
+                    f"Polling timed out after {timeout_s}s for run_id={run_id}"
+                )
+
+            wait_s = policy.long_poll_s(timeout_s - elapsed)
+            try:
+                response = await self._client.get(
+                    url,
+                    params={"waitForFinish": wait_s} if wait_s else None,
+                    timeout=30 + wait_s,
+                )
+            except httpx.HTTPError as e:
+                raise ApifyError(f"Request failed: {e}") from e
+
+            if response.is_error:
+                raise ApifyError(
+                    f"Failed to get run status: {response.status_code}",
+                    status_code=response.status_code,
+                    body=response.text,
+                )
+
+            data = response.json().get("data", {})
+            run_info = parse_run_info(data, data.get("actId", data.get("actorId", "")))
+
+            if run_info.is_terminal():
+                logger.info(
+                    "Run completed: run_id=%s, status=%s",
+                    run_info.run_id,
+                    run_info.status,
+                )
+                return run_info
+
+            logger.debug(
+                "Run still in progress: run_id=%s, status=%s, elapsed=%.1fs",
+                run_id,
+                run_info.status,
+                elapsed,
+            )
+            if wait_s:
+                # Apify already held the request for wait_s
+                continue
+
+            finished = await self._wait(run_id, next(delays))
+            if finished is not None:
+                run_info = parse_run_info(finished, finished.get("actId", ""))
+                if run_info.is_terminal():
+                    logger.info(
+                        "Run completed (webhook): run_id=%s, status=%s",
+                        run_info.run_id,
+                        run_info.status,
+                    )
+                    return run_info
+
+    async def _wait(self, run_id: str, delay_s: float) -> dict[str, Any] | None:
+        """Sleep delay_s, returning early with the run if a webhook reports it finished."""
+        if not webhooks_enabled():
+            await asyncio.sleep(delay_s)
+            return None
+
+        deadline = time.monotonic() + delay_s
+        while True:
+            # Cache read (Redis in production): keep it off the loop
+            finished = await sync_to_async(get_finished_run, thread_sensitive=False)(run_id)
+            remaining = deadline - time.monotonic()
+            if finished is not None or remaining <= 0:
+                return finished
+            await asyncio.sleep(min(WEBHOOK_CHECK_INTERVAL_S, remaining))
+
+    async def fetch_dataset_items(
+        self,
+        dataset_id: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch items from a dataset.
+
+        Raises:
+            ApifyDisabledError: If APIFY_ENABLED=false (PR-0 guardrail)
+            ApifyError: If API returns an error
+        """
+        require_apify_enabled()
+
+        url = f"{self.base_url}/v2/datasets/{dataset_id}/items"
+        params = {"limit": limit, "offset": offset}
+        logger.info(
+            "Fetching dataset items: dataset_id=%s, limit=%d, offset=%d",
+            dataset_id,
+            limit,
+            offset,
+        )
+
+        try:
+            response = await self._client.get(url, params=params, timeout=60)
+        except httpx.HTTPError as e:
+            raise ApifyError(f"Request failed: {e}") from e
+
+        if response.is_error:
+            raise ApifyError(
+                f"Failed to fetch dataset items: {response.status_code}",
+                status_code=response.status_code,
+                body=response.text,
+            )
+
+        # Dataset items endpoint returns array directly, not wrapped in "data"
+        items = response.json()
+        if isinstance(items, dict) and "items" in items:
+            items = items["items"]
+
+        logger.info("Fetched %d items from dataset", len(items))
+        return items
+
+    async def abort_run(self, run_id: str) -> RunInfo:
+        """
+        Abort a run that is still in progress.
+
+        Raises:
+            ApifyDisabledError: If APIFY_ENABLED=false (PR-0 guardrail)
+            ApifyError: If API returns an error
+        """
+        require_apify_enabled()
+
+        url = f"{self.base_url}/v2/actor-runs/{run_id}/abort"
+        logger.info("Aborting run: run_id=%s", run_id)
+
+        try:
+            response = await self._client.post(url, timeout=30)
+        except httpx.HTTPError as e:
+            raise ApifyError(f"Request failed: {e}") from e
+
+        if response.is_error:
+            raise ApifyError(
+                f"Failed to abort run: {response.status_code}",
+                status_code=response.status_code,
+                body=response.text,
+            )
+
+        data = response.json().get("data", {})
+        return parse_run_info(data, data.get("actId", data.get("actorId", "")))
+
+
+async def aiter_dataset_pages(
+    client: AsyncApifyClient,
+    dataset_id: str,
+    limit: int | None = None,
+    offset: int = 0,
+    page_size: int | None = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Async variant of kairo.integrations.apify.client.iter_dataset_pages."""
+    page_size = page_size or dataset_page_size()
+    remaining = limit
+
+    while remaining is None or remaining > 0:
+        want = page_size if remaining is None else min(page_size, remaining)
+        page = await client.fetch_dataset_items(dataset_id, limit=want, offset=offset)
+        if not page:
+            return
+        yield page
+        offset += len(page)
+        if remaining is not None:
+            remaining -= len(page)
+        if len(page) < want:
+            return
@@ -3,15 +3,20 @@ Apify API v2 client.
 
 Per brandbrain_spec_skeleton.md §7: Apify Integration Contract.
 
-Implements exactly 3 primitives:
+Implements exactly 4 primitives:
 1. start_actor_run(actor_id, input_json) -> RunInfo
-2. poll_run(run_id, timeout_s, interval_s) -> RunInfo
+2. poll_run(run_id, timeout_s, interval_s, actor_id) -> RunInfo
+   (adaptive by default, see kairo.integrations.apify.polling)
 3. fetch_dataset_items(dataset_id, limit, offset) -> list[dict]
+4. abort_run(run_id) -> RunInfo
+
+iter_dataset_pages() streams large datasets page by page on top of (3).
 
 Endpoints per Apify API v2 docs (https://docs.apify.com/api/v2):
 - POST /v2/acts/{actorId}/runs - start actor run
 - GET /v2/actor-runs/{runId} - get run status
 - GET /v2/datasets/{datasetId}/items - fetch dataset items
+- POST /v2/actor-runs/{runId}/abort - abort a run
 
 PR-0 GUARDRAILS:
 All API calls are guarded by require_apify_enabled() from kairo.core.guardrails.
@@ -25,15 +30,24 @@ import logging
 import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterator
 from urllib.parse import quote
 
 import requests
+from django.conf import settings
 
 from kairo.core.guardrails import require_apify_enabled
+from kairo.integrations.apify.polling import PollPolicy
+from kairo.integrations.apify.webhooks import (
+    run_webhooks_param,
+    wait_for_finished_run,
+    webhooks_enabled,
+)
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_DATASET_PAGE_SIZE = 200
+
 
 class ApifyError(Exception):
     """Raised when Apify API returns an error response."""
@@ -138,7 +152,12 @@ class ApifyClient:
         )
 
         try:
-            response = self._session.post(url, json=input_json, timeout=30)
+            response = self._session.post(
+                url,
+                json=input_json,
+                params=start_run_params(),
+                timeout=30,
+            )
             duration_ms = int(time.monotonic() * 1000 - call_start_ms)
         except requests.RequestException as e:
             duration_ms = int(time.monotonic() * 1000 - call_start_ms)
@@ -183,15 +202,21 @@ class ApifyClient:
         self,
         run_id: str,
         timeout_s: int = 180,
-        interval_s: int = 3,
+        interval_s: float | None = None,
+        actor_id: str | None = None,
     ) -> RunInfo:
         """
         Poll run status until terminal state or timeout.
 
+        By default polls adaptively (see kairo.integrations.apify.polling):
+        waitForFinish long-polls, or exponential backoff seeded with the
+        actor's expected duration, resolved early by completion webhooks.
+
         Args:
             run_id: Apify run ID
             timeout_s: Maximum time to wait (seconds)
-            interval_s: Polling interval (seconds)
+            interval_s: Fixed polling interval (seconds); None = adaptive
+            actor_id: Actor ID, used for the expected-duration hint
 
         Returns:
             RunInfo with final status
@@ -204,6 +229,12 @@ class ApifyClient:
         # PR-0: Global kill switch - fail fast if Apify is disabled
         require_apify_enabled()
 
+        if interval_s is not None:
+            policy = PollPolicy.fixed(interval_s)
+        else:
+            policy = PollPolicy.adaptive(actor_id)
+        delays = policy.delays()
+
         url = f"{self.base_url}/v2/actor-runs/{run_id}"
         start_time = time.monotonic()
         logger.info("Polling run: run_id=%s, timeout_s=%d", run_id, timeout_s)
@@ -215,8 +246,13 @@ class ApifyClient:
                     f"Polling timed out after {timeout_s}s for run_id={run_id}"
                 )
 
+            wait_s = policy.long_poll_s(timeout_s - elapsed)
             try:
-                response = self._session.get(url, timeout=30)
+                response = self._session.get(
+                    url,
+                    params={"waitForFinish": wait_s} if wait_s else None,
+                    timeout=30 + wait_s,
+                )
             except requests.RequestException as e:
                 raise ApifyError(f"Request failed: {e}") from e
 
@@ -229,8 +265,7 @@ class ApifyClient:
 
             data = response.json().get("data", {})
             # Extract actor_id from response or use empty string
-            actor_id = data.get("actId", data.get("actorId", ""))
-            run_info = self._parse_run_info(data, actor_id)
+            run_info = parse_run_info(data, data.get("actId", data.get("actorId", "")))
 
             if run_info.is_terminal():
                 logger.info(
@@ -246,7 +281,27 @@ class ApifyClient:
                 run_info.status,
                 elapsed,
             )
-            time.sleep(interval_s)
+            if wait_s:
+                # Apify already held the request for wait_s
+                continue
+
+            finished = self._wait(run_id, next(delays))
+            if finished is not None:
+                run_info = parse_run_info(finished, finished.get("actId", ""))
+                if run_info.is_terminal():
+                    logger.info(
+                        "Run completed (webhook): run_id=%s, status=%s",
+                        run_info.run_id,
+                        run_info.status,
+                    )
+                    return run_info
+
+    def _wait(self, run_id: str, delay_s: float) -> dict[str, Any] | None:
+        """Sleep delay_s, returning early with the run if a webhook reports it finished."""
+        if webhooks_enabled():
+            return wait_for_finished_run(run_id, delay_s)
+        time.sleep(delay_s)
+        return None
 
     def fetch_dataset_items(
         self,
@@ -302,33 +357,118 @@ class ApifyClient:
         logger.info("Fetched %d items from dataset", len(items))
         return items
 
+    def abort_run(self, run_id: str) -> RunInfo:
+        """
+        Abort a run that is still in progress.
+
+        Used to stop runs whose output is no longer needed, which stops
+        their compute spend. A run blocked in poll_run() sees ABORTED as a
+        terminal status and returns.
+
+        Args:
+            run_id: Apify run ID
+
+        Returns:
+            RunInfo with the run's status after the abort request
+
+        Raises:
+            ApifyDisabledError: If APIFY_ENABLED=false (PR-0 guardrail)
+            ApifyError: If API returns an error
+        """
+        # PR-0: Global kill switch - fail fast if Apify is disabled
+        require_apify_enabled()
+
+        url = f"{self.base_url}/v2/actor-runs/{run_id}/abort"
+        logger.info("Aborting run: run_id=%s", run_id)
+
+        try:
+            response = self._session.post(url, timeout=30)
+        except requests.RequestException as e:
+            raise ApifyError(f"Request failed: {e}") from e
+
+        if not response.ok:
+            raise ApifyError(
+                f"Failed to abort run: {response.status_code}",
+                status_code=response.status_code,
+                body=response.text,
+            )
+
+        data = response.json().get("data", {})
+        return parse_run_info(data, data.get("actId", data.get("actorId", "")))
+
     def _parse_run_info(self, data: dict[str, Any], actor_id: str) -> RunInfo:
         """Parse API response into RunInfo."""
-        started_at = None
-        finished_at = None
+        return parse_run_info(data, actor_id)
 
-        if data.get("startedAt"):
-            try:
-                started_at = datetime.fromisoformat(
-                    data["startedAt"].replace("Z", "+00:00")
-                )
-            except (ValueError, AttributeError):
-                pass
 
-        if data.get("finishedAt"):
-            try:
-                finished_at = datetime.fromisoformat(
-                    data["finishedAt"].replace("Z", "+00:00")
-                )
-            except (ValueError, AttributeError):
-                pass
-
-        return RunInfo(
-            run_id=data.get("id", ""),
-            actor_id=actor_id or data.get("actId", ""),
-            status=data.get("status", "UNKNOWN"),
-            dataset_id=data.get("defaultDatasetId"),
-            started_at=started_at,
-            finished_at=finished_at,
-            error_message=data.get("statusMessage") if data.get("status") == "FAILED" else None,
-        )
+def dataset_page_size() -> int:
+    """Items per request when streaming datasets (APIFY_DATASET_PAGE_SIZE)."""
+    return int(getattr(settings, "APIFY_DATASET_PAGE_SIZE", DEFAULT_DATASET_PAGE_SIZE))
+
+
+def iter_dataset_pages(
+    client: ApifyClient,
+    dataset_id: str,
+    limit: int | None = None,
+    offset: int = 0,
+    page_size: int | None = None,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Stream a dataset as pages of at most page_size items.
+
+    Pages through client.fetch_dataset_items (limit/offset) until `limit`
+    items have been yielded (None = whole dataset) or the dataset ends, so
+    callers hold one page at a time instead of the whole dataset.
+    """
+    page_size = page_size or dataset_page_size()
+    remaining = limit
+
+    while remaining is None or remaining > 0:
+        want = page_size if remaining is None else min(page_size, remaining)
+        page = client.fetch_dataset_items(dataset_id, limit=want, offset=offset)
+        if not page:
+            return
+        yield page
+        offset += len(page)
+        if remaining is not None:
+            remaining -= len(page)
+        if len(page) < want:
+            return
+
+
+def start_run_params() -> dict[str, str] | None:
+    """Query params for POST /v2/acts/{actorId}/runs (completion webhook)."""
+    webhooks = run_webhooks_param()
+    return {"webhooks": webhooks} if webhooks else None
+
+
+def parse_run_info(data: dict[str, Any], actor_id: str) -> RunInfo:
+    """Parse an Apify run object (the "data" of run endpoints) into RunInfo."""
+    started_at = None
+    finished_at = None
+
+    if data.get("startedAt"):
+        try:
+            started_at = datetime.fromisoformat(
+                data["startedAt"].replace("Z", "+00:00")
+            )
+        except (ValueError, AttributeError):
+            pass
+
+    if data.get("finishedAt"):
+        try:
+            finished_at = datetime.fromisoformat(
+                data["finishedAt"].replace("Z", "+00:00")
+            )
+        except (ValueError, AttributeError):
+            pass
+
+    return RunInfo(
+        run_id=data.get("id", ""),
+        actor_id=actor_id or data.get("actId", ""),
+        status=data.get("status", "UNKNOWN"),
+        dataset_id=data.get("defaultDatasetId"),
+        started_at=started_at,
+        finished_at=finished_at,
+        error_message=data.get("statusMessage") if data.get("status") == "FAILED" else None,
+    )
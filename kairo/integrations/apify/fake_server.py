@@ -0,0 +1,271 @@
+"""
+Local fake Apify API v2 server.
+
+Serves the endpoints the Apify clients use, on 127.0.0.1 with an
+ephemeral port, so tests and benchmarks can exercise real HTTP (connection
+pooling, concurrency, polling) without spending Apify credits:
+
+- POST /v2/acts/{actor_id}/runs      -> start a run (RUNNING)
+- GET  /v2/actor-runs/{run_id}       -> run status; SUCCEEDED once
+                                        run_duration_s has elapsed
+                                        (honors ?waitForFinish=N)
+- POST /v2/actor-runs/{run_id}/abort -> ABORTED if still running
+- GET  /v2/datasets/{dataset_id}/items?limit=&offset=
+
+Usage:
+    with FakeApifyServer(run_duration_s=0.5) as server:
+        client = ApifyClient(token="test", base_url=server.base_url)
+        ...
+        server.stats["max_running"]  # peak concurrently running runs
+
+Not for production use.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qs, unquote, urlparse
+
+
+def default_items(actor_id: str, count: int) -> list[dict[str, Any]]:
+    """Generic dataset items (normalized by _normalize_generic_item)."""
+    slug = actor_id.replace("/", "-").replace("~", "-")
+    return [
+        {
+            "url": f"https://example.com/{slug}/{i}",
+            "text": f"{actor_id} item {i}",
+            "author": "fake-apify",
+        }
+        for i in range(count)
+    ]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # accept bursts of concurrent connections
+
+
+class FakeApifyServer:
+    """
+    Threaded in-process HTTP server mimicking Apify API v2.
+
+    Args:
+        run_duration_s: Seconds a run stays RUNNING before it terminates
+        items_per_run: Dataset size when items_for_actor is not given
+        items_for_actor: Optional callable(actor_id) -> list of dataset items
+        fail_actors: Actor IDs whose runs end FAILED
+        actor_run_duration_s: Per-actor run_duration_s overrides
+    """
+
+    def __init__(
+        self,
+        run_duration_s: float = 0.0,
+        items_per_run: int = 5,
+        items_for_actor: Callable[[str], list[dict[str, Any]]] | None = None,
+        fail_actors: set[str] | None = None,
+        actor_run_duration_s: dict[str, float] | None = None,
+    ):
+        self.run_duration_s = run_duration_s
+        self.items_per_run = items_per_run
+        self.items_for_actor = items_for_actor
+        self.fail_actors = set(fail_actors or ())
+        self.actor_run_duration_s = dict(actor_run_duration_s or {})
+
+        self._lock = threading.Lock()
+        self._runs: dict[str, dict[str, Any]] = {}
+        self._datasets: dict[str, list[dict[str, Any]]] = {}
+        self.stats: dict[str, int] = {
+            "runs_started": 0,
+            "status_requests": 0,
+            "dataset_requests": 0,
+            "max_running": 0,
+            "runs_aborted": 0,
+        }
+
+        self._httpd = _Server(("127.0.0.1", 0), self._handler_class())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeApifyServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "FakeApifyServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    # -------------------------------------------------------------------------
+    # Run bookkeeping (called from handler threads)
+    # -------------------------------------------------------------------------
+
+    def _start_run(self, actor_id: str) -> dict[str, Any]:
+        run_id = uuid.uuid4().hex[:17]
+        dataset_id = uuid.uuid4().hex[:17]
+        if self.items_for_actor is not None:
+            items = self.items_for_actor(actor_id)
+        else:
+            items = default_items(actor_id, self.items_per_run)
+
+        run = {
+            "id": run_id,
+            "actId": actor_id,
+            "defaultDatasetId": dataset_id,
+            "startedAt": _iso_now(),
+            "finishedAt": None,
+            "status": "RUNNING",
+            "_ends_at": time.monotonic() + self.actor_run_duration_s.get(actor_id, self.run_duration_s),
+        }
+        with self._lock:
+            self._runs[run_id] = run
+            self._datasets[dataset_id] = items
+            self.stats["runs_started"] += 1
+            self._refresh_locked()
+        return _public(run)
+
+    def finish_run(self, run_id: str) -> None:
+        """End a run now (e.g. before simulating its completion webhook)."""
+        with self._lock:
+            self._runs[run_id]["_ends_at"] = time.monotonic()
+            self._refresh_locked()
+
+    def _abort_run(self, run_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            self._refresh_locked()
+            run = self._runs.get(run_id)
+            if run is None:
+                return None
+            if run["status"] == "RUNNING":
+                run["status"] = "ABORTED"
+                run["finishedAt"] = _iso_now()
+                self.stats["runs_aborted"] += 1
+            return _public(run)
+
+    def _get_run(self, run_id: str, wait_for_finish_s: float = 0) -> dict[str, Any] | None:
+        """Run status; holds up to wait_for_finish_s for a RUNNING run, like Apify."""
+        deadline = time.monotonic() + wait_for_finish_s
+        with self._lock:
+            self.stats["status_requests"] += 1
+        while True:
+            with self._lock:
+                self._refresh_locked()
+                run = self._runs.get(run_id)
+                if run is None:
+                    return None
+                if run["status"] != "RUNNING" or time.monotonic() >= deadline:
+                    return _public(run)
+                wake_at = min(run["_ends_at"], deadline)
+            time.sleep(max(0.0, min(wake_at - time.monotonic(), 0.05)))
+
+    def _get_items(self, dataset_id: str, limit: int, offset: int) -> list | None:
+        with self._lock:
+            self.stats["dataset_requests"] += 1
+            items = self._datasets.get(dataset_id)
+            if items is None:
+                return None
+            return items[offset:offset + limit]
+
+    def _refresh_locked(self) -> None:
+        now = time.monotonic()
+        running = 0
+        for run in self._runs.values():
+            if run["status"] == "RUNNING" and now >= run["_ends_at"]:
+                run["status"] = "FAILED" if run["actId"] in self.fail_actors else "SUCCEEDED"
+                run["finishedAt"] = _iso_now()
+                if run["status"] == "FAILED":
+                    run["statusMessage"] = "Actor failed (fake server)"
+            if run["status"] == "RUNNING":
+                running += 1
+        self.stats["max_running"] = max(self.stats["max_running"], running)
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # noqa: A002 - stdlib signature
+                pass
+
+            def _send(self, status: int, payload: Any) -> None:
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _authorized(self) -> bool:
+                if self.headers.get("Authorization", "").startswith("Bearer "):
+                    return True
+                self._send(401, {"error": {"type": "token-not-provided"}})
+                return False
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                if not self._authorized():
+                    return
+                parts = urlparse(self.path).path.strip("/").split("/")
+                if len(parts) == 4 and parts[:2] == ["v2", "acts"] and parts[3] == "runs":
+                    self._send(201, {"data": server._start_run(unquote(parts[2]))})
+                elif len(parts) == 4 and parts[:2] == ["v2", "actor-runs"] and parts[3] == "abort":
+                    run = server._abort_run(parts[2])
+                    if run is None:
+                        self._send(404, {"error": {"type": "record-not-found"}})
+                    else:
+                        self._send(200, {"data": run})
+                else:
+                    self._send(404, {"error": {"type": "page-not-found"}})
+
+            def do_GET(self):
+                if not self._authorized():
+                    return
+                parsed = urlparse(self.path)
+                parts = parsed.path.strip("/").split("/")
+                query = parse_qs(parsed.query)
+                if len(parts) == 3 and parts[:2] == ["v2", "actor-runs"]:
+                    wait_s = float(query.get("waitForFinish", ["0"])[0])
+                    run = server._get_run(parts[2], wait_for_finish_s=wait_s)
+                    if run is None:
+                        self._send(404, {"error": {"type": "record-not-found"}})
+                    else:
+                        self._send(200, {"data": run})
+                elif len(parts) == 4 and parts[:2] == ["v2", "datasets"] and parts[3] == "items":
+                    limit = int(query.get("limit", ["1000"])[0])
+                    offset = int(query.get("offset", ["0"])[0])
+                    items = server._get_items(parts[2], limit, offset)
+                    if items is None:
+                        self._send(404, {"error": {"type": "record-not-found"}})
+                    else:
+                        self._send(200, items)
+                else:
+                    self._send(404, {"error": {"type": "page-not-found"}})
+
+        return Handler
+
+
+def _iso_now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+
+
+def _public(run: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in run.items() if not k.startswith("_")}
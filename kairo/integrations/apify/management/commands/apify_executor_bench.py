@@ -0,0 +1,104 @@
+"""
+Management command to benchmark SourceActivation executors.
+
+Usage:
+    python manage.py apify_executor_bench
+    python manage.py apify_executor_bench --recipes 40 --duration 2
+    python manage.py apify_executor_bench --executor async --json
+
+Runs a synthetic execution plan through the thread-pool executor and the
+async executor (SOURCEACTIVATION_EXECUTOR=async) against a local fake Apify
+server, and reports wall time and peak actor runs in flight for each
+(see kairo.sourceactivation.executor_bench).
+
+No Apify credits are spent: all traffic stays on 127.0.0.1.
+
+Failure Behavior:
+- Invalid arguments raise CommandError
+- An executor error or missing recipe results exit non-zero
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from kairo.sourceactivation.executor_bench import (
+    EXECUTORS,
+    ExecutorBenchConfig,
+    run_executor_bench,
+)
+
+
+class Command(BaseCommand):
+    """Benchmark thread-pool vs async SourceActivation executors."""
+
+    help = "Benchmark SourceActivation executors against a local fake Apify server"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--recipes",
+            type=int,
+            default=20,
+            help="Synthetic recipes in the execution plan (default: 20)",
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=1.0,
+            help="Seconds each fake actor run stays RUNNING (default: 1.0)",
+        )
+        parser.add_argument(
+            "--items",
+            type=int,
+            default=5,
+            help="Dataset items per run (default: 5)",
+        )
+        parser.add_argument(
+            "--executor",
+            choices=EXECUTORS,
+            action="append",
+            help="Executor to run; repeat for several (default: all)",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            default=False,
+            help="Print the report as JSON",
+        )
+
+    def handle(self, *args, **options):
+        if options["recipes"] < 1 or options["items"] < 0 or options["duration"] < 0:
+            raise CommandError("--recipes must be positive; --items and --duration non-negative")
+
+        config = ExecutorBenchConfig(
+            recipes=options["recipes"],
+            run_duration_s=options["duration"],
+            items_per_run=options["items"],
+            executors=tuple(options["executor"] or EXECUTORS),
+        )
+
+        if not options["json"]:
+            self.stdout.write(
+                f"Benchmarking {', '.join(config.executors)}: {config.recipes} recipes, "
+                f"{config.run_duration_s}s per actor run"
+            )
+
+        report = run_executor_bench(config)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report.to_dict(), indent=2))
+        else:
+            for timing in report.timings:
+                self.stdout.write(
+                    f"  {timing.executor}: {timing.elapsed_s:.2f}s, "
+                    f"peak in-flight runs={timing.max_inflight_runs}, "
+                    f"recipes={timing.recipes_executed}, items={timing.items}"
+                )
+                if timing.error:
+                    self.stdout.write(self.style.ERROR(f"    {timing.error}"))
+
+        if not report.ok:
+            raise CommandError("Benchmark failed: executor errors or missing recipe results")
+
+        if not options["json"]:
+            self.stdout.write(self.style.SUCCESS("Benchmark complete"))
@@ -0,0 +1,179 @@
+"""
+Adaptive polling policy for Apify actor runs.
+
+poll_run used to GET the run every 3s for up to 180s whatever the actor:
+slow for actors that finish in a second, and dozens of calls for a
+two-minute TikTok scrape. PollPolicy replaces the fixed interval with:
+
+1. Long-poll: each status request carries waitForFinish=N (Apify holds the
+   request until the run finishes or N seconds pass, max 60). A run is
+   seen as soon as it finishes, with one call per minute at most.
+2. Backoff: when long-poll is off (APIFY_WAIT_FOR_FINISH_S=0, or webhooks
+   are configured so waits must stay interruptible), sleeps start at
+   APIFY_POLL_INITIAL_S and grow by APIFY_POLL_BACKOFF up to APIFY_POLL_MAX_S.
+3. Duration hints: the first sleep is the actor's median run time, learned
+   from succeeded ApifyRun rows, so a slow actor is checked once near its
+   expected finish instead of repeatedly from the start.
+
+Webhook completion (kairo.integrations.apify.webhooks) resolves waits
+before any of the above when APIFY_WEBHOOK_URL is configured.
+
+Passing an explicit interval_s to poll_run keeps the old fixed interval.
+"""
+
+from __future__ import annotations
+
+import logging
+import statistics
+from dataclasses import dataclass
+from typing import Iterator
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INITIAL_S = 1.0
+DEFAULT_POLL_MAX_S = 15.0
+DEFAULT_POLL_BACKOFF = 2.0
+DEFAULT_WAIT_FOR_FINISH_S = 60
+
+# Apify caps waitForFinish at 60 seconds
+MAX_WAIT_FOR_FINISH_S = 60
+
+# Duration hints: sample size and cache lifetime
+DURATION_HINT_SAMPLE = 20
+DEFAULT_DURATION_HINT_TTL_S = 3600
+DURATION_HINT_PREFIX = "apify_duration_hint:v1"
+
+# Cached when an actor has no usable history (cache.get returns None on miss)
+_NO_HINT = 0.0
+
+
+def poll_initial_s() -> float:
+    return float(getattr(settings, "APIFY_POLL_INITIAL_S", DEFAULT_POLL_INITIAL_S))
+
+
+def poll_max_s() -> float:
+    return float(getattr(settings, "APIFY_POLL_MAX_S", DEFAULT_POLL_MAX_S))
+
+
+def poll_backoff() -> float:
+    return float(getattr(settings, "APIFY_POLL_BACKOFF", DEFAULT_POLL_BACKOFF))
+
+
+def wait_for_finish_s() -> int:
+    """Long-poll seconds per status request (0 disables long-poll)."""
+    value = int(getattr(settings, "APIFY_WAIT_FOR_FINISH_S", DEFAULT_WAIT_FOR_FINISH_S))
+    return max(0, min(value, MAX_WAIT_FOR_FINISH_S))
+
+
+def duration_hint_ttl() -> int:
+    return int(getattr(settings, "APIFY_DURATION_HINT_TTL_S", DEFAULT_DURATION_HINT_TTL_S))
+
+
+# =============================================================================
+# DURATION HINTS
+# =============================================================================
+
+
+def get_duration_hint_key(actor_id: str) -> str:
+    return f"{DURATION_HINT_PREFIX}:{actor_id}"
+
+
+def expected_run_duration(actor_id: str) -> float | None:
+    """
+    Median duration (seconds) of the actor's recent succeeded runs.
+
+    Reads the last DURATION_HINT_SAMPLE ApifyRun rows with both timestamps,
+    cached for APIFY_DURATION_HINT_TTL_S. Returns None without history or
+    on any error (polling then starts at APIFY_POLL_INITIAL_S).
+    """
+    key = get_duration_hint_key(actor_id)
+    try:
+        cached = cache.get(key)
+    except Exception as e:
+        logger.warning("Failed to read duration hint for %s: %s", actor_id, e)
+        cached = None
+    if cached is not None:
+        return cached or None
+
+    hint = _NO_HINT
+    try:
+        from kairo.integrations.apify.models import ApifyRun, ApifyRunStatus
+
+        rows = (
+            ApifyRun.objects.filter(
+                actor_id=actor_id,
+                status=ApifyRunStatus.SUCCEEDED,
+                started_at__isnull=False,
+                finished_at__isnull=False,
+            )
+            .order_by("-created_at")
+            .values_list("started_at", "finished_at")[:DURATION_HINT_SAMPLE]
+        )
+        durations = [
+            (finished - started).total_seconds()
+            for started, finished in rows
+            if finished > started
+        ]
+        if durations:
+            hint = statistics.median(durations)
+    except Exception as e:
+        logger.warning("Failed to compute duration hint for %s: %s", actor_id, e)
+        return None
+
+    try:
+        cache.set(key, hint, timeout=duration_hint_ttl())
+    except Exception as e:
+        logger.warning("Failed to cache duration hint for %s: %s", actor_id, e)
+
+    return hint or None
+
+
+# =============================================================================
+# POLICY
+# =============================================================================
+
+
+@dataclass
+class PollPolicy:
+    """How poll_run waits between status checks."""
+    initial_s: float
+    max_s: float
+    backoff: float
+    wait_for_finish_s: int = 0  # 0 = no long-poll
+    expected_s: float | None = None
+
+    @classmethod
+    def fixed(cls, interval_s: float) -> "PollPolicy":
+        """Legacy behavior: plain GETs every interval_s."""
+        return cls(initial_s=interval_s, max_s=interval_s, backoff=1.0)
+
+    @classmethod
+    def adaptive(cls, actor_id: str | None = None) -> "PollPolicy":
+        """Policy from settings, with a duration hint when actor_id is known."""
+        from kairo.integrations.apify.webhooks import webhooks_enabled
+
+        return cls(
+            initial_s=poll_initial_s(),
+            max_s=poll_max_s(),
+            backoff=poll_backoff(),
+            # A held request can't be woken by a webhook, so webhooks
+            # switch waiting to interruptible sleeps.
+            wait_for_finish_s=0 if webhooks_enabled() else wait_for_finish_s(),
+            expected_s=expected_run_duration(actor_id) if actor_id else None,
+        )
+
+    def delays(self) -> Iterator[float]:
+        """Sleep before each re-check: expected duration first, then backoff."""
+        if self.expected_s:
+            yield min(max(self.expected_s, self.initial_s), self.max_s)
+        delay = self.initial_s
+        while True:
+            yield delay
+            delay = min(delay * self.backoff, self.max_s)
+
+    def long_poll_s(self, remaining_s: float) -> int:
+        """waitForFinish for the next status request (never past the timeout)."""
+        return int(max(0, min(self.wait_for_finish_s, remaining_s)))
@@ -0,0 +1,15 @@
+"""
+URL configuration for Apify integration endpoints.
+
+Mounted at /api/integrations/apify/ in kairo/urls.py.
+"""
+
+from django.urls import path
+
+from kairo.integrations.apify import views
+
+app_name = "apify"
+
+urlpatterns = [
+    path("webhook/", views.apify_run_webhook, name="run_webhook"),
+]
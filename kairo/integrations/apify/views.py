@@ -0,0 +1,64 @@
+"""
+Apify webhook receiver.
+
+POST /api/integrations/apify/webhook/
+
+Receives the ad-hoc run webhooks attached by start_actor_run (see
+kairo.integrations.apify.webhooks) and records terminal runs so poll_run
+waiters resolve immediately.
+
+Access control:
+- X-Kairo-Webhook-Secret header must match APIFY_WEBHOOK_SECRET
+- Returns 404 if the secret is unset, missing or wrong
+- No user JWT (exempt in SupabaseAuthMiddleware)
+"""
+
+import hmac
+import json
+import logging
+
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from kairo.integrations.apify.webhooks import (
+    TERMINAL_EVENT_TYPES,
+    WEBHOOK_SECRET_HEADER,
+    record_finished_run,
+    webhook_secret,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@csrf_exempt
+@require_POST
+def apify_run_webhook(request: HttpRequest) -> HttpResponse:
+    """Record a finished Apify run from its completion webhook."""
+    expected_secret = webhook_secret()
+    provided_secret = request.headers.get(WEBHOOK_SECRET_HEADER, "")
+    if not expected_secret or not hmac.compare_digest(provided_secret, expected_secret):
+        return HttpResponse(status=404)
+
+    try:
+        payload = json.loads(request.body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+    resource = payload.get("resource") if isinstance(payload, dict) else None
+    if not isinstance(resource, dict) or not resource.get("id"):
+        return JsonResponse({"error": "Missing resource.id"}, status=400)
+
+    event_type = payload.get("eventType", "")
+    if event_type not in TERMINAL_EVENT_TYPES:
+        logger.info("Ignoring Apify webhook event %s for run %s", event_type, resource["id"])
+        return JsonResponse({"recorded": False})
+
+    record_finished_run(resource)
+    logger.info(
+        "APIFY_WEBHOOK run_id=%s event=%s status=%s",
+        resource["id"],
+        event_type,
+        resource.get("status"),
+    )
+    return JsonResponse({"recorded": True})
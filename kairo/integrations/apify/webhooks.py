@@ -0,0 +1,145 @@
+"""
+Apify run-completion webhooks.
+
+When APIFY_WEBHOOK_URL and APIFY_WEBHOOK_SECRET are set, start_actor_run
+attaches an ad-hoc webhook to every run (Apify's `webhooks` query
+parameter). On a terminal run event Apify POSTs the run object to
+/api/integrations/apify/webhook/ (views.apify_run_webhook), which records
+it here; poll_run waiters pick it up immediately instead of waiting for
+their next status request.
+
+Finished runs are stored in the Django cache (shared via Redis in
+production), so a webhook received by a web process resolves waits in job
+workers. Waiters in the receiving process are woken through a local Event;
+waiters elsewhere re-check the cache every WEBHOOK_CHECK_INTERVAL_S.
+
+All cache errors are swallowed: a lost webhook only means poll_run falls
+back to its regular status requests.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import threading
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_SECRET_HEADER = "X-Kairo-Webhook-Secret"
+
+TERMINAL_EVENT_TYPES = [
+    "ACTOR.RUN.SUCCEEDED",
+    "ACTOR.RUN.FAILED",
+    "ACTOR.RUN.ABORTED",
+    "ACTOR.RUN.TIMED_OUT",
+]
+
+FINISHED_RUN_PREFIX = "apify_run_finished:v1"
+FINISHED_RUN_TTL_S = 3600
+
+# How often waiters re-check the shared cache (seconds)
+WEBHOOK_CHECK_INTERVAL_S = 0.25
+
+
+def webhook_url() -> str:
+    return getattr(settings, "APIFY_WEBHOOK_URL", "")
+
+
+def webhook_secret() -> str:
+    return getattr(settings, "APIFY_WEBHOOK_SECRET", "")
+
+
+def webhooks_enabled() -> bool:
+    return bool(webhook_url() and webhook_secret())
+
+
+def run_webhooks_param() -> str | None:
+    """
+    Value for the `webhooks` query parameter of POST /v2/acts/{actor}/runs.
+
+    Base64-encoded JSON array of ad-hoc webhook definitions, or None when
+    webhooks are not configured.
+    """
+    if not webhooks_enabled():
+        return None
+    definitions = [
+        {
+            "eventTypes": TERMINAL_EVENT_TYPES,
+            "requestUrl": webhook_url(),
+            "headersTemplate": json.dumps({WEBHOOK_SECRET_HEADER: webhook_secret()}),
+        }
+    ]
+    return base64.b64encode(json.dumps(definitions).encode()).decode()
+
+
+# =============================================================================
+# FINISHED-RUN REGISTRY
+# =============================================================================
+
+
+_waiters_lock = threading.Lock()
+_waiters: dict[str, set[threading.Event]] = {}
+
+
+def get_finished_run_key(run_id: str) -> str:
+    return f"{FINISHED_RUN_PREFIX}:{run_id}"
+
+
+def record_finished_run(run_data: dict[str, Any]) -> None:
+    """Store a terminal run object (webhook `resource`) and wake local waiters."""
+    run_id = run_data.get("id")
+    if not run_id:
+        return
+    try:
+        cache.set(get_finished_run_key(run_id), run_data, timeout=FINISHED_RUN_TTL_S)
+    except Exception as e:
+        logger.warning("Failed to record finished Apify run %s: %s", run_id, e)
+
+    with _waiters_lock:
+        events = list(_waiters.get(run_id, ()))
+    for event in events:
+        event.set()
+
+
+def get_finished_run(run_id: str) -> dict[str, Any] | None:
+    """Run object recorded by a webhook, or None."""
+    try:
+        return cache.get(get_finished_run_key(run_id))
+    except Exception as e:
+        logger.warning("Failed to read finished Apify run %s: %s", run_id, e)
+        return None
+
+
+def wait_for_finished_run(run_id: str, timeout_s: float) -> dict[str, Any] | None:
+    """
+    Block up to timeout_s for a webhook about run_id.
+
+    Returns the recorded run object, or None once timeout_s has passed.
+    """
+    event = threading.Event()
+    with _waiters_lock:
+        _waiters.setdefault(run_id, set()).add(event)
+
+    deadline = time.monotonic() + timeout_s
+    try:
+        while True:
+            run_data = get_finished_run(run_id)
+            if run_data is not None:
+                return run_data
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            event.wait(min(WEBHOOK_CHECK_INTERVAL_S, remaining))
+    finally:
+        with _waiters_lock:
+            events = _waiters.get(run_id)
+            if events is not None:
+                events.discard(event)
+                if not events:
+                    del _waiters[run_id]
@@ -12,6 +12,11 @@ How it works:
 3. Look up or create the corresponding User in our database
 4. Attach the user to request.kairo_user
 
+Verified tokens are cached per process (token digest -> user) until the
+token's exp, capped at SUPABASE_AUTH_CACHE_TTL_S. Repeat requests with the
+same token (polling clients) skip jwt.decode and the user lookup entirely;
+the lookup and any email-drift UPDATE run once per token.
+
 Excluded paths (no auth required):
 - /health/ - Health check endpoint
 - /api/auth/ - Auth endpoints (login, signup callbacks)
@@ -20,7 +25,12 @@ Excluded paths (no auth required):
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 import jwt
@@ -37,6 +47,11 @@ logger = logging.getLogger(__name__)
 AUTH_EXEMPT_PATHS = [
     "/health/",
     "/api/auth/",
+    # Queue metrics are scraped by Prometheus, which has no user JWT;
+    # the view still requires X-Kairo-Internal-Token
+    "/hero/internal/queues/",
+    # Called by Apify; the view requires X-Kairo-Webhook-Secret
+    "/api/integrations/apify/webhook/",
 ]
 
 # Paths that are exempt in development only
@@ -44,6 +59,79 @@ DEV_EXEMPT_PATHS = [
     "/admin/",
 ]
 
+DEFAULT_AUTH_CACHE_SIZE = 1024
+DEFAULT_AUTH_CACHE_TTL_S = 300
+
+
+# =============================================================================
+# VERIFIED-TOKEN CACHE
+# =============================================================================
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified tokens: digest -> (expires_at, user).
+
+    Keys are SHA-256 digests of (JWT secret, token), so raw tokens are never
+    held and rotating the secret retires every entry. Entries expire at the
+    token's exp claim, or after SUPABASE_AUTH_CACHE_TTL_S if sooner, so
+    changes to the user row are picked up within that window.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+
+    @staticmethod
+    def digest(jwt_secret: str, token: str) -> str:
+        return hashlib.sha256(f"{jwt_secret}\x00{token}".encode()).hexdigest()
+
+    def get(self, digest: str):
+        """Cached user for a token digest, or None."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if expires_at <= time.time():
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+        # Each request gets its own instance; views may modify it
+        return copy.copy(user)
+
+    def set(self, digest: str, user, token_exp: float | None) -> None:
+        ttl = float(getattr(settings, "SUPABASE_AUTH_CACHE_TTL_S", DEFAULT_AUTH_CACHE_TTL_S))
+        max_size = int(getattr(settings, "SUPABASE_AUTH_CACHE_SIZE", DEFAULT_AUTH_CACHE_SIZE))
+        if ttl <= 0 or max_size <= 0:
+            return
+
+        expires_at = time.time() + ttl
+        if token_exp is not None:
+            expires_at = min(expires_at, token_exp)
+
+        with self._lock:
+            self._entries[digest] = (expires_at, copy.copy(user))
+            self._entries.move_to_end(digest)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_token_cache = VerifiedTokenCache()
+
+
+def clear_token_cache() -> None:
+    """Forget all verified tokens in this process (tests, user deactivation)."""
+    _token_cache.clear()
+
 
 class SupabaseAuthMiddleware:
     """
@@ -111,6 +199,11 @@ class SupabaseAuthMiddleware:
             # Supabase JWTs are signed with the project's JWT secret
             raise AuthenticationError("SUPABASE_JWT_SECRET not configured")
 
+        digest = VerifiedTokenCache.digest(jwt_secret, token)
+        cached_user = _token_cache.get(digest)
+        if cached_user is not None:
+            return cached_user
+
         try:
             # Decode the JWT
             # Supabase uses HS256 by default
@@ -145,10 +238,17 @@ class SupabaseAuthMiddleware:
         if created:
             logger.info("Created new user from Supabase: %s", email)
         elif email and user.email != email:
-            # Update email if it changed in Supabase
+            # Update email if it changed in Supabase. Conditional UPDATE: a
+            # concurrent request (or another process) syncing the same
+            # change writes nothing.
+            from django.utils import timezone
+
+            User.objects.filter(pk=user.pk).exclude(email=email).update(
+                email=email, updated_at=timezone.now()
+            )
             user.email = email
-            user.save(update_fields=["email", "updated_at"])
 
+        _token_cache.set(digest, user, payload.get("exp"))
         return user
 
     def _unauthorized_response(self, message: str) -> JsonResponse:
@@ -100,6 +100,9 @@ class RequestTimingMiddleware:
         # Only for latest snapshot and compile status endpoints
         if "/brandbrain/latest" not in path and "/compile/" not in path:
             return None
+        # SSE streams (compile/:id/events) have no buffered body
+        if response.streaming:
+            return None
 
         try:
             body = json.loads(response.content)
@@ -307,6 +307,57 @@ EXTERNAL_SIGNALS_MODE = os.environ.get("EXTERNAL_SIGNALS_MODE", "fixtures")
 APIFY_TOKEN = os.environ.get("APIFY_TOKEN", "")
 APIFY_BASE_URL = os.environ.get("APIFY_BASE_URL", "https://api.apify.com")
 
+# APIFY_DATASET_PAGE_SIZE: items per request when streaming datasets
+# (iter_dataset_pages); bounds per-page memory in ingestion and recipes.
+APIFY_DATASET_PAGE_SIZE = int(os.environ.get("APIFY_DATASET_PAGE_SIZE", "200"))
+
+# Async Apify client (kairo.integrations.apify.async_client).
+# APIFY_MAX_CONNECTIONS: httpx connection pool size per activation.
+# APIFY_MAX_INFLIGHT_RUNS: max recipes (actor runs) in flight per activation
+# when SOURCEACTIVATION_EXECUTOR=async.
+# SOURCEACTIVATION_EXECUTOR: "threads" (ThreadPoolExecutor, default) or
+# "async" (one event loop; polling runs cost a coroutine, not a thread).
+APIFY_MAX_CONNECTIONS = int(os.environ.get("APIFY_MAX_CONNECTIONS", "20"))
+APIFY_MAX_INFLIGHT_RUNS = int(os.environ.get("APIFY_MAX_INFLIGHT_RUNS", "32"))
+SOURCEACTIVATION_EXECUTOR = os.environ.get("SOURCEACTIVATION_EXECUTOR", "threads")
+
+# Recipe DAG scheduling (kairo/sourceactivation/scheduler.py): max recipes of
+# one platform in flight per activation. Format: "<platform>:<limit>,..."
+# Unlisted platforms are bounded only by the executor width.
+SOURCEACTIVATION_PLATFORM_CONCURRENCY = {
+    platform.strip(): int(limit)
+    for platform, _, limit in (
+        entry.partition(":")
+        for entry in os.environ.get(
+            "SOURCEACTIVATION_PLATFORM_CONCURRENCY",
+            "instagram:2,tiktok:3,youtube:2,linkedin:2",
+        ).split(",")
+        if entry.strip()
+    )
+}
+
+# Early cancellation (kairo/sourceactivation/budget.py evidence_quota_met):
+# once collected evidence meets the quota, live activation drops pending
+# recipes and aborts in-flight Apify runs. "false" waits for every recipe.
+SOURCEACTIVATION_EARLY_CANCEL = os.environ.get("SOURCEACTIVATION_EARLY_CANCEL", "true").lower() in ("true", "1", "yes")
+
+# Adaptive run polling (kairo.integrations.apify.polling).
+# APIFY_WAIT_FOR_FINISH_S: waitForFinish long-poll per status request
+# (max 60, 0 disables). Without long-poll, sleeps start at the actor's median
+# duration from ApifyRun history, then APIFY_POLL_INITIAL_S, growing by
+# APIFY_POLL_BACKOFF up to APIFY_POLL_MAX_S.
+APIFY_WAIT_FOR_FINISH_S = int(os.environ.get("APIFY_WAIT_FOR_FINISH_S", "60"))
+APIFY_POLL_INITIAL_S = float(os.environ.get("APIFY_POLL_INITIAL_S", "1.0"))
+APIFY_POLL_MAX_S = float(os.environ.get("APIFY_POLL_MAX_S", "15.0"))
+APIFY_POLL_BACKOFF = float(os.environ.get("APIFY_POLL_BACKOFF", "2.0"))
+APIFY_DURATION_HINT_TTL_S = int(os.environ.get("APIFY_DURATION_HINT_TTL_S", "3600"))
+
+# Run-completion webhooks (kairo.integrations.apify.webhooks).
+# APIFY_WEBHOOK_URL: public URL of /api/integrations/apify/webhook/.
+# Both must be set to enable; runs then finish as soon as Apify calls back.
+APIFY_WEBHOOK_URL = os.environ.get("APIFY_WEBHOOK_URL", "")
+APIFY_WEBHOOK_SECRET = os.environ.get("APIFY_WEBHOOK_SECRET", "")
+
 
 # =============================================================================
 # OPPORTUNITIES v2 GUARDRAILS (PR-0)
@@ -395,6 +446,94 @@ else:
 # PR-7: TodayBoard cache TTL (default 6 hours per PRD §D.4)
 OPPORTUNITIES_CACHE_TTL_S = int(os.environ.get("OPPORTUNITIES_CACHE_TTL_S", "21600"))
 
+# Cached TodayBoards are stored as the final response JSON and served without
+# Pydantic. Set to re-validate every cache hit against TodayBoardDTO
+# (default: on in DEBUG only).
+TODAY_BOARD_CACHE_VALIDATE = os.environ.get(
+    "TODAY_BOARD_CACHE_VALIDATE", str(DEBUG)
+).lower() in ("true", "1", "yes")
+
+# On a TodayBoard cache miss one request per brand rebuilds from the DB;
+# concurrent requests wait up to this long (seconds) for its cache write
+# before rebuilding themselves.
+TODAY_BOARD_REBUILD_WAIT_S = float(os.environ.get("TODAY_BOARD_REBUILD_WAIT_S", "2.0"))
+
+# Stale-while-revalidate (GET /today?swr=1 or X-Kairo-SWR: 1): the last READY
+# board is kept this long (seconds) after invalidation, to be served marked
+# stale while a regenerate job runs. Default 7 days.
+TODAY_BOARD_STALE_TTL_S = int(os.environ.get("TODAY_BOARD_STALE_TTL_S", "604800"))
+
+# BrandBrain read-path cache (GET /brandbrain/latest, GET /compile/:id/status).
+# The compile worker writes through on every state transition; the TTL only
+# bounds memory (snapshots are immutable). See kairo/brandbrain/cache.py.
+BRANDBRAIN_READ_CACHE_TTL_S = int(os.environ.get("BRANDBRAIN_READ_CACHE_TTL_S", "21600"))
+
+# SourceActivation query plans, keyed by a hash of the snapshot fields the
+# planner prompt uses (kairo/sourceactivation/query_planner.py). Unchanged
+# inputs reuse the plan instead of calling the LLM. Default 7 days.
+QUERY_PLAN_CACHE_TTL_S = int(os.environ.get("QUERY_PLAN_CACHE_TTL_S", "604800"))
+
+# TikTok subtitle fetching (kairo/sourceactivation/subtitles.py). Subtitle
+# links are fetched per normalized batch over one pooled session, at most
+# TIKTOK_SUBTITLE_CONCURRENCY at a time, each bounded by
+# TIKTOK_SUBTITLE_TIMEOUT_S and the batch by TIKTOK_SUBTITLE_BUDGET_S.
+# Text is cached by video id + language. Default TTL 7 days.
+TIKTOK_SUBTITLE_CONCURRENCY = int(os.environ.get("TIKTOK_SUBTITLE_CONCURRENCY", "8"))
+TIKTOK_SUBTITLE_TIMEOUT_S = float(os.environ.get("TIKTOK_SUBTITLE_TIMEOUT_S", "10"))
+TIKTOK_SUBTITLE_BUDGET_S = float(os.environ.get("TIKTOK_SUBTITLE_BUDGET_S", "30"))
+TIKTOK_SUBTITLE_CACHE_TTL_S = int(os.environ.get("TIKTOK_SUBTITLE_CACHE_TTL_S", "604800"))
+
+
+# =============================================================================
+# JOB QUEUE WAKEUP NOTIFICATIONS, FAIR SCHEDULING, METRICS & RETENTION
+# =============================================================================
+# Enqueue publishes a wakeup so idle workers start immediately instead of
+# waiting out their poll interval. See kairo/core/job_notify.py.
+# - "auto": redis if REDIS_URL, else postgres (LISTEN/NOTIFY) on PostgreSQL,
+#   else in-process
+# - "redis" | "postgres" | "inprocess" | "none" (pure polling)
+JOB_NOTIFY_BACKEND = os.environ.get("JOB_NOTIFY_BACKEND", "auto")
+
+# LISTEN needs a session-level connection. If DATABASE_URL goes through a
+# transaction-mode pooler (e.g. port 6543), point this at a direct connection.
+JOB_NOTIFY_DATABASE_URL = os.environ.get("JOB_NOTIFY_DATABASE_URL", "")
+
+# Per-tenant weights for fair claiming within a priority lane
+# (kairo/core/job_scheduling.py). Format: "<tenant_uuid>:<weight>,..."
+# Unlisted tenants weigh 1.0; a weight of 2 gets twice the claims.
+JOB_TENANT_WEIGHTS = {
+    tenant_id.strip(): float(weight)
+    for tenant_id, _, weight in (
+        entry.partition(":")
+        for entry in os.environ.get("JOB_TENANT_WEIGHTS", "").split(",")
+        if entry.strip()
+    )
+}
+
+# Window (minutes) of recent claims used to decide which tenant is owed
+# the next job in a lane
+JOB_FAIR_SHARE_WINDOW_MINUTES = int(os.environ.get("JOB_FAIR_SHARE_WINDOW_MINUTES", "15"))
+
+# Queue metrics storage (kairo/core/job_metrics.py), served at
+# /hero/internal/queues/metrics/. "auto": redis if REDIS_URL (aggregates
+# web + worker processes), else in-process. "inprocess" | "redis" | "none".
+JOB_METRICS_BACKEND = os.environ.get("JOB_METRICS_BACKEND", "auto")
+
+# Terminal jobs (succeeded/failed/insufficient_evidence) older than this many
+# days are moved to the job_archive table by `manage.py archive_jobs`
+# (kairo/core/job_retention.py), in batches of JOB_ARCHIVE_BATCH_SIZE.
+JOB_RETENTION_DAYS = int(os.environ.get("JOB_RETENTION_DAYS", "30"))
+JOB_ARCHIVE_BATCH_SIZE = int(os.environ.get("JOB_ARCHIVE_BATCH_SIZE", "500"))
+
+# Job progress events for the SSE endpoints (kairo/core/job_events.py,
+# kairo/core/job_stream.py). "auto": redis (PUBLISH/SUBSCRIBE) if REDIS_URL,
+# else in-process. "redis" | "inprocess" | "none".
+# Streams re-read job state after JOB_EVENTS_POLL_S without an event and
+# close after JOB_EVENTS_STREAM_MAX_S (EventSource reconnects).
+JOB_EVENTS_BACKEND = os.environ.get("JOB_EVENTS_BACKEND", "auto")
+JOB_EVENTS_POLL_S = float(os.environ.get("JOB_EVENTS_POLL_S", "5.0"))
+JOB_EVENTS_STREAM_MAX_S = float(os.environ.get("JOB_EVENTS_STREAM_MAX_S", "600"))
+
 
 # =============================================================================
 # SUPABASE AUTHENTICATION (Phase 1)
@@ -409,6 +548,12 @@ SUPABASE_JWT_SECRET = os.environ.get("SUPABASE_JWT_SECRET", "")
 # For local development, auth can be disabled
 AUTH_DISABLED = os.environ.get("AUTH_DISABLED", "false").lower() in ("true", "1", "yes")
 
+# Verified JWTs are cached per process (kairo/middleware/supabase_auth.py)
+# until their exp, capped at SUPABASE_AUTH_CACHE_TTL_S seconds (0 disables).
+# SUPABASE_AUTH_CACHE_SIZE bounds the number of cached tokens (LRU).
+SUPABASE_AUTH_CACHE_TTL_S = int(os.environ.get("SUPABASE_AUTH_CACHE_TTL_S", "300"))
+SUPABASE_AUTH_CACHE_SIZE = int(os.environ.get("SUPABASE_AUTH_CACHE_SIZE", "1024"))
+
 
 # =============================================================================
 # API KEY ENCRYPTION (Phase 2: BYOK)
@@ -416,3 +561,9 @@ AUTH_DISABLED = os.environ.get("AUTH_DISABLED", "false").lower() in ("true", "1"
 # Fernet key for encrypting user API keys at rest.
 # Generate with: python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"
 ENCRYPTION_KEY = os.environ.get("ENCRYPTION_KEY", "")
+
+# Per-user LLM / Apify clients are cached per process (kairo/users/clients.py)
+# so keys are not decrypted on every job. Key updates invalidate immediately;
+# the TTL (seconds) bounds reuse otherwise.
+BYOK_CLIENT_CACHE_TTL_S = int(os.environ.get("BYOK_CLIENT_CACHE_TTL_S", "900"))
+BYOK_CLIENT_CACHE_MAX_ENTRIES = int(os.environ.get("BYOK_CLIENT_CACHE_MAX_ENTRIES", "256"))
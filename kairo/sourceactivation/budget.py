@@ -441,3 +441,33 @@ def should_continue_recipes(evidence_items: list) -> bool:
             return False
 
     return True
+
+
+def evidence_quota_met(evidence_items: list) -> bool:
+    """
+    Check if evidence collected so far makes in-flight recipes unnecessary.
+
+    Evaluated by the parallel executors after every recipe result. The quota
+    is met when should_continue_recipes() says stop AND the synthesis
+    quality gates (kairo.hero.services.evidence_quality) already pass, so
+    cancelling never trades away a gate that more evidence could have met.
+    Once met, live.py aborts the remaining Apify runs.
+
+    Disabled by SOURCEACTIVATION_EARLY_CANCEL=false (always wait for every
+    recipe).
+
+    Args:
+        evidence_items: List of evidence items collected so far
+
+    Returns:
+        True if the remaining recipes should be cancelled
+    """
+    if not _get_bool_env("SOURCEACTIVATION_EARLY_CANCEL", True):
+        return False
+
+    if should_continue_recipes(evidence_items):
+        return False
+
+    from kairo.hero.services.evidence_quality import check_evidence_quality
+
+    return check_evidence_quality(evidence_items).passed
@@ -0,0 +1,159 @@
+"""
+SourceActivation Executor Benchmark Harness.
+
+Runs the same synthetic execution plan through the thread-pool executor
+(_execute_recipes_parallel + ApifyClient) and the async executor
+(run_recipes_async + AsyncApifyClient) against a local FakeApifyServer,
+measuring:
+- wall time per executor
+- peak number of actor runs in flight (as seen by the server)
+- items collected
+
+Used by the apify_executor_bench management command. No Apify credits are
+spent: every request goes to 127.0.0.1.
+
+Synthetic recipes (BENCH-0..BENCH-N) are registered in RECIPE_REGISTRY for
+the duration of the run and removed afterwards.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+
+from django.test.utils import override_settings
+
+EXECUTORS = ("threads", "async")
+
+BENCH_RECIPE_PREFIX = "BENCH-"
+
+
+# =============================================================================
+# RESULT TYPES
+# =============================================================================
+
+
+@dataclass
+class ExecutorBenchConfig:
+    """Parameters for one benchmark run."""
+    recipes: int = 20
+    run_duration_s: float = 1.0  # fake actor run time
+    items_per_run: int = 5
+    executors: tuple[str, ...] = EXECUTORS
+
+
+@dataclass
+class ExecutorTiming:
+    """Measured results for one executor."""
+    executor: str
+    elapsed_s: float = 0.0
+    max_inflight_runs: int = 0
+    recipes_executed: int = 0
+    items: int = 0
+    error: str | None = None
+
+
+@dataclass
+class ExecutorBenchReport:
+    """Measured results of one benchmark run."""
+    recipes: int
+    run_duration_s: float
+    timings: list[ExecutorTiming] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return all(t.error is None and t.recipes_executed == self.recipes for t in self.timings)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["ok"] = self.ok
+        return data
+
+
+# =============================================================================
+# HARNESS
+# =============================================================================
+
+
+def _bench_recipes(count: int) -> dict:
+    from kairo.sourceactivation.recipes import RecipeSpec
+
+    return {
+        f"{BENCH_RECIPE_PREFIX}{i}": RecipeSpec(
+            recipe_id=f"{BENCH_RECIPE_PREFIX}{i}",
+            platform="bench",
+            description=f"Executor benchmark recipe {i}",
+            stage1_actor=f"kairo-bench~actor-{i}",
+            stage1_input_builder=lambda seed_pack: {"query": seed_pack.brand_name},
+            stage1_result_limit=50,
+        )
+        for i in range(count)
+    }
+
+
+def _run_executor(executor: str, server, plan: list[str], seed_pack) -> ExecutorTiming:
+    from kairo.integrations.apify.client import ApifyClient
+    from kairo.sourceactivation import live
+
+    timing = ExecutorTiming(executor=executor)
+    server.stats["max_running"] = 0
+    brand_id = seed_pack.brand_id
+    run_id = uuid.uuid4()
+
+    start = time.monotonic()
+    try:
+        if executor == "async":
+            result = live.run_recipes_async(
+                brand_id=brand_id,
+                seed_pack=seed_pack,
+                run_id=run_id,
+                execution_plan=plan,
+                token="bench-token",
+                base_url=server.base_url,
+            )
+        else:
+            result = live._execute_recipes_parallel(
+                brand_id=brand_id,
+                seed_pack=seed_pack,
+                run_id=run_id,
+                execution_plan=plan,
+                client=ApifyClient(token="bench-token", base_url=server.base_url),
+            )
+    except Exception as e:
+        timing.error = str(e)
+        return timing
+    timing.elapsed_s = time.monotonic() - start
+
+    timing.max_inflight_runs = server.stats["max_running"]
+    timing.recipes_executed = len(result.recipes_executed)
+    timing.items = len(result.items)
+    if result.error:
+        timing.error = result.error
+    return timing
+
+
+def run_executor_bench(config: ExecutorBenchConfig) -> ExecutorBenchReport:
+    """Run the benchmark and return a report."""
+    from kairo.integrations.apify.fake_server import FakeApifyServer
+    from kairo.sourceactivation.recipes import RECIPE_REGISTRY
+    from kairo.sourceactivation.types import SeedPack
+
+    report = ExecutorBenchReport(recipes=config.recipes, run_duration_s=config.run_duration_s)
+    recipes = _bench_recipes(config.recipes)
+    plan = list(recipes)
+    seed_pack = SeedPack(brand_id=uuid.uuid4(), brand_name="Bench Brand")
+
+    RECIPE_REGISTRY.update(recipes)
+    try:
+        with override_settings(APIFY_ENABLED=True), FakeApifyServer(
+            run_duration_s=config.run_duration_s,
+            items_per_run=config.items_per_run,
+        ) as server:
+            for executor in config.executors:
+                report.timings.append(_run_executor(executor, server, plan, seed_pack))
+    finally:
+        for recipe_id in recipes:
+            RECIPE_REGISTRY.pop(recipe_id, None)
+
+    return report
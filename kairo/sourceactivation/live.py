@@ -8,6 +8,7 @@ This module provides:
 - execute_recipe(): Execute a single recipe (2-stage or single-stage)
 - execute_live_activation(): Execute full activation with budget controls
 - execute_live_activation_parallel(): Phase 3 parallel execution for speed
+- execute_recipe_async(): Asyncio variant used by SOURCEACTIVATION_EXECUTOR=async
 
 CRITICAL INVARIANTS (per PRD):
 - SA-1: Instagram MUST use 2-stage acquisition
@@ -17,14 +18,24 @@ CRITICAL INVARIANTS (per PRD):
 
 Phase 3 Enhancements:
 - Parallel execution of independent recipes for 3x faster evidence collection
-- All recipes run simultaneously instead of sequentially
+- Recipes run as a DAG (scheduler.py): each starts as soon as the recipes it
+  depends on (RecipeSpec.depends_on) finish, critical path first
+- Evidence quota checked as results arrive (budget.evidence_quota_met); once
+  met, pending recipes are dropped and in-flight Apify runs are aborted
+
+Async executor (opt-in, SOURCEACTIVATION_EXECUTOR=async):
+- Recipes run as coroutines on one event loop with a pooled httpx client
+  (kairo.integrations.apify.async_client), up to APIFY_MAX_INFLIGHT_RUNS at once
+- Same recipe DAG scheduling and RecipeResult semantics as the thread pool
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING
@@ -37,27 +48,28 @@ from kairo.core.guardrails import (
     require_apify_enabled,
     require_live_apify_allowed,
 )
-from kairo.integrations.apify.client import ApifyClient, ApifyError
+from kairo.integrations.apify.client import ApifyClient, ApifyError, RunInfo, iter_dataset_pages
 from kairo.sourceactivation.budget import (
     APIFY_PER_REGENERATE_CAP_USD,
     BudgetStatus,
     apply_caps_to_input,
     check_budget_for_run,
     estimate_recipe_cost,
+    evidence_quota_met,
     should_continue_recipes,
 )
 from kairo.sourceactivation.normalizers import normalize_actor_output
 from kairo.sourceactivation.recipes import (
     DEFAULT_EXECUTION_PLAN,
     RecipeSpec,
-    extract_trending_hashtags,
     get_execution_plan,
     get_recipe,
 )
+from kairo.sourceactivation.scheduler import RecipeScheduler, build_recipe_dag
 from kairo.sourceactivation.types import EvidenceBundle, EvidenceItemData, SeedPack
 
 if TYPE_CHECKING:
-    pass
+    from kairo.integrations.apify.async_client import AsyncApifyClient
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +88,7 @@ class RecipeResult:
     stage2_items_count: int
     estimated_cost: Decimal
     error: str | None = None
+    cancelled: bool = False  # stopped early because the evidence quota was met
 
 
 @dataclass
@@ -87,6 +100,49 @@ class LiveActivationResult:
     total_cost: Decimal
     early_exit_reason: str | None = None
     error: str | None = None
+    # Apify runs aborted after the evidence quota was met
+    # [{"recipe_id", "actor_id", "run_id", "stage"}, ...]
+    cancelled_runs: list[dict] = field(default_factory=list)
+
+
+class InFlightRuns:
+    """
+    Apify runs started by one activation that have not finished yet.
+
+    Recipes register each run they start; when the evidence quota is met the
+    executor calls cancel() and aborts what it returns. A run registered after
+    cancel() is refused, and the recipe aborts it itself. Every aborted run
+    ends up in cancelled_runs (recorded on ActivationRun).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._runs: dict[str, dict] = {}
+        self.cancelled = False
+        self.cancelled_runs: list[dict] = []
+
+    def add(self, recipe_id: str, actor_id: str, run_id: str, stage: int) -> bool:
+        """Register a started run. False if the activation was already cancelled."""
+        run = {"recipe_id": recipe_id, "actor_id": actor_id, "run_id": run_id, "stage": stage}
+        with self._lock:
+            if self.cancelled:
+                self.cancelled_runs.append(run)
+                return False
+            self._runs[run_id] = run
+            return True
+
+    def discard(self, run_id: str) -> None:
+        with self._lock:
+            self._runs.pop(run_id, None)
+
+    def cancel(self) -> list[dict]:
+        """Mark the activation cancelled; returns the runs to abort."""
+        with self._lock:
+            self.cancelled = True
+            runs = list(self._runs.values())
+            self._runs.clear()
+            self.cancelled_runs.extend(runs)
+            return runs
 
 
 # =============================================================================
@@ -95,11 +151,15 @@ class LiveActivationResult:
 
 def get_apify_client(user_id: UUID | None = None) -> ApifyClient:
     """
-    Create Apify client with user's BYOK credentials.
+    Get Apify client with user's BYOK credentials.
 
     BYOK only - no system .env token fallback.
     User must configure their own Apify token in settings.
 
+    Clients are cached per user (kairo.users.clients), so the token is
+    decrypted once per BYOK_CLIENT_CACHE_TTL_S (or key update) and the
+    client's requests.Session keeps its connections across jobs.
+
     Args:
         user_id: User UUID for BYOK lookup (required)
 
@@ -112,15 +172,22 @@ def get_apify_client(user_id: UUID | None = None) -> ApifyClient:
     if not user_id:
         raise ValueError("No user context - cannot retrieve BYOK Apify token")
 
-    from kairo.users.encryption import get_user_apify_token
-    token = get_user_apify_token(user_id)
-    if not token:
-        raise ValueError(f"User has no Apify token configured in settings (user_id={user_id})")
+    from kairo.users.clients import APIFY_CLIENT, get_user_client
+
+    def build_user_client() -> ApifyClient | None:
+        from kairo.users.encryption import get_user_apify_token
 
-    logger.info("Using user's BYOK Apify token for user_id=%s", user_id)
-    base_url = getattr(settings, "APIFY_BASE_URL", "https://api.apify.com")
+        token = get_user_apify_token(user_id)
+        if not token:
+            return None
+        logger.info("Using user's BYOK Apify token for user_id=%s", user_id)
+        base_url = getattr(settings, "APIFY_BASE_URL", "https://api.apify.com")
+        return ApifyClient(token=token, base_url=base_url)
 
-    return ApifyClient(token=token, base_url=base_url)
+    client = get_user_client(APIFY_CLIENT, user_id, build_user_client)
+    if client is None:
+        raise ValueError(f"User has no Apify token configured in settings (user_id={user_id})")
+    return client
 
 
 # =============================================================================
@@ -132,6 +199,7 @@ def execute_recipe(
     seed_pack: SeedPack,
     run_id: UUID,
     client: ApifyClient | None = None,
+    in_flight: InFlightRuns | None = None,
 ) -> RecipeResult:
     """
     Execute a recipe and return normalized evidence.
@@ -149,6 +217,8 @@ def execute_recipe(
         seed_pack: Seed pack for input building
         run_id: ActivationRun ID for correlation
         client: Optional Apify client (created if not provided)
+        in_flight: Optional activation-wide run registry; once cancelled, the
+            recipe starts no more runs and returns a cancelled result
 
     Returns:
         RecipeResult with items and metrics
@@ -183,8 +253,11 @@ def execute_recipe(
         stage1_input = apply_caps_to_input(recipe.stage1_actor, stage1_input)
 
         # Execute actor
-        run_info = client.start_actor_run(recipe.stage1_actor, stage1_input)
-        run_info = client.poll_run(run_info.run_id, timeout_s=180)
+        run_info = _run_actor(
+            client, recipe, recipe.stage1_actor, stage1_input, stage=1, in_flight=in_flight
+        )
+        if run_info is None:
+            return _cancelled_result(recipe.recipe_id, estimated_cost)
 
         if not run_info.is_success():
             return RecipeResult(
@@ -197,18 +270,18 @@ def execute_recipe(
                 error=f"Stage 1 failed: {run_info.status} - {run_info.error_message}",
             )
 
-        # Fetch and normalize Stage 1 results
-        stage1_raw_items = client.fetch_dataset_items(
+        # Fetch and normalize Stage 1 results page by page
+        # (raw items are kept only for the Stage 2 filter)
+        stage1_raw_items: list[dict] = []
+        stage1_items = _fetch_normalized(
+            client,
             run_info.dataset_id,
             limit=recipe.stage1_result_limit,
-        )
-
-        stage1_items = normalize_actor_output(
-            raw_items=stage1_raw_items,
             actor_id=recipe.stage1_actor,
             recipe_id=recipe.recipe_id,
             stage=1,
             run_id=run_id,
+            raw_sink=stage1_raw_items if recipe.stage1_to_stage2_filter else None,
         )
 
         # NOTE: Relevancy filtering now done at scrape time via:
@@ -252,17 +325,20 @@ def execute_recipe(
                 stage2_input = apply_caps_to_input(recipe.stage2_actor, stage2_input)
 
                 # Execute Stage 2
-                run_info = client.start_actor_run(recipe.stage2_actor, stage2_input)
-                run_info = client.poll_run(run_info.run_id, timeout_s=180)
+                run_info = _run_actor(
+                    client, recipe, recipe.stage2_actor, stage2_input, stage=2, in_flight=in_flight
+                )
 
-                if run_info.is_success():
-                    stage2_raw_items = client.fetch_dataset_items(
+                if run_info is None:
+                    logger.info(
+                        "Recipe %s Stage 2 cancelled (evidence quota met), keeping Stage 1 items",
+                        recipe.recipe_id,
+                    )
+                elif run_info.is_success():
+                    stage2_items = _fetch_normalized(
+                        client,
                         run_info.dataset_id,
                         limit=recipe.stage2_result_limit or 5,
-                    )
-
-                    stage2_items = normalize_actor_output(
-                        raw_items=stage2_raw_items,
                         actor_id=recipe.stage2_actor,
                         recipe_id=recipe.recipe_id,
                         stage=2,
@@ -321,6 +397,92 @@ def execute_recipe(
         )
 
 
+def _run_actor(
+    client: ApifyClient,
+    recipe: RecipeSpec,
+    actor_id: str,
+    input_json: dict,
+    stage: int,
+    in_flight: InFlightRuns | None,
+) -> RunInfo | None:
+    """
+    Start an actor run and poll it to a terminal state.
+
+    Returns None if the activation was cancelled (evidence quota met) before
+    the run started or while it was in flight.
+    """
+    if in_flight is not None and in_flight.cancelled:
+        return None
+
+    run_info = client.start_actor_run(actor_id, input_json)
+    if in_flight is None:
+        return client.poll_run(run_info.run_id, timeout_s=180, actor_id=actor_id)
+
+    if not in_flight.add(recipe.recipe_id, actor_id, run_info.run_id, stage):
+        _abort_run(client, run_info.run_id)
+        return None
+
+    try:
+        run_info = client.poll_run(run_info.run_id, timeout_s=180, actor_id=actor_id)
+    finally:
+        in_flight.discard(run_info.run_id)
+
+    if run_info.status == "ABORTED" and in_flight.cancelled:
+        return None
+    return run_info
+
+
+def _abort_run(client: ApifyClient, run_id: str) -> None:
+    """Abort a run, best effort (it may have finished in the meantime)."""
+    try:
+        client.abort_run(run_id)
+    except ApifyError as e:
+        logger.warning("EARLY_CANCEL abort failed for run_id=%s: %s", run_id, str(e))
+
+
+def _cancelled_result(recipe_id: str, estimated_cost: Decimal) -> RecipeResult:
+    return RecipeResult(
+        recipe_id=recipe_id,
+        success=False,
+        items=[],
+        stage1_items_count=0,
+        stage2_items_count=0,
+        estimated_cost=estimated_cost,
+        error="Cancelled: evidence quota met",
+        cancelled=True,
+    )
+
+
+def _fetch_normalized(
+    client: ApifyClient,
+    dataset_id: str,
+    limit: int,
+    actor_id: str,
+    recipe_id: str,
+    stage: int,
+    run_id: UUID,
+    raw_sink: list[dict] | None = None,
+) -> list[EvidenceItemData]:
+    """
+    Stream a dataset and normalize it page by page.
+
+    Only one page of raw items is held at a time unless raw_sink is given,
+    in which case raw items are appended to it (e.g. for the Stage 2 filter).
+    """
+    items: list[EvidenceItemData] = []
+    for page in iter_dataset_pages(client, dataset_id, limit=limit):
+        items.extend(normalize_actor_output(
+            raw_items=page,
+            actor_id=actor_id,
+            recipe_id=recipe_id,
+            stage=stage,
+            run_id=run_id,
+        ))
+        if raw_sink is not None:
+            raw_sink.extend(page)
+    return items
+
+
 def _merge_stage_results(
     stage1_items: list[EvidenceItemData],
     stage2_items: list[EvidenceItemData],
@@ -357,7 +519,7 @@ def _merge_stage_results(
 # =============================================================================
 
 # Phase 3: Maximum parallel workers for recipe execution
-# Each recipe may have multiple stages, but recipes are independent
+# Each recipe may have multiple stages; dependencies are scheduled by RecipeScheduler
 MAX_PARALLEL_RECIPES = 5
 
 
@@ -433,6 +595,24 @@ def execute_live_activation(
             error=str(e),
         )
 
+    # Async executor: one event loop instead of a thread per recipe.
+    # asyncio.run() cannot nest, so callers already on a loop use threads.
+    if parallel and use_async_executor():
+        if _event_loop_running():
+            logger.warning(
+                "SOURCEACTIVATION_EXECUTOR=async inside a running event loop, "
+                "falling back to thread pool"
+            )
+        else:
+            return run_recipes_async(
+                brand_id=brand_id,
+                seed_pack=seed_pack,
+                run_id=run_id,
+                execution_plan=execution_plan,
+                token=client.token,
+                base_url=client.base_url,
+            )
+
     # Phase 3: Use parallel execution by default for speed
     if parallel:
         return _execute_recipes_parallel(
@@ -452,6 +632,14 @@ def execute_live_activation(
         )
 
 
+def _event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 def _execute_recipes_parallel(
     brand_id: UUID,
     seed_pack: SeedPack,
@@ -460,20 +648,16 @@ def _execute_recipes_parallel(
     client: ApifyClient,
 ) -> LiveActivationResult:
     """
-    Execute recipes in parallel with TikTok chaining for maximum quality and speed.
-
-    Phase 3 Enhancement: Intelligent parallel execution with TikTok chaining.
+    Execute the execution plan's recipe DAG on a thread pool.
 
-    Execution Strategy:
-    1. Run ALL non-TT-1 recipes in parallel (including TT-TRENDS recipes)
-    2. Wait for TT-TRENDS recipes to complete and extract trending hashtags
-    3. Run TT-1 with discovered trending hashtags for transcript-rich content
+    Recipes declare their upstream recipes (RecipeSpec.depends_on, e.g.
+    TT-TRENDS → TT-1) and RecipeScheduler starts each one as soon as its
+    upstreams finish, critical path first, within MAX_PARALLEL_RECIPES threads
+    and the per-platform limits. Recipes without dependencies (IG, YT, LI)
+    start immediately and never wait on TikTok chaining.
 
-    This approach:
-    - Maximizes parallelism (all non-TT-1 recipes run simultaneously)
-    - Enables TT-TRENDS → TT-1 chaining for better quality
-    - Only adds latency for TT-1 (must wait for TT-TRENDS)
-    - Other platforms (IG, YT, LI) are unaffected by the wait
+    The evidence quota is checked after every result; once met, recipes not
+    yet started are dropped and in-flight Apify runs are aborted.
     """
     logger.info(
         "PARALLEL_EXECUTION brand=%s recipes=%s",
@@ -486,28 +670,18 @@ def _execute_recipes_parallel(
     total_cost = Decimal("0")
     errors: list[str] = []
 
-    # Separate recipes into groups:
-    # - TT-TRENDS recipes: run in parallel, extract hashtags when done
-    # - TT-1: runs AFTER TT-TRENDS with discovered hashtags
-    # - Other recipes: run in parallel immediately
-    tt_trends_recipes = []
-    tt_content_recipe = None
-    other_recipes = []
-
-    for recipe_id in execution_plan:
-        recipe = get_recipe(recipe_id)
-        if not recipe:
-            logger.warning("Recipe %s not found, skipping", recipe_id)
-            continue
-
-        if recipe_id.startswith("TT-TRENDS"):
-            tt_trends_recipes.append((recipe_id, recipe))
-        elif recipe_id == "TT-1":
-            tt_content_recipe = (recipe_id, recipe)
-        else:
-            other_recipes.append((recipe_id, recipe))
+    try:
+        scheduler = RecipeScheduler(build_recipe_dag(execution_plan, get_recipe))
+    except ValueError as e:
+        return LiveActivationResult(
+            success=False,
+            items=[],
+            recipes_executed=[],
+            total_cost=Decimal("0"),
+            error=str(e),
+        )
 
-    if not other_recipes and not tt_trends_recipes and not tt_content_recipe:
+    if not scheduler.nodes:
         return LiveActivationResult(
             success=False,
             items=[],
@@ -516,132 +690,70 @@ def _execute_recipes_parallel(
             error="No valid recipes in execution plan",
         )
 
-    # PHASE 1: Run TT-TRENDS + other recipes in parallel
-    # TT-TRENDS discovers what's trending while other platforms collect evidence
-    phase1_recipes = other_recipes + tt_trends_recipes
-    tt_trends_raw_items: list[dict] = []
+    in_flight = InFlightRuns()
+    early_exit_reason: str | None = None
 
     with ThreadPoolExecutor(max_workers=MAX_PARALLEL_RECIPES) as executor:
-        # Submit all Phase 1 recipes
-        future_to_recipe = {
-            executor.submit(
-                execute_recipe,
-                recipe=recipe,
-                seed_pack=seed_pack,
-                run_id=run_id,
-                client=client,
-            ): recipe_id
-            for recipe_id, recipe in phase1_recipes
-        }
-
-        # Collect results as they complete
-        for future in as_completed(future_to_recipe):
-            recipe_id = future_to_recipe[future]
-            try:
-                result = future.result()
-                recipes_executed.append(recipe_id)
-                total_cost += result.estimated_cost
-
-                if result.success:
-                    all_items.extend(result.items)
-                    logger.info(
-                        "PARALLEL recipe %s complete: %d items (cost: $%.2f)",
-                        recipe_id,
-                        len(result.items),
-                        float(result.estimated_cost),
-                    )
-
-                    # Collect raw items from TT-TRENDS for hashtag extraction
-                    if recipe_id.startswith("TT-TRENDS"):
-                        # Extract raw items from evidence items
-                        for item in result.items:
-                            if item.raw_json:
-                                tt_trends_raw_items.append(item.raw_json)
-                else:
-                    errors.append(f"{recipe_id}: {result.error}")
-                    logger.warning(
-                        "PARALLEL recipe %s failed: %s",
-                        recipe_id,
-                        result.error,
-                    )
-            except Exception as e:
-                errors.append(f"{recipe_id}: {str(e)}")
-                logger.exception("PARALLEL recipe %s exception: %s", recipe_id, str(e))
-
-    # PHASE 2: Execute TT-1 with discovered trending hashtags
-    if tt_content_recipe:
-        recipe_id, recipe = tt_content_recipe
-
-        # Extract trending hashtags from TT-TRENDS results
-        if tt_trends_raw_items:
-            trending_hashtags = extract_trending_hashtags(tt_trends_raw_items)
-            if trending_hashtags:
-                # Create a modified seed_pack with trending hashtags
-                seed_pack_with_trends = SeedPack(
-                    brand_id=seed_pack.brand_id,
-                    brand_name=seed_pack.brand_name,
-                    positioning=seed_pack.positioning,
-                    search_terms=seed_pack.search_terms,
-                    pillar_keywords=seed_pack.pillar_keywords,
-                    persona_contexts=seed_pack.persona_contexts,
-                    snapshot_id=seed_pack.snapshot_id,
-                    tiktok_queries=seed_pack.tiktok_queries,
-                    tiktok_hashtags=seed_pack.tiktok_hashtags,
-                    instagram_queries=seed_pack.instagram_queries,
-                    instagram_hashtags=seed_pack.instagram_hashtags,
-                    query_plan_error=seed_pack.query_plan_error,
-                    inferred_industry=seed_pack.inferred_industry,
-                    trending_hashtags=trending_hashtags,  # NEW: discovered trends
-                )
-                logger.info(
-                    "TIKTOK_CHAIN TT-TRENDS → TT-1 with %d trending hashtags: %s",
-                    len(trending_hashtags),
-                    trending_hashtags,
-                )
-            else:
-                seed_pack_with_trends = seed_pack
-                logger.warning(
-                    "TIKTOK_CHAIN no trending hashtags extracted from TT-TRENDS, "
-                    "TT-1 will use Query Planner fallback"
-                )
-        else:
-            seed_pack_with_trends = seed_pack
-            logger.warning(
-                "TIKTOK_CHAIN TT-TRENDS produced no raw items, "
-                "TT-1 will use Query Planner fallback"
-            )
-
-        # Execute TT-1 with the (possibly enriched) seed pack
-        logger.info(
-            "PHASE2_EXECUTION: Running TT-1 with trending hashtags"
-        )
-
-        try:
-            result = execute_recipe(
-                recipe=recipe,
-                seed_pack=seed_pack_with_trends,
-                run_id=run_id,
-                client=client,
-            )
-            recipes_executed.append(recipe_id)
-            total_cost += result.estimated_cost
-
-            if result.success:
-                all_items.extend(result.items)
-                logger.info(
-                    "TIKTOK_CHAIN TT-1 complete: %d items with transcripts (cost: $%.2f)",
-                    len(result.items),
-                    float(result.estimated_cost),
-                )
-            else:
-                errors.append(f"{recipe_id}: {result.error}")
-                logger.warning(
-                    "TIKTOK_CHAIN TT-1 failed: %s",
-                    result.error,
+        running: dict[Future, str] = {}
+
+        while not scheduler.is_done():
+            for node in scheduler.start_ready(MAX_PARALLEL_RECIPES - len(running)):
+                future = executor.submit(
+                    execute_recipe,
+                    recipe=node.recipe,
+                    seed_pack=scheduler.seed_pack_for(node, seed_pack),
+                    run_id=run_id,
+                    client=client,
+                    in_flight=in_flight,
                 )
-        except Exception as e:
-            errors.append(f"{recipe_id}: {str(e)}")
-            logger.exception("TIKTOK_CHAIN TT-1 exception: %s", str(e))
+                running[future] = node.recipe_id
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            # Collect results as they complete
+            for future in done:
+                recipe_id = running.pop(future)
+                result = None
+                try:
+                    result = future.result()
+
+                    if result.cancelled:
+                        # Stopped runs count as neither executed nor spent
+                        logger.info("PARALLEL recipe %s cancelled (evidence quota met)", recipe_id)
+                    elif result.success:
+                        recipes_executed.append(recipe_id)
+                        total_cost += result.estimated_cost
+                        all_items.extend(result.items)
+                        logger.info(
+                            "PARALLEL recipe %s complete: %d items (cost: $%.2f)",
+                            recipe_id,
+                            len(result.items),
+                            float(result.estimated_cost),
+                        )
+                    else:
+                        recipes_executed.append(recipe_id)
+                        total_cost += result.estimated_cost
+                        errors.append(f"{recipe_id}: {result.error}")
+                        logger.warning(
+                            "PARALLEL recipe %s failed: %s",
+                            recipe_id,
+                            result.error,
+                        )
+                except Exception as e:
+                    errors.append(f"{recipe_id}: {str(e)}")
+                    logger.exception("PARALLEL recipe %s exception: %s", recipe_id, str(e))
+                scheduler.finish(recipe_id, result)
+
+            # Nothing left to stop once the last recipe has finished
+            if (
+                not scheduler.is_done()
+                and not in_flight.cancelled
+                and evidence_quota_met(all_items)
+            ):
+                early_exit_reason = "evidence_gates_met"
+                runs = _cancel_remaining(scheduler, in_flight, len(all_items))
+                for run in runs:
+                    _abort_run(client, run["run_id"])
 
     logger.info(
         "PARALLEL_EXECUTION complete: %d items from %d recipes (cost: $%.2f)",
@@ -655,9 +767,28 @@ def _execute_recipes_parallel(
         items=all_items,
         recipes_executed=recipes_executed,
         total_cost=total_cost,
-        early_exit_reason=None,
+        early_exit_reason=early_exit_reason,
         error="; ".join(errors) if errors and not all_items else None,
+        cancelled_runs=in_flight.cancelled_runs,
+    )
+
+
+def _cancel_remaining(
+    scheduler: RecipeScheduler,
+    in_flight: InFlightRuns,
+    item_count: int,
+) -> list[dict]:
+    """Drop pending recipes and cancel the activation; returns runs to abort."""
+    skipped = scheduler.cancel_pending()
+    runs = in_flight.cancel()
+    logger.info(
+        "EARLY_CANCEL evidence quota met with %d items: aborting %d runs %s, skipping recipes %s",
+        item_count,
+        len(runs),
+        [run["run_id"] for run in runs],
+        skipped,
     )
+    return runs
 
 
 def _execute_recipes_sequential(
@@ -745,6 +876,384 @@ def _execute_recipes_sequential(
     )
 
 
+# =============================================================================
+# ASYNC EXECUTION (SOURCEACTIVATION_EXECUTOR=async)
+# =============================================================================
+# Same recipes, same DAG scheduling as _execute_recipes_parallel,
+# but on one event loop: a run waiting in poll_run is a suspended coroutine,
+# not a blocked thread, so APIFY_MAX_INFLIGHT_RUNS runs can be in flight
+# per activation over one pooled connection set.
+
+DEFAULT_MAX_INFLIGHT_RUNS = 32
+
+
+def get_max_inflight_runs() -> int:
+    return int(getattr(settings, "APIFY_MAX_INFLIGHT_RUNS", DEFAULT_MAX_INFLIGHT_RUNS))
+
+
+def use_async_executor() -> bool:
+    return getattr(settings, "SOURCEACTIVATION_EXECUTOR", "threads") == "async"
+
+
+async def execute_recipe_async(
+    recipe: RecipeSpec,
+    seed_pack: SeedPack,
+    run_id: UUID,
+    client: "AsyncApifyClient",
+    in_flight: InFlightRuns | None = None,
+) -> RecipeResult:
+    """
+    Async variant of execute_recipe() on an AsyncApifyClient.
+
+    Same stages, invariants (SA-1, SA-2) and error handling; see execute_recipe.
+    """
+    if recipe.platform == "instagram" and not recipe.stage2_actor:
+        raise ValueError(
+            f"SA-1 violation: Instagram recipe {recipe.recipe_id} MUST have stage2_actor"
+        )
+
+    estimated_cost = estimate_recipe_cost(recipe.recipe_id)
+    stage2_count = 0
+
+    try:
+        # Stage 1: Discovery
+        logger.info(
+            "Executing recipe %s Stage 1: %s",
+            recipe.recipe_id,
+            recipe.stage1_actor,
+        )
+
+        stage1_input = recipe.stage1_input_builder(seed_pack)
+        stage1_input = apply_caps_to_input(recipe.stage1_actor, stage1_input)
+
+        run_info = await _arun_actor(
+            client, recipe, recipe.stage1_actor, stage1_input, stage=1, in_flight=in_flight
+        )
+        if run_info is None:
+            return _cancelled_result(recipe.recipe_id, estimated_cost)
+
+        if not run_info.is_success():
+            return RecipeResult(
+                recipe_id=recipe.recipe_id,
+                success=False,
+                items=[],
+                stage1_items_count=0,
+                stage2_items_count=0,
+                estimated_cost=estimated_cost,
+                error=f"Stage 1 failed: {run_info.status} - {run_info.error_message}",
+            )
+
+        stage1_raw_items: list[dict] = []
+        all_items = await _afetch_normalized(
+            client,
+            run_info.dataset_id,
+            limit=recipe.stage1_result_limit,
+            actor_id=recipe.stage1_actor,
+            recipe_id=recipe.recipe_id,
+            stage=1,
+            run_id=run_id,
+            raw_sink=stage1_raw_items if recipe.stage1_to_stage2_filter else None,
+        )
+        stage1_count = len(all_items)
+
+        _log_freshness_diagnostics(recipe.recipe_id, all_items)
+
+        logger.info(
+            "Recipe %s Stage 1 complete: %d items",
+            recipe.recipe_id,
+            stage1_count,
+        )
+
+        # Stage 2: Enrichment (Instagram 2-stage only)
+        if recipe.stage2_actor and recipe.stage1_to_stage2_filter:
+            # INVARIANT SA-2: Derive Stage 2 inputs from Stage 1 outputs
+            stage2_urls = recipe.stage1_to_stage2_filter(stage1_raw_items)
+
+            if not stage2_urls:
+                logger.info(
+                    "Recipe %s: No winners from Stage 1 filter, skipping Stage 2",
+                    recipe.recipe_id,
+                )
+            else:
+                stage2_input = recipe.stage2_input_builder(stage2_urls)
+                stage2_input = apply_caps_to_input(recipe.stage2_actor, stage2_input)
+
+                run_info = await _arun_actor(
+                    client, recipe, recipe.stage2_actor, stage2_input, stage=2, in_flight=in_flight
+                )
+
+                if run_info is None:
+                    logger.info(
+                        "Recipe %s Stage 2 cancelled (evidence quota met), keeping Stage 1 items",
+                        recipe.recipe_id,
+                    )
+                elif run_info.is_success():
+                    stage2_items = await _afetch_normalized(
+                        client,
+                        run_info.dataset_id,
+                        limit=recipe.stage2_result_limit or 5,
+                        actor_id=recipe.stage2_actor,
+                        recipe_id=recipe.recipe_id,
+                        stage=2,
+                        run_id=run_id,
+                    )
+                    stage2_count = len(stage2_items)
+                    all_items = _merge_stage_results(all_items, stage2_items)
+
+                    logger.info(
+                        "Recipe %s Stage 2 complete: %d items (merged total: %d)",
+                        recipe.recipe_id,
+                        stage2_count,
+                        len(all_items),
+                    )
+                else:
+                    logger.warning(
+                        "Recipe %s Stage 2 failed: %s - %s",
+                        recipe.recipe_id,
+                        run_info.status,
+                        run_info.error_message,
+                    )
+
+        return RecipeResult(
+            recipe_id=recipe.recipe_id,
+            success=True,
+            items=all_items,
+            stage1_items_count=stage1_count,
+            stage2_items_count=stage2_count,
+            estimated_cost=estimated_cost,
+        )
+
+    except Exception as e:
+        logger.exception("Error in recipe %s: %s", recipe.recipe_id, str(e))
+        return RecipeResult(
+            recipe_id=recipe.recipe_id,
+            success=False,
+            items=[],
+            stage1_items_count=0,
+            stage2_items_count=0,
+            estimated_cost=estimated_cost,
+            error=str(e),
+        )
+
+
+async def _arun_actor(
+    client: "AsyncApifyClient",
+    recipe: RecipeSpec,
+    actor_id: str,
+    input_json: dict,
+    stage: int,
+    in_flight: InFlightRuns | None,
+) -> RunInfo | None:
+    """Async variant of _run_actor()."""
+    if in_flight is not None and in_flight.cancelled:
+        return None
+
+    run_info = await client.start_actor_run(actor_id, input_json)
+    if in_flight is None:
+        return await client.poll_run(run_info.run_id, timeout_s=180, actor_id=actor_id)
+
+    if not in_flight.add(recipe.recipe_id, actor_id, run_info.run_id, stage):
+        await _aabort_run(client, run_info.run_id)
+        return None
+
+    try:
+        run_info = await client.poll_run(run_info.run_id, timeout_s=180, actor_id=actor_id)
+    finally:
+        in_flight.discard(run_info.run_id)
+
+    if run_info.status == "ABORTED" and in_flight.cancelled:
+        return None
+    return run_info
+
+
+async def _aabort_run(client: "AsyncApifyClient", run_id: str) -> None:
+    """Async variant of _abort_run()."""
+    try:
+        await client.abort_run(run_id)
+    except ApifyError as e:
+        logger.warning("EARLY_CANCEL abort failed for run_id=%s: %s", run_id, str(e))
+
+
+async def _afetch_normalized(
+    client: "AsyncApifyClient",
+    dataset_id: str,
+    limit: int,
+    actor_id: str,
+    recipe_id: str,
+    stage: int,
+    run_id: UUID,
+    raw_sink: list[dict] | None = None,
+) -> list[EvidenceItemData]:
+    """Async variant of _fetch_normalized()."""
+    from kairo.integrations.apify.async_client import aiter_dataset_pages
+
+    items: list[EvidenceItemData] = []
+    async for page in aiter_dataset_pages(client, dataset_id, limit=limit):
+        # Normalizing a TikTok page blocks on subtitle downloads: run it in a
+        # thread so other recipes keep polling meanwhile
+        items.extend(await asyncio.to_thread(
+            normalize_actor_output,
+            raw_items=page,
+            actor_id=actor_id,
+            recipe_id=recipe_id,
+            stage=stage,
+            run_id=run_id,
+        ))
+        if raw_sink is not None:
+            raw_sink.extend(page)
+    return items
+
+
+async def _execute_recipes_async(
+    brand_id: UUID,
+    seed_pack: SeedPack,
+    run_id: UUID,
+    execution_plan: list[str],
+    client: "AsyncApifyClient",
+) -> LiveActivationResult:
+    """
+    Execute the execution plan's recipe DAG concurrently on the event loop.
+
+    Same RecipeScheduler and evidence-quota cancellation as
+    _execute_recipes_parallel, with up to APIFY_MAX_INFLIGHT_RUNS recipes in
+    flight instead of a thread pool width.
+    """
+    logger.info(
+        "ASYNC_EXECUTION brand=%s recipes=%s",
+        brand_id,
+        execution_plan,
+    )
+
+    all_items: list[EvidenceItemData] = []
+    recipes_executed: list[str] = []
+    total_cost = Decimal("0")
+    errors: list[str] = []
+
+    try:
+        scheduler = RecipeScheduler(build_recipe_dag(execution_plan, get_recipe))
+    except ValueError as e:
+        return LiveActivationResult(
+            success=False,
+            items=[],
+            recipes_executed=[],
+            total_cost=Decimal("0"),
+            error=str(e),
+        )
+
+    if not scheduler.nodes:
+        return LiveActivationResult(
+            success=False,
+            items=[],
+            recipes_executed=[],
+            total_cost=Decimal("0"),
+            error="No valid recipes in execution plan",
+        )
+
+    def record(recipe_id: str, result: RecipeResult) -> None:
+        nonlocal total_cost
+        if result.cancelled:
+            # Stopped runs count as neither executed nor spent
+            logger.info("ASYNC recipe %s cancelled (evidence quota met)", recipe_id)
+            return
+        recipes_executed.append(recipe_id)
+        total_cost += result.estimated_cost
+        if result.success:
+            all_items.extend(result.items)
+            logger.info(
+                "ASYNC recipe %s complete: %d items (cost: $%.2f)",
+                recipe_id,
+                len(result.items),
+                float(result.estimated_cost),
+            )
+        else:
+            errors.append(f"{recipe_id}: {result.error}")
+            logger.warning("ASYNC recipe %s failed: %s", recipe_id, result.error)
+
+    max_inflight = get_max_inflight_runs()
+    running: dict[asyncio.Task, str] = {}
+    in_flight = InFlightRuns()
+    early_exit_reason: str | None = None
+
+    while not scheduler.is_done():
+        for node in scheduler.start_ready(max_inflight - len(running)):
+            task = asyncio.ensure_future(execute_recipe_async(
+                recipe=node.recipe,
+                seed_pack=scheduler.seed_pack_for(node, seed_pack),
+                run_id=run_id,
+                client=client,
+                in_flight=in_flight,
+            ))
+            running[task] = node.recipe_id
+
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+        for task in done:
+            recipe_id = running.pop(task)
+            result = None
+            try:
+                result = task.result()
+                record(recipe_id, result)
+            except Exception as e:
+                errors.append(f"{recipe_id}: {str(e)}")
+                logger.exception("ASYNC recipe %s exception: %s", recipe_id, str(e))
+            scheduler.finish(recipe_id, result)
+
+        if (
+            not scheduler.is_done()
+            and not in_flight.cancelled
+            and evidence_quota_met(all_items)
+        ):
+            early_exit_reason = "evidence_gates_met"
+            runs = _cancel_remaining(scheduler, in_flight, len(all_items))
+            await asyncio.gather(*(_aabort_run(client, run["run_id"]) for run in runs))
+
+    logger.info(
+        "ASYNC_EXECUTION complete: %d items from %d recipes (cost: $%.2f)",
+        len(all_items),
+        len(recipes_executed),
+        float(total_cost),
+    )
+
+    return LiveActivationResult(
+        success=len(all_items) > 0,
+        items=all_items,
+        recipes_executed=recipes_executed,
+        total_cost=total_cost,
+        early_exit_reason=early_exit_reason,
+        error="; ".join(errors) if errors and not all_items else None,
+        cancelled_runs=in_flight.cancelled_runs,
+    )
+
+
+def run_recipes_async(
+    brand_id: UUID,
+    seed_pack: SeedPack,
+    run_id: UUID,
+    execution_plan: list[str],
+    token: str,
+    base_url: str,
+) -> LiveActivationResult:
+    """
+    Run _execute_recipes_async to completion from synchronous code.
+
+    The AsyncApifyClient (and its connection pool) lives for one activation,
+    inside the event loop that uses it.
+    """
+    from kairo.integrations.apify.async_client import AsyncApifyClient
+
+    async def main() -> LiveActivationResult:
+        async with AsyncApifyClient(token=token, base_url=base_url) as client:
+            return await _execute_recipes_async(
+                brand_id=brand_id,
+                seed_pack=seed_pack,
+                run_id=run_id,
+                execution_plan=execution_plan,
+                client=client,
+            )
+
+    return asyncio.run(main())
+
+
 # =============================================================================
 # FRESHNESS DIAGNOSTICS
 # =============================================================================
@@ -15,78 +15,16 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any
 from uuid import UUID
 
-import requests
-
+from kairo.sourceactivation.subtitles import fetch_transcripts, subtitle_links
 from kairo.sourceactivation.types import EvidenceItemData
 
 logger = logging.getLogger(__name__)
 
 
-# =============================================================================
-# SUBTITLE FETCHING
-# =============================================================================
-
-def _fetch_subtitle_content(url: str, timeout: int = 10) -> str:
-    """
-    Fetch subtitle content from a URL.
-
-    TikTok subtitle links return WebVTT or SRT format text.
-    We parse out the actual text content, stripping timing info.
-
-    Args:
-        url: Subtitle file URL (tiktokLink from videoMeta.subtitleLinks)
-        timeout: Request timeout in seconds
-
-    Returns:
-        Extracted text content, or empty string on failure
-    """
-    if not url:
-        return ""
-
-    try:
-        response = requests.get(url, timeout=timeout)
-        response.raise_for_status()
-        raw_content = response.text
-
-        # Parse VTT/SRT format - extract just the text lines
-        # VTT format has timing lines like "00:00:01.000 --> 00:00:04.000"
-        # SRT format has timing lines like "00:00:01,000 --> 00:00:04,000"
-        lines = raw_content.split("\n")
-        text_lines = []
-
-        for line in lines:
-            line = line.strip()
-            # Skip empty lines
-            if not line:
-                continue
-            # Skip WEBVTT header
-            if line.startswith("WEBVTT"):
-                continue
-            # Skip timing lines (contain -->)
-            if "-->" in line:
-                continue
-            # Skip numeric index lines (SRT format)
-            if line.isdigit():
-                continue
-            # Skip NOTE lines (VTT comments)
-            if line.startswith("NOTE"):
-                continue
-            # Keep actual subtitle text
-            text_lines.append(line)
-
-        return " ".join(text_lines)
-
-    except requests.RequestException as e:
-        logger.warning("Failed to fetch subtitle from %s: %s", url[:100], str(e))
-        return ""
-    except Exception as e:
-        logger.warning("Error parsing subtitle from %s: %s", url[:100], str(e))
-        return ""
-
-
 # =============================================================================
 # MAIN NORMALIZER
 # =============================================================================
@@ -120,6 +58,14 @@ def normalize_actor_output(
     # Select normalizer based on actor
     normalizer = _get_normalizer_for_actor(actor_id)
 
+    # TikTok subtitle links are fetched for the whole batch up front
+    # (concurrent, cached) instead of one blocking request per item
+    if normalizer is _normalize_tiktok_item:
+        transcripts = fetch_transcripts(
+            [raw for raw in raw_items if not _embedded_tiktok_transcript(raw)]
+        )
+        normalizer = partial(_normalize_tiktok_item, transcripts=transcripts)
+
     for raw in raw_items:
         try:
             item = normalizer(
@@ -299,6 +245,7 @@ def _normalize_tiktok_item(
     recipe_id: str,
     stage: int,
     fetched_at: datetime,
+    transcripts: dict[str, str] | None = None,
 ) -> EvidenceItemData | None:
     """
     Normalize TikTok scraper output.
@@ -312,6 +259,10 @@ def _normalize_tiktok_item(
     - createTime
     - subtitles (when shouldDownloadSubtitles=true) or videoMeta.subtitleLinks
     - hashtags or textExtra
+
+    transcripts maps subtitle URLs to fetched text (fetch_transcripts);
+    normalize_actor_output passes it for the whole batch. When omitted,
+    this item's subtitle links are fetched on their own.
     """
     # Get URL
     url = raw.get("webVideoUrl")
@@ -341,63 +292,17 @@ def _normalize_tiktok_item(
     comment_count = stats.get("commentCount") or raw.get("commentCount")
     share_count = stats.get("shareCount") or raw.get("shareCount")
 
-    # TASK-2: Extract transcript from downloaded subtitles
-    # When shouldDownloadSubtitles=true, subtitles are downloaded and text is extracted
-    transcript = ""
-
-    # Option 1: Direct subtitles field (when downloaded)
-    subtitles = raw.get("subtitles")
-    if subtitles:
-        if isinstance(subtitles, str):
-            # Plain text subtitles
-            transcript = subtitles
-        elif isinstance(subtitles, list):
-            # List of subtitle objects
-            transcript = " ".join(
-                sub.get("text", "") if isinstance(sub, dict) else str(sub)
-                for sub in subtitles
-                if sub
-            )
-
-    # Option 2: subtitleInfos field (legacy format)
-    if not transcript:
-        subtitle_infos = raw.get("subtitleInfos") or []
-        if subtitle_infos:
-            transcript = " ".join(
-                info.get("text", "")
-                for info in subtitle_infos
-                if info.get("text")
-            )
-
-    # Option 3: Fetch subtitles from videoMeta.subtitleLinks URLs
-    # TikTok provides subtitle download links but doesn't embed the content
+    # TASK-2: Extract transcript from downloaded subtitles, else from the
+    # fetched videoMeta.subtitleLinks files (see kairo.sourceactivation.subtitles)
+    transcript = _embedded_tiktok_transcript(raw)
     if not transcript:
-        video_meta = raw.get("videoMeta", {})
-        subtitle_links = video_meta.get("subtitleLinks") or []
-        for link_info in subtitle_links:
-            # First check if content was already embedded
-            content = link_info.get("content") or link_info.get("text")
-            if content:
-                transcript = content if isinstance(content, str) else str(content)
+        if transcripts is None:
+            transcripts = fetch_transcripts([raw])
+        for link in subtitle_links(raw):
+            transcript = transcripts.get(link.url, "")
+            if transcript:
                 break
 
-            # Otherwise, fetch from tiktokLink URL (English preferred)
-            language = link_info.get("language", "")
-            tiktok_link = link_info.get("tiktokLink")
-            if tiktok_link and ("eng" in language.lower() or "en" in language.lower()):
-                transcript = _fetch_subtitle_content(tiktok_link)
-                if transcript:
-                    break
-
-        # If no English subtitles, try any available subtitle
-        if not transcript:
-            for link_info in subtitle_links:
-                tiktok_link = link_info.get("tiktokLink")
-                if tiktok_link:
-                    transcript = _fetch_subtitle_content(tiktok_link)
-                    if transcript:
-                        break
-
     # Clean up transcript (remove excessive whitespace)
     if transcript:
         transcript = " ".join(transcript.split())
@@ -446,6 +351,44 @@ def _normalize_tiktok_item(
     )
 
 
+def _embedded_tiktok_transcript(raw: dict[str, Any]) -> str:
+    """Transcript text already present in a TikTok item (no fetch needed)."""
+    # Option 1: Direct subtitles field (when downloaded)
+    subtitles = raw.get("subtitles")
+    if subtitles:
+        if isinstance(subtitles, str):
+            # Plain text subtitles
+            return subtitles
+        if isinstance(subtitles, list):
+            # List of subtitle objects
+            transcript = " ".join(
+                sub.get("text", "") if isinstance(sub, dict) else str(sub)
+                for sub in subtitles
+                if sub
+            )
+            if transcript:
+                return transcript
+
+    # Option 2: subtitleInfos field (legacy format)
+    subtitle_infos = raw.get("subtitleInfos") or []
+    transcript = " ".join(
+        info.get("text", "")
+        for info in subtitle_infos
+        if info.get("text")
+    )
+    if transcript:
+        return transcript
+
+    # Option 3: Content embedded in videoMeta.subtitleLinks entries
+    video_meta = raw.get("videoMeta") or {}
+    for link_info in video_meta.get("subtitleLinks") or []:
+        content = link_info.get("content") or link_info.get("text")
+        if content:
+            return content if isinstance(content, str) else str(content)
+
+    return ""
+
+
 def _normalize_tiktok_trends_item(
     raw: dict[str, Any],
     actor_id: str,
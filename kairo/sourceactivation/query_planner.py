@@ -18,7 +18,8 @@ This is the minimum intelligence required to make trend discovery real.
 
 DESIGN PRINCIPLES:
 -----------------
-- Single LLM call per regenerate (cheap, fast)
+- At most one LLM call per regenerate (cheap, fast); none when the snapshot
+  inputs are unchanged (see PLAN CACHE)
 - Strict output schema validation
 - No fallback to brand names (that's what we're fixing)
 - Platform-specific query strategies
@@ -39,16 +40,29 @@ The LLM outputs:
     "rationale": "Discovery of trending marketing content"
   }
 }
+
+PLAN CACHE:
+----------
+Validated LLM output is cached per brand under a hash of exactly the
+snapshot fields the prompt uses (brand name, positioning, audience,
+pillars) plus the prompt template and model role. Recompiles that leave
+those fields alone reuse the plan; any change to them is a new key, so
+nothing needs invalidating. Trend-bank mixing runs on every call, cached
+or not, so discovery queries still rotate.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from dataclasses import dataclass, field
 from typing import Any
 from uuid import UUID
 
+from django.conf import settings
+from django.core.cache import cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -237,6 +251,7 @@ def generate_query_plan(
     snapshot_json: dict,
     *,
     model: str = "fast",
+    use_cache: bool = True,
 ) -> QueryPlan:
     """
     Generate a query plan from BrandBrainSnapshot.
@@ -245,6 +260,8 @@ def generate_query_plan(
         brand_id: The brand UUID
         snapshot_json: The BrandBrainSnapshot.snapshot_json
         model: LLM model to use ("fast" or "heavy")
+        use_cache: Reuse a cached plan for identical snapshot inputs
+            (False always calls the LLM; the result is still cached)
 
     Returns:
         QueryPlan with platform-specific search probes
@@ -271,6 +288,25 @@ def generate_query_plan(
         pillars_text=pillars_text,
     )
 
+    role = "fast" if model == "fast" else "heavy"
+    input_hash = plan_input_hash(
+        brand_name=brand_name,
+        positioning=positioning,
+        who_for=who_for,
+        pillars_text=pillars_text,
+        role=role,
+    )
+
+    if use_cache:
+        cached_output = get_cached_plan_output(brand_id, input_hash)
+        if cached_output is not None:
+            logger.info(
+                "QUERY_PLANNER_CACHE_HIT brand_id=%s input_hash=%s",
+                brand_id,
+                input_hash[:12],
+            )
+            return _mix_trend_bank_queries(_build_query_plan(brand_id, cached_output))
+
     logger.info(
         "QUERY_PLANNER_PROMPT brand_name=%s pillars_count=%d",
         brand_name,
@@ -279,10 +315,9 @@ def generate_query_plan(
 
     # Call LLM using the standard client
     try:
-        from kairo.hero.llm_client import LLMClient
+        from kairo.hero.llm_client import get_default_client
 
-        client = LLMClient()
-        role = "fast" if model == "fast" else "heavy"
+        client = get_default_client()
 
         llm_response = client.call(
             brand_id=UUID(brand_id),
@@ -302,6 +337,8 @@ def generate_query_plan(
 
         # Parse and validate response
         plan = _parse_llm_response(brand_id, response)
+        if plan.probes:
+            set_cached_plan_output(brand_id, input_hash, plan.raw_llm_output)
 
         # Mix in trend bank queries for guaranteed discovery
         plan = _mix_trend_bank_queries(plan)
@@ -350,6 +387,11 @@ def _parse_llm_response(brand_id: str, response: str) -> QueryPlan:
         )
         raise ValueError(f"Invalid JSON in LLM response: {e}")
 
+    return _build_query_plan(brand_id, data)
+
+
+def _build_query_plan(brand_id: str, data: dict) -> QueryPlan:
+    """Validate parsed LLM output (fresh or cached) into a QueryPlan."""
     # Validate and extract probes
     probes = {}
 
@@ -543,6 +585,72 @@ def _mix_trend_bank_queries(plan: QueryPlan) -> QueryPlan:
     return plan
 
 
+# =============================================================================
+# PLAN CACHE
+# =============================================================================
+
+QUERY_PLAN_KEY_PREFIX = "query_plan:v1"
+
+DEFAULT_QUERY_PLAN_CACHE_TTL_S = 604800  # 7 days
+
+
+def query_plan_cache_ttl() -> int:
+    """TTL (seconds) for cached query plans."""
+    return int(getattr(settings, "QUERY_PLAN_CACHE_TTL_S", DEFAULT_QUERY_PLAN_CACHE_TTL_S))
+
+
+def plan_input_hash(
+    *,
+    brand_name: str,
+    positioning: str,
+    who_for: str,
+    pillars_text: str,
+    role: str,
+) -> str:
+    """
+    Stable hash of everything that shapes the query planner's LLM request.
+
+    Covers the snapshot fields the prompt reads (not the whole snapshot, so
+    unrelated snapshot changes keep the cached plan) and the prompt template
+    itself, so editing QUERY_PLANNER_PROMPT retires old plans.
+    """
+    inputs = {
+        "brand_name": brand_name,
+        "positioning": positioning,
+        "who_for": who_for,
+        "pillars_text": pillars_text,
+        "role": role,
+        "template": hashlib.sha256(QUERY_PLANNER_PROMPT.encode("utf-8")).hexdigest(),
+    }
+    encoded = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def get_query_plan_key(brand_id: str, input_hash: str) -> str:
+    return f"{QUERY_PLAN_KEY_PREFIX}:{brand_id}:{input_hash}"
+
+
+def get_cached_plan_output(brand_id: str, input_hash: str) -> dict | None:
+    """Cached LLM output for these inputs, or None on miss / cache error."""
+    try:
+        return cache.get(get_query_plan_key(brand_id, input_hash))
+    except Exception as e:
+        logger.warning("Failed to read query plan cache for brand %s: %s", brand_id, e)
+        return None
+
+
+def set_cached_plan_output(brand_id: str, input_hash: str, output: dict) -> None:
+    """Cache validated LLM output. Errors are logged, never raised."""
+    try:
+        cache.set(
+            get_query_plan_key(brand_id, input_hash),
+            output,
+            timeout=query_plan_cache_ttl(),
+        )
+    except Exception as e:
+        logger.warning("Failed to write query plan cache for brand %s: %s", brand_id, e)
+
+
 # =============================================================================
 # SNAPSHOT EXTRACTION HELPERS
 # =============================================================================
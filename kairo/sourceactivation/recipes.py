@@ -8,6 +8,7 @@ This module provides:
 - RecipeSpec dataclass for recipe definitions
 - RECIPE_REGISTRY with all platform recipes
 - Input builder functions for each recipe type
+- Recipe dependencies (depends_on) for the DAG scheduler in scheduler.py
 
 CRITICAL INVARIANTS (per PRD B.6):
 - SA-1: Instagram MUST use 2-stage acquisition
@@ -17,6 +18,7 @@ CRITICAL INVARIANTS (per PRD B.6):
 
 from __future__ import annotations
 
+import dataclasses
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -66,6 +68,18 @@ class RecipeSpec:
     # Filter between stages (None for single-stage)
     stage1_to_stage2_filter: Callable[[list[dict]], list[str]] | None = None
 
+    # DAG scheduling (see scheduler.py)
+    # depends_on: recipes whose raw output feeds this recipe's input. The
+    # recipe starts as soon as those in the execution plan have finished.
+    # upstream_seed_builder: (seed_pack, upstream raw items) -> seed pack
+    # handed to stage1_input_builder. None = use the seed pack as is.
+    depends_on: tuple[str, ...] = ()
+    upstream_seed_builder: Callable[["SeedPack", list[dict]], "SeedPack"] | None = None
+
+    @property
+    def stage_count(self) -> int:
+        return 2 if self.stage2_actor else 1
+
 
 # =============================================================================
 # INPUT BUILDERS - Instagram
@@ -388,6 +402,40 @@ def extract_trending_hashtags(trends_raw_items: list[dict]) -> list[str]:
     return top_hashtags
 
 
+def seed_pack_with_trending_hashtags(
+    seed_pack: "SeedPack",
+    trends_raw_items: list[dict],
+) -> "SeedPack":
+    """
+    Seed pack for TT-1, enriched with hashtags discovered by TT-TRENDS.
+
+    Upstream seed builder for TT-1 (TT-TRENDS → TT-1 chain). Returns the
+    seed pack unchanged when TT-TRENDS produced nothing usable, so TT-1
+    falls back to Query Planner output.
+    """
+    if not trends_raw_items:
+        logger.warning(
+            "TIKTOK_CHAIN TT-TRENDS produced no raw items, "
+            "TT-1 will use Query Planner fallback"
+        )
+        return seed_pack
+
+    trending_hashtags = extract_trending_hashtags(trends_raw_items)
+    if not trending_hashtags:
+        logger.warning(
+            "TIKTOK_CHAIN no trending hashtags extracted from TT-TRENDS, "
+            "TT-1 will use Query Planner fallback"
+        )
+        return seed_pack
+
+    logger.info(
+        "TIKTOK_CHAIN TT-TRENDS → TT-1 with %d trending hashtags: %s",
+        len(trending_hashtags),
+        trending_hashtags,
+    )
+    return dataclasses.replace(seed_pack, trending_hashtags=trending_hashtags)
+
+
 def build_tt_hashtag_input(seed_pack: "SeedPack") -> dict:
     """
     Build TikTok hashtag search input.
@@ -667,6 +715,7 @@ RECIPE_REGISTRY: dict[str, RecipeSpec] = {
 
     # TikTok recipes (single-stage, semantically rich)
     # Phase 3: Limits DOUBLED for more evidence collection
+    # TT-1 searches the hashtags TT-TRENDS discovered, so it waits for them
     "TT-1": RecipeSpec(
         recipe_id="TT-1",
         platform="tiktok",
@@ -678,6 +727,8 @@ RECIPE_REGISTRY: dict[str, RecipeSpec] = {
         stage2_input_builder=None,
         stage2_result_limit=None,
         stage1_to_stage2_filter=None,
+        depends_on=("TT-TRENDS-GENERAL", "TT-TRENDS-INDUSTRY"),
+        upstream_seed_builder=seed_pack_with_trending_hashtags,
     ),
 
     "TT-2": RecipeSpec(
@@ -768,7 +819,8 @@ RECIPE_REGISTRY: dict[str, RecipeSpec] = {
 # - GENERAL: What's trending across all of TikTok (viral moments)
 # - INDUSTRY: What's trending in the brand's specific market
 #
-# All recipes run in PARALLEL for speed (~3x faster than sequential)
+# Recipes run in PARALLEL for speed (~3x faster than sequential); TT-1 starts
+# as soon as both TT-TRENDS recipes finish (depends_on)
 DEFAULT_EXECUTION_PLAN = [
     "IG-1",              # Instagram hashtag search → Reel enrichment
     "IG-3",              # Instagram keyword search → Reel enrichment
@@ -0,0 +1,199 @@
+"""
+Recipe DAG Scheduler for SourceActivation.
+
+Recipes declare the recipes their input is derived from in
+RecipeSpec.depends_on (see recipes.py). build_recipe_dag() turns an execution
+plan into a DAG and RecipeScheduler decides which recipes start next:
+- A recipe is ready once every upstream recipe in the plan has finished,
+  successfully or not (a failed upstream means fallback input, not a skip)
+- Dependents start the moment their own upstreams finish, not when every
+  recipe started alongside them has
+- Ready recipes start critical-path first: most actor stages on the longest
+  chain from the recipe to the end of the DAG, ties broken by plan order
+- At most SOURCEACTIVATION_PLATFORM_CONCURRENCY[platform] recipes of one
+  platform run at once; unlisted platforms are bounded only by the executor
+
+The scheduler owns no threads or event loop: live.py drives it from both the
+thread pool and the async executor.
+
+Instagram Stage 2 (reel enrichment) stays inside its recipe node. Its input
+is the same recipe's Stage 1 output (SA-2), so it already starts as soon as
+Stage 1 is done.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable
+
+from django.conf import settings
+
+from kairo.sourceactivation.recipes import RecipeSpec, get_recipe
+
+if TYPE_CHECKING:
+    from kairo.sourceactivation.live import RecipeResult
+    from kairo.sourceactivation.types import SeedPack
+
+logger = logging.getLogger(__name__)
+
+# Per-platform concurrent recipe limits used when the setting is absent
+DEFAULT_PLATFORM_CONCURRENCY = {
+    "instagram": 2,
+    "tiktok": 3,
+    "youtube": 2,
+    "linkedin": 2,
+}
+
+
+def platform_concurrency() -> dict[str, int]:
+    limits = getattr(settings, "SOURCEACTIVATION_PLATFORM_CONCURRENCY", DEFAULT_PLATFORM_CONCURRENCY)
+    return {platform: max(1, int(limit)) for platform, limit in limits.items()}
+
+
+# =============================================================================
+# DAG
+# =============================================================================
+
+
+@dataclass
+class RecipeNode:
+    """One recipe in an execution plan's DAG."""
+    recipe_id: str
+    recipe: RecipeSpec
+    position: int  # index in the execution plan
+    depends_on: tuple[str, ...] = ()  # upstream recipes present in the plan
+    dependents: list[str] = field(default_factory=list)
+    critical_path: int = 0  # actor stages on the longest path to a sink
+
+
+def build_recipe_dag(
+    execution_plan: list[str],
+    lookup: Callable[[str], RecipeSpec | None] = get_recipe,
+) -> dict[str, RecipeNode]:
+    """
+    Build the recipe DAG for an execution plan.
+
+    Unknown recipes are skipped. Dependencies on recipes outside the plan
+    are dropped, so the dependent runs with its unenriched seed pack.
+
+    Raises:
+        ValueError: If the dependencies form a cycle
+    """
+    nodes: dict[str, RecipeNode] = {}
+    for recipe_id in execution_plan:
+        recipe = lookup(recipe_id)
+        if not recipe:
+            logger.warning("Recipe %s not found, skipping", recipe_id)
+            continue
+        nodes[recipe_id] = RecipeNode(recipe_id=recipe_id, recipe=recipe, position=len(nodes))
+
+    for node in nodes.values():
+        node.depends_on = tuple(dep for dep in node.recipe.depends_on if dep in nodes)
+        for dep in node.depends_on:
+            nodes[dep].dependents.append(node.recipe_id)
+
+    # Kahn's algorithm: topological order, or a cycle if nodes are left over
+    indegree = {recipe_id: len(node.depends_on) for recipe_id, node in nodes.items()}
+    order = [recipe_id for recipe_id, count in indegree.items() if count == 0]
+    for recipe_id in order:
+        for dependent in nodes[recipe_id].dependents:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                order.append(dependent)
+
+    if len(order) < len(nodes):
+        cycle = sorted(recipe_id for recipe_id, count in indegree.items() if count > 0)
+        raise ValueError(f"Recipe dependency cycle: {', '.join(cycle)}")
+
+    for recipe_id in reversed(order):
+        node = nodes[recipe_id]
+        node.critical_path = node.recipe.stage_count + max(
+            (nodes[dependent].critical_path for dependent in node.dependents),
+            default=0,
+        )
+
+    return nodes
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+
+class RecipeScheduler:
+    """
+    Tracks one execution of a recipe DAG.
+
+    Drivers loop: start_ready() with their free capacity, run what it returns,
+    and report each outcome with finish() until is_done().
+    """
+
+    def __init__(
+        self,
+        nodes: dict[str, RecipeNode],
+        platform_limits: dict[str, int] | None = None,
+    ):
+        self.nodes = nodes
+        self.platform_limits = platform_concurrency() if platform_limits is None else platform_limits
+        self._pending = set(nodes)
+        self._running: Counter[str] = Counter()
+        self._results: dict[str, "RecipeResult | None"] = {}
+
+    def is_done(self) -> bool:
+        return not self._pending and not sum(self._running.values())
+
+    def start_ready(self, capacity: int) -> list[RecipeNode]:
+        """
+        Pick up to `capacity` ready recipes to start now, critical path first.
+
+        Recipes over their platform limit stay pending for a later call.
+        """
+        ready = sorted(
+            (
+                self.nodes[recipe_id]
+                for recipe_id in self._pending
+                if all(dep in self._results for dep in self.nodes[recipe_id].depends_on)
+            ),
+            key=lambda node: (-node.critical_path, node.position),
+        )
+
+        started: list[RecipeNode] = []
+        for node in ready:
+            if len(started) >= capacity:
+                break
+            platform = node.recipe.platform
+            limit = self.platform_limits.get(platform)
+            if limit is not None and self._running[platform] >= limit:
+                continue
+            self._pending.discard(node.recipe_id)
+            self._running[platform] += 1
+            started.append(node)
+        return started
+
+    def cancel_pending(self) -> list[str]:
+        """Drop recipes that have not started; returns their IDs in plan order."""
+        cancelled = sorted(self._pending, key=lambda recipe_id: self.nodes[recipe_id].position)
+        self._pending.clear()
+        return cancelled
+
+    def finish(self, recipe_id: str, result: "RecipeResult | None") -> None:
+        """Record a finished recipe (result is None if it raised)."""
+        self._running[self.nodes[recipe_id].recipe.platform] -= 1
+        self._results[recipe_id] = result
+
+    def seed_pack_for(self, node: RecipeNode, seed_pack: "SeedPack") -> "SeedPack":
+        """Seed pack for a ready recipe, derived from its upstream output."""
+        builder = node.recipe.upstream_seed_builder
+        if builder is None or not node.depends_on:
+            return seed_pack
+
+        upstream_raw_items = [
+            item.raw_json
+            for dep in node.depends_on
+            if (result := self._results.get(dep)) is not None and result.success
+            for item in result.items
+            if item.raw_json
+        ]
+        return builder(seed_pack, upstream_raw_items)
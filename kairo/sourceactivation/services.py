@@ -47,6 +47,7 @@ def derive_seed_pack(
 
     QUERY PLANNER INTEGRATION:
     - When use_query_planner=True, calls LLM to generate semantic search probes
+      (reused from cache while the snapshot's planner inputs are unchanged)
     - Probes are stored in tiktok_queries, instagram_queries, etc.
     - Recipes use these instead of naive brand-name searches
 
@@ -443,6 +444,8 @@ def _create_live_bundle(
         recipes_selected=execution_plan,
         recipes_executed=result.recipes_executed,
         estimated_cost=float(result.total_cost),
+        early_exit_reason=result.early_exit_reason,
+        cancelled_runs=result.cancelled_runs,
     )
 
     logger.info(
@@ -473,6 +476,8 @@ def _persist_evidence(
     recipes_selected: list[str] | None = None,
     recipes_executed: list[str] | None = None,
     estimated_cost: float = 0,
+    early_exit_reason: str | None = None,
+    cancelled_runs: list[dict] | None = None,
 ) -> tuple[UUID, list[EvidenceItemData]]:
     """
     Persist evidence items to database.
@@ -497,6 +502,8 @@ def _persist_evidence(
         recipes_selected: List of recipe IDs that were selected for execution
         recipes_executed: List of recipe IDs that were actually executed
         estimated_cost: Estimated Apify cost for this run (USD)
+        early_exit_reason: Why live activation stopped early, if it did
+        cancelled_runs: Apify runs aborted after the evidence quota was met
 
     Returns:
         Tuple of (activation_run_id, persisted_items)
@@ -544,6 +551,8 @@ def _persist_evidence(
             item_count=len(items),
             items_with_transcript=sum(1 for i in items if i.has_transcript),
             estimated_cost_usd=estimated_cost,
+            early_exit_reason=early_exit_reason or "",
+            cancelled_runs=cancelled_runs or [],
         )
 
         persisted_items = []
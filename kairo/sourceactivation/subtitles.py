@@ -0,0 +1,277 @@
+"""
+TikTok Subtitle Fetching.
+
+clockworks/tiktok-scraper returns subtitle download links
+(videoMeta.subtitleLinks[].tiktokLink) rather than subtitle text. Fetching
+them one by one inside the normalizer cost up to 10s per video, serially,
+so a 30-video recipe could spend minutes on transcripts.
+
+fetch_transcripts() runs that work as one batch per normalized page:
+- One shared requests.Session (pooled connections) for all fetches
+- Up to TIKTOK_SUBTITLE_CONCURRENCY fetches in flight
+- Per-fetch timeout (TIKTOK_SUBTITLE_TIMEOUT_S) and a deadline for the
+  whole batch (TIKTOK_SUBTITLE_BUDGET_S); links not fetched by then are
+  treated as missing, exactly like a failed fetch
+- Fetched text is cached by video id + language (falling back to a hash of
+  the URL). Subtitle URLs are signed and change between scrapes, the video
+  id does not, so re-scraping a video never re-fetches its subtitles.
+
+Links are tried in preference order (English first, then any language); a
+video's next link is only fetched if the previous one yielded no text.
+
+CRITICAL: Subtitle parsing is DETERMINISTIC and makes NO LLM calls (SA-4).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SUBTITLE_CONCURRENCY = 8
+DEFAULT_SUBTITLE_TIMEOUT_S = 10.0
+DEFAULT_SUBTITLE_BUDGET_S = 30.0
+DEFAULT_SUBTITLE_CACHE_TTL_S = 604800  # 7 days
+
+SUBTITLE_KEY_PREFIX = "tiktok_subtitle:v1"
+
+
+def subtitle_concurrency() -> int:
+    return max(1, int(getattr(settings, "TIKTOK_SUBTITLE_CONCURRENCY", DEFAULT_SUBTITLE_CONCURRENCY)))
+
+
+def subtitle_timeout_s() -> float:
+    return float(getattr(settings, "TIKTOK_SUBTITLE_TIMEOUT_S", DEFAULT_SUBTITLE_TIMEOUT_S))
+
+
+def subtitle_budget_s() -> float:
+    return float(getattr(settings, "TIKTOK_SUBTITLE_BUDGET_S", DEFAULT_SUBTITLE_BUDGET_S))
+
+
+def subtitle_cache_ttl() -> int:
+    return int(getattr(settings, "TIKTOK_SUBTITLE_CACHE_TTL_S", DEFAULT_SUBTITLE_CACHE_TTL_S))
+
+
+# =============================================================================
+# LINKS
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class SubtitleLink:
+    """A fetchable subtitle file and its cache key."""
+    url: str
+    cache_key: str
+
+
+def get_subtitle_key(video_id: str, language: str, url: str) -> str:
+    if video_id:
+        return f"{SUBTITLE_KEY_PREFIX}:{video_id}:{language or 'und'}"
+    return f"{SUBTITLE_KEY_PREFIX}:url:{hashlib.sha256(url.encode()).hexdigest()}"
+
+
+def _is_english(language: str) -> bool:
+    language = language.lower()
+    return "eng" in language or "en" in language
+
+
+def subtitle_links(raw: dict[str, Any]) -> list[SubtitleLink]:
+    """Fetchable subtitle links of a TikTok item, English first."""
+    entries = (raw.get("videoMeta") or {}).get("subtitleLinks") or []
+    video_id = str(raw.get("id") or "")
+
+    english, other = [], []
+    for entry in entries:
+        url = entry.get("tiktokLink")
+        if not url:
+            continue
+        language = entry.get("language", "")
+        link = SubtitleLink(url=url, cache_key=get_subtitle_key(video_id, language, url))
+        (english if _is_english(language) else other).append(link)
+    return english + other
+
+
+# =============================================================================
+# FETCHING
+# =============================================================================
+
+
+_session_lock = threading.Lock()
+_session: requests.Session | None = None
+
+
+def get_session() -> requests.Session:
+    """Process-wide session; its pool fits TIKTOK_SUBTITLE_CONCURRENCY."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=subtitle_concurrency(),
+                pool_maxsize=subtitle_concurrency(),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def parse_subtitle_text(raw_content: str) -> str:
+    """
+    Extract spoken text from WebVTT or SRT content.
+
+    Drops the WEBVTT header, NOTE comments, cue timing lines
+    ("00:00:01.000 --> 00:00:04.000") and SRT index lines.
+    """
+    text_lines = []
+    for line in raw_content.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("WEBVTT") or line.startswith("NOTE"):
+            continue
+        if "-->" in line:
+            continue
+        if line.isdigit():
+            continue
+        text_lines.append(line)
+    return " ".join(text_lines)
+
+
+def fetch_subtitle(url: str, timeout: float | None = None) -> str:
+    """
+    Fetch and parse one subtitle file.
+
+    Returns the extracted text, or empty string on any failure.
+    """
+    if not url:
+        return ""
+    try:
+        response = get_session().get(url, timeout=timeout or subtitle_timeout_s())
+        response.raise_for_status()
+        return parse_subtitle_text(response.text)
+    except requests.RequestException as e:
+        logger.warning("Failed to fetch subtitle from %s: %s", url[:100], str(e))
+        return ""
+    except Exception as e:
+        logger.warning("Error parsing subtitle from %s: %s", url[:100], str(e))
+        return ""
+
+
+def _get_cached(keys: list[str]) -> dict[str, str]:
+    if not keys:
+        return {}
+    try:
+        return cache.get_many(keys)
+    except Exception as e:
+        logger.warning("Failed to read cached subtitles: %s", e)
+        return {}
+
+
+def _set_cached(values: dict[str, str]) -> None:
+    if not values:
+        return
+    try:
+        cache.set_many(values, timeout=subtitle_cache_ttl())
+    except Exception as e:
+        logger.warning("Failed to cache subtitles: %s", e)
+
+
+def fetch_transcripts(raw_items: list[dict[str, Any]]) -> dict[str, str]:
+    """
+    Fetch subtitle text for a batch of TikTok items.
+
+    Returns {subtitle URL: text} for every link that produced text, from
+    cache or a fetch. Each item's links are tried in subtitle_links() order
+    until one has text, in rounds: round N fetches the N-th link of every
+    item still without a transcript.
+    """
+    pending = [links for links in map(subtitle_links, raw_items) if links]
+    if not pending:
+        return {}
+
+    transcripts: dict[str, str] = {}
+    deadline = time.monotonic() + subtitle_budget_s()
+    fetched = cached_hits = 0
+
+    executor = ThreadPoolExecutor(
+        max_workers=subtitle_concurrency(),
+        thread_name_prefix="tiktok-subtitles",
+    )
+    try:
+        while pending:
+            round_links = {links[0].url: links[0] for links in pending}
+            cached = _get_cached([link.cache_key for link in round_links.values()])
+            to_fetch = []
+            for url, link in round_links.items():
+                if cached.get(link.cache_key):
+                    transcripts[url] = cached[link.cache_key]
+                    cached_hits += 1
+                else:
+                    to_fetch.append(link)
+
+            results = _fetch_round(executor, to_fetch, deadline)
+            fetched += len(results)
+            _set_cached({link.cache_key: text for link, text in results if text})
+            transcripts.update((link.url, text) for link, text in results if text)
+
+            if time.monotonic() >= deadline:
+                break
+            pending = [
+                links[1:]
+                for links in pending
+                if links[0].url not in transcripts and len(links) > 1
+            ]
+    finally:
+        # Don't block on fetches that outlived the deadline
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    logger.info(
+        "Subtitle batch: %d items, %d transcripts (%d cached, %d fetched)",
+        len(raw_items),
+        len(transcripts),
+        cached_hits,
+        fetched,
+    )
+    return transcripts
+
+
+def _fetch_round(
+    executor: ThreadPoolExecutor,
+    links: list[SubtitleLink],
+    deadline: float,
+) -> list[tuple[SubtitleLink, str]]:
+    """Fetch links concurrently; links unfinished at the deadline are dropped."""
+    futures = {}
+    for link in links:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        timeout = min(subtitle_timeout_s(), remaining)
+        futures[executor.submit(fetch_subtitle, link.url, timeout)] = link
+
+    results = []
+    not_done = set(futures)
+    while not_done:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, not_done = wait(not_done, timeout=remaining, return_when=FIRST_COMPLETED)
+        results.extend((futures[future], future.result()) for future in done)
+
+    for future in not_done:
+        future.cancel()
+    if not_done:
+        logger.warning("Subtitle batch deadline hit with %d fetches pending", len(not_done))
+    return results
@@ -27,6 +27,11 @@ urlpatterns = [
         "api/",
         include("kairo.core.api.urls", namespace="core_api"),
     ),
+    # Apify run-completion webhooks (secret-header auth, no user JWT)
+    path(
+        "api/integrations/apify/",
+        include("kairo.integrations.apify.urls", namespace="apify"),
+    ),
     # PR-5: BrandBrain API endpoints
     path(
         "api/brands/<str:brand_id>/brandbrain/",
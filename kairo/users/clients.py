@@ -0,0 +1,163 @@
+"""
+Per-user API client registry.
+
+Phase 2: BYOK (Bring Your Own Key)
+
+Jobs and graph invocations used to query UserAPIKeys and Fernet-decrypt the
+user's key on every call, then build a fresh OpenAI client or
+requests.Session, losing connection reuse. The registry keeps one client
+per (kind, user) per process, so the key lookup happens once per TTL and
+HTTP connections stay warm.
+
+INVALIDATION:
+- UserAPIKeysView.put calls invalidate_user_clients() after saving, which
+  drops this process's entries and bumps the user's key version in the
+  Django cache (shared via Redis in production).
+- Every lookup compares the entry's key version with the cached one, so
+  other processes (job workers) rebuild on their next lookup.
+- BYOK_CLIENT_CACHE_TTL_S bounds how long any entry lives regardless.
+
+The registry also caches "user has no key" (factory returned None), so
+users without BYOK skip the DB lookup too.
+
+Thread-safe. Clients are shared across threads (the OpenAI client and
+requests.Session both pool connections for concurrent use).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Client kinds
+OPENAI_CLIENT = "openai"
+APIFY_CLIENT = "apify"
+
+# Django cache key holding a user's current key version (random token)
+KEY_VERSION_PREFIX = "byok_key_version:v1"
+
+DEFAULT_CLIENT_CACHE_TTL_S = 900
+DEFAULT_CLIENT_CACHE_MAX_ENTRIES = 256
+
+
+def client_cache_ttl() -> float:
+    """Seconds a cached per-user client is reused."""
+    return float(getattr(settings, "BYOK_CLIENT_CACHE_TTL_S", DEFAULT_CLIENT_CACHE_TTL_S))
+
+
+def client_cache_max_entries() -> int:
+    """Maximum per-user clients held per process (LRU beyond that)."""
+    return int(
+        getattr(settings, "BYOK_CLIENT_CACHE_MAX_ENTRIES", DEFAULT_CLIENT_CACHE_MAX_ENTRIES)
+    )
+
+
+def get_key_version_key(user_id) -> str:
+    return f"{KEY_VERSION_PREFIX}:{user_id}"
+
+
+def _read_key_version(user_id) -> str | None:
+    try:
+        return cache.get(get_key_version_key(user_id))
+    except Exception as e:
+        logger.warning("Failed to read BYOK key version for user %s: %s", user_id, e)
+        return None
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+
+class UserClientRegistry:
+    """
+    TTL- and size-bounded LRU of per-user clients.
+
+    Entries: (kind, user_id) -> (expires_at, key_version, client).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, Hashable], tuple[float, str | None, Any]] = (
+            OrderedDict()
+        )
+
+    def get_or_create(self, kind: str, user_id, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached client for (kind, user_id), building it on a miss.
+
+        factory() runs outside the lock; it may return None (cached as "no
+        key") and may raise (nothing is cached, the error propagates).
+        """
+        key = (kind, str(user_id))
+        version = _read_key_version(user_id)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, entry_version, client = entry
+                if expires_at > now and entry_version == version:
+                    self._entries.move_to_end(key)
+                    return client
+                del self._entries[key]
+
+        client = factory()
+
+        with self._lock:
+            self._entries[key] = (now + client_cache_ttl(), version, client)
+            self._entries.move_to_end(key)
+            while len(self._entries) > client_cache_max_entries():
+                self._entries.popitem(last=False)
+
+        return client
+
+    def invalidate_user(self, user_id) -> None:
+        """Drop this process's clients for a user."""
+        user_key = str(user_id)
+        with self._lock:
+            for key in [k for k in self._entries if k[1] == user_key]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_registry = UserClientRegistry()
+
+
+def get_user_client(kind: str, user_id, factory: Callable[[], Any]) -> Any:
+    """Get a per-user client from the process-wide registry."""
+    return _registry.get_or_create(kind, user_id, factory)
+
+
+def invalidate_user_clients(user_id) -> None:
+    """
+    Invalidate a user's cached clients in every process.
+
+    Call after the user's API keys change. Never raises.
+    """
+    _registry.invalidate_user(user_id)
+    try:
+        cache.set(get_key_version_key(user_id), uuid.uuid4().hex, timeout=None)
+    except Exception as e:
+        logger.warning("Failed to bump BYOK key version for user %s: %s", user_id, e)
+
+
+def reset_user_clients() -> None:
+    """Drop every cached client in this process (for tests)."""
+    _registry.clear()
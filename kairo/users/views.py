@@ -26,6 +26,7 @@ from django.utils import timezone
 
 from kairo.middleware.supabase_auth import get_current_user
 from kairo.users.models import User, UserAPIKeys
+from kairo.users.clients import invalidate_user_clients
 from kairo.users.encryption import encrypt_api_key, decrypt_api_key, get_last4, is_encryption_configured
 from kairo.core.models import Tenant
 
@@ -284,6 +285,9 @@ class UserAPIKeysView(View):
 
         api_keys.save()
 
+        # Cached per-user LLM / Apify clients hold the old keys
+        invalidate_user_clients(user.id)
+
         logger.info("Updated API keys for user %s", user.email)
 
         return JsonResponse({
@@ -12,6 +12,7 @@ E) Status endpoint - read-only, returns correct shape for all states
 F) Evidence status - LinkedIn profile posts skipped by default
 G) Query count - GET /status is bounded (small, constant)
 H) Input hash - deterministic hashing for short-circuit
+J) Status cache - read-through, worker write-through
 """
 
 from __future__ import annotations
@@ -865,3 +866,86 @@ class TestCrossBrandSecurity:
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "PENDING"
+
+
+# =============================================================================
+# J) STATUS READ-THROUGH CACHE
+# =============================================================================
+
+
+@pytest.mark.db
+class TestCompileStatusCache:
+    """GET /status is served from cache between worker status transitions."""
+
+    def test_hit_costs_no_queries(
+        self, db, brand_with_onboarding, existing_snapshot, django_assert_num_queries
+    ):
+        from kairo.brandbrain.compile import get_compile_status_json
+
+        run_id = existing_snapshot.compile_run.id
+        first = get_compile_status_json(run_id, brand_with_onboarding.id)
+
+        with django_assert_num_queries(0):
+            second = get_compile_status_json(run_id, brand_with_onboarding.id)
+
+        assert second == first
+        data = json.loads(second)
+        assert data["status"] == "SUCCEEDED"
+        assert data["snapshot"]["snapshot_id"] == str(existing_snapshot.id)
+
+    def test_cached_entry_enforces_brand(self, db, brand_with_onboarding, brand_b):
+        from kairo.brandbrain.compile import get_compile_status_json
+        from kairo.brandbrain.models import BrandBrainCompileRun
+
+        run = BrandBrainCompileRun.objects.create(brand=brand_with_onboarding, status="PENDING")
+        assert get_compile_status_json(run.id, brand_with_onboarding.id) is not None
+
+        assert get_compile_status_json(run.id, brand_b.id) is None
+
+    def test_worker_transition_replaces_cached_status(self, db, brand_with_onboarding):
+        from kairo.brandbrain.compile import get_compile_status_json
+        from kairo.brandbrain.compile.service import publish_compile_status
+        from kairo.brandbrain.models import BrandBrainCompileRun
+
+        run = BrandBrainCompileRun.objects.create(brand=brand_with_onboarding, status="PENDING")
+        get_compile_status_json(run.id, brand_with_onboarding.id)
+
+        run.status = "RUNNING"
+        run.save(update_fields=["status"])
+        publish_compile_status(run)
+
+        data = json.loads(get_compile_status_json(run.id, brand_with_onboarding.id))
+        assert data["status"] == "RUNNING"
+        assert "progress" in data
+
+    def test_reader_fill_never_overwrites_worker_write(self, db, brand_with_onboarding):
+        from kairo.brandbrain.cache import get_compile_status_body, set_compile_status_body
+
+        run_id = uuid.uuid4()
+        set_compile_status_body(run_id, brand_with_onboarding.id, '{"status": "RUNNING"}')
+
+        # A reader that loaded PENDING before the transition fills late
+        set_compile_status_body(
+            run_id, brand_with_onboarding.id, '{"status": "PENDING"}', replace=False
+        )
+
+        assert get_compile_status_body(run_id, brand_with_onboarding.id) == '{"status": "RUNNING"}'
+
+    def test_failed_compile_publishes_status(self, db, brand_with_onboarding):
+        from kairo.brandbrain.compile import get_compile_status_json
+        from kairo.brandbrain.compile.worker import execute_compile_job
+        from kairo.brandbrain.models import BrandBrainCompileRun
+
+        run = BrandBrainCompileRun.objects.create(brand=brand_with_onboarding, status="PENDING")
+        get_compile_status_json(run.id, brand_with_onboarding.id)
+
+        with patch(
+            "kairo.brandbrain.compile.worker._log_llm_config",
+            side_effect=RuntimeError("boom"),
+        ):
+            with pytest.raises(RuntimeError):
+                execute_compile_job(run.id)
+
+        data = json.loads(get_compile_status_json(run.id, brand_with_onboarding.id))
+        assert data["status"] == "FAILED"
+        assert data["error"] == "boom"
@@ -212,6 +212,27 @@ class TestJobClaim:
         assert claim_result.claimed is False
         assert claim_result.job is None
 
+    def test_claim_serves_interactive_lane_first(self, db, brand, compile_run):
+        """A user-triggered compile is claimed ahead of older scheduled ones."""
+        from kairo.core.enums import JobPriority
+
+        scheduled = enqueue_compile_job(
+            brand_id=brand.id,
+            compile_run_id=compile_run.id,
+            priority=JobPriority.SCHEDULED,
+        )
+        interactive = enqueue_compile_job(
+            brand_id=brand.id,
+            compile_run_id=compile_run.id,
+        )
+
+        first = claim_next_job(worker_id="test-worker-1")
+        second = claim_next_job(worker_id="test-worker-1")
+
+        assert first.job.id == interactive.job_id
+        assert second.job.id == scheduled.job_id
+        assert first.job.tenant_id == brand.tenant_id
+
 
 @pytest.mark.db
 class TestJobComplete:
@@ -8,7 +8,7 @@ A) Contract Tests: Response shapes match spec interfaces
 B) Include Params: ?include=evidence,qa,bundle,full
 C) Overrides CRUD: GET/PATCH /overrides
 D) Cross-Brand Data Isolation: brand_id scoping (NO auth enforcement)
-E) Query Count: Bounded queries (no N+1)
+E) Query Count: Bounded queries (no N+1); conditional GET and read cache
 F) Read-Path Boundary: No side effects on read endpoints
 
 NOTE: Auth/ownership enforcement is NOT implemented (out of scope for PRD v1).
@@ -730,6 +730,141 @@ class TestQueryCount:
         assert response.status_code == 200
 
 
+# =============================================================================
+# E2) CONDITIONAL GET (ETag / If-None-Match)
+# =============================================================================
+
+
+@pytest.mark.db
+class TestLatestConditionalGet:
+    """GET /latest answers an unchanged poll with 304 after one id lookup."""
+
+    def _get(self, brand_id, query: str = "", **headers):
+        from django.test import RequestFactory
+
+        from kairo.brandbrain.api.views import latest_snapshot
+
+        request = RequestFactory().get(
+            f"/api/brands/{brand_id}/brandbrain/latest{query}", **headers
+        )
+        return latest_snapshot(request, str(brand_id))
+
+    def test_response_has_etag(self, db, brand_with_onboarding, snapshot_with_full_data):
+        response = self._get(brand_with_onboarding.id)
+
+        assert response.status_code == 200
+        assert response["ETag"].startswith('"')
+
+    def test_matching_etag_returns_304_in_one_query(
+        self, db, brand_with_onboarding, snapshot_with_full_data, django_assert_num_queries
+    ):
+        from django.core.cache import cache
+
+        etag = self._get(brand_with_onboarding.id)["ETag"]
+        cache.clear()
+
+        with django_assert_num_queries(1):
+            response = self._get(brand_with_onboarding.id, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+
+    def test_matching_etag_cached_costs_no_queries(
+        self, db, brand_with_onboarding, snapshot_with_full_data, django_assert_num_queries
+    ):
+        etag = self._get(brand_with_onboarding.id)["ETag"]
+
+        with django_assert_num_queries(0):
+            response = self._get(brand_with_onboarding.id, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_etag_varies_with_include(self, db, brand_with_onboarding, snapshot_with_full_data):
+        compact = self._get(brand_with_onboarding.id)["ETag"]
+        full = self._get(brand_with_onboarding.id, "?include=full")["ETag"]
+        reordered = self._get(brand_with_onboarding.id, "?include=qa,evidence")["ETag"]
+
+        assert compact != full
+        assert reordered == self._get(brand_with_onboarding.id, "?include=evidence,qa")["ETag"]
+        assert self._get(
+            brand_with_onboarding.id, "?include=full", HTTP_IF_NONE_MATCH=compact
+        ).status_code == 200
+
+    def test_new_snapshot_invalidates_etag(
+        self, db, brand_with_onboarding, snapshot_with_full_data, compile_run_succeeded
+    ):
+        from kairo.brandbrain.compile.service import publish_compile_status
+        from kairo.brandbrain.models import BrandBrainSnapshot
+
+        etag = self._get(brand_with_onboarding.id)["ETag"]
+        newer = BrandBrainSnapshot.objects.create(
+            brand=brand_with_onboarding,
+            compile_run=compile_run_succeeded,
+            snapshot_json={"positioning": {"what_we_do": {"value": "v2"}}},
+        )
+        publish_compile_status(compile_run_succeeded, newer)  # compile worker
+
+        response = self._get(brand_with_onboarding.id, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+
+@pytest.mark.db
+class TestLatestSnapshotCache:
+    """GET /latest is served from cache until the worker publishes a new snapshot."""
+
+    def _get(self, brand_id, query: str = ""):
+        from django.test import RequestFactory
+
+        from kairo.brandbrain.api.views import latest_snapshot
+
+        request = RequestFactory().get(f"/api/brands/{brand_id}/brandbrain/latest{query}")
+        return latest_snapshot(request, str(brand_id))
+
+    def test_hit_costs_no_queries(
+        self, db, brand_with_onboarding, snapshot_with_full_data, django_assert_num_queries
+    ):
+        first = self._get(brand_with_onboarding.id, "?include=full")
+
+        with django_assert_num_queries(0):
+            second = self._get(brand_with_onboarding.id, "?include=full")
+
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert json.loads(second.content)["snapshot_id"] == str(snapshot_with_full_data.id)
+
+    def test_variants_cached_separately(self, db, brand_with_onboarding, snapshot_with_full_data):
+        self._get(brand_with_onboarding.id)
+
+        full = json.loads(self._get(brand_with_onboarding.id, "?include=full").content)
+        compact = json.loads(self._get(brand_with_onboarding.id).content)
+
+        assert "qa_report" in full
+        assert "qa_report" not in compact
+
+    def test_published_snapshot_replaces_cached_one(
+        self, db, brand_with_onboarding, snapshot_with_full_data, compile_run_succeeded
+    ):
+        from kairo.brandbrain.compile.service import publish_compile_status
+        from kairo.brandbrain.models import BrandBrainSnapshot
+
+        self._get(brand_with_onboarding.id)
+        newer = BrandBrainSnapshot.objects.create(
+            brand=brand_with_onboarding,
+            compile_run=compile_run_succeeded,
+            snapshot_json={"positioning": {"what_we_do": {"value": "v2"}}},
+        )
+
+        publish_compile_status(compile_run_succeeded, newer)
+
+        data = json.loads(self._get(brand_with_onboarding.id).content)
+        assert data["snapshot_id"] == str(newer.id)
+
+    def test_missing_snapshot_not_cached(self, db, brand_with_onboarding):
+        assert self._get(brand_with_onboarding.id).status_code == 404
+
+
 # =============================================================================
 # F) READ-PATH BOUNDARY TESTS
 # =============================================================================
@@ -0,0 +1,146 @@
+"""
+Tests for the async Apify client.
+
+Runs AsyncApifyClient against the local FakeApifyServer (real HTTP on
+127.0.0.1, no Apify credits).
+"""
+
+import asyncio
+
+import pytest
+
+from kairo.core.guardrails import ApifyDisabledError
+from kairo.integrations.apify.async_client import AsyncApifyClient
+from kairo.integrations.apify.client import ApifyError, ApifyTimeoutError
+from kairo.integrations.apify.fake_server import FakeApifyServer
+
+
+@pytest.fixture
+def enable_apify(settings):
+    """Enable APIFY_ENABLED for tests that need to call client methods."""
+    settings.APIFY_ENABLED = True
+    yield
+    settings.APIFY_ENABLED = False
+
+
+@pytest.fixture
+def server():
+    with FakeApifyServer(run_duration_s=0.2, items_per_run=7) as fake:
+        yield fake
+
+
+def _run(coro_fn, server, **client_kwargs):
+    """Run coro_fn(client) with a fresh client on a fresh event loop."""
+    async def main():
+        async with AsyncApifyClient(
+            token="test-token", base_url=server.base_url, **client_kwargs
+        ) as client:
+            return await coro_fn(client)
+
+    return asyncio.run(main())
+
+
+class TestAsyncApifyClientInit:
+    """Tests for AsyncApifyClient initialization."""
+
+    def test_init_without_token_raises(self):
+        with pytest.raises(ValueError, match="token is required"):
+            AsyncApifyClient(token="")
+
+    def test_base_url_trailing_slash_stripped(self):
+        client = AsyncApifyClient(token="t", base_url="https://custom.apify.com/")
+        assert client.base_url == "https://custom.apify.com"
+        asyncio.run(client.aclose())
+
+
+@pytest.mark.usefixtures("enable_apify")
+class TestAsyncApifyClientCalls:
+    """Start / poll / fetch against the fake server."""
+
+    def test_start_poll_fetch(self, server):
+        async def flow(client):
+            run = await client.start_actor_run("apify~instagram-scraper", {"q": "x"})
+            assert run.status == "RUNNING"
+            done = await client.poll_run(run.run_id, timeout_s=5, interval_s=0.05)
+            items = await client.fetch_dataset_items(done.dataset_id, limit=5, offset=1)
+            return done, items
+
+        done, items = _run(flow, server)
+
+        assert done.is_success()
+        assert done.actor_id == "apify~instagram-scraper"
+        assert done.finished_at is not None
+        assert [item["url"] for item in items] == [
+            f"https://example.com/apify-instagram-scraper/{i}" for i in range(1, 6)
+        ]
+
+    def test_failed_run_reports_error_message(self):
+        with FakeApifyServer(fail_actors={"bad~actor"}) as server:
+            async def flow(client):
+                run = await client.start_actor_run("bad~actor", {})
+                return await client.poll_run(run.run_id, timeout_s=5, interval_s=0.05)
+
+            run = _run(flow, server)
+
+        assert run.status == "FAILED"
+        assert run.error_message == "Actor failed (fake server)"
+
+    def test_poll_timeout(self, server):
+        server.run_duration_s = 60
+
+        async def flow(client):
+            run = await client.start_actor_run("slow~actor", {})
+            await client.poll_run(run.run_id, timeout_s=0.2, interval_s=0.05)
+
+        with pytest.raises(ApifyTimeoutError):
+            _run(flow, server)
+
+    def test_http_error_raises_apify_error(self, server):
+        async def flow(client):
+            await client.poll_run("does-not-exist", timeout_s=1)
+
+        with pytest.raises(ApifyError) as exc_info:
+            _run(flow, server)
+
+        assert exc_info.value.status_code == 404
+
+    def test_connection_error_raises_apify_error(self):
+        with FakeApifyServer() as server:
+            base_url = server.base_url  # closed on exit
+
+        async def main():
+            async with AsyncApifyClient(token="t", base_url=base_url) as client:
+                await client.start_actor_run("any~actor", {})
+
+        with pytest.raises(ApifyError, match="Request failed"):
+            asyncio.run(main())
+
+    def test_concurrent_runs_share_pool(self, server):
+        async def flow(client):
+            runs = await asyncio.gather(
+                *(client.start_actor_run(f"actor~{i}", {}) for i in range(20))
+            )
+            return await asyncio.gather(
+                *(client.poll_run(r.run_id, timeout_s=5, interval_s=0.05) for r in runs)
+            )
+
+        results = _run(flow, server, max_connections=4)
+
+        assert all(r.is_success() for r in results)
+        assert server.stats["runs_started"] == 20
+        assert server.stats["max_running"] == 20
+
+
+class TestAsyncApifyClientGuardrails:
+    """PR-0: calls are blocked when APIFY_ENABLED=false."""
+
+    def test_disabled_blocks_calls(self, settings, server):
+        settings.APIFY_ENABLED = False
+
+        async def flow(client):
+            await client.start_actor_run("any~actor", {})
+
+        with pytest.raises(ApifyDisabledError):
+            _run(flow, server)
+
+        assert server.stats["runs_started"] == 0
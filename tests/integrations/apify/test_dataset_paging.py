@@ -0,0 +1,252 @@
+"""
+Tests for streaming Apify dataset fetches.
+
+Covers iter_dataset_pages / aiter_dataset_pages against FakeApifyServer,
+page-by-page RawApifyItem storage in ingest_source, chunked raw item
+reads in brandbrain normalization, and incremental normalization in
+kairo.sourceactivation.live.
+"""
+
+import asyncio
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from kairo.integrations.apify.async_client import AsyncApifyClient, aiter_dataset_pages
+from kairo.integrations.apify.client import ApifyClient, ApifyError, RunInfo, iter_dataset_pages
+from kairo.integrations.apify.fake_server import FakeApifyServer
+from kairo.sourceactivation import live
+
+
+@pytest.fixture(autouse=True)
+def enable_apify(settings):
+    settings.APIFY_ENABLED = True
+
+
+def _dataset(client):
+    run = client.start_actor_run("apify~fast", {})
+    return run.dataset_id
+
+
+# =============================================================================
+# PAGING
+# =============================================================================
+
+
+class TestIterDatasetPages:
+    """Test limit/offset paging against the fake server."""
+
+    def test_pages_whole_dataset(self):
+        with FakeApifyServer(run_duration_s=0, items_per_run=25) as server:
+            client = ApifyClient(token="t", base_url=server.base_url)
+            dataset_id = _dataset(client)
+            pages = list(iter_dataset_pages(client, dataset_id, page_size=10))
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        urls = [item["url"] for page in pages for item in page]
+        assert len(set(urls)) == 25
+        assert server.stats["dataset_requests"] == 3
+
+    def test_limit_caps_items_and_requests(self):
+        with FakeApifyServer(run_duration_s=0, items_per_run=25) as server:
+            client = ApifyClient(token="t", base_url=server.base_url)
+            dataset_id = _dataset(client)
+            pages = list(iter_dataset_pages(client, dataset_id, limit=12, page_size=10))
+
+        assert [len(page) for page in pages] == [10, 2]
+        assert server.stats["dataset_requests"] == 2
+
+    def test_exact_multiple_stops_on_empty_page(self):
+        with FakeApifyServer(run_duration_s=0, items_per_run=20) as server:
+            client = ApifyClient(token="t", base_url=server.base_url)
+            dataset_id = _dataset(client)
+            pages = list(iter_dataset_pages(client, dataset_id, page_size=10))
+
+        assert [len(page) for page in pages] == [10, 10]
+        assert server.stats["dataset_requests"] == 3
+
+    def test_page_size_from_settings(self, settings):
+        settings.APIFY_DATASET_PAGE_SIZE = 4
+        client = MagicMock(spec=ApifyClient)
+        client.fetch_dataset_items.side_effect = [[{}] * 4, [{}] * 4, [{}]]
+
+        pages = list(iter_dataset_pages(client, "ds-1", limit=100))
+
+        assert [len(page) for page in pages] == [4, 4, 1]
+        offsets = [c.kwargs["offset"] for c in client.fetch_dataset_items.call_args_list]
+        assert offsets == [0, 4, 8]
+
+    def test_async_pages(self):
+        async def main(server):
+            async with AsyncApifyClient(token="t", base_url=server.base_url) as client:
+                run = await client.start_actor_run("apify~fast", {})
+                return [
+                    len(page)
+                    async for page in aiter_dataset_pages(
+                        client, run.dataset_id, limit=23, page_size=10
+                    )
+                ]
+
+        with FakeApifyServer(run_duration_s=0, items_per_run=25) as server:
+            sizes = asyncio.run(main(server))
+
+        assert sizes == [10, 10, 3]
+        assert server.stats["dataset_requests"] == 3
+
+
+# =============================================================================
+# INGESTION
+# =============================================================================
+
+
+@pytest.mark.db
+class TestPagedIngestion:
+    """Test ingest_source stores raw items page by page."""
+
+    @pytest.fixture
+    def source(self, db):
+        from kairo.brandbrain.models import SourceConnection
+        from kairo.core.models import Brand, Tenant
+
+        tenant = Tenant.objects.create(name="Paging Tenant", slug="paging-tenant")
+        brand = Brand.objects.create(tenant=tenant, name="Paging Brand", slug="paging-brand")
+        return SourceConnection.objects.create(
+            brand=brand,
+            platform="instagram",
+            capability="posts",
+            identifier="pagingbrand",
+            is_enabled=True,
+        )
+
+    def test_multi_page_dataset_stored_contiguously(self, source, settings):
+        from kairo.brandbrain.ingestion import ingest_source
+        from kairo.integrations.apify.models import RawApifyItem
+
+        settings.APIFY_DATASET_PAGE_SIZE = 2
+        run_info = RunInfo(
+            run_id="paging-run",
+            actor_id="apify~instagram-scraper",
+            status="SUCCEEDED",
+            dataset_id="paging-dataset",
+            started_at=timezone.now(),
+            finished_at=timezone.now(),
+        )
+        items = [
+            {"id": str(i), "url": f"https://instagram.com/p/P{i}", "caption": f"post {i}"}
+            for i in range(5)
+        ]
+        client = MagicMock(spec=ApifyClient)
+        client.start_actor_run.return_value = run_info
+        client.poll_run.return_value = run_info
+        client.fetch_dataset_items.side_effect = [items[0:2], items[2:4], items[4:5]]
+
+        result = ingest_source(source, apify_client=client)
+
+        assert result.success is True
+        assert result.raw_items_count == 5
+        assert client.fetch_dataset_items.call_count == 3
+        stored = RawApifyItem.objects.filter(apify_run_id=result.apify_run_id).order_by("item_index")
+        assert [row.item_index for row in stored] == [0, 1, 2, 3, 4]
+        assert [row.raw_json["id"] for row in stored] == ["0", "1", "2", "3", "4"]
+
+    def _client(self, pages):
+        run_info = RunInfo(
+            run_id="paging-run",
+            actor_id="apify~instagram-scraper",
+            status="SUCCEEDED",
+            dataset_id="paging-dataset",
+            started_at=timezone.now(),
+            finished_at=timezone.now(),
+        )
+        client = MagicMock(spec=ApifyClient)
+        client.start_actor_run.return_value = run_info
+        client.poll_run.return_value = run_info
+        client.fetch_dataset_items.side_effect = pages
+        return client
+
+    def test_no_transaction_open_across_page_fetches(self, source, settings):
+        from kairo.brandbrain.ingestion import ingest_source
+
+        settings.APIFY_DATASET_PAGE_SIZE = 1
+        outer_depth = len(connection.atomic_blocks)
+        depths = []
+
+        def fetch(dataset_id, limit, offset):
+            depths.append(len(connection.atomic_blocks))
+            return [{"id": str(offset), "url": f"https://instagram.com/p/T{offset}"}] if offset < 2 else []
+
+        client = self._client(None)
+        client.fetch_dataset_items.side_effect = fetch
+
+        result = ingest_source(source, apify_client=client)
+
+        assert result.raw_items_count == 2
+        assert depths and set(depths) == {outer_depth}
+
+    def test_failed_page_drops_partial_items(self, source, settings):
+        from kairo.brandbrain.ingestion import ingest_source
+        from kairo.integrations.apify.models import ApifyRun, RawApifyItem
+
+        settings.APIFY_DATASET_PAGE_SIZE = 2
+        client = self._client([
+            [{"id": "0"}, {"id": "1"}],
+            ApifyError("dataset fetch failed"),
+        ])
+
+        result = ingest_source(source, apify_client=client)
+
+        assert result.success is False
+        assert "Failed to fetch dataset items" in result.error
+        run = ApifyRun.objects.get(id=result.apify_run_id)
+        assert not RawApifyItem.objects.filter(apify_run=run).exists()
+        assert run.raw_item_count == 0
+
+
+@pytest.mark.db
+class TestNormalizationRawItemChunks:
+    """Test brandbrain normalization reads raw items in keyset chunks."""
+
+    def test_chunks_respect_order_and_limit(self, db, monkeypatch):
+        from kairo.brandbrain.normalization import service
+        from kairo.integrations.apify.models import ApifyRun, RawApifyItem
+
+        monkeypatch.setattr(service, "RAW_ITEM_CHUNK_SIZE", 2)
+        run = ApifyRun.objects.create(actor_id="apify~instagram-scraper", apify_run_id="chunk-run")
+        RawApifyItem.objects.bulk_create([
+            RawApifyItem(apify_run=run, item_index=i, raw_json={"id": str(i)})
+            for i in (4, 0, 6, 2, 1, 5, 3)
+        ])
+
+        items = list(service._fetch_raw_items(run, limit=5))
+
+        assert [item.item_index for item in items] == [0, 1, 2, 3, 4]
+
+
+# =============================================================================
+# SOURCEACTIVATION
+# =============================================================================
+
+
+class TestFetchNormalized:
+    """Test incremental normalization in live recipe execution."""
+
+    def test_raw_sink_only_when_requested(self, settings):
+        settings.APIFY_DATASET_PAGE_SIZE = 10
+
+        with FakeApifyServer(run_duration_s=0, items_per_run=25) as server:
+            client = ApifyClient(token="t", base_url=server.base_url)
+            dataset_id = _dataset(client)
+            raw = []
+            with_sink = live._fetch_normalized(
+                client, dataset_id, 25, "apify~fast", "GEN-1", 1, uuid.uuid4(), raw_sink=raw
+            )
+            without_sink = live._fetch_normalized(
+                client, dataset_id, 25, "apify~fast", "GEN-1", 1, uuid.uuid4()
+            )
+
+        assert len(raw) == 25
+        assert len(with_sink) == len(without_sink) == 25
+        assert server.stats["dataset_requests"] == 6
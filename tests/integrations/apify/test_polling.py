@@ -0,0 +1,379 @@
+"""
+Tests for adaptive Apify run polling and completion webhooks.
+
+Covers kairo.integrations.apify.polling (policy, duration hints),
+kairo.integrations.apify.webhooks (finished-run registry) and the webhook
+view, plus ApifyClient / AsyncApifyClient polling against FakeApifyServer.
+"""
+
+import asyncio
+import base64
+import json
+import threading
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.utils import timezone
+
+from kairo.integrations.apify.async_client import AsyncApifyClient
+from kairo.integrations.apify.client import ApifyClient
+from kairo.integrations.apify.fake_server import FakeApifyServer
+from kairo.integrations.apify.polling import PollPolicy, expected_run_duration
+from kairo.integrations.apify.views import apify_run_webhook
+from kairo.integrations.apify.webhooks import (
+    get_finished_run,
+    record_finished_run,
+    run_webhooks_param,
+    wait_for_finished_run,
+)
+
+WEBHOOK_SECRET = "whsec-test"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def enable_apify(settings):
+    settings.APIFY_ENABLED = True
+
+
+@pytest.fixture
+def enable_webhooks(settings):
+    settings.APIFY_WEBHOOK_URL = "https://kairo.example.com/api/integrations/apify/webhook/"
+    settings.APIFY_WEBHOOK_SECRET = WEBHOOK_SECRET
+
+
+def _take(iterator, n):
+    return [next(iterator) for _ in range(n)]
+
+
+# =============================================================================
+# POLICY
+# =============================================================================
+
+
+class TestPollPolicy:
+    """Test delay schedule and long-poll sizing."""
+
+    def test_backoff_is_capped(self):
+        policy = PollPolicy(initial_s=1.0, max_s=5.0, backoff=2.0)
+
+        assert _take(policy.delays(), 5) == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_expected_duration_leads_schedule(self):
+        policy = PollPolicy(initial_s=1.0, max_s=15.0, backoff=2.0, expected_s=9.5)
+
+        assert _take(policy.delays(), 3) == [9.5, 1.0, 2.0]
+
+    def test_expected_duration_clamped_to_max(self):
+        policy = PollPolicy(initial_s=1.0, max_s=15.0, backoff=2.0, expected_s=120.0)
+
+        assert next(policy.delays()) == 15.0
+
+    def test_fixed_interval(self):
+        assert _take(PollPolicy.fixed(3).delays(), 3) == [3, 3, 3]
+        assert PollPolicy.fixed(3).long_poll_s(100) == 0
+
+    def test_long_poll_never_exceeds_remaining(self):
+        policy = PollPolicy(initial_s=1.0, max_s=15.0, backoff=2.0, wait_for_finish_s=60)
+
+        assert policy.long_poll_s(200) == 60
+        assert policy.long_poll_s(12.7) == 12
+        assert policy.long_poll_s(-1) == 0
+
+    def test_webhooks_disable_long_poll(self, settings, enable_webhooks):
+        settings.APIFY_WAIT_FOR_FINISH_S = 60
+
+        assert PollPolicy.adaptive().wait_for_finish_s == 0
+
+    def test_wait_for_finish_capped_at_apify_limit(self, settings):
+        settings.APIFY_WAIT_FOR_FINISH_S = 300
+
+        assert PollPolicy.adaptive().wait_for_finish_s == 60
+
+
+@pytest.mark.db
+class TestDurationHints:
+    """Test expected durations learned from ApifyRun history."""
+
+    def _run(self, actor_id, seconds, status="succeeded"):
+        from kairo.integrations.apify.models import ApifyRun
+
+        started = timezone.now() - timedelta(hours=1)
+        return ApifyRun.objects.create(
+            actor_id=actor_id,
+            apify_run_id=f"run-{ApifyRun.objects.count()}",
+            status=status,
+            started_at=started,
+            finished_at=started + timedelta(seconds=seconds),
+        )
+
+    def test_median_of_succeeded_runs(self, db):
+        for seconds in (10, 40, 20):
+            self._run("apify~tiktok-scraper", seconds)
+        self._run("apify~tiktok-scraper", 500, status="failed")
+
+        assert expected_run_duration("apify~tiktok-scraper") == 20
+
+    def test_no_history(self, db):
+        assert expected_run_duration("apify~unknown") is None
+
+    def test_hint_cached(self, db, django_assert_num_queries):
+        self._run("apify~tiktok-scraper", 30)
+        expected_run_duration("apify~tiktok-scraper")
+
+        with django_assert_num_queries(0):
+            assert expected_run_duration("apify~tiktok-scraper") == 30
+
+    def test_missing_history_cached(self, db, django_assert_num_queries):
+        expected_run_duration("apify~unknown")
+
+        with django_assert_num_queries(0):
+            assert expected_run_duration("apify~unknown") is None
+
+    def test_async_poll_uses_hint(self, transactional_db, enable_apify, settings):
+        settings.APIFY_WAIT_FOR_FINISH_S = 60
+        self._run("apify~tiktok-scraper", 30)
+        policies = []
+        adaptive = PollPolicy.adaptive.__func__
+
+        def spy(cls, actor_id=None):
+            policies.append(adaptive(cls, actor_id))
+            return policies[-1]
+
+        async def main(server):
+            async with AsyncApifyClient(token="t", base_url=server.base_url) as client:
+                run = await client.start_actor_run("apify~tiktok-scraper", {})
+                return await client.poll_run(
+                    run.run_id, timeout_s=30, actor_id="apify~tiktok-scraper"
+                )
+
+        with FakeApifyServer(run_duration_s=0.1) as server, \
+             patch.object(PollPolicy, "adaptive", classmethod(spy)):
+            result = asyncio.run(main(server))
+
+        assert result.is_success()
+        assert [policy.expected_s for policy in policies] == [30]
+
+
+# =============================================================================
+# CLIENT POLLING
+# =============================================================================
+
+
+@pytest.mark.usefixtures("enable_apify")
+class TestAdaptivePolling:
+    """Test poll_run against the fake server."""
+
+    def test_long_poll_resolves_with_one_request(self, settings):
+        settings.APIFY_WAIT_FOR_FINISH_S = 60
+
+        with FakeApifyServer(run_duration_s=0.5) as server:
+            client = ApifyClient(token="t", base_url=server.base_url)
+            run = client.start_actor_run("apify~fast", {})
+            started = time.monotonic()
+            result = client.poll_run(run.run_id, timeout_s=30)
+            waited = time.monotonic() - started
+
+        assert result.is_success()
+        assert server.stats["status_requests"] == 1
+        assert waited < 2
+
+    def test_backoff_without_long_poll(self, settings):
+        settings.APIFY_WAIT_FOR_FINISH_S = 0
+        settings.APIFY_POLL_INITIAL_S = 0.05
+        settings.APIFY_POLL_BACKOFF = 2.0
+
+        with FakeApifyServer(run_duration_s=0.5) as server:
+            client = ApifyClient(token="t", base_url=server.base_url)
+            run = client.start_actor_run("apify~fast", {})
+            result = client.poll_run(run.run_id, timeout_s=30)
+
+        assert result.is_success()
+        # 0.05 + 0.1 + 0.2 + 0.4 covers 0.5s: ~5 checks instead of one per interval
+        assert server.stats["status_requests"] <= 6
+
+    def test_async_long_poll(self, settings):
+        settings.APIFY_WAIT_FOR_FINISH_S = 60
+
+        async def main(server):
+            async with AsyncApifyClient(token="t", base_url=server.base_url) as client:
+                run = await client.start_actor_run("apify~fast", {})
+                return await client.poll_run(run.run_id, timeout_s=30)
+
+        with FakeApifyServer(run_duration_s=0.3) as server:
+            result = asyncio.run(main(server))
+
+        assert result.is_success()
+        assert server.stats["status_requests"] == 1
+
+
+# =============================================================================
+# WEBHOOKS
+# =============================================================================
+
+
+class TestFinishedRunRegistry:
+    """Test the webhook → waiter hand-off."""
+
+    def test_wait_returns_recorded_run(self):
+        record_finished_run({"id": "run-1", "status": "SUCCEEDED"})
+
+        assert wait_for_finished_run("run-1", timeout_s=0.1)["status"] == "SUCCEEDED"
+
+    def test_wait_times_out(self):
+        started = time.monotonic()
+
+        assert wait_for_finished_run("run-1", timeout_s=0.1) is None
+        assert time.monotonic() - started < 1
+
+    def test_record_wakes_waiter(self):
+        timer = threading.Timer(0.1, record_finished_run, args=[{"id": "run-1", "status": "FAILED"}])
+        timer.start()
+        started = time.monotonic()
+
+        result = wait_for_finished_run("run-1", timeout_s=10)
+
+        assert result["status"] == "FAILED"
+        assert time.monotonic() - started < 1
+
+    def test_webhooks_param(self, enable_webhooks):
+        definitions = json.loads(base64.b64decode(run_webhooks_param()))
+
+        assert definitions[0]["requestUrl"].endswith("/api/integrations/apify/webhook/")
+        assert "ACTOR.RUN.SUCCEEDED" in definitions[0]["eventTypes"]
+        assert json.loads(definitions[0]["headersTemplate"]) == {
+            "X-Kairo-Webhook-Secret": WEBHOOK_SECRET
+        }
+
+    def test_no_webhooks_param_when_unconfigured(self):
+        assert run_webhooks_param() is None
+
+
+@pytest.mark.usefixtures("enable_apify", "enable_webhooks")
+class TestWebhookPolling:
+    """Test poll_run resolving through a webhook."""
+
+    @patch("kairo.integrations.apify.client.requests.Session")
+    def test_start_attaches_webhook(self, mock_session_class):
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        mock_session.post.return_value.ok = True
+        mock_session.post.return_value.json.return_value = {"data": {"id": "run-1"}}
+
+        ApifyClient(token="t").start_actor_run("apify~actor", {})
+
+        assert mock_session.post.call_args.kwargs["params"] == {"webhooks": run_webhooks_param()}
+
+    def test_webhook_resolves_wait(self, settings):
+        settings.APIFY_POLL_INITIAL_S = 30
+
+        with FakeApifyServer(run_duration_s=60) as server:
+            client = ApifyClient(token="t", base_url=server.base_url)
+            run = client.start_actor_run("apify~slow", {})
+
+            def deliver_webhook():
+                server.finish_run(run.run_id)
+                record_finished_run({
+                    "id": run.run_id,
+                    "status": "SUCCEEDED",
+                    "defaultDatasetId": run.dataset_id,
+                })
+
+            threading.Timer(0.2, deliver_webhook).start()
+            started = time.monotonic()
+            result = client.poll_run(run.run_id, timeout_s=60)
+
+        assert result.is_success()
+        assert result.dataset_id == run.dataset_id
+        assert time.monotonic() - started < 5
+        assert server.stats["status_requests"] == 1
+
+    def test_async_webhook_wait_reads_cache_off_the_loop(self, settings):
+        settings.APIFY_POLL_INITIAL_S = 30
+        reader_threads = set()
+
+        def reading_finished_run(run_id):
+            reader_threads.add(threading.current_thread())
+            return get_finished_run(run_id)
+
+        async def main(server):
+            async with AsyncApifyClient(token="t", base_url=server.base_url) as client:
+                run = await client.start_actor_run("apify~slow", {})
+
+                def deliver_webhook():
+                    server.finish_run(run.run_id)
+                    record_finished_run({
+                        "id": run.run_id,
+                        "status": "SUCCEEDED",
+                        "defaultDatasetId": run.dataset_id,
+                    })
+
+                threading.Timer(0.2, deliver_webhook).start()
+                return await client.poll_run(run.run_id, timeout_s=60)
+
+        with FakeApifyServer(run_duration_s=60) as server, patch(
+            "kairo.integrations.apify.async_client.get_finished_run",
+            side_effect=reading_finished_run,
+        ):
+            started = time.monotonic()
+            result = asyncio.run(main(server))
+
+        assert result.is_success()
+        assert time.monotonic() - started < 5
+        assert reader_threads and threading.main_thread() not in reader_threads
+
+
+class TestWebhookView:
+    """Test POST /api/integrations/apify/webhook/."""
+
+    def _post(self, payload, secret=WEBHOOK_SECRET):
+        headers = {"HTTP_X_KAIRO_WEBHOOK_SECRET": secret} if secret else {}
+        request = RequestFactory().post(
+            "/api/integrations/apify/webhook/",
+            data=payload if isinstance(payload, str) else json.dumps(payload),
+            content_type="application/json",
+            **headers,
+        )
+        return apify_run_webhook(request)
+
+    def test_records_terminal_run(self, enable_webhooks):
+        response = self._post({
+            "eventType": "ACTOR.RUN.SUCCEEDED",
+            "resource": {"id": "run-1", "status": "SUCCEEDED"},
+        })
+
+        assert response.status_code == 200
+        assert get_finished_run("run-1")["status"] == "SUCCEEDED"
+
+    def test_ignores_non_terminal_event(self, enable_webhooks):
+        response = self._post({
+            "eventType": "ACTOR.RUN.CREATED",
+            "resource": {"id": "run-1", "status": "READY"},
+        })
+
+        assert json.loads(response.content) == {"recorded": False}
+        assert get_finished_run("run-1") is None
+
+    def test_wrong_secret_is_404(self, enable_webhooks):
+        response = self._post({"resource": {"id": "run-1"}}, secret="nope")
+
+        assert response.status_code == 404
+
+    def test_unconfigured_is_404(self):
+        response = self._post({"resource": {"id": "run-1"}}, secret="")
+
+        assert response.status_code == 404
+
+    def test_invalid_json(self, enable_webhooks):
+        assert self._post("{not json").status_code == 400
+        assert self._post({"eventType": "ACTOR.RUN.SUCCEEDED"}).status_code == 400
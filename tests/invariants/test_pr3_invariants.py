@@ -236,20 +236,20 @@ class TestActivationRunCRUD:
         assert opportunities_job.activation_runs.count() == 1
         assert opportunities_job.activation_runs.first().id == run.id
 
-    def test_activation_run_cascade_delete(self, brand, opportunities_job):
-        """Deleting job cascades to ActivationRun."""
+    def test_activation_run_detached_on_job_delete(self, brand, opportunities_job):
+        """Deleting job (e.g. archival) detaches ActivationRun, keeping the ledger."""
         run = ActivationRun.objects.create(
             job=opportunities_job,
             brand_id=brand.id,
             snapshot_id=uuid.uuid4(),
         )
-        run_id = run.id
 
         # Delete job
         opportunities_job.delete()
 
-        # Run should be deleted
-        assert not ActivationRun.objects.filter(id=run_id).exists()
+        # Run survives without its job
+        run.refresh_from_db()
+        assert run.job_id is None
 
 
 # =============================================================================
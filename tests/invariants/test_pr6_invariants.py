@@ -687,28 +687,40 @@ class TestAutoEnqueueNeverLiveMode:
         1. first_run=True → fixture_only (regardless of APIFY_ENABLED)
         2. force=True + APIFY_ENABLED=False → fixture_only
         3. force=True + APIFY_ENABLED=True → live_cap_limited (ONLY this case)
+
+        Each case finishes its job first so enqueue coalescing doesn't fold
+        the cases into one job.
         """
         from kairo.hero.jobs.queue import enqueue_opportunities_job
         from kairo.hero.models import OpportunitiesJob
 
+        def finish_jobs():
+            OpportunitiesJob.objects.filter(brand=brand).update(status="succeeded")
+
         # Case 1: first_run=True + APIFY_ENABLED=True → fixture_only
         with patch("kairo.core.guardrails.is_apify_enabled", return_value=True):
             result1 = enqueue_opportunities_job(brand.id, first_run=True)
         job1 = OpportunitiesJob.objects.get(id=result1.job_id)
         assert job1.params_json["mode"] == "fixture_only"
 
+        finish_jobs()
+
         # Case 2: force=True + APIFY_ENABLED=False → fixture_only
         with patch("kairo.core.guardrails.is_apify_enabled", return_value=False):
             result2 = enqueue_opportunities_job(brand.id, force=True)
         job2 = OpportunitiesJob.objects.get(id=result2.job_id)
         assert job2.params_json["mode"] == "fixture_only"
 
+        finish_jobs()
+
         # Case 3: force=True + APIFY_ENABLED=True → live_cap_limited (ONLY path)
         with patch("kairo.core.guardrails.is_apify_enabled", return_value=True):
             result3 = enqueue_opportunities_job(brand.id, force=True)
         job3 = OpportunitiesJob.objects.get(id=result3.job_id)
         assert job3.params_json["mode"] == "live_cap_limited"
 
+        finish_jobs()
+
         # Case 4: neither force nor first_run + APIFY_ENABLED=True → fixture_only
         with patch("kairo.core.guardrails.is_apify_enabled", return_value=True):
             result4 = enqueue_opportunities_job(brand.id)
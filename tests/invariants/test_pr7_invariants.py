@@ -16,6 +16,7 @@ These tests prove the caching and polling-storm defense mechanisms.
 
 import uuid
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -24,6 +25,9 @@ from django.core.cache import cache
 from kairo.core.enums import TodayBoardState
 from kairo.core.models import Brand
 
+if TYPE_CHECKING:
+    from kairo.hero.dto import TodayBoardDTO
+
 
 # =============================================================================
 # Fixtures
@@ -983,3 +987,541 @@ class TestRegenerateContractPreserved:
             job = OpportunitiesJob.objects.get(id=result.job_id)
             assert job.params_json["mode"] == "live_cap_limited"
             assert job.params_json["force"] is True
+
+
+# =============================================================================
+# 9. Cache hits served pre-serialized
+# =============================================================================
+
+
+def _ready_board(brand_id, **meta) -> "TodayBoardDTO":
+    from kairo.hero.dto import BrandSnapshotDTO, TodayBoardDTO, TodayBoardMetaDTO
+
+    return TodayBoardDTO(
+        brand_id=brand_id,
+        snapshot=BrandSnapshotDTO(brand_id=brand_id, brand_name="Test"),
+        opportunities=[],
+        meta=TodayBoardMetaDTO(
+            generated_at=datetime.now(timezone.utc),
+            state=TodayBoardState.READY,
+            ready_reason="fresh_generation",
+            **meta,
+        ),
+    )
+
+
+@pytest.mark.django_db
+class TestPreSerializedCacheHits:
+    """
+    Cached boards are stored as the final GET /today body.
+
+    Hits are returned without Pydantic parsing unless
+    TODAY_BOARD_CACHE_VALIDATE is set.
+    """
+
+    def test_stored_body_includes_hit_meta(self, brand: Brand):
+        import json
+
+        from kairo.hero.cache import get_cache_key, get_cached_board_json, set_cached_board
+
+        board = _ready_board(brand.id)
+        set_cached_board(brand.id, board)
+
+        meta = json.loads(get_cached_board_json(brand.id))["meta"]
+        assert meta["cache_hit"] is True
+        assert meta["ready_reason"] == "cache_hit"
+        assert meta["cache_key"] == get_cache_key(brand.id)
+        assert meta["cache_ttl_seconds"] == 21600
+        # The fresh response's own DTO is not marked as a hit
+        assert board.meta.cache_hit is False
+        assert board.meta.ready_reason == "fresh_generation"
+
+    def test_view_serves_cached_body_without_dto(self, brand: Brand, settings):
+        from django.test import RequestFactory
+
+        from kairo.hero import api_views
+        from kairo.hero.cache import get_cached_board_json, set_cached_board
+
+        settings.TODAY_BOARD_CACHE_VALIDATE = False
+        set_cached_board(brand.id, _ready_board(brand.id))
+        request = RequestFactory().get(f"/api/brands/{brand.id}/today/")
+
+        with patch("kairo.hero.dto.TodayBoardDTO.model_validate_json") as validate, \
+                patch("kairo.hero.services.today_service.get_today_board") as slow_path:
+            response = api_views.get_today_board(request, str(brand.id))
+
+        validate.assert_not_called()
+        slow_path.assert_not_called()
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        assert response["Cache-Control"] == "no-cache, must-revalidate"
+        assert response.content.decode() == get_cached_board_json(brand.id)
+
+    def test_view_hit_matches_dto_path(self, brand: Brand):
+        import json
+
+        from django.test import RequestFactory
+
+        from kairo.hero import api_views
+        from kairo.hero.cache import set_cached_board
+        from kairo.hero.services import today_service
+
+        set_cached_board(brand.id, _ready_board(brand.id, opportunity_count=0))
+        request = RequestFactory().get(f"/api/brands/{brand.id}/today/")
+
+        fast = json.loads(api_views.get_today_board(request, str(brand.id)).content)
+        slow = today_service.get_today_board(brand.id).model_dump(mode="json")
+
+        assert fast == slow
+
+    def test_view_hit_for_missing_brand_is_404(self, db):
+        from django.test import RequestFactory
+
+        from kairo.hero import api_views
+        from kairo.hero.cache import set_cached_board
+
+        brand_id = uuid.uuid4()
+        set_cached_board(brand_id, _ready_board(brand_id))
+        request = RequestFactory().get(f"/api/brands/{brand_id}/today/")
+
+        response = api_views.get_today_board(request, str(brand_id))
+
+        assert response.status_code == 404
+
+    def test_legacy_entry_rendered_as_hit(self, brand: Brand):
+        import json
+
+        from kairo.hero.cache import get_cache_key, get_cached_board_json
+
+        legacy = _ready_board(brand.id, cache_hit=False).model_dump_json()
+        cache.set(get_cache_key(brand.id), legacy, timeout=3600)
+
+        meta = json.loads(get_cached_board_json(brand.id))["meta"]
+
+        assert meta["cache_hit"] is True
+        assert meta["ready_reason"] == "cache_hit"
+
+    def test_validation_mode_drops_corrupt_entry(self, brand: Brand, settings):
+        from kairo.hero.cache import get_cache_key, get_cached_board_json
+
+        settings.TODAY_BOARD_CACHE_VALIDATE = True
+        cache_key = get_cache_key(brand.id)
+        cache.set(cache_key, '{"meta": {"cache_hit":true}}', timeout=3600)
+
+        assert get_cached_board_json(brand.id) is None
+        assert cache.get(cache_key) is None
+
+
+# =============================================================================
+# 10. Single-flight rebuild on cache miss
+# =============================================================================
+
+
+@pytest.mark.django_db
+class TestSingleFlightRebuild:
+    """
+    Concurrent cache misses for one brand run one board rebuild.
+
+    The leader holds a per-brand cache.add lock while it rebuilds; followers
+    wait for its cache write, or rebuild themselves once the lock is gone.
+    """
+
+    def test_only_one_leader(self, brand: Brand):
+        import threading
+
+        from kairo.hero.cache import board_rebuild_lock
+
+        leaders = []
+        entered = threading.Barrier(5)  # 4 requests + test thread
+        hold = threading.Event()
+
+        def request():
+            with board_rebuild_lock(brand.id) as leader:
+                leaders.append(leader)
+                entered.wait(timeout=5)
+                hold.wait(timeout=5)
+
+        threads = [threading.Thread(target=request) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        entered.wait(timeout=5)
+        hold.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert sorted(leaders) == [False, False, False, True]
+
+    def test_lock_released_after_rebuild(self, brand: Brand):
+        from kairo.hero.cache import board_rebuild_lock, get_rebuild_lock_key
+
+        with board_rebuild_lock(brand.id) as leader:
+            assert leader is True
+            assert cache.get(get_rebuild_lock_key(brand.id)) is not None
+
+        assert cache.get(get_rebuild_lock_key(brand.id)) is None
+
+    def test_follower_gets_leader_result_without_rebuilding(self, brand: Brand):
+        import threading
+
+        from kairo.hero.cache import board_rebuild_lock, set_cached_board
+        from kairo.hero.services import today_service
+
+        def leader_finishes():
+            set_cached_board(brand.id, _ready_board(brand.id))
+
+        with board_rebuild_lock(brand.id):
+            timer = threading.Timer(0.2, leader_finishes)
+            timer.start()
+            with patch.object(today_service, "_get_persisted_board") as rebuild:
+                result = today_service.get_today_board(brand.id)
+            timer.join()
+
+        rebuild.assert_not_called()
+        assert result.meta.cache_hit is True
+        assert result.meta.ready_reason == "cache_hit"
+
+    def test_follower_rebuilds_when_leader_caches_nothing(self, brand: Brand):
+        from kairo.hero.cache import board_rebuild_lock, get_rebuild_lock_key
+        from kairo.hero.services import today_service
+
+        with board_rebuild_lock(brand.id):
+            # Leader finished with a non-READY board: lock gone, nothing cached
+            cache.delete(get_rebuild_lock_key(brand.id))
+            with patch.object(
+                today_service, "_get_persisted_board", return_value=_ready_board(brand.id)
+            ) as rebuild:
+                result = today_service.get_today_board(brand.id)
+
+        rebuild.assert_called_once()
+        assert result.meta.cache_hit is False
+        assert result.meta.ready_reason == "fresh_generation"
+
+    def test_follower_wait_is_bounded(self, brand: Brand, settings):
+        import time
+
+        from kairo.hero.cache import board_rebuild_lock
+        from kairo.hero.services import today_service
+
+        settings.TODAY_BOARD_REBUILD_WAIT_S = 0.1
+
+        with board_rebuild_lock(brand.id):
+            started = time.monotonic()
+            with patch.object(
+                today_service, "_get_persisted_board", return_value=_ready_board(brand.id)
+            ) as rebuild:
+                today_service.get_today_board(brand.id)
+            elapsed = time.monotonic() - started
+
+        rebuild.assert_called_once()
+        assert elapsed < 1.0
+
+
+# =============================================================================
+# 11. Write-through at job completion, versioned writes
+# =============================================================================
+
+
+@pytest.mark.django_db
+class TestWriteThroughVersioning:
+    """
+    Job completion writes its READY board into the cache.
+
+    Writes are versioned by board generated_at: an older board (slow job,
+    slow GET rebuild) never replaces a newer one.
+    """
+
+    def _board_at(self, brand_id, generated_at):
+        board = _ready_board(brand_id)
+        board.meta.generated_at = generated_at
+        return board
+
+    def test_older_board_does_not_overwrite_newer(self, brand: Brand):
+        import json
+        from datetime import timedelta
+
+        from kairo.hero.cache import get_cached_board_json, set_cached_board
+
+        newer = datetime.now(timezone.utc)
+        older = newer - timedelta(minutes=5)
+
+        assert set_cached_board(brand.id, self._board_at(brand.id, newer)) is True
+        assert set_cached_board(brand.id, self._board_at(brand.id, older)) is False
+
+        meta = json.loads(get_cached_board_json(brand.id))["meta"]
+        assert meta["generated_at"].startswith(newer.strftime("%Y-%m-%dT%H:%M:%S"))
+
+    def test_non_ready_completion_blocks_older_rebuild(self, brand: Brand):
+        from datetime import timedelta
+
+        from kairo.hero.cache import get_cached_board_json, invalidate_cache, set_cached_board
+
+        now = datetime.now(timezone.utc)
+        set_cached_board(brand.id, self._board_at(brand.id, now - timedelta(minutes=5)))
+
+        # Newer INSUFFICIENT_EVIDENCE board supersedes the cached READY one
+        invalidate_cache(brand.id, superseded_at=now)
+
+        assert get_cached_board_json(brand.id) is None
+        # A slow GET rebuild that loaded the older READY board cannot restore it
+        assert set_cached_board(brand.id, self._board_at(brand.id, now - timedelta(minutes=5))) is False
+        assert get_cached_board_json(brand.id) is None
+
+    def test_superseded_invalidation_keeps_newer_entry(self, brand: Brand):
+        from datetime import timedelta
+
+        from kairo.hero.cache import get_cached_board_json, invalidate_cache, set_cached_board
+
+        now = datetime.now(timezone.utc)
+        set_cached_board(brand.id, self._board_at(brand.id, now))
+
+        invalidate_cache(brand.id, superseded_at=now - timedelta(minutes=5))
+
+        assert get_cached_board_json(brand.id) is not None
+
+    def test_write_through_matches_get_rebuild(self, brand: Brand):
+        import json
+
+        from kairo.hero.cache import get_cached_board_json, get_cached_job_id, set_cached_job_id
+        from kairo.hero.models import OpportunitiesBoard
+        from kairo.hero.services import today_service
+
+        board = OpportunitiesBoard.objects.create(
+            brand=brand,
+            state=TodayBoardState.READY,
+            opportunity_ids=[],
+        )
+        set_cached_job_id(brand.id, str(uuid.uuid4()))
+
+        rendered = today_service.render_today_board(brand.id, board)
+        assert today_service.write_through_today_board_cache(brand.id, rendered) is True
+
+        assert get_cached_job_id(brand.id) is None
+        written = json.loads(get_cached_board_json(brand.id))
+
+        cache.clear()
+        today_service.get_today_board(brand.id)  # miss: rebuild from DB
+        rebuilt = json.loads(get_cached_board_json(brand.id))
+
+        assert written == rebuilt
+
+    def test_write_through_of_non_ready_board_invalidates(self, brand: Brand):
+        from kairo.hero.cache import get_cached_board_json, set_cached_board
+        from kairo.hero.services import today_service
+
+        set_cached_board(brand.id, _ready_board(brand.id))
+        failed = _ready_board(brand.id)
+        failed.meta.state = TodayBoardState.ERROR
+
+        assert today_service.write_through_today_board_cache(brand.id, failed) is False
+        assert get_cached_board_json(brand.id) is None
+
+    def test_write_through_keeps_board_when_write_lock_busy(self, brand: Brand):
+        from kairo.hero.cache import (
+            WRITE_LOCK_PREFIX,
+            get_cached_board_json,
+            get_stale_key,
+            set_cached_board,
+        )
+        from kairo.hero.services import today_service
+
+        set_cached_board(brand.id, _ready_board(brand.id))
+        cache.add(f"{WRITE_LOCK_PREFIX}:{brand.id}", "other-writer", timeout=30)
+
+        assert today_service.write_through_today_board_cache(brand.id, _ready_board(brand.id)) is False
+        assert get_cached_board_json(brand.id) is not None
+        assert cache.get(get_stale_key(brand.id)) is not None
+
+
+# =============================================================================
+# 12. Stale-while-revalidate (opt-in)
+# =============================================================================
+
+
+@pytest.mark.django_db
+class TestStaleWhileRevalidate:
+    """
+    With allow_stale (GET ?swr=1 / X-Kairo-SWR), a running job serves the
+    previous READY board marked stale instead of an empty GENERATING board.
+    Without it the PRD §0.2 contract is unchanged.
+    """
+
+    def _regenerating(self, brand):
+        from kairo.hero.cache import invalidate_cache, set_cached_board, set_cached_job_id
+
+        set_cached_board(brand.id, _ready_board(brand.id, opportunity_count=3))
+        invalidate_cache(brand.id)  # POST /regenerate
+        job_id = str(uuid.uuid4())
+        set_cached_job_id(brand.id, job_id)
+        return job_id
+
+    def test_default_contract_returns_generating(self, brand: Brand):
+        from kairo.hero.services import today_service
+
+        job_id = self._regenerating(brand)
+
+        result = today_service.get_today_board(brand.id)
+
+        assert result.meta.state == TodayBoardState.GENERATING
+        assert result.meta.job_id == job_id
+        assert result.meta.stale is False
+
+    def test_allow_stale_serves_previous_board(self, brand: Brand):
+        from kairo.hero.services import today_service
+
+        job_id = self._regenerating(brand)
+
+        with patch("kairo.hero.models.OpportunitiesBoard.to_dto") as to_dto:
+            result = today_service.get_today_board(brand.id, allow_stale=True)
+
+        to_dto.assert_not_called()
+        assert result.meta.state == TodayBoardState.READY
+        assert result.meta.stale is True
+        assert result.meta.job_id == job_id
+        assert result.meta.ready_reason == "stale_while_revalidate"
+        assert result.meta.opportunity_count == 3
+
+    def test_view_flag_and_header(self, brand: Brand):
+        import json
+
+        from django.test import RequestFactory
+
+        from kairo.hero import api_views
+
+        job_id = self._regenerating(brand)
+        factory = RequestFactory()
+
+        by_query = api_views.get_today_board(
+            factory.get(f"/api/brands/{brand.id}/today/", {"swr": "1"}), str(brand.id)
+        )
+        by_header = api_views.get_today_board(
+            factory.get(f"/api/brands/{brand.id}/today/", HTTP_X_KAIRO_SWR="1"), str(brand.id)
+        )
+        plain = api_views.get_today_board(
+            factory.get(f"/api/brands/{brand.id}/today/"), str(brand.id)
+        )
+
+        for response in (by_query, by_header):
+            meta = json.loads(response.content)["meta"]
+            assert meta["state"] == "ready"
+            assert meta["stale"] is True
+            assert meta["job_id"] == job_id
+        assert json.loads(plain.content)["meta"]["state"] == "generating"
+
+    def test_no_previous_board_falls_back_to_generating(self, brand: Brand):
+        from kairo.hero.cache import set_cached_job_id
+        from kairo.hero.services import today_service
+
+        set_cached_job_id(brand.id, str(uuid.uuid4()))
+
+        result = today_service.get_today_board(brand.id, allow_stale=True)
+
+        assert result.meta.state == TodayBoardState.GENERATING
+
+    def test_non_ready_completion_drops_stale_board(self, brand: Brand):
+        from kairo.hero.cache import get_stale_key, invalidate_cache
+
+        self._regenerating(brand)
+
+        invalidate_cache(brand.id, superseded_at=datetime.now(timezone.utc))
+
+        assert cache.get(get_stale_key(brand.id)) is None
+
+
+# =============================================================================
+# 13. Conditional GET (ETag / If-None-Match)
+# =============================================================================
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """
+    Cached READY boards carry an ETag; a poll with a matching If-None-Match
+    gets 304 from cache metadata alone (no DB access, no body).
+    """
+
+    def _get(self, brand_id, **headers):
+        from django.test import RequestFactory
+
+        from kairo.hero import api_views
+
+        request = RequestFactory().get(f"/api/brands/{brand_id}/today/", **headers)
+        return api_views.get_today_board(request, str(brand_id))
+
+    def test_hit_sets_etag(self, brand: Brand):
+        from kairo.hero.cache import get_cached_board_etag, set_cached_board
+
+        set_cached_board(brand.id, _ready_board(brand.id))
+
+        response = self._get(brand.id)
+
+        assert response.status_code == 200
+        assert response["ETag"] == get_cached_board_etag(brand.id)
+
+    def test_matching_etag_returns_304_without_db(
+        self, brand: Brand, django_assert_num_queries
+    ):
+        from kairo.hero.cache import get_cached_board_etag, set_cached_board
+
+        set_cached_board(brand.id, _ready_board(brand.id))
+        etag = get_cached_board_etag(brand.id)
+
+        with django_assert_num_queries(0):
+            response = self._get(brand.id, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response["ETag"] == etag
+        assert response["Cache-Control"] == "no-cache, must-revalidate"
+
+    def test_new_board_changes_etag(self, brand: Brand):
+        from datetime import timedelta
+
+        from kairo.hero.cache import get_cached_board_etag, set_cached_board
+
+        first = _ready_board(brand.id)
+        set_cached_board(brand.id, first)
+        old_etag = get_cached_board_etag(brand.id)
+
+        second = _ready_board(brand.id, opportunity_count=2)
+        second.meta.generated_at = first.meta.generated_at + timedelta(seconds=1)
+        set_cached_board(brand.id, second)
+
+        response = self._get(brand.id, HTTP_IF_NONE_MATCH=old_etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != old_etag
+
+    def test_invalidation_drops_etag(self, brand: Brand):
+        from kairo.hero.cache import get_cached_board_etag, invalidate_cache, set_cached_board
+
+        set_cached_board(brand.id, _ready_board(brand.id))
+        etag = get_cached_board_etag(brand.id)
+
+        invalidate_cache(brand.id)
+
+        assert get_cached_board_etag(brand.id) is None
+        assert self._get(brand.id, HTTP_IF_NONE_MATCH=etag).status_code != 304
+
+    def test_weak_and_list_forms_match(self, brand: Brand):
+        from kairo.hero.cache import get_cached_board_etag, set_cached_board
+
+        set_cached_board(brand.id, _ready_board(brand.id))
+        etag = get_cached_board_etag(brand.id)
+
+        weak = self._get(brand.id, HTTP_IF_NONE_MATCH=f'W/{etag}')
+        listed = self._get(brand.id, HTTP_IF_NONE_MATCH=f'"other", {etag}')
+
+        assert weak.status_code == 304
+        assert listed.status_code == 304
+
+    def test_stale_body_has_no_etag(self, brand: Brand):
+        from kairo.hero.cache import invalidate_cache, set_cached_board, set_cached_job_id
+
+        set_cached_board(brand.id, _ready_board(brand.id))
+        invalidate_cache(brand.id)
+        set_cached_job_id(brand.id, str(uuid.uuid4()))
+
+        response = self._get(brand.id, HTTP_X_KAIRO_SWR="1")
+
+        assert response.status_code == 200
+        assert not response.has_header("ETag")
@@ -0,0 +1,206 @@
+"""
+Evidence-Quota Early Cancellation Tests.
+
+Tests for quota-driven cancellation in kairo.sourceactivation.live, run
+against the local FakeApifyServer:
+- budget.evidence_quota_met combines should_continue_recipes with the
+  evidence_quality gates, and can be switched off
+- Once the quota is met, in-flight Apify runs are aborted through the abort
+  API and pending recipes never start (thread pool and async executors)
+- Cancelled runs are reported on LiveActivationResult for ActivationRun
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from datetime import datetime, timezone
+from functools import partialmethod
+from unittest.mock import patch
+
+import pytest
+
+from kairo.integrations.apify.async_client import AsyncApifyClient
+from kairo.integrations.apify.client import ApifyClient
+from kairo.integrations.apify.fake_server import FakeApifyServer
+from kairo.sourceactivation import budget, live
+from kairo.sourceactivation.recipes import RecipeSpec
+from kairo.sourceactivation.types import EvidenceItemData, SeedPack
+
+
+@pytest.fixture(autouse=True)
+def enable_apify(settings):
+    settings.APIFY_ENABLED = True
+
+
+@pytest.fixture
+def quota_of_three():
+    """Quota met as soon as 3 items have been collected."""
+    with patch(
+        "kairo.sourceactivation.live.evidence_quota_met",
+        side_effect=lambda items: len(items) >= 3,
+    ):
+        yield
+
+
+def _recipe(recipe_id: str, depends_on: tuple[str, ...] = ()) -> RecipeSpec:
+    return RecipeSpec(
+        recipe_id=recipe_id,
+        platform="test",
+        description=f"Test recipe {recipe_id}",
+        stage1_actor=f"test~{recipe_id.lower()}",
+        stage1_input_builder=lambda seed_pack: {"q": seed_pack.brand_name},
+        stage1_result_limit=3,
+        depends_on=depends_on,
+    )
+
+
+def _item(platform: str = "instagram", transcript: bool = True) -> EvidenceItemData:
+    return EvidenceItemData(
+        platform=platform,
+        actor_id="test",
+        acquisition_stage=1,
+        recipe_id="TEST",
+        canonical_url=f"https://example.com/{uuid.uuid4()}",
+        external_id="1",
+        author_ref="author",
+        text_primary="Some caption text",
+        has_transcript=transcript,
+        published_at=datetime.now(timezone.utc),
+    )
+
+
+# FAST returns 3 items quickly; SLOW would run for 30s; AFTER-SLOW waits on SLOW
+RECIPES = {
+    "FAST": _recipe("FAST"),
+    "SLOW": _recipe("SLOW"),
+    "AFTER-SLOW": _recipe("AFTER-SLOW", depends_on=("SLOW",)),
+}
+DURATIONS = {"test~fast": 0.05, "test~slow": 30.0}
+
+
+def _run(executor: str, server):
+    kwargs = {
+        "brand_id": uuid.uuid4(),
+        "seed_pack": SeedPack(brand_id=uuid.uuid4(), brand_name="Quota Brand"),
+        "run_id": uuid.uuid4(),
+        "execution_plan": list(RECIPES),
+    }
+    with patch("kairo.sourceactivation.live.get_recipe", RECIPES.get):
+        if executor == "async":
+            return live.run_recipes_async(
+                token="test-token", base_url=server.base_url, **kwargs
+            )
+        client = ApifyClient(token="test-token", base_url=server.base_url)
+        return live._execute_recipes_parallel(client=client, **kwargs)
+
+
+class TestEvidenceQuotaMet:
+    """Test the quota predicate in budget.py."""
+
+    def test_below_should_continue_threshold(self):
+        assert not budget.evidence_quota_met([_item() for _ in range(5)])
+
+    def test_met_when_sufficient_and_gates_pass(self):
+        items = [_item() for _ in range(budget.MIN_EVIDENCE_ITEMS)]
+
+        assert budget.evidence_quota_met(items)
+
+    def test_not_met_when_quality_gates_fail(self):
+        # Enough items, but no required platform (instagram)
+        items = [_item(platform="tiktok") for _ in range(budget.MIN_EVIDENCE_ITEMS)]
+
+        assert not budget.evidence_quota_met(items)
+
+    def test_disabled_by_setting(self, settings):
+        settings.SOURCEACTIVATION_EARLY_CANCEL = False
+        items = [_item() for _ in range(budget.MIN_EVIDENCE_ITEMS)]
+
+        assert not budget.evidence_quota_met(items)
+
+
+@pytest.mark.usefixtures("quota_of_three")
+class TestEarlyCancel:
+    """Test in-flight runs are aborted once the quota is met."""
+
+    @pytest.fixture(autouse=True)
+    def fast_async_polling(self):
+        with patch.object(
+            AsyncApifyClient,
+            "poll_run",
+            partialmethod(AsyncApifyClient.poll_run, interval_s=0.02),
+        ):
+            yield
+
+    @pytest.mark.parametrize("executor", ["threads", "async"])
+    def test_aborts_inflight_and_skips_pending(self, executor):
+        with FakeApifyServer(items_per_run=3, actor_run_duration_s=DURATIONS) as server:
+            start = time.monotonic()
+            result = _run(executor, server)
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 10  # did not wait out SLOW's 30s run
+        assert result.success
+        assert len(result.items) == 3
+        assert result.early_exit_reason == "evidence_gates_met"
+        assert result.error is None
+        assert server.stats["runs_aborted"] == 1
+        assert server.stats["runs_started"] == 2  # AFTER-SLOW never started
+        assert result.recipes_executed == ["FAST"]  # SLOW was stopped, not executed
+
+        [cancelled] = result.cancelled_runs
+        assert cancelled["recipe_id"] == "SLOW"
+        assert cancelled["actor_id"] == "test~slow"
+        assert cancelled["stage"] == 1
+
+    @pytest.mark.parametrize("executor", ["threads", "async"])
+    def test_quota_met_by_last_recipe_is_not_early_exit(self, executor):
+        recipes = {"FAST": _recipe("FAST")}
+
+        with FakeApifyServer(items_per_run=3) as server, \
+             patch.dict(RECIPES, recipes, clear=True):
+            result = _run(executor, server)
+
+        assert len(result.items) == 3
+        assert result.early_exit_reason is None
+        assert result.cancelled_runs == []
+        assert server.stats["runs_aborted"] == 0
+
+    def test_no_cancel_when_quota_not_met(self):
+        recipes = {"FAST": _recipe("FAST"), "FAST-2": _recipe("FAST-2")}
+
+        with FakeApifyServer(items_per_run=1) as server, \
+             patch("kairo.sourceactivation.live.get_recipe", recipes.get):
+            result = live._execute_recipes_parallel(
+                brand_id=uuid.uuid4(),
+                seed_pack=SeedPack(brand_id=uuid.uuid4(), brand_name="Quota Brand"),
+                run_id=uuid.uuid4(),
+                execution_plan=list(recipes),
+                client=ApifyClient(token="test-token", base_url=server.base_url),
+            )
+
+        assert result.early_exit_reason is None
+        assert result.cancelled_runs == []
+        assert server.stats["runs_aborted"] == 0
+
+
+class TestInFlightRuns:
+    """Test the activation-wide run registry."""
+
+    def test_cancel_returns_registered_runs(self):
+        in_flight = live.InFlightRuns()
+        assert in_flight.add("A", "actor~a", "run-a", stage=1)
+        assert in_flight.add("B", "actor~b", "run-b", stage=2)
+        in_flight.discard("run-a")
+
+        runs = in_flight.cancel()
+
+        assert [run["run_id"] for run in runs] == ["run-b"]
+        assert in_flight.cancelled_runs == runs
+
+    def test_add_after_cancel_refused_and_recorded(self):
+        in_flight = live.InFlightRuns()
+        in_flight.cancel()
+
+        assert not in_flight.add("A", "actor~a", "run-late", stage=1)
+        assert [run["run_id"] for run in in_flight.cancelled_runs] == ["run-late"]
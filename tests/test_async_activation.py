@@ -0,0 +1,234 @@
+"""
+Async SourceActivation Executor Tests.
+
+Tests for the SOURCEACTIVATION_EXECUTOR=async path in
+kairo.sourceactivation.live, run against the local FakeApifyServer:
+- execute_recipe_async mirrors execute_recipe results
+- Many actor runs stay in flight at once (beyond MAX_PARALLEL_RECIPES)
+- TT-TRENDS → TT-1 chaining is preserved
+- Slow normalization (TikTok subtitles) does not stall other recipes
+- execute_live_activation dispatches on the setting
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import uuid
+from dataclasses import replace
+from functools import partialmethod
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kairo.integrations.apify.async_client import AsyncApifyClient
+from kairo.integrations.apify.client import ApifyClient
+from kairo.integrations.apify.fake_server import FakeApifyServer
+from kairo.sourceactivation import live
+from kairo.sourceactivation.normalizers import normalize_actor_output
+from kairo.sourceactivation.recipes import RecipeSpec, seed_pack_with_trending_hashtags
+from kairo.sourceactivation.types import SeedPack
+
+
+@pytest.fixture(autouse=True)
+def enable_apify(settings):
+    settings.APIFY_ENABLED = True
+
+
+@pytest.fixture
+def fast_polling():
+    """Poll the fake server every 20ms instead of every 3s."""
+    with patch.object(
+        AsyncApifyClient,
+        "poll_run",
+        partialmethod(AsyncApifyClient.poll_run, interval_s=0.02),
+    ):
+        yield
+
+
+def _recipe(recipe_id: str, builder=None) -> RecipeSpec:
+    return RecipeSpec(
+        recipe_id=recipe_id,
+        platform="test",
+        description=f"Test recipe {recipe_id}",
+        stage1_actor=f"test~{recipe_id.lower()}",
+        stage1_input_builder=builder or (lambda seed_pack: {"q": seed_pack.brand_name}),
+        stage1_result_limit=3,
+    )
+
+
+def _seed_pack() -> SeedPack:
+    return SeedPack(brand_id=uuid.uuid4(), brand_name="Async Brand")
+
+
+def _run_plan(server, recipes: dict[str, RecipeSpec]):
+    with patch("kairo.sourceactivation.live.get_recipe", recipes.get):
+        return live.run_recipes_async(
+            brand_id=uuid.uuid4(),
+            seed_pack=_seed_pack(),
+            run_id=uuid.uuid4(),
+            execution_plan=list(recipes),
+            token="test-token",
+            base_url=server.base_url,
+        )
+
+
+class TestExecuteRecipeAsync:
+    """Test the single-recipe coroutine."""
+
+    def test_success_normalizes_items(self):
+        async def main(server):
+            async with AsyncApifyClient(token="t", base_url=server.base_url) as client:
+                return await live.execute_recipe_async(
+                    _recipe("GEN-1"), _seed_pack(), uuid.uuid4(), client
+                )
+
+        with FakeApifyServer(items_per_run=10) as server:
+            result = asyncio.run(main(server))
+
+        assert result.success
+        assert result.stage1_items_count == 3  # stage1_result_limit
+        assert len(result.items) == 3
+        assert result.items[0].canonical_url.startswith("https://example.com/test-gen-1/")
+
+    def test_failed_run_returns_failed_result(self):
+        async def main(server):
+            async with AsyncApifyClient(token="t", base_url=server.base_url) as client:
+                return await live.execute_recipe_async(
+                    _recipe("GEN-1"), _seed_pack(), uuid.uuid4(), client
+                )
+
+        with FakeApifyServer(fail_actors={"test~gen-1"}) as server:
+            result = asyncio.run(main(server))
+
+        assert not result.success
+        assert result.items == []
+        assert result.error.startswith("Stage 1 failed: FAILED")
+
+
+@pytest.mark.usefixtures("fast_polling")
+class TestAsyncExecutor:
+    """Test concurrent orchestration across recipes."""
+
+    def test_runs_beyond_thread_pool_width(self):
+        recipes = {f"GEN-{i}": _recipe(f"GEN-{i}") for i in range(3 * live.MAX_PARALLEL_RECIPES)}
+
+        with FakeApifyServer(run_duration_s=0.3, items_per_run=2) as server:
+            result = _run_plan(server, recipes)
+
+        assert result.success
+        assert sorted(result.recipes_executed) == sorted(recipes)
+        assert len(result.items) == 2 * len(recipes)
+        assert server.stats["max_running"] == len(recipes)
+
+    def test_blocking_normalization_runs_off_the_loop(self):
+        recipes = {"BLOCKING": _recipe("BLOCKING"), "OTHER": _recipe("OTHER")}
+        other_normalized = threading.Event()
+        overlapped = []
+
+        def normalize(**kwargs):
+            if kwargs["recipe_id"] == "BLOCKING":
+                # Blocks like a subtitle fetch until OTHER has been normalized
+                overlapped.append(other_normalized.wait(timeout=5))
+            else:
+                other_normalized.set()
+            return normalize_actor_output(**kwargs)
+
+        with FakeApifyServer(
+            items_per_run=2,
+            actor_run_duration_s={"test~blocking": 0.02, "test~other": 0.2},
+        ) as server, patch(
+            "kairo.sourceactivation.live.normalize_actor_output", side_effect=normalize
+        ):
+            result = _run_plan(server, recipes)
+
+        assert result.success
+        assert overlapped == [True]
+
+    def test_inflight_runs_bounded_by_setting(self, settings):
+        settings.APIFY_MAX_INFLIGHT_RUNS = 4
+        recipes = {f"GEN-{i}": _recipe(f"GEN-{i}") for i in range(10)}
+
+        with FakeApifyServer(run_duration_s=0.1) as server:
+            result = _run_plan(server, recipes)
+
+        assert len(result.recipes_executed) == 10
+        assert server.stats["max_running"] <= 4
+
+    def test_tiktok_chaining_preserved(self):
+        seen_hashtags = []
+
+        def tt1_builder(seed_pack):
+            seen_hashtags.append(seed_pack.trending_hashtags)
+            return {"hashtags": seed_pack.trending_hashtags}
+
+        recipes = {
+            "TT-1": replace(
+                _recipe("TT-1", builder=tt1_builder),
+                depends_on=("TT-TRENDS-1",),
+                upstream_seed_builder=seed_pack_with_trending_hashtags,
+            ),
+            "TT-TRENDS-1": _recipe("TT-TRENDS-1"),
+            "GEN-1": _recipe("GEN-1"),
+        }
+
+        with FakeApifyServer() as server, patch(
+            "kairo.sourceactivation.recipes.extract_trending_hashtags",
+            return_value=["#trend"],
+        ) as extract:
+            result = _run_plan(server, recipes)
+
+        assert result.recipes_executed[-1] == "TT-1"
+        assert len(extract.call_args.args[0]) == 3  # TT-TRENDS raw items
+        assert seen_hashtags == [["#trend"]]
+
+    def test_recipe_failure_does_not_sink_others(self):
+        recipes = {"GEN-1": _recipe("GEN-1"), "GEN-2": _recipe("GEN-2")}
+
+        with FakeApifyServer(fail_actors={"test~gen-2"}) as server:
+            result = _run_plan(server, recipes)
+
+        assert result.success
+        assert len(result.items) == 3
+        assert result.error is None
+
+
+class TestExecutorDispatch:
+    """Test execute_live_activation picks the executor from settings."""
+
+    def _activate(self):
+        client = ApifyClient(token="test-token", base_url="http://127.0.0.1:9")
+        with patch("kairo.sourceactivation.live.get_execution_plan", return_value=["GEN-1"]), \
+             patch("kairo.sourceactivation.live.check_budget_for_run",
+                   return_value=MagicMock(can_proceed=True)), \
+             patch("kairo.sourceactivation.live.get_apify_client", return_value=client), \
+             patch("kairo.sourceactivation.live.run_recipes_async") as run_async, \
+             patch("kairo.sourceactivation.live._execute_recipes_parallel") as run_threads:
+            live.execute_live_activation(uuid.uuid4(), _seed_pack(), uuid.uuid4())
+        return run_async, run_threads
+
+    def test_threads_by_default(self):
+        run_async, run_threads = self._activate()
+
+        run_async.assert_not_called()
+        run_threads.assert_called_once()
+
+    def test_async_when_configured(self, settings):
+        settings.SOURCEACTIVATION_EXECUTOR = "async"
+
+        run_async, run_threads = self._activate()
+
+        run_threads.assert_not_called()
+        assert run_async.call_args.kwargs["token"] == "test-token"
+        assert run_async.call_args.kwargs["base_url"] == "http://127.0.0.1:9"
+
+    def test_falls_back_to_threads_inside_event_loop(self, settings):
+        settings.SOURCEACTIVATION_EXECUTOR = "async"
+
+        async def main():
+            return self._activate()
+
+        run_async, run_threads = asyncio.run(main())
+
+        run_async.assert_not_called()
+        run_threads.assert_called_once()
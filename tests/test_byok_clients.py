@@ -0,0 +1,219 @@
+"""
+BYOK Client Registry Tests.
+
+Tests for kairo.users.clients and its callers:
+- Registry TTL, LRU bound and per-user invalidation
+- get_client_for_user / get_apify_client decrypt once and reuse the client
+- Saving keys through UserAPIKeysView invalidates cached clients
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+from cryptography.fernet import Fernet
+
+from kairo.users.clients import (
+    UserClientRegistry,
+    invalidate_user_clients,
+    reset_user_clients,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    reset_user_clients()
+    yield
+    reset_user_clients()
+
+
+@pytest.fixture
+def encryption(settings, monkeypatch):
+    """Configure a throwaway ENCRYPTION_KEY."""
+    from kairo.users import encryption
+
+    settings.ENCRYPTION_KEY = Fernet.generate_key().decode()
+    monkeypatch.setattr(encryption, "_fernet", None)
+    return encryption
+
+
+@pytest.fixture
+def byok_user(db, encryption):
+    """User with both BYOK keys stored."""
+    from kairo.users.models import User, UserAPIKeys
+
+    user = User.objects.create(email="byok@example.com", supabase_uid="sb-byok")
+    UserAPIKeys.objects.create(
+        user=user,
+        openai_key_encrypted=encryption.encrypt_api_key("sk-user-1111"),
+        apify_token_encrypted=encryption.encrypt_api_key("apify-user-2222"),
+    )
+    return user
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestUserClientRegistry:
+    """Test registry caching semantics with stub factories."""
+
+    def test_factory_runs_once(self):
+        registry = UserClientRegistry()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return object()
+
+        first = registry.get_or_create("openai", "user-1", factory)
+        second = registry.get_or_create("openai", "user-1", factory)
+
+        assert first is second
+        assert len(calls) == 1
+
+    def test_none_result_is_cached(self):
+        registry = UserClientRegistry()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return None
+
+        registry.get_or_create("openai", "user-1", factory)
+        registry.get_or_create("openai", "user-1", factory)
+
+        assert len(calls) == 1
+
+    def test_factory_error_is_not_cached(self):
+        registry = UserClientRegistry()
+
+        def failing_factory():
+            raise RuntimeError("key lookup failed")
+
+        with pytest.raises(RuntimeError):
+            registry.get_or_create("openai", "user-1", failing_factory)
+
+        assert registry.get_or_create("openai", "user-1", lambda: "client") == "client"
+
+    def test_entries_expire(self, settings):
+        settings.BYOK_CLIENT_CACHE_TTL_S = 60
+        registry = UserClientRegistry()
+        registry.get_or_create("openai", "user-1", lambda: "old")
+
+        with patch("kairo.users.clients.time.monotonic", return_value=10**9):
+            client = registry.get_or_create("openai", "user-1", lambda: "new")
+
+        assert client == "new"
+
+    def test_lru_bound(self, settings):
+        settings.BYOK_CLIENT_CACHE_MAX_ENTRIES = 2
+        registry = UserClientRegistry()
+        registry.get_or_create("openai", "user-1", lambda: "c1")
+        registry.get_or_create("openai", "user-2", lambda: "c2")
+        registry.get_or_create("openai", "user-1", lambda: "unused")  # user-1 most recent
+        registry.get_or_create("openai", "user-3", lambda: "c3")
+
+        assert len(registry) == 2
+        assert registry.get_or_create("openai", "user-1", lambda: "rebuilt") == "c1"
+        assert registry.get_or_create("openai", "user-2", lambda: "rebuilt") == "rebuilt"
+
+    def test_key_version_bump_invalidates_other_processes(self):
+        """A bump recorded in the shared cache makes every registry rebuild."""
+        worker_registry = UserClientRegistry()
+        worker_registry.get_or_create("apify", "user-1", lambda: "old")
+
+        invalidate_user_clients("user-1")  # e.g. from the web process
+
+        assert worker_registry.get_or_create("apify", "user-1", lambda: "new") == "new"
+
+    def test_invalidation_is_per_user(self):
+        registry = UserClientRegistry()
+        registry.get_or_create("openai", "user-1", lambda: "c1")
+        registry.get_or_create("openai", "user-2", lambda: "c2")
+
+        registry.invalidate_user("user-1")
+
+        assert registry.get_or_create("openai", "user-2", lambda: "rebuilt") == "c2"
+        assert registry.get_or_create("openai", "user-1", lambda: "rebuilt") == "rebuilt"
+
+
+# =============================================================================
+# CALLERS
+# =============================================================================
+
+
+@pytest.mark.db
+class TestCachedUserClients:
+    """Test BYOK client factories use the registry."""
+
+    def test_llm_client_decrypted_once(self, byok_user, encryption):
+        from kairo.hero.llm_client import get_client_for_user
+
+        with patch.object(encryption, "decrypt_api_key", wraps=encryption.decrypt_api_key) as decrypt:
+            first = get_client_for_user(byok_user.id)
+            second = get_client_for_user(byok_user.id)
+
+        assert first is second
+        assert first._api_key_override == "sk-user-1111"
+        assert decrypt.call_count == 1
+
+    def test_llm_client_without_key_uses_default(self, db, encryption):
+        from kairo.hero.llm_client import get_client_for_user, get_default_client
+        from kairo.users.models import User
+
+        user = User.objects.create(email="nokey@example.com", supabase_uid="sb-nokey")
+
+        assert get_client_for_user(user.id) is get_default_client()
+
+    def test_apify_client_reused(self, byok_user, settings):
+        from kairo.sourceactivation.live import get_apify_client
+
+        settings.APIFY_ENABLED = True
+
+        first = get_apify_client(user_id=byok_user.id)
+        second = get_apify_client(user_id=byok_user.id)
+
+        assert first is second
+        assert first.token == "apify-user-2222"
+
+    def test_apify_client_without_token_raises(self, db, encryption, settings):
+        from kairo.sourceactivation.live import get_apify_client
+        from kairo.users.models import User
+
+        settings.APIFY_ENABLED = True
+        user = User.objects.create(email="nokey@example.com", supabase_uid="sb-nokey")
+
+        with pytest.raises(ValueError):
+            get_apify_client(user_id=user.id)
+
+    def test_key_update_via_view_invalidates(self, byok_user, settings):
+        from django.test import RequestFactory
+
+        from kairo.hero.llm_client import get_client_for_user
+        from kairo.sourceactivation.live import get_apify_client
+        from kairo.users.views import UserAPIKeysView
+
+        settings.APIFY_ENABLED = True
+        old_llm = get_client_for_user(byok_user.id)
+        old_apify = get_apify_client(user_id=byok_user.id)
+
+        request = RequestFactory().put(
+            "/api/user/api-keys/",
+            data=json.dumps({"openai_key": "sk-user-9999", "apify_token": "apify-user-8888"}),
+            content_type="application/json",
+        )
+        request.kairo_user = byok_user
+        response = UserAPIKeysView.as_view()(request)
+
+        assert response.status_code == 200
+        new_llm = get_client_for_user(byok_user.id)
+        new_apify = get_apify_client(user_id=byok_user.id)
+        assert new_llm is not old_llm
+        assert new_llm._api_key_override == "sk-user-9999"
+        assert new_apify is not old_apify
+        assert new_apify.token == "apify-user-8888"
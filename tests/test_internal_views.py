@@ -8,6 +8,7 @@ Tests cover:
 - Run browser endpoints (HTML + JSON)
 - Eval browser endpoints
 - Brand browser endpoints (HTML)
+- Job queue metrics endpoint (JSON + Prometheus text)
 
 Per spec: all internal views are under /hero/internal/ and return 404 on auth failure.
 """
@@ -699,3 +700,71 @@ class TestFilesystemIsolation:
         marker_file.write_text("test")
         assert marker_file.exists()
         # tmp_path is unique per test invocation
+
+
+# =============================================================================
+# QUEUE METRICS
+# =============================================================================
+
+
+@pytest.mark.django_db
+class TestQueueMetrics:
+    """Test /hero/internal/queues/metrics/."""
+
+    @pytest.fixture(autouse=True)
+    def metrics_backend(self):
+        from kairo.core.job_metrics import InProcessJobMetricsBackend, set_metrics_backend
+
+        set_metrics_backend(InProcessJobMetricsBackend())
+        yield
+        set_metrics_backend(None)
+
+    def test_auth_required(self, client, no_admin_token):
+        response = client.get("/hero/internal/queues/metrics/")
+        assert response.status_code == 404
+
+    def test_json_includes_counters_and_depth(self, client, admin_token, sample_brand):
+        from kairo.hero.jobs.queue import enqueue_opportunities_job
+
+        enqueue_opportunities_job(sample_brand.id, force=True)
+
+        response = client.get(
+            "/hero/internal/queues/metrics/",
+            HTTP_X_KAIRO_INTERNAL_TOKEN=admin_token,
+        )
+
+        assert response.status_code == 200
+        metrics = response.json()["metrics"]
+        (enqueued,) = metrics["kairo_job_enqueued_total"]
+        assert enqueued["labels"] == {
+            "coalesced": "false",
+            "priority": "interactive",
+            "queue": "opportunities",
+        }
+        assert enqueued["value"] == 1
+        depth = {
+            (d["labels"]["queue"], d["labels"]["status"]): d["value"]
+            for d in metrics["kairo_job_depth"]
+        }
+        assert depth[("opportunities", "pending")] == 1
+
+    def test_prometheus_text(self, client, admin_token, sample_brand):
+        from kairo.hero.jobs.queue import claim_next_job, enqueue_opportunities_job
+
+        enqueue_opportunities_job(sample_brand.id)
+        claim_next_job(worker_id="worker-1")
+
+        response = client.get(
+            "/hero/internal/queues/metrics/?format=prometheus",
+            HTTP_X_KAIRO_INTERNAL_TOKEN=admin_token,
+        )
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain")
+        body = response.content.decode()
+        assert "# TYPE kairo_job_claimed_total counter" in body
+        assert "# TYPE kairo_job_queue_wait_seconds histogram" in body
+        assert (
+            'kairo_job_queue_wait_seconds_count{priority="scheduled",queue="opportunities"} 1'
+            in body
+        )
@@ -0,0 +1,400 @@
+"""
+Job Progress Event Tests.
+
+Tests for kairo.core.job_events and kairo.core.job_stream:
+- In-process event bus semantics (broadcast, timeout, unsubscribe)
+- Job queue transitions publish state after commit (both queues)
+- SSE stream: initial state, pushed events, DB poll fallback, termination
+- SSE endpoints (ownership, content type, WSGI streaming)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from kairo.core.job_events import (
+    COMPILE_EVENTS,
+    OPPORTUNITIES_EVENTS,
+    InProcessJobEventBus,
+    NullJobEventBus,
+    job_channel,
+    set_event_bus,
+    subscribe_job_events,
+)
+from kairo.core.job_stream import job_event_stream
+
+
+@pytest.fixture
+def bus():
+    """Install a fresh in-process event bus for the test."""
+    bus = InProcessJobEventBus()
+    set_event_bus(bus)
+    yield bus
+    set_event_bus(None)
+
+
+def _collect(stream) -> list[tuple[str, dict | None]]:
+    """Run an SSE stream to completion; returns (event, data) pairs."""
+
+    async def consume():
+        return [chunk async for chunk in stream]
+
+    messages = []
+    for chunk in asyncio.run(consume()):
+        if chunk.startswith("event:"):
+            event_line, data_line = chunk.strip().split("\n")
+            messages.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+        elif chunk.startswith(":"):
+            messages.append(("keepalive", None))
+    return messages
+
+
+def _terminal(state):
+    return state["status"] in ("succeeded", "failed")
+
+
+# =============================================================================
+# IN-PROCESS BUS
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestInProcessEventBus:
+    """Test the in-process stand-in backend."""
+
+    def test_every_subscriber_receives_every_event(self, bus):
+        first = subscribe_job_events(OPPORTUNITIES_EVENTS, "job-1")
+        second = subscribe_job_events(OPPORTUNITIES_EVENTS, "job-1")
+
+        bus.publish(job_channel(OPPORTUNITIES_EVENTS, "job-1"), {"status": "running"})
+
+        assert first.get(0.1) == {"status": "running"}
+        assert second.get(0.1) == {"status": "running"}
+
+    def test_get_times_out(self, bus):
+        subscription = subscribe_job_events(OPPORTUNITIES_EVENTS, "job-1")
+
+        started = time.monotonic()
+        assert subscription.get(0.05) is None
+        assert time.monotonic() - started >= 0.05
+
+    def test_channels_are_independent(self, bus):
+        subscription = subscribe_job_events(OPPORTUNITIES_EVENTS, "job-1")
+
+        bus.publish(job_channel(OPPORTUNITIES_EVENTS, "job-2"), {"status": "running"})
+        bus.publish(job_channel(COMPILE_EVENTS, "job-1"), {"status": "RUNNING"})
+
+        assert subscription.get(0.02) is None
+
+    def test_close_unsubscribes(self, bus):
+        subscription = subscribe_job_events(OPPORTUNITIES_EVENTS, "job-1")
+        channel = job_channel(OPPORTUNITIES_EVENTS, "job-1")
+        assert bus.subscriber_count(channel) == 1
+
+        subscription.close()
+
+        assert bus.subscriber_count(channel) == 0
+
+    def test_publish_wakes_blocked_subscriber(self, bus):
+        subscription = subscribe_job_events(OPPORTUNITIES_EVENTS, "job-1")
+        received = []
+
+        thread = threading.Thread(target=lambda: received.append(subscription.get(5.0)))
+        thread.start()
+        time.sleep(0.02)
+        bus.publish(job_channel(OPPORTUNITIES_EVENTS, "job-1"), {"status": "running"})
+        thread.join(timeout=2.0)
+
+        assert received == [{"status": "running"}]
+
+
+# =============================================================================
+# QUEUE TRANSITIONS PUBLISH
+# =============================================================================
+
+
+@pytest.mark.db
+class TestTransitionsPublish:
+    """Test that job state changes reach subscribers once committed."""
+
+    def test_opportunities_progress_and_completion(
+        self, db, bus, test_brand, django_capture_on_commit_callbacks
+    ):
+        from kairo.hero.jobs.queue import complete_job, update_job_progress
+        from kairo.hero.models import OpportunitiesJob
+
+        job = OpportunitiesJob.objects.create(brand=test_brand, status="running")
+        subscription = subscribe_job_events(OPPORTUNITIES_EVENTS, job.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            update_job_progress(job.id, "synthesizing", "Generating...")
+            complete_job(job.id)
+
+        assert subscription.get(0.1) == {
+            "job_id": str(job.id),
+            "status": "running",
+            "stage": "synthesizing",
+            "detail": "Generating...",
+        }
+        assert subscription.get(0.1) == {"job_id": str(job.id), "status": "succeeded"}
+
+    def test_opportunities_retry_publishes_pending(
+        self, db, bus, test_brand, django_capture_on_commit_callbacks
+    ):
+        from kairo.hero.jobs.queue import fail_job
+        from kairo.hero.models import OpportunitiesJob
+
+        job = OpportunitiesJob.objects.create(
+            brand=test_brand, status="running", attempts=1, max_attempts=3
+        )
+        subscription = subscribe_job_events(OPPORTUNITIES_EVENTS, job.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            fail_job(job.id, "boom")
+
+        assert subscription.get(0.1) == {
+            "job_id": str(job.id),
+            "status": "pending",
+            "error": "boom",
+        }
+
+    def test_compile_status_event_matches_status_body(
+        self, db, bus, test_brand, django_capture_on_commit_callbacks
+    ):
+        from kairo.brandbrain.compile.service import get_compile_state, publish_compile_status
+        from kairo.brandbrain.models import BrandBrainCompileRun
+
+        run = BrandBrainCompileRun.objects.create(brand=test_brand, status="RUNNING")
+        subscription = subscribe_job_events(COMPILE_EVENTS, run.id)
+        progress = {"stage": "bundling", "sources_completed": 2, "sources_total": 2}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            publish_compile_status(run, progress=progress)
+
+        event = subscription.get(0.1)
+        assert event["status"] == "RUNNING"
+        assert event["progress"] == progress
+        assert event == get_compile_state(run.id, test_brand.id)
+
+    def test_not_published_before_commit(
+        self, db, bus, test_brand, django_capture_on_commit_callbacks
+    ):
+        from kairo.hero.jobs.queue import update_job_progress
+        from kairo.hero.models import OpportunitiesJob
+
+        job = OpportunitiesJob.objects.create(brand=test_brand, status="running")
+        subscription = subscribe_job_events(OPPORTUNITIES_EVENTS, job.id)
+
+        with django_capture_on_commit_callbacks(execute=False):
+            update_job_progress(job.id, "synthesizing")
+
+        assert subscription.get(0.02) is None
+
+
+# =============================================================================
+# SSE STREAM
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestJobEventStream:
+    """Test kairo.core.job_stream.job_event_stream with stub job state."""
+
+    def test_terminal_job_sends_done_and_closes(self, bus):
+        stream = job_event_stream(
+            OPPORTUNITIES_EVENTS, "job-1",
+            load_state=lambda: {"status": "succeeded"},
+            is_terminal=_terminal,
+        )
+
+        assert _collect(stream) == [("done", {"status": "succeeded"})]
+        assert bus.subscriber_count(job_channel(OPPORTUNITIES_EVENTS, "job-1")) == 0
+
+    def test_missing_job_sends_error(self, bus):
+        stream = job_event_stream(
+            OPPORTUNITIES_EVENTS, "job-1", load_state=lambda: None, is_terminal=_terminal
+        )
+
+        [(event, data)] = _collect(stream)
+        assert event == "error"
+        assert data["job_id"] == "job-1"
+
+    def test_pushed_events_are_merged_until_done(self, bus):
+        def publisher():
+            channel = job_channel(OPPORTUNITIES_EVENTS, "job-1")
+            while not bus.subscriber_count(channel):
+                time.sleep(0.005)
+            time.sleep(0.02)
+            bus.publish(channel, {"stage": "synthesizing"})
+            bus.publish(channel, {"status": "succeeded", "board_id": "b-1"})
+
+        thread = threading.Thread(target=publisher)
+        thread.start()
+        stream = job_event_stream(
+            OPPORTUNITIES_EVENTS, "job-1",
+            load_state=lambda: {"status": "running", "stage": "fetching_evidence"},
+            is_terminal=_terminal,
+        )
+        messages = _collect(stream)
+        thread.join(timeout=2.0)
+
+        assert messages == [
+            ("progress", {"status": "running", "stage": "fetching_evidence"}),
+            ("progress", {"status": "running", "stage": "synthesizing"}),
+            ("done", {"status": "succeeded", "stage": "synthesizing", "board_id": "b-1"}),
+        ]
+
+    def test_full_state_events_replace(self, bus):
+        channel = job_channel(COMPILE_EVENTS, "run-1")
+
+        def publisher():
+            while not bus.subscriber_count(channel):
+                time.sleep(0.005)
+            time.sleep(0.02)
+            bus.publish(channel, {"status": "SUCCEEDED"})
+
+        thread = threading.Thread(target=publisher)
+        thread.start()
+        stream = job_event_stream(
+            COMPILE_EVENTS, "run-1",
+            load_state=lambda: {"status": "RUNNING", "progress": {"stage": "bundling"}},
+            is_terminal=lambda state: state["status"] == "SUCCEEDED",
+            partial_events=False,
+        )
+        messages = _collect(stream)
+        thread.join(timeout=2.0)
+
+        assert messages[-1] == ("done", {"status": "SUCCEEDED"})
+
+    def test_polls_db_without_events(self, settings):
+        set_event_bus(NullJobEventBus())
+        settings.JOB_EVENTS_POLL_S = 0.01
+        states = iter([{"status": "running"}, {"status": "running"}, {"status": "succeeded"}])
+        try:
+            stream = job_event_stream(
+                OPPORTUNITIES_EVENTS, "job-1",
+                load_state=lambda: next(states),
+                is_terminal=_terminal,
+            )
+            messages = _collect(stream)
+        finally:
+            set_event_bus(None)
+
+        assert messages == [
+            ("progress", {"status": "running"}),
+            ("keepalive", None),
+            ("done", {"status": "succeeded"}),
+        ]
+
+    def test_closes_after_max_duration(self, bus, settings):
+        settings.JOB_EVENTS_POLL_S = 0.01
+        settings.JOB_EVENTS_STREAM_MAX_S = 0.05
+
+        stream = job_event_stream(
+            OPPORTUNITIES_EVENTS, "job-1",
+            load_state=lambda: {"status": "running"},
+            is_terminal=_terminal,
+        )
+        messages = _collect(stream)
+
+        assert messages[0] == ("progress", {"status": "running"})
+        assert {event for event, _ in messages[1:]} <= {"keepalive"}
+
+
+# =============================================================================
+# SSE ENDPOINTS
+# =============================================================================
+
+
+@pytest.mark.db
+class TestEventEndpoints:
+    """Test the opportunities and compile SSE views."""
+
+    def test_job_events_stream_terminal_job(self, db, bus, test_brand):
+        from django.test import RequestFactory
+
+        from kairo.hero import api_views
+        from kairo.hero.models import OpportunitiesJob
+
+        job = OpportunitiesJob.objects.create(brand=test_brand, status="succeeded")
+        request = RequestFactory().get(f"/api/brands/{test_brand.id}/jobs/{job.id}/events/")
+
+        response = api_views.stream_job_events(request, str(test_brand.id), str(job.id))
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/event-stream"
+        body = b"".join(response).decode()
+        assert "event: done" in body
+        assert '"status": "succeeded"' in body
+
+    def test_wsgi_stream_flushes_first_event_before_job_finishes(self, db, bus, test_brand):
+        from django.test import RequestFactory
+
+        from kairo.hero import api_views
+        from kairo.hero.models import OpportunitiesJob
+
+        job = OpportunitiesJob.objects.create(brand=test_brand, status="running")
+        request = RequestFactory().get(f"/api/brands/{test_brand.id}/jobs/{job.id}/events/")
+
+        response = api_views.stream_job_events(request, str(test_brand.id), str(job.id))
+        chunks = iter(response)
+
+        assert not response.is_async
+        assert next(chunks).startswith(b"retry:")
+        first = next(chunks).decode()
+        assert first.startswith("event: progress")
+        assert '"status": "running"' in first
+
+        response.close()
+        channel = job_channel(OPPORTUNITIES_EVENTS, job.id)
+        assert bus.subscriber_count(channel) == 0
+
+    def test_job_events_other_brand_404(self, db, bus, test_brand, test_tenant):
+        import uuid
+
+        from django.test import RequestFactory
+
+        from kairo.hero import api_views
+        from kairo.hero.models import OpportunitiesJob
+
+        job = OpportunitiesJob.objects.create(brand=test_brand, status="running")
+        other_brand = uuid.uuid4()
+        request = RequestFactory().get(f"/api/brands/{other_brand}/jobs/{job.id}/events/")
+
+        response = api_views.stream_job_events(request, str(other_brand), str(job.id))
+
+        assert response.status_code == 404
+
+    def test_compile_events_stream_terminal_run(self, db, bus, test_brand):
+        from django.test import RequestFactory
+
+        from kairo.brandbrain.api.views import compile_events
+        from kairo.brandbrain.models import BrandBrainCompileRun
+
+        run = BrandBrainCompileRun.objects.create(
+            brand=test_brand, status="FAILED", error="boom"
+        )
+        request = RequestFactory().get(
+            f"/api/brands/{test_brand.id}/brandbrain/compile/{run.id}/events"
+        )
+
+        response = compile_events(request, str(test_brand.id), str(run.id))
+
+        body = b"".join(response).decode()
+        assert "event: done" in body
+        assert '"error": "boom"' in body
+
+    def test_regenerate_returns_events_url(self, db, test_brand):
+        from kairo.brandbrain.models import BrandBrainSnapshot
+        from kairo.hero.services import today_service
+
+        BrandBrainSnapshot.objects.create(brand=test_brand, snapshot_json={})
+
+        result = today_service.regenerate_today_board(test_brand.id)
+
+        assert result.events_url == f"/api/brands/{test_brand.id}/jobs/{result.job_id}/events/"
@@ -0,0 +1,210 @@
+"""
+Job Queue Metrics Tests.
+
+Tests for kairo.core.job_metrics:
+- Counter/histogram recording and Prometheus rendering
+- Queue modules emit on enqueue, claim, complete, fail and stale-release
+- Progress stage timing
+- DB-derived depth/lag gauges
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from kairo.core.job_metrics import (
+    InProcessJobMetricsBackend,
+    collect_queue_gauges,
+    metrics_json,
+    record_retry_backoff,
+    render_prometheus,
+    set_metrics_backend,
+)
+
+
+@pytest.fixture
+def metrics():
+    """Install a fresh in-process metrics backend for the test."""
+    backend = InProcessJobMetricsBackend()
+    set_metrics_backend(backend)
+    yield backend
+    set_metrics_backend(None)
+
+
+def _value(series: dict, key: str) -> float:
+    return series.get(key, 0.0)
+
+
+# =============================================================================
+# RECORDING & RENDERING
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestRendering:
+    """Test histogram encoding and Prometheus text output."""
+
+    def test_histogram_buckets_are_cumulative(self, metrics):
+        record_retry_backoff("opportunities", 60)
+
+        series = metrics.snapshot()
+        name = "kairo_job_retry_backoff_seconds"
+        assert _value(series, f'{name}_bucket{{le="30",queue="opportunities"}}') == 0
+        assert _value(series, f'{name}_bucket{{le="60",queue="opportunities"}}') == 1
+        assert _value(series, f'{name}_bucket{{le="+Inf",queue="opportunities"}}') == 1
+        assert _value(series, f'{name}_sum{{queue="opportunities"}}') == 60
+        assert _value(series, f'{name}_count{{queue="opportunities"}}') == 1
+
+    def test_prometheus_orders_buckets_numerically(self, metrics):
+        record_retry_backoff("brandbrain", 0.2)
+
+        body = render_prometheus(include_gauges=False)
+
+        assert "# TYPE kairo_job_retry_backoff_seconds histogram" in body
+        lines = [l for l in body.splitlines() if l.startswith("kairo_job_retry_backoff_seconds_bucket")]
+        assert lines[0].startswith('kairo_job_retry_backoff_seconds_bucket{le="0.05"')
+        assert lines[-1].startswith('kairo_job_retry_backoff_seconds_bucket{le="+Inf"')
+
+    def test_backend_errors_are_swallowed(self):
+        class Broken:
+            def incr(self, values):
+                raise ConnectionError("down")
+
+            def snapshot(self):
+                return {}
+
+        set_metrics_backend(Broken())
+        try:
+            record_retry_backoff("opportunities", 1)  # must not raise
+        finally:
+            set_metrics_backend(None)
+
+
+# =============================================================================
+# QUEUE INSTRUMENTATION
+# =============================================================================
+
+
+@pytest.mark.db
+class TestQueueInstrumentation:
+    """Test that queue operations emit metrics."""
+
+    def test_opportunities_lifecycle(self, db, metrics, test_brand):
+        from kairo.hero.jobs.queue import (
+            claim_next_job,
+            complete_job,
+            enqueue_opportunities_job,
+        )
+
+        enqueue_opportunities_job(test_brand.id, first_run=True)
+        enqueue_opportunities_job(test_brand.id, first_run=True)
+        claim = claim_next_job(worker_id="worker-1")
+        complete_job(claim.job.id)
+
+        series = metrics.snapshot()
+        assert _value(series, 'kairo_job_enqueued_total{coalesced="false",priority="first_run",queue="opportunities"}') == 1
+        assert _value(series, 'kairo_job_enqueued_total{coalesced="true",priority="first_run",queue="opportunities"}') == 1
+        assert _value(series, 'kairo_job_claimed_total{priority="first_run",queue="opportunities"}') == 1
+        assert _value(series, 'kairo_job_finished_total{outcome="succeeded",queue="opportunities"}') == 1
+        assert _value(series, 'kairo_job_run_seconds_count{outcome="succeeded",queue="opportunities"}') == 1
+
+    def test_fail_records_retry_and_backoff(self, db, metrics, test_brand):
+        from kairo.hero.jobs.queue import claim_next_job, enqueue_opportunities_job, fail_job
+
+        enqueue_opportunities_job(test_brand.id)
+        claim = claim_next_job(worker_id="worker-1")
+        fail_job(claim.job.id, "boom")
+
+        series = metrics.snapshot()
+        assert _value(series, 'kairo_job_retried_total{queue="opportunities"}') == 1
+        assert _value(series, 'kairo_job_retry_backoff_seconds_count{queue="opportunities"}') == 1
+
+    def test_stale_release_recorded(self, db, metrics, test_brand):
+        from kairo.hero.jobs.queue import (
+            claim_next_job,
+            enqueue_opportunities_job,
+            release_stale_jobs,
+        )
+        from kairo.hero.models import OpportunitiesJob
+
+        enqueue_opportunities_job(test_brand.id)
+        claim = claim_next_job(worker_id="worker-1")
+        OpportunitiesJob.objects.filter(id=claim.job.id).update(
+            locked_at=timezone.now() - timedelta(hours=1)
+        )
+
+        release_stale_jobs()
+
+        series = metrics.snapshot()
+        assert _value(series, 'kairo_job_stale_released_total{outcome="retry",queue="opportunities"}') == 1
+
+    def test_progress_stages_timed(self, db, metrics, test_brand):
+        from kairo.hero.jobs.queue import (
+            claim_next_job,
+            complete_job,
+            enqueue_opportunities_job,
+            update_job_progress,
+        )
+
+        enqueue_opportunities_job(test_brand.id)
+        claim = claim_next_job(worker_id="worker-1")
+        update_job_progress(claim.job.id, "fetching_evidence")
+        update_job_progress(claim.job.id, "synthesizing")
+        complete_job(claim.job.id)
+
+        series = metrics.snapshot()
+        for stage in ("fetching_evidence", "synthesizing"):
+            key = f'kairo_job_stage_seconds_count{{queue="opportunities",stage="{stage}"}}'
+            assert _value(series, key) == 1
+
+    def test_brandbrain_lifecycle(self, db, metrics, test_brand):
+        from kairo.brandbrain.jobs.queue import claim_next_job, complete_job, enqueue_compile_job
+        from kairo.brandbrain.models import BrandBrainCompileRun
+
+        compile_run = BrandBrainCompileRun.objects.create(brand=test_brand)
+        enqueue_compile_job(test_brand.id, compile_run.id)
+        claim = claim_next_job(worker_id="worker-1")
+        complete_job(claim.job.id)
+
+        series = metrics.snapshot()
+        assert _value(series, 'kairo_job_claimed_total{priority="interactive",queue="brandbrain"}') == 1
+        assert _value(series, 'kairo_job_finished_total{outcome="succeeded",queue="brandbrain"}') == 1
+
+
+# =============================================================================
+# GAUGES
+# =============================================================================
+
+
+@pytest.mark.db
+class TestQueueGauges:
+    """Test DB-derived depth and lag gauges."""
+
+    def test_depth_and_backoff(self, db, metrics, test_brand):
+        from kairo.hero.jobs.queue import enqueue_opportunities_job
+        from kairo.hero.models import OpportunitiesJob
+
+        result = enqueue_opportunities_job(test_brand.id)
+        OpportunitiesJob.objects.filter(id=result.job_id).update(
+            available_at=timezone.now() + timedelta(minutes=5)
+        )
+
+        gauges = collect_queue_gauges()
+
+        assert gauges['kairo_job_depth{priority="scheduled",queue="opportunities",status="pending"}'] == 1
+        assert gauges['kairo_job_pending_backoff{queue="opportunities"}'] == 1
+        assert gauges['kairo_job_pending_backoff{queue="brandbrain"}'] == 0
+
+    def test_json_groups_by_metric(self, db, metrics, test_brand):
+        from kairo.hero.jobs.queue import enqueue_opportunities_job
+
+        enqueue_opportunities_job(test_brand.id)
+
+        result = metrics_json()
+
+        (age,) = result["kairo_job_oldest_ready_age_seconds"]
+        assert age["labels"] == {"priority": "scheduled", "queue": "opportunities"}
+        assert age["value"] >= 0
@@ -0,0 +1,137 @@
+"""
+Job Queue Wakeup Notification Tests.
+
+Tests for kairo.core.job_notify:
+- In-process notifier semantics (publish/wait tokens)
+- Adaptive poll backoff
+- Enqueue publishes a wakeup after commit (both job queues)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from kairo.core.job_notify import (
+    BRANDBRAIN_JOBS_CHANNEL,
+    OPPORTUNITIES_JOBS_CHANNEL,
+    AdaptivePollBackoff,
+    InProcessJobNotifier,
+    set_notifier,
+    wait_for_job,
+)
+
+
+@pytest.fixture
+def notifier():
+    """Install a fresh in-process notifier for the test."""
+    notifier = InProcessJobNotifier()
+    set_notifier(notifier)
+    yield notifier
+    set_notifier(None)
+
+
+# =============================================================================
+# IN-PROCESS NOTIFIER
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestInProcessNotifier:
+    """Test the in-process stand-in backend."""
+
+    def test_wait_times_out_without_publish(self, notifier):
+        """wait returns False after the timeout when nothing is published."""
+        started = time.monotonic()
+        assert wait_for_job(OPPORTUNITIES_JOBS_CHANNEL, 0.05) is False
+        assert time.monotonic() - started >= 0.05
+
+    def test_publish_before_wait_is_not_lost(self, notifier):
+        """A publish with no waiter is consumed by the next wait."""
+        notifier.publish(OPPORTUNITIES_JOBS_CHANNEL)
+
+        assert wait_for_job(OPPORTUNITIES_JOBS_CHANNEL, 0.05) is True
+        assert notifier.pending(OPPORTUNITIES_JOBS_CHANNEL) == 0
+
+    def test_publish_wakes_blocked_waiter(self, notifier):
+        """A blocked waiter wakes as soon as a job is published."""
+        woken = []
+
+        def waiter():
+            woken.append(wait_for_job(OPPORTUNITIES_JOBS_CHANNEL, 5.0))
+
+        thread = threading.Thread(target=waiter)
+        started = time.monotonic()
+        thread.start()
+        time.sleep(0.02)
+        notifier.publish(OPPORTUNITIES_JOBS_CHANNEL)
+        thread.join(timeout=2.0)
+
+        assert woken == [True]
+        assert time.monotonic() - started < 2.0
+
+    def test_channels_are_independent(self, notifier):
+        """Publishing on one channel does not wake the other."""
+        notifier.publish(BRANDBRAIN_JOBS_CHANNEL)
+
+        assert wait_for_job(OPPORTUNITIES_JOBS_CHANNEL, 0.02) is False
+        assert wait_for_job(BRANDBRAIN_JOBS_CHANNEL, 0.02) is True
+
+
+@pytest.mark.unit
+class TestAdaptivePollBackoff:
+    """Test idle poll backoff."""
+
+    def test_doubles_up_to_cap(self):
+        backoff = AdaptivePollBackoff(5, 30)
+
+        timeouts = [backoff.next_timeout() for _ in range(5)]
+
+        assert timeouts == [5, 10, 20, 30, 30]
+
+    def test_reset_returns_to_min(self):
+        backoff = AdaptivePollBackoff(5, 60)
+        backoff.next_timeout()
+        backoff.next_timeout()
+
+        backoff.reset()
+
+        assert backoff.next_timeout() == 5
+
+
+# =============================================================================
+# ENQUEUE PUBLISHES
+# =============================================================================
+
+
+@pytest.mark.db
+class TestEnqueuePublishes:
+    """Test that enqueue wakes idle workers once the job row is committed."""
+
+    def test_opportunities_enqueue_publishes_on_commit(
+        self, db, notifier, test_brand, django_capture_on_commit_callbacks
+    ):
+        from kairo.hero.jobs.queue import enqueue_opportunities_job
+
+        with django_capture_on_commit_callbacks(execute=True):
+            enqueue_opportunities_job(test_brand.id)
+            # Not published until the transaction commits
+            assert notifier.pending(OPPORTUNITIES_JOBS_CHANNEL) == 0
+
+        assert notifier.pending(OPPORTUNITIES_JOBS_CHANNEL) == 1
+
+    def test_compile_enqueue_publishes_on_commit(
+        self, db, notifier, test_brand, django_capture_on_commit_callbacks
+    ):
+        from kairo.brandbrain.jobs.queue import enqueue_compile_job
+        from kairo.brandbrain.models import BrandBrainCompileRun
+
+        compile_run = BrandBrainCompileRun.objects.create(brand=test_brand)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            enqueue_compile_job(test_brand.id, compile_run.id)
+
+        assert notifier.pending(BRANDBRAIN_JOBS_CHANNEL) == 1
+        assert notifier.pending(OPPORTUNITIES_JOBS_CHANNEL) == 0
@@ -0,0 +1,212 @@
+"""
+Job Retention Tests.
+
+Tests for kairo.core.job_retention and the archive_jobs command:
+- Old terminal jobs move to job_archive; live and recent jobs stay
+- Bounded batches and max_batches
+- gzip JSONL export
+- Dry run
+- Archiving a job detaches its ActivationRun; the evidence ledger survives
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from kairo.core.job_retention import archive_terminal_jobs
+
+
+def _job(brand, status, age_days, **kwargs):
+    from kairo.hero.models import OpportunitiesJob
+
+    job = OpportunitiesJob.objects.create(brand=brand, status=status, **kwargs)
+    finished_at = timezone.now() - timedelta(days=age_days) if status != "pending" else None
+    OpportunitiesJob.objects.filter(id=job.id).update(finished_at=finished_at)
+    return job
+
+
+@pytest.mark.django_db
+class TestArchiveTerminalJobs:
+    """Test archive_terminal_jobs() against the opportunities queue."""
+
+    def test_moves_old_terminal_jobs_to_archive(self, test_brand):
+        from kairo.core.models import ArchivedJob
+        from kairo.hero.models import OpportunitiesJob
+
+        old = [
+            _job(test_brand, "succeeded", 40, attempts=1),
+            _job(test_brand, "failed", 40),
+            _job(test_brand, "insufficient_evidence", 40),
+        ]
+        recent = _job(test_brand, "succeeded", 2)
+        live = _job(test_brand, "pending", 40)
+
+        result = archive_terminal_jobs("opportunities", older_than_days=30)
+
+        assert result.archived == 3
+        assert set(OpportunitiesJob.objects.values_list("id", flat=True)) == {recent.id, live.id}
+
+        archived = ArchivedJob.objects.get(id=old[0].id)
+        assert archived.queue == "opportunities"
+        assert archived.brand_id == test_brand.id
+        assert archived.tenant_id == test_brand.tenant_id
+        assert archived.status == "succeeded"
+        assert archived.attempts == 1
+        assert archived.payload_json["id"] == str(old[0].id)
+
+    def test_running_job_never_archived(self, test_brand):
+        from kairo.hero.models import OpportunitiesJob
+
+        job = _job(test_brand, "running", 90)
+
+        result = archive_terminal_jobs("opportunities", older_than_days=30)
+
+        assert result.archived == 0
+        assert OpportunitiesJob.objects.filter(id=job.id).exists()
+
+    def test_legacy_rows_without_finished_at_use_updated_at(self, test_brand):
+        from kairo.hero.models import OpportunitiesJob
+
+        job = _job(test_brand, "failed", 40)
+        OpportunitiesJob.objects.filter(id=job.id).update(
+            finished_at=None,
+            updated_at=timezone.now() - timedelta(days=40),
+        )
+
+        result = archive_terminal_jobs("opportunities", older_than_days=30)
+
+        assert result.archived == 1
+
+    def test_archived_job_detaches_activation_run_and_keeps_evidence(self, test_brand):
+        from kairo.hero.models import ActivationRun, EvidenceItem, OpportunitiesJob
+
+        job = _job(test_brand, "succeeded", 40)
+        run = ActivationRun.objects.create(
+            job=job,
+            brand_id=test_brand.id,
+            snapshot_id=uuid.uuid4(),
+            estimated_cost_usd=Decimal("0.00"),
+        )
+        item = EvidenceItem.objects.create(
+            activation_run=run,
+            brand_id=test_brand.id,
+            platform="instagram",
+            actor_id="apify/instagram-scraper",
+            acquisition_stage=1,
+            recipe_id="IG-1",
+            canonical_url="https://instagram.com/p/retained",
+            author_ref="author",
+            text_primary="Caption",
+            fetched_at=timezone.now(),
+        )
+
+        result = archive_terminal_jobs("opportunities", older_than_days=30)
+
+        assert result.archived == 1
+        assert not OpportunitiesJob.objects.filter(id=job.id).exists()
+        run.refresh_from_db()
+        assert run.job_id is None
+        assert EvidenceItem.objects.filter(id=item.id, activation_run=run).exists()
+
+    def test_batches_are_bounded(self, test_brand):
+        for _ in range(5):
+            _job(test_brand, "succeeded", 40)
+
+        result = archive_terminal_jobs("opportunities", older_than_days=30, batch_size=2)
+
+        assert result.archived == 5
+        assert result.batches == 3
+        assert result.remaining is False
+
+    def test_max_batches_leaves_remainder(self, test_brand):
+        from kairo.hero.models import OpportunitiesJob
+
+        for _ in range(5):
+            _job(test_brand, "succeeded", 40)
+
+        result = archive_terminal_jobs(
+            "opportunities", older_than_days=30, batch_size=2, max_batches=1
+        )
+
+        assert result.archived == 2
+        assert result.remaining is True
+        assert OpportunitiesJob.objects.count() == 3
+
+    def test_export_writes_gzip_jsonl(self, test_brand, tmp_path):
+        from kairo.core.models import ArchivedJob
+
+        jobs = [_job(test_brand, "succeeded", 40) for _ in range(3)]
+        path = tmp_path / "jobs.jsonl.gz"
+
+        archive_terminal_jobs("opportunities", older_than_days=30, batch_size=2, export_path=str(path))
+
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            rows = [json.loads(line) for line in fh]
+        assert {row["id"] for row in rows} == {str(job.id) for job in jobs}
+        assert all(row["queue"] == "opportunities" for row in rows)
+        assert not ArchivedJob.objects.exists()
+
+    def test_dry_run_counts_only(self, test_brand):
+        from kairo.hero.models import OpportunitiesJob
+
+        _job(test_brand, "succeeded", 40)
+
+        result = archive_terminal_jobs("opportunities", older_than_days=30, dry_run=True)
+
+        assert result.archived == 1
+        assert OpportunitiesJob.objects.count() == 1
+
+    def test_brandbrain_queue(self, test_brand):
+        from kairo.brandbrain.models import BrandBrainJob
+        from kairo.core.models import ArchivedJob
+
+        job = BrandBrainJob.objects.create(brand=test_brand, status="failed")
+        BrandBrainJob.objects.filter(id=job.id).update(
+            finished_at=timezone.now() - timedelta(days=40)
+        )
+
+        result = archive_terminal_jobs("brandbrain", older_than_days=30)
+
+        assert result.archived == 1
+        assert ArchivedJob.objects.get(id=job.id).queue == "brandbrain"
+
+    def test_unknown_queue_raises(self, db):
+        with pytest.raises(ValueError):
+            archive_terminal_jobs("nope")
+
+
+@pytest.mark.django_db
+class TestArchiveJobsCommand:
+    """Test the archive_jobs management command."""
+
+    def test_archives_all_queues(self, test_brand):
+        from kairo.hero.models import OpportunitiesJob
+
+        _job(test_brand, "succeeded", 40)
+        out = StringIO()
+
+        call_command("archive_jobs", days=30, stdout=out)
+
+        assert "opportunities: archived 1 jobs" in out.getvalue()
+        assert "brandbrain: archived 0 jobs" in out.getvalue()
+        assert OpportunitiesJob.objects.count() == 0
+
+    def test_dry_run(self, test_brand):
+        from kairo.hero.models import OpportunitiesJob
+
+        _job(test_brand, "succeeded", 40)
+        out = StringIO()
+
+        call_command("archive_jobs", queue="opportunities", days=30, dry_run=True, stdout=out)
+
+        assert "1 terminal jobs older than 30 days would be archived" in out.getvalue()
+        assert OpportunitiesJob.objects.count() == 1
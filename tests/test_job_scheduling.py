@@ -0,0 +1,68 @@
+"""
+Job Queue Claim Scheduling Tests.
+
+Tests for kairo.core.job_scheduling:
+- allocate_fair_slots() weighted round-robin across tenants
+- tenant_weight() settings lookup
+
+Queue-level lane and fairness behavior is covered in
+tests/test_opportunities_job_queue.py.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from kairo.core.job_scheduling import allocate_fair_slots, tenant_weight
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.unit
+class TestAllocateFairSlots:
+    """Test slot allocation across tenants within a lane."""
+
+    def test_alternates_between_equal_tenants(self):
+        heads = {"a": (T0, 10), "b": (T0 + timedelta(minutes=5), 10)}
+
+        assert allocate_fair_slots(heads, {}, 4) == [("a", 2), ("b", 2)]
+
+    def test_recently_served_tenant_waits(self):
+        """A tenant with recent claims yields until the others catch up."""
+        heads = {"a": (T0, 10), "b": (T0 + timedelta(minutes=5), 10)}
+
+        assert allocate_fair_slots(heads, {"a": 3}, 3) == [("b", 3)]
+
+    def test_respects_available_depth(self):
+        heads = {"a": (T0, 10), "b": (T0, 1)}
+
+        assert dict(allocate_fair_slots(heads, {}, 5)) == {"a": 4, "b": 1}
+
+    def test_weights_scale_share(self):
+        heads = {"a": (T0, 10), "b": (T0, 10)}
+
+        allocation = dict(allocate_fair_slots(heads, {}, 6, {"a": 2.0, "b": 1.0}))
+
+        assert allocation == {"a": 4, "b": 2}
+
+    def test_stops_when_lane_exhausted(self):
+        assert allocate_fair_slots({"a": (T0, 2)}, {}, 5) == [("a", 2)]
+
+
+@pytest.mark.unit
+class TestTenantWeight:
+    """Test JOB_TENANT_WEIGHTS lookup."""
+
+    def test_defaults_to_one(self, settings):
+        settings.JOB_TENANT_WEIGHTS = {}
+        assert tenant_weight("anything") == 1.0
+
+    def test_reads_weight_by_string_id(self, settings):
+        settings.JOB_TENANT_WEIGHTS = {"tenant-1": 3.0}
+        assert tenant_weight("tenant-1") == 3.0
+
+    def test_non_positive_weight_falls_back(self, settings):
+        settings.JOB_TENANT_WEIGHTS = {"tenant-1": 0.0}
+        assert tenant_weight("tenant-1") == 1.0
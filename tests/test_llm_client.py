@@ -14,6 +14,8 @@ All tests use fake provider behavior - no real HTTP calls.
 """
 
 import logging
+import os
+import time
 from unittest.mock import patch
 from uuid import uuid4
 
@@ -1294,3 +1296,212 @@ class TestAPIRouting:
         # Verify model passed correctly
         call_kwargs = mock_responses.call_args.kwargs
         assert call_kwargs["model"] == "gpt-5-pro"
+
+
+# =============================================================================
+# RESPONSE CACHE TESTS
+# =============================================================================
+
+
+class TestResponseCache:
+    """Tests for the opt-in LLM response cache (kairo/hero/llm_cache.py)."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_caches(self):
+        from kairo.hero.llm_cache import reset_llm_caches
+
+        reset_llm_caches()
+        yield
+        reset_llm_caches()
+
+    @staticmethod
+    def _client(tmp_path, **overrides) -> LLMClient:
+        config = LLMConfig(
+            api_key="test-key",
+            fast_model_name="test-fast",
+            cache_backend="disk",
+            cache_dir=str(tmp_path),
+            **overrides,
+        )
+        return LLMClient(config=config)
+
+    @staticmethod
+    def _provider_result(content="cached answer"):
+        return {"content": content, "usage": {"prompt_tokens": 10, "completion_tokens": 20}}
+
+    def _call(self, client, brand_id, **kwargs):
+        params = {"brand_id": brand_id, "flow": "F1_today", "prompt": "same prompt"}
+        params.update(kwargs)
+        return client.call(**params)
+
+    def test_identical_request_served_from_cache(self, tmp_path, sample_brand_id):
+        """A repeated identical call does not reach the provider."""
+        client = self._client(tmp_path)
+
+        with patch.object(client, "_call_provider") as mock_provider:
+            mock_provider.return_value = self._provider_result()
+            first = self._call(client, sample_brand_id)
+            second = self._call(client, sample_brand_id)
+
+        mock_provider.assert_called_once()
+        assert first.status == "success"
+        assert second.status == "cache_hit"
+        assert second.raw_text == "cached answer"
+        assert second.usage_tokens_in == 10
+        assert second.usage_tokens_out == 20
+        assert second.estimated_cost_usd == 0.0
+
+    def test_cache_shared_between_clients(self, tmp_path, sample_brand_id):
+        """Entries written by one client are served to another with the same config."""
+        writer = self._client(tmp_path)
+        reader = self._client(tmp_path)
+
+        with patch.object(writer, "_call_provider", return_value=self._provider_result()):
+            self._call(writer, sample_brand_id)
+        with patch.object(reader, "_call_provider") as mock_provider:
+            response = self._call(reader, sample_brand_id)
+
+        mock_provider.assert_not_called()
+        assert response.status == "cache_hit"
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"prompt": "different prompt"},
+            {"system_prompt": "different system prompt"},
+            {"flow": "F2_package"},
+            {"max_output_tokens": 99},
+            {"role": "heavy"},
+        ],
+    )
+    def test_key_covers_request_inputs(self, tmp_path, sample_brand_id, change):
+        """Changing any keyed input misses the cache."""
+        client = self._client(tmp_path)
+
+        with patch.object(client, "_call_provider") as mock_provider:
+            mock_provider.return_value = self._provider_result()
+            self._call(client, sample_brand_id)
+            response = self._call(client, sample_brand_id, **change)
+
+        assert mock_provider.call_count == 2
+        assert response.status == "success"
+
+    def test_nonzero_temperature_bypasses_cache(self, tmp_path, sample_brand_id):
+        """Sampled calls are not cached by default."""
+        client = self._client(tmp_path)
+
+        with patch.object(client, "_call_provider") as mock_provider:
+            mock_provider.return_value = self._provider_result()
+            self._call(client, sample_brand_id, temperature=0.7)
+            response = self._call(client, sample_brand_id, temperature=0.7)
+
+        assert mock_provider.call_count == 2
+        assert response.status == "success"
+
+    def test_nonzero_temperature_cached_when_enabled(self, tmp_path, sample_brand_id):
+        """cache_nonzero_temperature (or cache=True) opts sampled calls in."""
+        client = self._client(tmp_path, cache_nonzero_temperature=True)
+
+        with patch.object(client, "_call_provider") as mock_provider:
+            mock_provider.return_value = self._provider_result()
+            self._call(client, sample_brand_id, temperature=0.7)
+            config_opt_in = self._call(client, sample_brand_id, temperature=0.7)
+            self._call(client, sample_brand_id, temperature=0.9, cache=True)
+            call_opt_in = self._call(client, sample_brand_id, temperature=0.9, cache=True)
+
+        assert mock_provider.call_count == 2
+        assert config_opt_in.status == "cache_hit"
+        assert call_opt_in.status == "cache_hit"
+
+    def test_cache_false_bypasses(self, tmp_path, sample_brand_id):
+        """cache=False neither reads nor writes the cache."""
+        client = self._client(tmp_path)
+
+        with patch.object(client, "_call_provider") as mock_provider:
+            mock_provider.return_value = self._provider_result()
+            self._call(client, sample_brand_id)
+            response = self._call(client, sample_brand_id, cache=False)
+
+        assert mock_provider.call_count == 2
+        assert response.status == "success"
+
+    def test_disabled_by_default(self, sample_brand_id):
+        """Without a cache backend every call reaches the provider."""
+        client = LLMClient(config=LLMConfig(api_key="test-key"))
+
+        with patch.object(client, "_call_provider") as mock_provider:
+            mock_provider.return_value = self._provider_result()
+            self._call(client, sample_brand_id)
+            self._call(client, sample_brand_id)
+
+        assert mock_provider.call_count == 2
+
+    def test_failures_are_not_cached(self, tmp_path, sample_brand_id):
+        """A failed call leaves nothing behind for the retry."""
+        client = self._client(tmp_path)
+
+        with patch.object(client, "_call_provider") as mock_provider:
+            mock_provider.side_effect = [Exception("boom"), self._provider_result()]
+            with pytest.raises(LLMCallError):
+                self._call(client, sample_brand_id)
+            response = self._call(client, sample_brand_id)
+
+        assert response.status == "success"
+
+    def test_hit_logged_with_cache_hit_status(
+        self, tmp_path, sample_brand_id, mock_log_handler
+    ):
+        """Cache hits go through _log_call with status cache_hit."""
+        client = self._client(tmp_path)
+
+        with patch.object(client, "_call_provider", return_value=self._provider_result()):
+            self._call(client, sample_brand_id)
+            self._call(client, sample_brand_id)
+
+        statuses = [getattr(r, "status", None) for r in mock_log_handler.records]
+        assert statuses == ["success", "cache_hit"]
+
+    def test_entries_expire_after_ttl(self, tmp_path, sample_brand_id):
+        """Entries older than the TTL are misses."""
+        client = self._client(tmp_path, cache_ttl_s=60)
+
+        with patch.object(client, "_call_provider") as mock_provider:
+            mock_provider.return_value = self._provider_result()
+            self._call(client, sample_brand_id)
+            with patch("kairo.hero.llm_cache.time.time", return_value=time.time() + 61):
+                response = self._call(client, sample_brand_id)
+
+        assert mock_provider.call_count == 2
+        assert response.status == "success"
+
+    def test_disk_cache_evicts_least_recently_used(self, tmp_path):
+        """Beyond max_entries the least recently used entries are removed."""
+        from kairo.hero.llm_cache import DiskLLMResponseCache, make_entry
+
+        cache = DiskLLMResponseCache(str(tmp_path), ttl_s=3600, max_entries=3)
+        for i, key in enumerate(["aa1", "bb2", "cc3"]):
+            cache.set(key, make_entry(f"answer {i}", 1, 1))
+            os.utime(cache._path(key), (1000 + i, 1000 + i))
+        cache.get("aa1")  # Most recently used now
+
+        cache.set("dd4", make_entry("answer 3", 1, 1))
+
+        assert cache.get("bb2") is None
+        assert cache.get("aa1") is not None
+        assert cache.get("dd4") is not None
+
+    def test_load_config_from_env(self, monkeypatch, tmp_path):
+        """Cache settings are read from KAIRO_LLM_CACHE_* env vars."""
+        monkeypatch.setenv("KAIRO_LLM_CACHE", "disk")
+        monkeypatch.setenv("KAIRO_LLM_CACHE_TTL_S", "120")
+        monkeypatch.setenv("KAIRO_LLM_CACHE_MAX_ENTRIES", "50")
+        monkeypatch.setenv("KAIRO_LLM_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("KAIRO_LLM_CACHE_NONZERO_TEMP", "true")
+
+        config = load_config_from_env()
+
+        assert config.cache_backend == "disk"
+        assert config.cache_ttl_s == 120
+        assert config.cache_max_entries == 50
+        assert config.cache_dir == str(tmp_path)
+        assert config.cache_nonzero_temperature is True
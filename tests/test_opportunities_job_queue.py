@@ -0,0 +1,519 @@
+"""
+OpportunitiesJob Queue Tests.
+
+Tests for kairo.hero.jobs.queue claim semantics:
+- claim_next_jobs() batch claiming
+- claim_next_job() compatibility wrapper
+- No double-claiming across workers
+- extend_job_locks() batched heartbeat and --concurrency worker mode
+- Per-brand enqueue coalescing
+- Priority lanes and per-tenant fair scheduling
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from django.utils import timezone
+
+from kairo.core.models import Brand, Tenant
+from kairo.hero.jobs.queue import (
+    claim_next_job,
+    claim_next_jobs,
+    enqueue_opportunities_job,
+    extend_job_locks,
+)
+from kairo.hero.models import OpportunitiesJob, OpportunitiesJobStatus
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def tenant(db):
+    """Create a test tenant."""
+    return Tenant.objects.create(
+        name="Job Queue Test Tenant",
+        slug="job-queue-test-tenant",
+    )
+
+
+@pytest.fixture
+def brand(db, tenant):
+    """Create a test brand."""
+    return Brand.objects.create(
+        tenant=tenant,
+        name="Job Queue Test Brand",
+        slug="job-queue-test-brand",
+    )
+
+
+def _make_pending_jobs(brand, count: int) -> list[OpportunitiesJob]:
+    """
+    Create `count` PENDING jobs directly (bypasses enqueue policy).
+
+    One PENDING job per brand is allowed, so extra jobs get sibling brands
+    in the same tenant.
+    """
+    jobs = []
+    for i in range(count):
+        job_brand = brand if i == 0 else Brand.objects.create(
+            tenant=brand.tenant,
+            name=f"{brand.name} {i}",
+            slug=f"{brand.slug}-{i}",
+        )
+        jobs.append(OpportunitiesJob.objects.create(
+            brand=job_brand,
+            status=OpportunitiesJobStatus.PENDING,
+            params_json={"mode": "fixture_only"},
+        ))
+    return jobs
+
+
+# =============================================================================
+# BATCH CLAIMING
+# =============================================================================
+
+
+@pytest.mark.db
+class TestClaimNextJobs:
+    """Test claim_next_jobs() batch claiming."""
+
+    def test_claims_up_to_limit(self, db, brand):
+        """Claims at most `limit` jobs and marks them RUNNING."""
+        _make_pending_jobs(brand, 5)
+
+        jobs = claim_next_jobs(worker_id="worker-1", limit=3)
+
+        assert len(jobs) == 3
+        for job in jobs:
+            assert job.status == OpportunitiesJobStatus.RUNNING
+            assert job.locked_by == "worker-1"
+            assert job.locked_at is not None
+            assert job.attempts == 1
+
+        assert OpportunitiesJob.objects.filter(
+            status=OpportunitiesJobStatus.PENDING
+        ).count() == 2
+
+    def test_claims_in_fifo_order(self, db, brand):
+        """Oldest available jobs are claimed first."""
+        created = _make_pending_jobs(brand, 3)
+
+        jobs = claim_next_jobs(worker_id="worker-1", limit=2)
+
+        assert [j.id for j in jobs] == [created[0].id, created[1].id]
+
+    def test_workers_claim_disjoint_jobs(self, db, brand):
+        """Successive claimers never receive the same job."""
+        _make_pending_jobs(brand, 4)
+
+        first = claim_next_jobs(worker_id="worker-1", limit=2)
+        second = claim_next_jobs(worker_id="worker-2", limit=2)
+        third = claim_next_jobs(worker_id="worker-3", limit=2)
+
+        first_ids = {j.id for j in first}
+        second_ids = {j.id for j in second}
+        assert len(first_ids) == 2
+        assert len(second_ids) == 2
+        assert first_ids.isdisjoint(second_ids)
+        assert third == []
+
+    def test_skips_jobs_in_backoff(self, db, brand):
+        """Jobs with available_at in the future are not claimed."""
+        (job,) = _make_pending_jobs(brand, 1)
+        OpportunitiesJob.objects.filter(id=job.id).update(
+            available_at=timezone.now() + timedelta(hours=1)
+        )
+
+        assert claim_next_jobs(worker_id="worker-1", limit=5) == []
+
+    def test_zero_limit_claims_nothing(self, db, brand):
+        """limit < 1 is a no-op."""
+        _make_pending_jobs(brand, 1)
+
+        assert claim_next_jobs(worker_id="worker-1", limit=0) == []
+        assert OpportunitiesJob.objects.filter(
+            status=OpportunitiesJobStatus.PENDING
+        ).count() == 1
+
+
+@pytest.mark.db
+class TestClaimNextJob:
+    """Test claim_next_job() single-claim wrapper."""
+
+    def test_claim_enqueued_job(self, db, brand):
+        """Wrapper returns the claimed job in a ClaimResult."""
+        result = enqueue_opportunities_job(brand.id)
+
+        claim = claim_next_job(worker_id="worker-1")
+
+        assert claim.claimed is True
+        assert claim.job.id == result.job_id
+        assert claim.job.status == OpportunitiesJobStatus.RUNNING
+
+    def test_claim_empty_queue(self, db):
+        """Wrapper reports an empty queue."""
+        claim = claim_next_job(worker_id="worker-1")
+
+        assert claim.claimed is False
+        assert claim.job is None
+        assert "No available jobs" in claim.reason
+
+
+# =============================================================================
+# BATCHED HEARTBEAT
+# =============================================================================
+
+
+@pytest.mark.db
+class TestExtendJobLocks:
+    """Test extend_job_locks() batched heartbeat."""
+
+    def test_extends_only_owned_running_jobs(self, db, brand):
+        """Only RUNNING jobs locked by this worker are extended."""
+        _make_pending_jobs(brand, 3)
+        mine = claim_next_jobs(worker_id="worker-1", limit=2)
+        (theirs,) = claim_next_jobs(worker_id="worker-2", limit=1)
+
+        old = timezone.now() - timedelta(minutes=5)
+        OpportunitiesJob.objects.update(locked_at=old)
+
+        extended = extend_job_locks(
+            [j.id for j in mine] + [theirs.id],
+            "worker-1",
+        )
+
+        assert extended == 2
+        for job in mine:
+            job.refresh_from_db()
+            assert job.locked_at > old
+        theirs.refresh_from_db()
+        assert theirs.locked_at == old
+
+    def test_empty_list_is_noop(self, db):
+        assert extend_job_locks([], "worker-1") == 0
+
+
+# =============================================================================
+# CONCURRENT WORKER
+# =============================================================================
+
+
+@pytest.mark.db
+class TestConcurrentWorker:
+    """Test opportunities_worker --concurrency mode."""
+
+    def test_runs_claimed_jobs_in_slots(self, db, brand):
+        """Each claimed job is executed exactly once across slots."""
+        from io import StringIO
+        from unittest.mock import patch
+
+        from django.core.management import call_command
+
+        created = _make_pending_jobs(brand, 3)
+        executed = []
+
+        def fake_run_job(self, job):
+            executed.append(job.id)
+
+        with patch(
+            "kairo.hero.management.commands.opportunities_worker.Command._run_job",
+            fake_run_job,
+        ):
+            out = StringIO()
+            call_command(
+                "opportunities_worker",
+                concurrency=2,
+                max_jobs=3,
+                stdout=out,
+            )
+
+        assert sorted(executed, key=str) == sorted((j.id for j in created), key=str)
+        assert "Concurrency: 2 slots" in out.getvalue()
+        assert "Jobs processed: 3" in out.getvalue()
+
+    def test_failed_slot_not_counted_as_processed(self, db, brand):
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        created = _make_pending_jobs(brand, 3)
+
+        def fake_run_job(self, job):
+            if job.id == created[0].id:
+                raise RuntimeError("slot crashed")
+
+        with patch(
+            "kairo.hero.management.commands.opportunities_worker.Command._run_job",
+            fake_run_job,
+        ):
+            out = StringIO()
+            call_command(
+                "opportunities_worker",
+                concurrency=2,
+                max_jobs=3,
+                stdout=out,
+            )
+
+        assert "Jobs processed: 2" in out.getvalue()
+
+
+# =============================================================================
+# ENQUEUE COALESCING
+# =============================================================================
+
+
+@pytest.mark.db
+class TestEnqueueCoalescing:
+    """Test per-brand coalescing in enqueue_opportunities_job()."""
+
+    def test_second_enqueue_returns_pending_job(self, db, brand):
+        first = enqueue_opportunities_job(brand.id)
+        second = enqueue_opportunities_job(brand.id, first_run=True)
+
+        assert first.coalesced is False
+        assert second.coalesced is True
+        assert second.job_id == first.job_id
+        assert OpportunitiesJob.objects.filter(brand=brand).count() == 1
+
+    def test_live_request_promotes_pending_fixture_job(self, db, brand):
+        """A stronger mode upgrades the queued job instead of adding one."""
+        first = enqueue_opportunities_job(brand.id, first_run=True)
+        user_id = uuid4()
+
+        second = enqueue_opportunities_job(
+            brand.id,
+            force=True,
+            mode="live_cap_limited",
+            user_id=user_id,
+        )
+
+        assert second.job_id == first.job_id
+        job = OpportunitiesJob.objects.get(id=first.job_id)
+        assert job.params_json["mode"] == "live_cap_limited"
+        assert job.params_json["force"] is True
+        assert job.params_json["user_id"] == str(user_id)
+
+    def test_fixture_request_does_not_downgrade_pending_live_job(self, db, brand):
+        first = enqueue_opportunities_job(brand.id, force=True, mode="live_cap_limited")
+
+        enqueue_opportunities_job(brand.id, first_run=True)
+
+        job = OpportunitiesJob.objects.get(id=first.job_id)
+        assert job.params_json["mode"] == "live_cap_limited"
+
+    def test_coalesces_into_running_job_with_covering_mode(self, db, brand):
+        first = enqueue_opportunities_job(brand.id, force=True, mode="live_cap_limited")
+        claim_next_job(worker_id="worker-1")
+
+        second = enqueue_opportunities_job(brand.id, first_run=True)
+
+        assert second.coalesced is True
+        assert second.job_id == first.job_id
+
+    def test_stronger_request_queues_behind_weaker_running_job(self, db, brand):
+        """A live request while a fixture job runs gets its own PENDING job."""
+        first = enqueue_opportunities_job(brand.id)
+        claim_next_job(worker_id="worker-1")
+
+        second = enqueue_opportunities_job(brand.id, force=True, mode="live_cap_limited")
+
+        assert second.coalesced is False
+        assert second.job_id != first.job_id
+        assert OpportunitiesJob.objects.get(id=second.job_id).status == (
+            OpportunitiesJobStatus.PENDING
+        )
+
+    def test_db_rejects_second_pending_job_for_brand(self, db, brand):
+        from django.db import IntegrityError, transaction
+
+        enqueue_opportunities_job(brand.id)
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            OpportunitiesJob.objects.create(
+                brand=brand,
+                status=OpportunitiesJobStatus.PENDING,
+            )
+
+    def test_retry_superseded_by_newer_pending_job(self, db, brand):
+        """fail_job does not requeue when a newer PENDING job exists."""
+        from kairo.hero.jobs.queue import fail_job
+
+        first = enqueue_opportunities_job(brand.id)
+        claim_next_job(worker_id="worker-1")
+        second = enqueue_opportunities_job(brand.id, force=True, mode="live_cap_limited")
+
+        assert fail_job(first.job_id, "boom") is True
+
+        job = OpportunitiesJob.objects.get(id=first.job_id)
+        assert job.status == OpportunitiesJobStatus.FAILED
+        assert str(second.job_id) in job.last_error
+
+    def test_retry_loses_race_to_concurrent_enqueue(self, db, brand):
+        """A PENDING job created after the sibling check supersedes the retry."""
+        from kairo.hero.jobs import queue
+
+        first = enqueue_opportunities_job(brand.id)
+        claim_next_job(worker_id="worker-1")
+        second = enqueue_opportunities_job(brand.id, force=True, mode="live_cap_limited")
+        checks = []
+
+        def racing_sibling_id(job):
+            # The first check runs before the concurrent enqueue commits
+            checks.append(job.id)
+            return original(job) if len(checks) > 1 else None
+
+        original = queue._pending_sibling_id
+        with patch.object(queue, "_pending_sibling_id", side_effect=racing_sibling_id):
+            assert queue.fail_job(first.job_id, "boom") is True
+
+        job = OpportunitiesJob.objects.get(id=first.job_id)
+        assert job.status == OpportunitiesJobStatus.FAILED
+        assert str(second.job_id) in job.last_error
+
+    def test_stale_release_loses_race_to_concurrent_enqueue(self, db, brand):
+        from kairo.hero.jobs import queue
+
+        first = enqueue_opportunities_job(brand.id)
+        claim_next_job(worker_id="worker-1")
+        OpportunitiesJob.objects.filter(id=first.job_id).update(
+            locked_at=timezone.now() - timedelta(hours=1)
+        )
+        second = enqueue_opportunities_job(brand.id, force=True, mode="live_cap_limited")
+        checks = []
+
+        def racing_sibling_id(job):
+            checks.append(job.id)
+            return original(job) if len(checks) > 1 else None
+
+        original = queue._pending_sibling_id
+        with patch.object(queue, "_pending_sibling_id", side_effect=racing_sibling_id):
+            assert queue.release_stale_jobs(stale_threshold_minutes=10) == 1
+
+        job = OpportunitiesJob.objects.get(id=first.job_id)
+        assert job.status == OpportunitiesJobStatus.FAILED
+        assert str(second.job_id) in job.last_error
+
+
+# =============================================================================
+# PRIORITY LANES & FAIR SCHEDULING
+# =============================================================================
+
+
+def _make_tenant_jobs(slug: str, count: int, **job_fields) -> list[OpportunitiesJob]:
+    """Create a tenant with `count` brands, each holding one PENDING job."""
+    tenant = Tenant.objects.create(name=f"Tenant {slug}", slug=slug)
+    jobs = []
+    for i in range(count):
+        brand = Brand.objects.create(
+            tenant=tenant,
+            name=f"{slug} brand {i}",
+            slug=f"{slug}-brand-{i}",
+        )
+        jobs.append(OpportunitiesJob.objects.create(
+            brand=brand,
+            status=OpportunitiesJobStatus.PENDING,
+            params_json={"mode": "fixture_only"},
+            **job_fields,
+        ))
+    return jobs
+
+
+@pytest.mark.db
+class TestPriorityLanes:
+    """Test priority lane ordering in claim_next_jobs()."""
+
+    def test_enqueue_assigns_lane(self, db, brand):
+        from kairo.core.enums import JobPriority
+
+        scheduled = enqueue_opportunities_job(brand.id)
+        job = OpportunitiesJob.objects.get(id=scheduled.job_id)
+
+        assert job.priority == JobPriority.SCHEDULED
+        assert job.tenant_id == brand.tenant_id
+
+    def test_interactive_claimed_ahead_of_backlog(self, db, brand):
+        """A regenerate jumps a deep first-run backlog."""
+        from kairo.core.enums import JobPriority
+
+        _make_tenant_jobs("bulk-onboard", 20, priority=JobPriority.FIRST_RUN)
+        regenerate = enqueue_opportunities_job(brand.id, force=True)
+
+        (job,) = claim_next_jobs(worker_id="worker-1", limit=1)
+
+        assert job.id == regenerate.job_id
+        assert job.priority == JobPriority.INTERACTIVE
+
+    def test_first_run_claimed_ahead_of_scheduled(self, db):
+        from kairo.core.enums import JobPriority
+
+        _make_tenant_jobs("scheduled-refresh", 2, priority=JobPriority.SCHEDULED)
+        (first_run,) = _make_tenant_jobs("first-run", 1, priority=JobPriority.FIRST_RUN)
+
+        (job,) = claim_next_jobs(worker_id="worker-1", limit=1)
+
+        assert job.id == first_run.id
+
+    def test_coalesced_regenerate_promotes_lane(self, db, brand):
+        from kairo.core.enums import JobPriority
+
+        first = enqueue_opportunities_job(brand.id, first_run=True)
+        second = enqueue_opportunities_job(brand.id, force=True)
+
+        assert second.job_id == first.job_id
+        job = OpportunitiesJob.objects.get(id=first.job_id)
+        assert job.priority == JobPriority.INTERACTIVE
+
+
+@pytest.mark.db
+class TestTenantFairness:
+    """Test weighted round-robin across tenants within a lane."""
+
+    def test_round_robin_across_tenants(self, db):
+        """A bulk tenant does not starve a tenant that enqueued later."""
+        bulk = _make_tenant_jobs("fair-bulk", 4)
+        small = _make_tenant_jobs("fair-small", 2)
+        tenant_of = {j.id: j.tenant_id for j in bulk + small}
+
+        order = [
+            tenant_of[claim_next_jobs(worker_id="worker-1", limit=1)[0].id]
+            for _ in range(6)
+        ]
+
+        a, b = bulk[0].tenant_id, small[0].tenant_id
+        assert order == [a, b, a, b, a, a]
+
+    def test_batch_claim_splits_slots(self, db):
+        bulk = _make_tenant_jobs("split-bulk", 5)
+        small = _make_tenant_jobs("split-small", 2)
+
+        jobs = claim_next_jobs(worker_id="worker-1", limit=4)
+
+        tenants = [j.tenant_id for j in jobs]
+        assert tenants.count(bulk[0].tenant_id) == 2
+        assert tenants.count(small[0].tenant_id) == 2
+
+    def test_weighted_tenant_gets_more_slots(self, db, settings):
+        heavy = _make_tenant_jobs("weighted-heavy", 6)
+        light = _make_tenant_jobs("weighted-light", 6)
+        settings.JOB_TENANT_WEIGHTS = {str(heavy[0].tenant_id): 2.0}
+
+        jobs = claim_next_jobs(worker_id="worker-1", limit=6)
+
+        tenants = [j.tenant_id for j in jobs]
+        assert tenants.count(heavy[0].tenant_id) == 4
+        assert tenants.count(light[0].tenant_id) == 2
+
+    def test_fills_from_single_tenant_when_others_empty(self, db):
+        bulk = _make_tenant_jobs("fill-bulk", 3)
+        (other,) = _make_tenant_jobs("fill-other", 1)
+
+        jobs = claim_next_jobs(worker_id="worker-1", limit=4)
+
+        assert {j.id for j in jobs} == {j.id for j in bulk} | {other.id}
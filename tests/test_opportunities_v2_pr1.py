@@ -236,8 +236,8 @@ class TestJobEnqueue:
         assert result.meta.state == TodayBoardState.GENERATING
         assert result.meta.job_id is not None
 
-    def test_multiple_regenerate_creates_multiple_jobs(self, brand):
-        """Multiple POST /regenerate with force=True creates new jobs."""
+    def test_multiple_regenerate_coalesces_into_one_job(self, brand):
+        """Multiple POST /regenerate while a job is pending reuse that job."""
         from kairo.hero.models import OpportunitiesJob
 
         result1 = today_service.regenerate_today_board(brand.id)
@@ -247,9 +247,10 @@ class TestJobEnqueue:
         assert result1.status == "accepted"
         assert result2.status == "accepted"
 
-        # Count jobs for this brand
+        # Second request coalesced into the first job
+        assert result2.job_id == result1.job_id
         job_count = OpportunitiesJob.objects.filter(brand_id=brand.id).count()
-        assert job_count == 2
+        assert job_count == 1
 
 
 # =============================================================================
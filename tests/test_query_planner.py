@@ -0,0 +1,157 @@
+"""
+Query Planner Cache Tests.
+
+Tests for the query plan cache in kairo.sourceactivation.query_planner:
+- Identical snapshot inputs reuse the cached plan (no LLM call)
+- Changing a prompt input misses; unrelated snapshot fields do not
+- Trend-bank mixing still runs on cached plans
+- Failed / empty plans are not cached
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from django.core.cache import cache
+
+from kairo.hero.llm_client import LLMResponse
+from kairo.sourceactivation.query_planner import (
+    TIKTOK_TREND_BANK,
+    generate_query_plan,
+)
+
+LLM_OUTPUT = {
+    "inferred_industry": "Technology",
+    "tiktok": {
+        "searchQueries": ["ai tools", "seo is dead", "chatgpt tips"],
+        "hashtags": ["#aitools", "#tech"],
+        "rationale": "AI search",
+    },
+    "instagram": {
+        "searchQueries": ["ai marketing"],
+        "hashtags": ["aimarketing", "seo", "growth"],
+        "rationale": "Marketing",
+    },
+}
+
+
+def _snapshot(one_liner: str = "AI search visibility for brands") -> dict:
+    return {
+        "positioning": {
+            "brand_name": {"value": "Acme"},
+            "one_liner": {"value": one_liner},
+            "who_for": {"value": "Marketing leads"},
+        },
+        "content": {
+            "content_pillars": [{"name": "AI search", "description": "How AI answers"}],
+        },
+        "voice": {"tone_tags": ["direct"]},
+    }
+
+
+@pytest.fixture
+def llm():
+    """Patch the default LLM client; returns the mock client."""
+    cache.clear()
+    client = MagicMock()
+    client.call.return_value = LLMResponse(
+        raw_text=json.dumps(LLM_OUTPUT),
+        model="test-fast",
+        usage_tokens_in=10,
+        usage_tokens_out=20,
+        latency_ms=5,
+        role="fast",
+    )
+    with patch("kairo.hero.llm_client.get_default_client", return_value=client):
+        yield client
+    cache.clear()
+
+
+@pytest.mark.unit
+class TestQueryPlanCache:
+    """Test snapshot-hash keyed query plan reuse."""
+
+    def test_unchanged_snapshot_reuses_plan(self, llm):
+        brand_id = str(uuid4())
+
+        first = generate_query_plan(brand_id, _snapshot())
+        second = generate_query_plan(brand_id, _snapshot())
+
+        assert llm.call.call_count == 1
+        assert second.error is None
+        assert second.inferred_industry == "Technology"
+        assert second.raw_llm_output == first.raw_llm_output
+        assert second.get_tiktok_queries()[:3] == ["ai tools", "seo is dead", "chatgpt tips"]
+
+    def test_trend_bank_mixed_on_cached_plan(self, llm):
+        brand_id = str(uuid4())
+        generate_query_plan(brand_id, _snapshot())
+
+        plan = generate_query_plan(brand_id, _snapshot())
+
+        trend_queries = plan.get_tiktok_queries()[3:]
+        assert len(trend_queries) == 2
+        assert set(trend_queries) <= set(TIKTOK_TREND_BANK)
+
+    def test_prompt_input_change_misses(self, llm):
+        brand_id = str(uuid4())
+
+        generate_query_plan(brand_id, _snapshot())
+        generate_query_plan(brand_id, _snapshot(one_liner="Something new"))
+
+        assert llm.call.call_count == 2
+
+    def test_unrelated_snapshot_change_hits(self, llm):
+        brand_id = str(uuid4())
+        changed = _snapshot()
+        changed["voice"] = {"tone_tags": ["playful"]}
+
+        generate_query_plan(brand_id, _snapshot())
+        generate_query_plan(brand_id, changed)
+
+        assert llm.call.call_count == 1
+
+    def test_cache_is_per_brand_and_role(self, llm):
+        brand_id = str(uuid4())
+
+        generate_query_plan(brand_id, _snapshot())
+        generate_query_plan(str(uuid4()), _snapshot())
+        generate_query_plan(brand_id, _snapshot(), model="heavy")
+
+        assert llm.call.call_count == 3
+
+    def test_use_cache_false_calls_llm(self, llm):
+        brand_id = str(uuid4())
+
+        generate_query_plan(brand_id, _snapshot())
+        generate_query_plan(brand_id, _snapshot(), use_cache=False)
+
+        assert llm.call.call_count == 2
+
+    def test_failed_plan_not_cached(self, llm):
+        brand_id = str(uuid4())
+        llm.call.return_value = LLMResponse(
+            raw_text="not json", model="test-fast", usage_tokens_in=1,
+            usage_tokens_out=1, latency_ms=1, role="fast",
+        )
+
+        failed = generate_query_plan(brand_id, _snapshot())
+        generate_query_plan(brand_id, _snapshot())
+
+        assert failed.error is not None
+        assert llm.call.call_count == 2
+
+    def test_plan_without_probes_not_cached(self, llm):
+        brand_id = str(uuid4())
+        llm.call.return_value = LLMResponse(
+            raw_text=json.dumps({"inferred_industry": "Technology"}), model="test-fast",
+            usage_tokens_in=1, usage_tokens_out=1, latency_ms=1, role="fast",
+        )
+
+        generate_query_plan(brand_id, _snapshot())
+        generate_query_plan(brand_id, _snapshot())
+
+        assert llm.call.call_count == 2
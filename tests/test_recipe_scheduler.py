@@ -0,0 +1,233 @@
+"""
+Recipe DAG Scheduler Tests.
+
+Tests for kairo.sourceactivation.scheduler and its use by the thread-pool
+executor in kairo.sourceactivation.live:
+- DAG built from RecipeSpec.depends_on; unknown recipes and out-of-plan
+  dependencies dropped; cycles rejected
+- Ready recipes start critical-path first, within per-platform limits
+- Dependents get a seed pack derived from upstream raw items
+- A dependent starts as soon as its upstream finishes, not when the phase does
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from kairo.sourceactivation import live
+from kairo.sourceactivation.live import RecipeResult
+from kairo.sourceactivation.recipes import DEFAULT_EXECUTION_PLAN, RECIPE_REGISTRY, RecipeSpec
+from kairo.sourceactivation.scheduler import RecipeScheduler, build_recipe_dag
+from kairo.sourceactivation.types import EvidenceItemData, SeedPack
+
+
+def _recipe(
+    recipe_id: str,
+    platform: str = "test",
+    depends_on: tuple[str, ...] = (),
+    two_stage: bool = False,
+    upstream_seed_builder=None,
+) -> RecipeSpec:
+    return RecipeSpec(
+        recipe_id=recipe_id,
+        platform=platform,
+        description=f"Test recipe {recipe_id}",
+        stage1_actor=f"test~{recipe_id.lower()}",
+        stage1_input_builder=lambda seed_pack: {},
+        stage1_result_limit=3,
+        stage2_actor="test~enrich" if two_stage else None,
+        depends_on=depends_on,
+        upstream_seed_builder=upstream_seed_builder,
+    )
+
+
+def _result(recipe_id: str, raw_items: list[dict] | None = None, success: bool = True) -> RecipeResult:
+    items = [
+        EvidenceItemData(
+            platform="test",
+            actor_id="test",
+            acquisition_stage=1,
+            recipe_id=recipe_id,
+            canonical_url=f"https://example.com/{recipe_id}/{i}",
+            external_id=str(i),
+            author_ref="test",
+            raw_json=raw,
+        )
+        for i, raw in enumerate(raw_items or [])
+    ]
+    return RecipeResult(
+        recipe_id=recipe_id,
+        success=success,
+        items=items,
+        stage1_items_count=len(items),
+        stage2_items_count=0,
+        estimated_cost=Decimal("0"),
+    )
+
+
+def _ids(nodes) -> list[str]:
+    return [node.recipe_id for node in nodes]
+
+
+class TestBuildRecipeDag:
+    """Test DAG construction from an execution plan."""
+
+    def test_default_plan_chains_tt1_after_trends(self):
+        nodes = build_recipe_dag(DEFAULT_EXECUTION_PLAN)
+
+        assert set(nodes) == set(DEFAULT_EXECUTION_PLAN)
+        assert nodes["TT-1"].depends_on == ("TT-TRENDS-GENERAL", "TT-TRENDS-INDUSTRY")
+        assert nodes["TT-TRENDS-GENERAL"].dependents == ["TT-1"]
+        assert nodes["IG-1"].depends_on == ()
+
+    def test_critical_path_counts_stages_downstream(self):
+        nodes = build_recipe_dag(DEFAULT_EXECUTION_PLAN)
+
+        assert nodes["TT-1"].critical_path == 1
+        assert nodes["TT-TRENDS-GENERAL"].critical_path == 2
+        assert nodes["IG-1"].critical_path == 2  # two-stage
+        assert nodes["YT-1"].critical_path == 1
+
+    def test_unknown_recipes_and_out_of_plan_dependencies_dropped(self):
+        nodes = build_recipe_dag(["TT-1", "NOPE"], RECIPE_REGISTRY.get)
+
+        assert list(nodes) == ["TT-1"]
+        assert nodes["TT-1"].depends_on == ()
+
+    def test_cycle_rejected(self):
+        recipes = {
+            "A": _recipe("A", depends_on=("B",)),
+            "B": _recipe("B", depends_on=("A",)),
+            "C": _recipe("C"),
+        }
+
+        with pytest.raises(ValueError, match="cycle: A, B"):
+            build_recipe_dag(list(recipes), recipes.get)
+
+
+class TestRecipeScheduler:
+    """Test ready-set selection and upstream seed derivation."""
+
+    def test_dependent_waits_for_all_upstreams(self):
+        recipes = {
+            "UP-1": _recipe("UP-1"),
+            "UP-2": _recipe("UP-2"),
+            "DOWN": _recipe("DOWN", depends_on=("UP-1", "UP-2")),
+        }
+        scheduler = RecipeScheduler(build_recipe_dag(list(recipes), recipes.get), {})
+
+        assert _ids(scheduler.start_ready(10)) == ["UP-1", "UP-2"]
+        scheduler.finish("UP-1", _result("UP-1"))
+        assert scheduler.start_ready(10) == []
+        scheduler.finish("UP-2", None)  # raised: still unblocks DOWN
+        assert _ids(scheduler.start_ready(10)) == ["DOWN"]
+        scheduler.finish("DOWN", _result("DOWN"))
+        assert scheduler.is_done()
+
+    def test_critical_path_first_then_plan_order(self):
+        recipes = {
+            "SHORT": _recipe("SHORT"),
+            "LONG": _recipe("LONG", two_stage=True),
+            "CHAIN-HEAD": _recipe("CHAIN-HEAD", two_stage=True),
+            "CHAIN-TAIL": _recipe("CHAIN-TAIL", depends_on=("CHAIN-HEAD",)),
+        }
+        scheduler = RecipeScheduler(build_recipe_dag(list(recipes), recipes.get), {})
+
+        assert _ids(scheduler.start_ready(2)) == ["CHAIN-HEAD", "LONG"]
+        assert _ids(scheduler.start_ready(5)) == ["SHORT"]
+
+    def test_platform_limit(self):
+        recipes = {
+            "IG-A": _recipe("IG-A", platform="instagram"),
+            "IG-B": _recipe("IG-B", platform="instagram"),
+            "YT-A": _recipe("YT-A", platform="youtube"),
+        }
+        scheduler = RecipeScheduler(
+            build_recipe_dag(list(recipes), recipes.get), {"instagram": 1}
+        )
+
+        assert _ids(scheduler.start_ready(10)) == ["IG-A", "YT-A"]
+        assert scheduler.start_ready(10) == []
+        scheduler.finish("IG-A", _result("IG-A"))
+        assert _ids(scheduler.start_ready(10)) == ["IG-B"]
+
+    def test_seed_pack_from_successful_upstream_raw_items(self):
+        seen = []
+
+        def builder(seed_pack, raw_items):
+            seen.append(raw_items)
+            return seed_pack
+
+        recipes = {
+            "UP-1": _recipe("UP-1"),
+            "UP-2": _recipe("UP-2"),
+            "DOWN": _recipe("DOWN", depends_on=("UP-1", "UP-2"), upstream_seed_builder=builder),
+        }
+        scheduler = RecipeScheduler(build_recipe_dag(list(recipes), recipes.get), {})
+        scheduler.start_ready(10)
+        scheduler.finish("UP-1", _result("UP-1", [{"hashtag": "a"}, {}]))
+        scheduler.finish("UP-2", _result("UP-2", [{"hashtag": "b"}], success=False))
+
+        [down] = scheduler.start_ready(10)
+        seed_pack = SeedPack(brand_id=uuid.uuid4(), brand_name="Brand")
+
+        assert scheduler.seed_pack_for(down, seed_pack) is seed_pack
+        assert seen == [[{"hashtag": "a"}]]
+
+
+class TestParallelExecutorScheduling:
+    """Test _execute_recipes_parallel drives the DAG without phase barriers."""
+
+    def test_dependent_starts_before_unrelated_slow_recipe_finishes(self):
+        recipes = {
+            "SLOW": _recipe("SLOW"),
+            "UP": _recipe("UP"),
+            "DOWN": _recipe("DOWN", depends_on=("UP",)),
+        }
+        durations = {"SLOW": 0.5, "UP": 0.05, "DOWN": 0.05}
+        events: list[tuple[str, str]] = []
+        lock = threading.Lock()
+
+        def fake_execute(recipe, seed_pack, run_id, client, in_flight=None):
+            with lock:
+                events.append(("start", recipe.recipe_id))
+            time.sleep(durations[recipe.recipe_id])
+            with lock:
+                events.append(("end", recipe.recipe_id))
+            return _result(recipe.recipe_id, [{"n": 1}])
+
+        with patch("kairo.sourceactivation.live.get_recipe", recipes.get), \
+             patch("kairo.sourceactivation.live.execute_recipe", side_effect=fake_execute):
+            result = live._execute_recipes_parallel(
+                brand_id=uuid.uuid4(),
+                seed_pack=SeedPack(brand_id=uuid.uuid4(), brand_name="Brand"),
+                run_id=uuid.uuid4(),
+                execution_plan=list(recipes),
+                client=None,
+            )
+
+        assert result.success
+        assert sorted(result.recipes_executed) == sorted(recipes)
+        assert events.index(("end", "DOWN")) < events.index(("end", "SLOW"))
+        assert events.index(("end", "UP")) < events.index(("start", "DOWN"))
+
+    def test_cycle_returns_error_result(self):
+        recipes = {"A": _recipe("A", depends_on=("A",))}
+
+        with patch("kairo.sourceactivation.live.get_recipe", recipes.get):
+            result = live._execute_recipes_parallel(
+                brand_id=uuid.uuid4(),
+                seed_pack=SeedPack(brand_id=uuid.uuid4(), brand_name="Brand"),
+                run_id=uuid.uuid4(),
+                execution_plan=["A"],
+                client=None,
+            )
+
+        assert not result.success
+        assert "cycle" in result.error
@@ -0,0 +1,145 @@
+"""
+Supabase Auth Middleware Tests.
+
+Tests for the verified-token cache in kairo.middleware.supabase_auth:
+- Repeat requests with the same token make no DB queries
+- Entries expire with the token (and the TTL cap)
+- Email drift is written once per token
+- Invalid / expired tokens are still rejected
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import jwt
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from kairo.middleware.supabase_auth import SupabaseAuthMiddleware, clear_token_cache
+
+JWT_SECRET = "test-jwt-secret-with-enough-length-for-hs256"
+
+
+@pytest.fixture
+def middleware(settings):
+    settings.SUPABASE_JWT_SECRET = JWT_SECRET
+    settings.AUTH_DISABLED = False
+    clear_token_cache()
+    yield SupabaseAuthMiddleware(lambda request: HttpResponse("ok"))
+    clear_token_cache()
+
+
+def _token(sub="sb-user-1", email="user@example.com", exp_in=3600) -> str:
+    payload = {
+        "sub": sub,
+        "email": email,
+        "aud": "authenticated",
+        "exp": int(time.time()) + exp_in,
+    }
+    return jwt.encode(payload, JWT_SECRET, algorithm="HS256")
+
+
+def _request(token: str):
+    return RequestFactory().get("/api/brands/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+
+@pytest.mark.db
+class TestVerifiedTokenCache:
+    """Test token verification caching."""
+
+    def test_cached_token_makes_no_queries(
+        self, db, middleware, django_assert_num_queries
+    ):
+        token = _token()
+        first = _request(token)
+        middleware(first)
+
+        second = _request(token)
+        with django_assert_num_queries(0):
+            response = middleware(second)
+
+        assert response.status_code == 200
+        assert second.kairo_user.supabase_uid == "sb-user-1"
+        assert second.kairo_user.pk == first.kairo_user.pk
+        assert second.kairo_user is not first.kairo_user
+
+    def test_cached_token_skips_decode(self, db, middleware):
+        token = _token()
+        middleware(_request(token))
+
+        with patch("kairo.middleware.supabase_auth.jwt.decode") as decode:
+            middleware(_request(token))
+
+        decode.assert_not_called()
+
+    def test_entry_expires_with_token(self, db, middleware):
+        token = _token(exp_in=60)
+        middleware(_request(token))
+
+        later = time.time() + 120
+        with patch("kairo.middleware.supabase_auth.time.time", return_value=later), \
+             patch("kairo.middleware.supabase_auth.jwt.decode",
+                   side_effect=jwt.ExpiredSignatureError) as decode:
+            response = middleware(_request(token))
+
+        decode.assert_called_once()
+        assert response.status_code == 401
+
+    def test_ttl_cap(self, db, middleware, settings, django_assert_num_queries):
+        settings.SUPABASE_AUTH_CACHE_TTL_S = 30
+        token = _token()
+        middleware(_request(token))
+
+        with patch("kairo.middleware.supabase_auth.time.time", return_value=time.time() + 60):
+            with django_assert_num_queries(1):
+                response = middleware(_request(token))
+
+        assert response.status_code == 200
+
+    def test_lru_bound(self, db, middleware, settings):
+        from kairo.middleware import supabase_auth
+
+        settings.SUPABASE_AUTH_CACHE_SIZE = 2
+        for i in range(3):
+            middleware(_request(_token(sub=f"sb-user-{i}", email=f"user{i}@example.com")))
+
+        assert len(supabase_auth._token_cache) == 2
+
+    def test_email_drift_written_once(self, db, middleware, django_assert_num_queries):
+        from kairo.users.models import User
+
+        middleware(_request(_token(email="old@example.com")))
+        token = _token(email="new@example.com")
+
+        with django_assert_num_queries(2):  # get + conditional UPDATE
+            middleware(_request(token))
+        with django_assert_num_queries(0):
+            middleware(_request(token))
+
+        assert User.objects.get(supabase_uid="sb-user-1").email == "new@example.com"
+
+    def test_invalid_token_rejected_and_not_cached(self, db, middleware):
+        from kairo.middleware import supabase_auth
+
+        bad = jwt.encode(
+            {"sub": "sb-user-1", "aud": "authenticated", "exp": int(time.time()) + 60},
+            "some-other-secret-with-enough-length-for-hs256",
+            algorithm="HS256",
+        )
+
+        response = middleware(_request(bad))
+
+        assert response.status_code == 401
+        assert len(supabase_auth._token_cache) == 0
+
+    def test_secret_rotation_retires_entries(self, db, middleware, settings):
+        token = _token()
+        middleware(_request(token))
+
+        settings.SUPABASE_JWT_SECRET = "rotated-secret-with-enough-length-for-hs256"
+        response = middleware(_request(token))
+
+        assert response.status_code == 401
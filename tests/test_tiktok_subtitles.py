@@ -0,0 +1,152 @@
+"""
+TikTok Subtitle Fetching Tests.
+
+Tests for kairo.sourceactivation.subtitles and its use in the TikTok
+normalizer:
+- Batch fetches run concurrently over the shared session
+- Fetched text is cached by video id; re-scrapes skip the fetch
+- English links preferred; fallback links fetched only when needed
+- Batch deadline drops slow fetches instead of blocking
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+
+from kairo.sourceactivation import subtitles
+from kairo.sourceactivation.normalizers import normalize_actor_output
+
+VTT = "WEBVTT\n\n1\n00:00:01.000 --> 00:00:04.000\nHello from {video}\n\nNOTE comment\n"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class FakeSession:
+    """Stand-in for requests.Session serving VTT for any URL."""
+
+    def __init__(self, delay_s: float = 0.0, fail_urls: set[str] | None = None):
+        self.delay_s = delay_s
+        self.fail_urls = fail_urls or set()
+        self.urls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, timeout=None):
+        with self._lock:
+            self.urls.append(url)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay_s)
+            response = MagicMock()
+            response.text = "" if url in self.fail_urls else VTT.format(video=url.rsplit("/", 1)[-1])
+            return response
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def session():
+    fake = FakeSession()
+    with patch.object(subtitles, "get_session", return_value=fake):
+        yield fake
+
+
+def _tiktok_item(video_id: str, links: list[tuple[str, str]]) -> dict:
+    return {
+        "id": video_id,
+        "webVideoUrl": f"https://www.tiktok.com/@test/video/{video_id}",
+        "text": "caption",
+        "videoMeta": {
+            "subtitleLinks": [
+                {"language": language, "tiktokLink": url} for language, url in links
+            ]
+        },
+    }
+
+
+def _normalize(items):
+    return normalize_actor_output(items, "clockworks/tiktok-scraper", "TT-1", 1, uuid.uuid4())
+
+
+class TestParseSubtitleText:
+    def test_strips_vtt_and_srt_markup(self):
+        srt = "1\n00:00:01,000 --> 00:00:02,000\nFirst line\n\n2\n00:00:02,000 --> 00:00:03,000\nSecond"
+
+        assert subtitles.parse_subtitle_text(VTT.format(video="v1")) == "Hello from v1"
+        assert subtitles.parse_subtitle_text(srt) == "First line Second"
+
+
+class TestFetchTranscripts:
+    def test_batch_runs_concurrently(self, settings, session):
+        settings.TIKTOK_SUBTITLE_CONCURRENCY = 5
+        session.delay_s = 0.1
+        items = [_tiktok_item(f"v{i}", [("eng-US", f"https://sub.example/v{i}")]) for i in range(10)]
+
+        started = time.monotonic()
+        results = _normalize(items)
+        elapsed = time.monotonic() - started
+
+        assert [item.text_secondary for item in results] == [f"Hello from v{i}" for i in range(10)]
+        assert all(item.has_transcript for item in results)
+        assert session.max_in_flight == 5
+        assert elapsed < 0.8  # serial would take 1s
+
+    def test_rescrape_hits_cache_by_video_id(self, session):
+        _normalize([_tiktok_item("v1", [("eng-US", "https://sub.example/v1?sig=a")])])
+        # Same video, freshly signed URL
+        results = _normalize([_tiktok_item("v1", [("eng-US", "https://sub.example/v1?sig=b")])])
+
+        assert session.urls == ["https://sub.example/v1?sig=a"]
+        assert results[0].text_secondary == "Hello from v1?sig=a"
+
+    def test_english_preferred_fallback_only_when_empty(self, session):
+        session.fail_urls = {"https://sub.example/v2-en"}
+        items = [
+            _tiktok_item("v1", [("spa-ES", "https://sub.example/v1-es"), ("eng-US", "https://sub.example/v1-en")]),
+            _tiktok_item("v2", [("eng-US", "https://sub.example/v2-en"), ("fra-FR", "https://sub.example/v2-fr")]),
+        ]
+
+        results = _normalize(items)
+
+        assert sorted(session.urls) == [
+            "https://sub.example/v1-en",
+            "https://sub.example/v2-en",
+            "https://sub.example/v2-fr",
+        ]
+        assert results[0].text_secondary == "Hello from v1-en"
+        assert results[1].text_secondary == "Hello from v2-fr"
+
+    def test_embedded_subtitles_skip_fetch(self, session):
+        item = _tiktok_item("v1", [("eng-US", "https://sub.example/v1")])
+        item["subtitles"] = "Transcript that was downloaded by the actor."
+
+        results = _normalize([item])
+
+        assert session.urls == []
+        assert results[0].text_secondary == "Transcript that was downloaded by the actor."
+
+    def test_deadline_drops_slow_fetches(self, settings, session):
+        settings.TIKTOK_SUBTITLE_BUDGET_S = 0.2
+        session.delay_s = 2.0
+
+        started = time.monotonic()
+        transcripts = subtitles.fetch_transcripts(
+            [_tiktok_item("v1", [("eng-US", "https://sub.example/v1")])]
+        )
+
+        assert transcripts == {}
+        assert time.monotonic() - started < 1